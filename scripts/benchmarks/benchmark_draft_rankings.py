@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark: draft rankings index
+Runs a seeded synthetic snake draft (synthetic_data.py players, projections
+and salaries) where every pick takes the best available player by vorp under
+the team's per-pick budget, answering each pick two ways:
+
+    scan    re-rank the undrafted pool and take the first affordable player
+            (what get_best_available_player did on every call)
+    index   DraftRankingIndex.best_available (min-salary segment tree)
+
+and checks that both draft the same players.
+
+Usage:
+    python3 scripts/benchmarks/benchmark_draft_rankings.py [--teams 12] [--rounds 13] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'setup'))
+
+from draft_rankings import DEFAULT_ROSTER_POSITIONS, DraftRankingIndex, eligible_slots, league_rankings
+from fantasy_scoring import SCORING_FORMATS
+from league_scoring import profile_columns, projection_matrix
+from synthetic_data import generate_players, generate_projections, generate_salaries
+
+SALARY_CAP = 200_000_000
+PROJECTION_COLUMNS = {'GP': 'gp', 'PTS': 'pts', 'REB': 'reb', 'AST': 'ast', 'STL': 'stl', 'BLK': 'blk', 'TO': 'to', '3PM': '3pm'}
+
+def synthetic_pool(rng: random.Random):
+    """(pool, projection rows) in the shapes draft_rankings.load_pool returns"""
+    players, profiles = generate_players(rng)
+    by_name = {player['name']: player for player in players}
+    salaries = {row['Name']: int(row['2025-26'][1:].replace(',', '')) for row in generate_salaries(rng, players, profiles)}
+    pool, projections = [], []
+    for row in generate_projections(rng, players, profiles):
+        player = by_name[row['Name']]
+        pool.append({'player_id': player['id'], 'salary': salaries[row['Name']], 'slots': eligible_slots(player['position'])})
+        projections.append({'player_id': player['id'], **{
+            f'proj_2026_{column}': float(row['2026 Projections'][key]) for key, column in PROJECTION_COLUMNS.items()}})
+    return pool, projections
+
+def scan_best(rows, budget):
+    """Best undrafted player under budget by re-ranking the pool"""
+    ranked = sorted((row for row in rows if not row.get('drafted_by_team_id')), key=lambda row: row['vorp_rank'])
+    return next((row for row in ranked if row['salary'] <= budget), None)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the draft rankings index")
+    parser.add_argument('--teams', type=int, default=12)
+    parser.add_argument('--rounds', type=int, default=13)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    pool, projections = synthetic_pool(rng)
+    weights, _, _ = profile_columns([SCORING_FORMATS['FanDuel']])
+    per_game, games = projection_matrix(projections, 2026)
+
+    start = time.perf_counter()
+    rows = league_rankings('league', pool, (per_game @ weights)[:, 0] * games, games, args.teams, DEFAULT_ROSTER_POSITIONS)
+    rank_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = DraftRankingIndex([dict(row) for row in rows])
+    build_time = time.perf_counter() - start
+
+    print(f"🏀 Draft rankings benchmark: {len(pool):,} players, {args.teams} teams x {args.rounds} rounds")
+    print("-" * 60)
+
+    scan_rows = [dict(row) for row in rows]
+    scan_by_id = {row['player_id']: row for row in scan_rows}
+    teams = [f'team-{i}' for i in range(args.teams)]
+    scan_time = index_time = 0.0
+    mismatches = picks = 0
+    for draft_round in range(args.rounds):
+        for team in (teams if draft_round % 2 == 0 else teams[::-1]):
+            budget = (SALARY_CAP - index.team_salary(team)) / (args.rounds - draft_round) * 2.0
+
+            start = time.perf_counter()
+            scanned = scan_best(scan_rows, budget)
+            scan_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            found = index.best_available(budget)
+            index_time += time.perf_counter() - start
+
+            chosen = found[0] if found else None
+            if (scanned or {}).get('player_id') != (chosen or {}).get('player_id'):
+                mismatches += 1
+            if chosen:
+                index.draft(chosen['player_id'], team)
+                scan_by_id[chosen['player_id']]['drafted_by_team_id'] = team
+                picks += 1
+
+    print(f"{'vorp ranking (ms)':30}{rank_time * 1000:>12.2f}")
+    print(f"{'index build (ms)':30}{build_time * 1000:>12.2f}")
+    print(f"{'scan per pick (ms)':30}{scan_time / picks * 1000:>12.3f}")
+    print(f"{'index per pick (ms)':30}{index_time / picks * 1000:>12.3f}")
+    print(f"{'speedup':30}{scan_time / index_time:>11.1f}x")
+    print("-" * 60)
+    print(f"{'✅' if not mismatches else '❌'} {mismatches} of {picks} picks differ between scan and index")
+    top = sorted(rows, key=lambda row: row['vorp_rank'])[:3]
+    for row in top:
+        print(f"   #{row['vorp_rank']} vorp {row['vorp']:>7.1f}  ${row['salary']:>12,}  {'/'.join(row['positions'])}")
+    spent = [index.team_salary(team) for team in teams]
+    print(f"   💰 team salaries ${min(spent) / 1e6:.1f}M - ${max(spent) / 1e6:.1f}M (cap ${SALARY_CAP / 1e6:.0f}M)")
+
+if __name__ == "__main__":
+    main()
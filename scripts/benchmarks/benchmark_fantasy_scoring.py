@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark: fantasy scoring engine
+Scores a seeded synthetic season of box scores (synthetic_data.py) for every
+format in fantasy_scoring.SCORING_FORMATS, comparing a per-log loop (how
+fantasyScoring.ts scores logs one at a time) with the weight-matrix engine,
+and checks that both give the same points.
+
+Usage:
+    python3 scripts/benchmarks/benchmark_fantasy_scoring.py [--weeks 26] [--seed 7] [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'setup'))
+
+import numpy as np
+
+from fantasy_scoring import DOUBLE_DOUBLE_STATS, DOUBLE_DOUBLE_THRESHOLD, SCORING_FORMATS, score_matrix, stat_matrix
+from synthetic_data import generate_boxscores, generate_players, generate_schedule
+
+def loop_points(row: Dict[str, Any], scoring: Dict[str, Any]) -> float:
+    """One log, one format, the way fantasyScoring.ts calculatePoints does it"""
+    total = sum((row.get(stat) or 0) * weight for stat, weight in scoring['weights'].items())
+    categories = sum(1 for stat in DOUBLE_DOUBLE_STATS if (row.get(stat) or 0) >= DOUBLE_DOUBLE_THRESHOLD)
+    if categories >= 2:
+        total += scoring.get('double_double', 0.0)
+    if categories >= 3:
+        total += scoring.get('triple_double', 0.0)
+    return round(total, 2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fantasy scoring engine")
+    parser.add_argument('--weeks', type=int, default=26, help='Played weeks of the synthetic season')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed repetitions')
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players, profiles = generate_players(rng)
+    games, _ = generate_schedule(rng, datetime(2025, 10, 21), 2026)
+    logs: List[Dict[str, Any]] = list(generate_boxscores(rng, games, players, profiles, args.weeks))
+    formats = list(SCORING_FORMATS)
+
+    print(f"🏀 Fantasy scoring benchmark: {len(logs):,} game logs x {len(formats)} formats")
+    print("-" * 60)
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        looped = [[loop_points(row, SCORING_FORMATS[name]) for name in formats] for row in logs]
+    loop_time = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        matrix = stat_matrix(logs)
+    build_time = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        points = score_matrix(matrix, SCORING_FORMATS)
+    score_time = (time.perf_counter() - start) / args.repeat
+
+    mismatches = int(np.sum(np.abs(points - np.array(looped)) > 0.005))
+
+    print(f"{'per-log loop (ms)':28}{loop_time * 1000:>12.1f}")
+    print(f"{'stat matrix build (ms)':28}{build_time * 1000:>12.1f}")
+    print(f"{'matrix scoring (ms)':28}{score_time * 1000:>12.2f}")
+    print(f"{'engine total (ms)':28}{(build_time + score_time) * 1000:>12.1f}")
+    print(f"{'speedup':28}{loop_time / (build_time + score_time):>11.1f}x")
+    print("-" * 60)
+    print(f"{'✅' if not mismatches else '❌'} {mismatches} of {points.size:,} points differ from the per-log loop")
+    for j, name in enumerate(formats):
+        print(f"   {name:<12} season total {points[:, j].sum():>12,.1f}  best game {points[:, j].max():>6.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Supabase round trips per import
+Runs the ESPN projections import against the in-memory FakeSupabaseClient and
+reports how many requests and payload bytes it issues, cold (empty crosswalk)
+and warm (crosswalk filled by the first run).
+
+The player universe is built from the ESPN names plus seeded synthetic
+players, so the benchmark needs no database or network.
+
+Usage:
+    python3 scripts/benchmarks/benchmark_import_requests.py [--players 5000] [--seed 7] [--budget 40]
+
+With --budget the script exits 1 if the warm import needs more requests.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import uuid
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(SCRIPTS_DIR, 'setup'))
+
+# Keep the player snapshot away from the real cache
+os.environ['HOOPGEEK_CACHE_DIR'] = tempfile.mkdtemp(prefix='hoopgeek_bench_')
+
+from fake_supabase import FakeSupabaseClient, RequestBudgetExceeded
+from import_espn_projections import import_espn_projections
+
+ESPN_FILE = os.path.join(SCRIPTS_DIR, 'supabase', 'espn_projections.json')
+
+def build_players(count: int, seed: int):
+    """ESPN names as nba_players rows, padded with synthetic players"""
+    rng = random.Random(seed)
+    with open(ESPN_FILE, 'r', encoding='utf-8') as f:
+        projections = json.load(f)
+
+    players = []
+    for projection in projections:
+        players.append({
+            'id': str(uuid.UUID(int=rng.getrandbits(128))),
+            'nba_player_id': len(players) + 1,
+            'name': projection['Name'],
+            'team_name': projection.get('Team'),
+            'is_active': True,
+        })
+    while len(players) < count:
+        players.append({
+            'id': str(uuid.UUID(int=rng.getrandbits(128))),
+            'nba_player_id': len(players) + 1,
+            'name': f"Synthetic Player {len(players)}",
+            'team_name': None,
+            'is_active': rng.random() < 0.1,
+        })
+    return players
+
+def run_import(supabase: FakeSupabaseClient):
+    """One import with its output silenced, returns (seconds, stats)"""
+    supabase.reset_stats()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        import_espn_projections(supabase, ESPN_FILE)
+    return time.perf_counter() - start, supabase.stats()
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Supabase requests issued by the ESPN projections import")
+    parser.add_argument('--players', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--budget', type=int, help="Max requests for a warm import")
+    args = parser.parse_args()
+
+    supabase = FakeSupabaseClient({'nba_players': build_players(args.players, args.seed)})
+    print(f"🏀 ESPN projections import against {args.players} players (in-memory Supabase)")
+
+    for label in ('cold', 'warm'):
+        seconds, stats = run_import(supabase)
+        print(f"\n📊 {label.capitalize()} import: {stats['requests']} requests, "
+              f"{stats['bytes_sent'] / 1024:.0f} KB sent, {stats['bytes_received'] / 1024:.0f} KB received, {seconds:.2f}s")
+        for target, count in stats['requests_by_target'].items():
+            print(f"   {target:<45} {count:>5}")
+
+    if args.budget is not None:
+        try:
+            with supabase.budget(max_requests=args.budget):
+                with contextlib.redirect_stdout(io.StringIO()):
+                    import_espn_projections(supabase, ESPN_FILE)
+        except RequestBudgetExceeded as e:
+            print(f"\n❌ Over budget: {e}")
+            sys.exit(1)
+        print(f"\n✅ Warm import within budget of {args.budget} requests")
+
+if __name__ == "__main__":
+    main()
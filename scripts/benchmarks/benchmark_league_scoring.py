@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark: league scoring batch job
+Scores a seeded synthetic season (synthetic_data.py) for --leagues leagues,
+--custom of them with their own random scoring, the way league_scoring.py
+does: profiles from unique weight columns, weekly totals per player, one
+matrix product. Compares with scoring every league separately (one
+weight_matrix + product per league, timed on a sample and extrapolated) and
+checks that both agree.
+
+Usage:
+    python3 scripts/benchmarks/benchmark_league_scoring.py [--leagues 10000] [--custom 500] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'setup'))
+
+import numpy as np
+
+from fantasy_scoring import SCORING_FORMATS, weight_matrix
+from league_scoring import profile_columns, weekly_totals
+from synthetic_data import generate_boxscores, generate_players, generate_schedule
+
+PRESETS = ['FanDuel', 'DraftKings', 'Yahoo', 'ESPN']
+SAMPLE_LEAGUES = 200
+
+def random_scoring(rng: random.Random):
+    """A commissioner's custom scoring"""
+    return {
+        'weights': {'pts': 1.0, 'reb': rng.choice([1.0, 1.2, 1.5]), 'ast': rng.choice([1.0, 1.5, 2.0]),
+                    'stl': rng.choice([2.0, 3.0]), 'blk': rng.choice([2.0, 3.0]), 'tov': rng.choice([-0.5, -1.0]),
+                    'fg3m': rng.choice([0.0, 0.5, 1.0])},
+        'double_double': rng.choice([0.0, 1.5, 2.0]),
+        'triple_double': rng.choice([0.0, 3.0, 5.0]),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the league scoring batch job")
+    parser.add_argument('--leagues', type=int, default=10000)
+    parser.add_argument('--custom', type=int, default=500, help='Leagues with custom scoring')
+    parser.add_argument('--weeks', type=int, default=26, help='Played weeks of the synthetic season')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    players, profiles = generate_players(rng)
+    games, season_weeks = generate_schedule(rng, datetime(2025, 10, 21), 2026)
+    logs = list(generate_boxscores(rng, games, players, profiles, args.weeks))
+    scorings = ([random_scoring(rng) for _ in range(args.custom)]
+                + [SCORING_FORMATS[rng.choice(PRESETS)] for _ in range(args.leagues - args.custom)])
+
+    print(f"🏀 League scoring benchmark: {args.leagues:,} leagues ({args.custom:,} custom), {len(logs):,} game logs")
+    print("-" * 60)
+
+    start = time.perf_counter()
+    totals = weekly_totals(logs, season_weeks)
+    totals_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    weights, bonuses, inverse = profile_columns(scorings)
+    profile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    points = totals['stats'] @ weights + totals['bonuses'] @ bonuses
+    score_time = time.perf_counter() - start
+
+    # One league at a time, on a sample
+    sample = list(range(0, args.leagues, max(1, args.leagues // SAMPLE_LEAGUES)))[:SAMPLE_LEAGUES]
+    start = time.perf_counter()
+    mismatches = 0
+    for i in sample:
+        w, b = weight_matrix({i: scorings[i]})
+        league_points = totals['stats'] @ w + totals['bonuses'] @ b
+        mismatches += int(np.sum(np.abs(league_points[:, 0] - points[:, inverse[i]]) > 1e-6))
+    per_league_time = (time.perf_counter() - start) / len(sample) * args.leagues
+
+    batch_time = profile_time + score_time
+    print(f"{'weekly totals (ms)':30}{totals_time * 1000:>12.1f}   {len(totals['pairs']):,} player-weeks")
+    print(f"{'profiles (ms)':30}{profile_time * 1000:>12.1f}   {weights.shape[1]:,} unique")
+    print(f"{'matrix scoring (ms)':30}{score_time * 1000:>12.1f}   {points.size:,} totals")
+    print(f"{'per-league loop (ms, est.)':30}{per_league_time * 1000:>12.1f}   {args.leagues * len(totals['pairs']):,} totals")
+    print(f"{'speedup':30}{per_league_time / batch_time:>11.1f}x")
+    print("-" * 60)
+    print(f"{'✅' if not mismatches else '❌'} {mismatches} mismatches on {len(sample)} sampled leagues")
+
+if __name__ == "__main__":
+    main()
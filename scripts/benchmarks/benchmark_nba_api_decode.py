@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: nba_api response decoding
+Compares nba_api_decode with the pandas path the importers used before
+(get_data_frames() followed by iterrows() / iloc[0]):
+
+- startup: import time and peak RSS of a fresh interpreter importing
+  nba_api_decode vs pandas
+- decode: time to turn one payload into rows, on a seeded synthetic
+  PlayerGameLogs-shaped payload (a season is ~26,000 rows x 67 columns) and a
+  one-row CommonPlayerInfo-shaped payload
+
+The pandas rows are skipped when pandas is not installed. Note that nba_api
+itself imports pandas when it is available, so the startup saving only shows
+up fully where pandas is not installed.
+
+Usage:
+    python3 scripts/benchmarks/benchmark_nba_api_decode.py [--rows 26000] [--repeat 5] [--seed 7]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+SETUP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'setup')
+sys.path.insert(0, SETUP_DIR)
+
+from nba_api_decode import decode
+
+STARTUP_PROBE = (
+    "import resource, sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)\n"
+)
+
+GAME_LOG_TEXT = ['SEASON_YEAR', 'PLAYER_NAME', 'NICKNAME', 'TEAM_ABBREVIATION', 'TEAM_NAME', 'GAME_ID', 'GAME_DATE', 'MATCHUP', 'WL']
+GAME_LOG_STATS = ['MIN', 'FGM', 'FGA', 'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT', 'OREB', 'DREB', 'REB',
+                  'AST', 'TOV', 'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS', 'PLUS_MINUS', 'NBA_FANTASY_PTS', 'DD2', 'TD3']
+
+def game_logs_payload(rows: int, seed: int) -> str:
+    """PlayerGameLogs-shaped JSON text: ids, text columns, stats and their ranks"""
+    rng = random.Random(seed)
+    headers = ['PLAYER_ID', 'TEAM_ID'] + GAME_LOG_TEXT + GAME_LOG_STATS + [f"{name}_RANK" for name in GAME_LOG_STATS]
+    row_set = []
+    for i in range(rows):
+        row = [1630000 + rng.randrange(600), 1610612737 + rng.randrange(30)]
+        row += ['2024-25', f"Player {i % 600}", f"P{i % 600}", 'BOS', 'Boston Celtics',
+                f"00224{i // 20:05d}", '2025-01-15T00:00:00', 'BOS vs. NYK', rng.choice('WL')]
+        for name in GAME_LOG_STATS:
+            row.append(round(rng.random(), 3) if name.endswith('_PCT') or name in ('MIN', 'NBA_FANTASY_PTS') else rng.randrange(40))
+        row += [rng.randrange(1, 600) for _ in GAME_LOG_STATS]
+        row_set.append(row)
+    return json.dumps({'resource': 'playergamelogs', 'resultSets': [{'name': 'PlayerGameLogs', 'headers': headers, 'rowSet': row_set}]})
+
+def player_info_payload() -> str:
+    """CommonPlayerInfo-shaped JSON text (one row plus two small sets)"""
+    headers = ['PERSON_ID', 'FIRST_NAME', 'LAST_NAME', 'DISPLAY_FIRST_LAST', 'BIRTHDATE', 'SCHOOL', 'COUNTRY', 'HEIGHT',
+               'WEIGHT', 'SEASON_EXP', 'JERSEY', 'POSITION', 'TEAM_ID', 'TEAM_NAME', 'FROM_YEAR', 'TO_YEAR', 'DRAFT_YEAR']
+    row = [1628369, 'Jayson', 'Tatum', 'Jayson Tatum', '1998-03-03T00:00:00', 'Duke', 'USA', '6-8',
+           '210', 7, '0', 'Forward', 1610612738, 'Celtics', 2017, 2024, '2017']
+    return json.dumps({'resource': 'commonplayerinfo', 'resultSets': [
+        {'name': 'CommonPlayerInfo', 'headers': headers, 'rowSet': [row]},
+        {'name': 'PlayerHeadlineStats', 'headers': ['PLAYER_ID', 'PTS', 'AST', 'REB'], 'rowSet': [[1628369, 26.9, 4.9, 8.1]]},
+        {'name': 'AvailableSeasons', 'headers': ['SEASON_ID'], 'rowSet': [[f"2{year}"] for year in range(2017, 2025)]},
+    ]})
+
+def best_of(fn: Callable[[], Any], repeat: int) -> float:
+    """Fastest of `repeat` runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def measure_startup(module: str, repeat: int) -> Dict[str, float]:
+    """Median import time (ms) and peak RSS (MB) of a fresh interpreter importing `module`"""
+    seconds, rss = [], []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', STARTUP_PROBE.format(module=module)],
+                                cwd=SETUP_DIR, capture_output=True, text=True, check=True).stdout.split()
+        seconds.append(float(output[0]))
+        rss.append(int(output[1]) / 1024)
+    return {'import_ms': statistics.median(seconds) * 1000, 'rss_mb': statistics.median(rss)}
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="nba_api_decode vs pandas: startup and decode time")
+    parser.add_argument('--rows', type=int, default=26000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+
+    print("🚀 Startup (fresh interpreter, median of runs)")
+    for module in ('nba_api_decode', 'pandas'):
+        if module == 'pandas' and pd is None:
+            print(f"   {module:<16} skipped (pandas not installed)")
+            continue
+        startup = measure_startup(module, args.repeat)
+        print(f"   {module:<16} {startup['import_ms']:>8.1f} ms import   {startup['rss_mb']:>7.1f} MB peak RSS")
+
+    payloads = [
+        (f"PlayerGameLogs ({args.rows:,} rows)", game_logs_payload(args.rows, args.seed)),
+        ("CommonPlayerInfo (1 row)", player_info_payload()),
+    ]
+    for label, text in payloads:
+        data = json.loads(text)
+        main_set = data['resultSets'][0]
+        print(f"\n📊 {label}: {len(text) / 1024:.0f} KB JSON, best of {args.repeat}")
+        cases: List = [
+            ('json.loads (both paths)', lambda: json.loads(text)),
+            ('decode + records()', lambda: decode(data)[0].records()),
+            ('decode + tuples()', lambda: list(decode(data)[0].tuples())),
+            ('decode + first()', lambda: decode(data)[0].first()),
+            ('decode + columns(typed)', lambda: decode(data)[0].columns(typed=True)),
+        ]
+        if pd is not None:
+            def frames():
+                return [pd.DataFrame(result_set['rowSet'], columns=result_set['headers']) for result_set in data['resultSets']]
+            cases += [
+                ('DataFrame + iterrows()', lambda: [row for _, row in frames()[0].iterrows()]),
+                ('DataFrame + iloc[0]', lambda: frames()[0].iloc[0].to_dict()),
+                ('DataFrame + to_dict(records)', lambda: frames()[0].to_dict('records')),
+            ]
+        for name, fn in cases:
+            seconds = best_of(fn, args.repeat)
+            per_row = seconds / max(len(main_set['rowSet']), 1) * 1e6
+            print(f"   {name:<30} {seconds * 1000:>9.2f} ms   {per_row:>7.2f} µs/row")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark: play-by-play analytics engine
+Times supabase/json/pbp.py + score.py + story.py on a seeded synthetic season
+in the NBA live play-by-play format (default 1,300 games x ~500 actions):
+
+- load: actions -> column arrays (load_play_by_play)
+- each section: lead changes, dunks, deep shots, player lines, team box,
+  fun scores, full score and story output
+
+Usage:
+    python3 scripts/benchmarks/benchmark_pbp_engine.py [--games 1300] [--actions 500] [--seed 7]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+JSON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'supabase', 'json')
+sys.path.insert(0, JSON_DIR)
+
+from fun import fun_scores
+from pbp import load_play_by_play, team_box
+from score import compute_scores, deep_shots, dunk_stats, game_features, lead_changes, player_lines
+from story import compute_stories
+
+TEAMS = [('BOS', 1610612738), ('LAL', 1610612747), ('NYK', 1610612752), ('GSW', 1610612744),
+         ('DEN', 1610612743), ('MIA', 1610612748), ('PHX', 1610612756), ('OKC', 1610612760)]
+SHOT_TYPES = ['jump shot', 'layup', 'dunk', 'hook']
+DESCRIPTORS = ['', '', 'driving', 'running', 'alley-oop', 'putback', 'tip', 'cutting', 'pullup']
+QUALIFIERS = ['fastbreak', 'pointsinthepaint', '2ndchance', 'fromturnover']
+
+def synthetic_game(rng: random.Random, game_number: int, n_actions: int) -> Dict[str, Any]:
+    """One game of live-format actions with a consistent running score"""
+    (home, home_id), (away, away_id) = rng.sample(TEAMS, 2)
+    players = {side: [1630000 + rng.randrange(5000) for _ in range(10)] for side in 'hv'}
+    score = {'h': 0, 'v': 0}
+    periods = 4 + (rng.random() < 0.06)
+    actions = []
+    for i in range(n_actions):
+        period = 1 + i * periods // n_actions
+        length = 720 if period <= 4 else 300
+        left = length * (1 - (i * periods / n_actions - (period - 1)))
+        side = rng.choice('hv')
+        person = rng.choice(players[side])
+        action = {
+            'actionNumber': i + 1,
+            'clock': f"PT{int(left // 60):02d}M{left % 60:05.2f}S",
+            'period': period,
+            'teamId': home_id if side == 'h' else away_id,
+            'teamTricode': home if side == 'h' else away,
+            'personId': person,
+            'playerNameI': f"P. {person}",
+            'location': side,
+            'qualifiers': [q for q in QUALIFIERS if rng.random() < 0.08],
+        }
+        roll = rng.random()
+        if roll < 0.45:
+            three = rng.random() < 0.4
+            made = rng.random() < 0.47
+            action.update(actionType='3pt' if three else '2pt', isFieldGoal=1,
+                          subType='jump shot' if three else rng.choice(SHOT_TYPES),
+                          descriptor=rng.choice(DESCRIPTORS),
+                          shotDistance=round(rng.uniform(23, 34) if three else rng.uniform(0, 22), 1),
+                          shotResult='Made' if made else 'Missed')
+            if made:
+                score[side] += 3 if three else 2
+                if rng.random() < 0.6:
+                    action['assistPersonId'] = rng.choice(players[side])
+        elif roll < 0.55:
+            made = rng.random() < 0.78
+            action.update(actionType='freethrow', isFieldGoal=0, subType=rng.choice(['1 of 2', '2 of 2', '1 of 1']),
+                          shotResult='Made' if made else 'Missed')
+            score[side] += made
+        elif roll < 0.80:
+            action.update(actionType='rebound', isFieldGoal=0, subType=rng.choice(['offensive', 'defensive', 'defensive']))
+        else:
+            action.update(actionType=rng.choice(['turnover', 'steal', 'block', 'foul', 'substitution']), isFieldGoal=0)
+        action['scoreHome'] = str(score['h'])
+        action['scoreAway'] = str(score['v'])
+        actions.append(action)
+    return {'game': {'gameId': f"00224{game_number:05d}", 'actions': actions}}
+
+def timed(label: str, fn: Callable[[], Any]) -> Any:
+    start = time.perf_counter()
+    result = fn()
+    print(f"   {label:<28} {(time.perf_counter() - start) * 1000:>9.1f} ms")
+    return result
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Play-by-play engine on a synthetic season")
+    parser.add_argument('--games', type=int, default=1300)
+    parser.add_argument('--actions', type=int, default=500)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"🏀 Generating {args.games:,} games x {args.actions} actions (seed {args.seed})")
+    games: List[Dict[str, Any]] = [synthetic_game(rng, i, args.actions) for i in range(args.games)]
+
+    print("⏱️  Timings")
+    start = time.perf_counter()
+    pbp = timed('load_play_by_play', lambda: load_play_by_play(games))
+    timed('lead_changes', lambda: lead_changes(pbp))
+    timed('dunk_stats', lambda: dunk_stats(pbp))
+    timed('deep_shots', lambda: deep_shots(pbp))
+    timed('player_lines', lambda: player_lines(pbp))
+    timed('team_box', lambda: team_box(pbp))
+    timed('fun_scores', lambda: fun_scores(game_features(pbp)))
+    scores = timed('compute_scores (all)', lambda: compute_scores(pbp))
+    timed('compute_stories (all)', lambda: compute_stories(pbp))
+    elapsed = time.perf_counter() - start
+
+    fun = [score['fun_score'] for score in scores.values()]
+    print(f"\n✅ {pbp.n_games:,} games, {len(pbp):,} actions in {elapsed:.2f}s "
+          f"({len(pbp) / elapsed:,.0f} actions/s) · fun score {min(fun)}-{max(fun)}, avg {sum(fun) / len(fun):.1f}")
+
+if __name__ == "__main__":
+    main()
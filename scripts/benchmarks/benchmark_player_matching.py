@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: player name matching
+Matches the ESPN projections file against a ~5,000 player universe and compares
+the shared PlayerNameIndex with the old exact-only lookup dictionary.
+
+The universe is built offline from the ESPN names themselves (spelled the way
+nba_players spells them, with accents, suffixes and typos mixed in) plus
+seeded synthetic players, so the benchmark needs no database.
+
+Usage:
+    python3 scripts/benchmarks/benchmark_player_matching.py [--players 5000] [--seed 7]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'setup'))
+
+from player_matching import PlayerNameIndex
+
+ESPN_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'supabase', 'espn_projections.json')
+
+ACCENTS = {'c': 'ć', 'e': 'é', 'a': 'á', 's': 'š', 'o': 'ö', 'u': 'ü', 'i': 'í'}
+
+def legacy_lookup(players: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """The create_lookup_dict the importers used before player_matching"""
+    import unicodedata
+    lookup = {}
+    for player in players:
+        name_key = player['name'].lower().strip()
+        lookup[name_key] = player
+        name_no_suffix = name_key.replace(' jr', '').replace(' sr', '').replace(' iii', '').replace(' ii', '').replace(' iv', '')
+        if name_no_suffix != name_key:
+            lookup[name_no_suffix] = player
+        name_no_accents = ''.join(c for c in unicodedata.normalize('NFD', name_key) if unicodedata.category(c) != 'Mn')
+        if name_no_accents != name_key:
+            lookup[name_no_accents] = player
+    return lookup
+
+def db_spelling(name: str, rng: random.Random) -> str:
+    """Spell a name the way another source might"""
+    roll = rng.random()
+    if roll < 0.08:
+        return name + ' Jr.'
+    if roll < 0.14:
+        for plain, accented in ACCENTS.items():
+            if plain in name[1:]:
+                return name[0] + name[1:].replace(plain, accented, 1)
+    if roll < 0.20 and len(name) > 8:
+        cut = rng.randrange(2, len(name) - 1)
+        return name[:cut] + name[cut + 1:]
+    if roll < 0.23 and ' ' in name:
+        first, rest = name.split(' ', 1)
+        return f"{first[0]}.{first[1:2]}. {rest}" if len(first) <= 3 else name
+    return name
+
+def build_universe(espn_rows: List[Dict[str, Any]], size: int, rng: random.Random) -> List[Dict[str, Any]]:
+    players = []
+    for i, row in enumerate(espn_rows):
+        players.append({
+            'id': f"espn-{i}",
+            'name': db_spelling(row['Name'], rng),
+            'team_name': row.get('Team') or None,
+            'is_active': True
+        })
+
+    first_names = [row['Name'].split(' ')[0] for row in espn_rows]
+    last_names = [row['Name'].split(' ', 1)[-1] for row in espn_rows]
+    teams = sorted({row.get('Team') for row in espn_rows if row.get('Team')})
+    taken = {p['name'] for p in players}
+
+    while len(players) < size:
+        name = f"{rng.choice(first_names)} {rng.choice(last_names)}"
+        if name in taken:
+            continue
+        taken.add(name)
+        players.append({
+            'id': f"synthetic-{len(players)}",
+            'name': name,
+            'team_name': rng.choice(teams),
+            'is_active': rng.random() < 0.1
+        })
+
+    rng.shuffle(players)
+    return players
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark player name matching")
+    parser.add_argument('--players', type=int, default=5000, help='Size of the player universe')
+    parser.add_argument('--seed', type=int, default=7, help='Random seed')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed repetitions')
+    args = parser.parse_args()
+
+    with open(ESPN_FILE, 'r', encoding='utf-8') as f:
+        espn_rows = [row for row in json.load(f) if row.get('Name')]
+
+    rng = random.Random(args.seed)
+    universe = build_universe(espn_rows, args.players, rng)
+    truth = {}
+    for player in universe:
+        if player['id'].startswith('espn-'):
+            truth[int(player['id'].split('-')[1])] = player['id']
+
+    print(f"🏀 Player matching benchmark: {len(espn_rows)} ESPN rows vs {len(universe)} players")
+    print("-" * 60)
+
+    # Build
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        legacy = legacy_lookup(universe)
+    legacy_build = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        index = PlayerNameIndex(universe)
+    index_build = (time.perf_counter() - start) / args.repeat
+
+    # Match
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        legacy_hits = [legacy.get(row['Name'].lower().strip()) for row in espn_rows]
+    legacy_match = (time.perf_counter() - start) / args.repeat
+
+    start = time.perf_counter()
+    for _ in range(args.repeat):
+        results = [index.match(row['Name'], row.get('Team')) for row in espn_rows]
+    index_match = (time.perf_counter() - start) / args.repeat
+
+    legacy_correct = sum(1 for i, hit in enumerate(legacy_hits) if hit and hit['id'] == truth[i])
+    index_correct = sum(1 for i, hit in enumerate(results) if hit and hit['player']['id'] == truth[i])
+    index_wrong = sum(1 for i, hit in enumerate(results) if hit and hit['player']['id'] != truth[i])
+    methods = Counter(hit['method'] for hit in results if hit)
+
+    print(f"{'':24}{'legacy dict':>16}{'PlayerNameIndex':>18}")
+    print(f"{'build (ms)':24}{legacy_build * 1000:>16.1f}{index_build * 1000:>18.1f}")
+    print(f"{'match all rows (ms)':24}{legacy_match * 1000:>16.2f}{index_match * 1000:>18.2f}")
+    print(f"{'per row (µs)':24}{legacy_match / len(espn_rows) * 1e6:>16.1f}{index_match / len(espn_rows) * 1e6:>18.1f}")
+    print(f"{'correct matches':24}{legacy_correct:>16}{index_correct:>18}")
+    print(f"{'wrong matches':24}{len([h for h in legacy_hits if h]) - legacy_correct:>16}{index_wrong:>18}")
+    print(f"{'unmatched':24}{legacy_hits.count(None):>16}{results.count(None):>18}")
+    print("-" * 60)
+    print("📊 PlayerNameIndex matches by tier: " + ", ".join(f"{k}={v}" for k, v in sorted(methods.items())))
+
+if __name__ == "__main__":
+    main()
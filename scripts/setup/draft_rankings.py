@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""
+Draft Rankings Index
+Value-over-replacement and value-per-dollar rankings per league, for
+auto-draft's best-available lookups.
+
+For each league with an upcoming or running draft, projected season points
+(nba_espn_projections scored with the league's scoring profile, see
+league_scoring.py) are turned into:
+
+    vorp              projected points above the replacement player at the
+                      player's best position (replacement = the first player
+                      left once every team has filled its G/F/C slots)
+    value_per_dollar  vorp per $1M of salary (nba_hoopshype_salaries)
+
+and written to fantasy_draft_rankings. A trigger on fantasy_draft_picks marks
+drafted players as picks come in, and get_best_available_player reads the
+precomputed rows instead of re-scoring the whole pool on every pick.
+
+DraftRankingIndex is the in-memory version: players sorted by vorp (and by
+value_per_dollar), with a min-salary segment tree per order and position, so
+"best available under this budget at this position" is one O(log n) descent
+and drafting a player is O(log n).
+
+Usage:
+    python3 scripts/setup/draft_rankings.py [--season-year 2026] [--league-id <uuid>] [--dry-run]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from supabase import Client
+
+from league_scoring import league_scoring, profile_columns, projection_matrix
+from supabase_bulk import chunked, iter_rows
+from setup_log import get_logger
+
+log = get_logger('draft_rankings')
+
+TABLE = 'fantasy_draft_rankings'
+SALARY_COLUMN = 'salary_2025_26'
+UPSERT_CHUNK_SIZE = 1000
+DELETE_CHUNK_SIZE = 100  # player ids per delete request (in the URL)
+
+# Draft states that still need rankings
+RANKED_DRAFT_STATUSES = ('scheduled', 'in_progress')
+
+# Roster slots a position can fill (UTIL takes anyone); matches DraftRoster.tsx canPlayPosition
+SLOTS = ('G', 'F', 'C')
+SLOT_NAMES = {
+    'G': ('PG', 'SG', 'G', 'GUARD', 'POINT GUARD', 'SHOOTING GUARD'),
+    'F': ('SF', 'PF', 'F', 'FORWARD', 'SMALL FORWARD', 'POWER FORWARD'),
+    'C': ('C', 'CENTER'),
+}
+DEFAULT_ROSTER_POSITIONS = {'G': 4, 'F': 4, 'C': 2, 'UTIL': 5}
+DEFAULT_TEAMS = 12
+
+# Query orders and the rank column behind each
+ORDERS = {'vorp': 'vorp_rank', 'value_per_dollar': 'value_rank'}
+
+def eligible_slots(position: Optional[str]) -> Tuple[str, ...]:
+    """G/F/C slots for an nba_players.position such as 'PG, SG', 'F-C' or 'Guard-Forward'"""
+    parts = [part.strip().upper() for part in (position or '').replace('-', ',').split(',') if part.strip()]
+    return tuple(slot for slot in SLOTS if any(part in SLOT_NAMES[slot] for part in parts))
+
+def replacement_levels(totals: np.ndarray, slots: List[Tuple[str, ...]], teams: int,
+                       roster_positions: Dict[str, int]) -> Dict[str, float]:
+    """
+    Projected total of the replacement player per slot.
+
+    A slot's replacement is the best eligible player outside the top
+    teams x slot-count; UTIL's is the best outside every starting slot.
+    """
+    levels = {}
+    starters = 0
+    for slot in SLOTS + ('UTIL',):
+        count = int(roster_positions.get(slot) or 0)
+        starters += count
+        pool = np.sort(totals if slot == 'UTIL' else totals[[slot in s for s in slots]])[::-1]
+        depth = teams * (starters if slot == 'UTIL' else count)
+        levels[slot] = float(pool[depth]) if depth < len(pool) else 0.0
+    return levels
+
+def vorp_values(totals: np.ndarray, slots: List[Tuple[str, ...]], levels: Dict[str, float]) -> np.ndarray:
+    """Points over replacement at each player's most favourable slot (UTIL if none)"""
+    replacement = np.array([min((levels[slot] for slot in s), default=levels['UTIL']) for s in slots])
+    return totals - replacement
+
+def league_rankings(league_id: str, pool: List[Dict[str, Any]], totals: np.ndarray, games: np.ndarray,
+                    teams: int, roster_positions: Dict[str, int]) -> List[Dict[str, Any]]:
+    """fantasy_draft_rankings rows for one league, ranked by vorp and by value_per_dollar"""
+    slots = [row['slots'] for row in pool]
+    vorp = vorp_values(totals, slots, replacement_levels(totals, slots, teams, roster_positions))
+    salaries = np.array([row['salary'] for row in pool], dtype=np.float64)
+    per_dollar = np.where(vorp > 0, vorp / (salaries / 1_000_000), 0.0)
+
+    vorp_rank = np.empty(len(pool), dtype=np.int64)
+    vorp_rank[np.lexsort((-totals, -vorp))] = np.arange(1, len(pool) + 1)
+    value_rank = np.empty(len(pool), dtype=np.int64)
+    value_rank[np.lexsort((-vorp, -per_dollar))] = np.arange(1, len(pool) + 1)
+    top_vorp = max(float(vorp.max()), 1.0)
+    top_value = max(float(per_dollar.max()), 1e-9)
+
+    return [
+        {'league_id': league_id, 'player_id': row['player_id'], 'positions': list(row['slots']),
+         'salary': int(row['salary']), 'projected_games': int(games[i]),
+         'projected_total': round(float(totals[i]), 2), 'vorp': round(float(vorp[i]), 2),
+         'value_per_dollar': round(float(per_dollar[i]), 4),
+         'vorp_score': round(max(float(vorp[i]), 0.0) / top_vorp, 4),
+         'value_score': round(float(per_dollar[i]) / top_value, 4),
+         'vorp_rank': int(vorp_rank[i]), 'value_rank': int(value_rank[i])}
+        for i, row in enumerate(pool)
+    ]
+
+class MinSalaryTree:
+    """Segment tree of salaries in rank order; finds the best-ranked entry under a budget"""
+
+    def __init__(self, salaries: Sequence[float]):
+        self.size = 1
+        while self.size < max(len(salaries), 1):
+            self.size *= 2
+        self.tree = [math.inf] * (2 * self.size)
+        self.tree[self.size:self.size + len(salaries)] = list(salaries)
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = min(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def set(self, index: int, salary: float) -> None:
+        node = index + self.size
+        self.tree[node] = salary
+        node //= 2
+        while node:
+            self.tree[node] = min(self.tree[2 * node], self.tree[2 * node + 1])
+            node //= 2
+
+    def first_at_most(self, budget: float, start: int = 0) -> Optional[int]:
+        """Lowest index >= start with salary <= budget"""
+        # Unavailable entries are inf, so an unlimited budget must stay below it
+        return self._find(1, 0, self.size, min(budget, sys.float_info.max), start)
+
+    def _find(self, node: int, lo: int, hi: int, budget: float, start: int) -> Optional[int]:
+        if hi <= start or self.tree[node] > budget:
+            return None
+        if hi - lo == 1:
+            return lo
+        mid = (lo + hi) // 2
+        found = self._find(2 * node, lo, mid, budget, start)
+        return found if found is not None else self._find(2 * node + 1, mid, hi, budget, start)
+
+class DraftRankingIndex:
+    """
+    One league's undrafted players, queryable by budget and position.
+
+    Rows are fantasy_draft_rankings rows (league_rankings output or read back
+    from the table). Each order in ORDERS keeps its own rank order and a
+    MinSalaryTree per slot (plus 'UTIL' for everyone); drafted players are set
+    to an infinite salary so every query skips them.
+    """
+
+    def __init__(self, rows: Iterable[Dict[str, Any]]):
+        self.rows = {row['player_id']: row for row in rows}
+        self.team_salaries: Dict[str, int] = {}
+        for row in self.rows.values():
+            if row.get('drafted_by_team_id'):
+                team = row['drafted_by_team_id']
+                self.team_salaries[team] = self.team_salaries.get(team, 0) + row['salary']
+        self.order: Dict[str, List[str]] = {}
+        self.position: Dict[str, Dict[str, int]] = {}
+        self.trees: Dict[Tuple[str, str], MinSalaryTree] = {}
+        for by in ORDERS:
+            ranked = sorted(self.rows.values(), key=lambda row: row[ORDERS[by]])
+            self.order[by] = [row['player_id'] for row in ranked]
+            self.position[by] = {player_id: i for i, player_id in enumerate(self.order[by])}
+            for slot in SLOTS + ('UTIL',):
+                self.trees[(by, slot)] = MinSalaryTree([
+                    row['salary'] if self._available(row) and (slot == 'UTIL' or slot in row['positions']) else math.inf
+                    for row in ranked
+                ])
+
+    @staticmethod
+    def _available(row: Dict[str, Any]) -> bool:
+        return not row.get('drafted_by_team_id')
+
+    def _update(self, player_id: str) -> None:
+        row = self.rows[player_id]
+        for by in ORDERS:
+            index = self.position[by][player_id]
+            for slot in SLOTS + ('UTIL',):
+                eligible = self._available(row) and (slot == 'UTIL' or slot in row['positions'])
+                self.trees[(by, slot)].set(index, row['salary'] if eligible else math.inf)
+
+    def draft(self, player_id: str, team_id: str) -> None:
+        """Take a player out of every query"""
+        row = self.rows.get(player_id)
+        if row and not row.get('drafted_by_team_id'):
+            row['drafted_by_team_id'] = team_id
+            self.team_salaries[team_id] = self.team_salaries.get(team_id, 0) + row['salary']
+            self._update(player_id)
+
+    def undraft(self, player_id: str) -> None:
+        """Put a player back (an undone pick)"""
+        row = self.rows.get(player_id)
+        if row and row.get('drafted_by_team_id'):
+            self.team_salaries[row['drafted_by_team_id']] -= row['salary']
+            row['drafted_by_team_id'] = None
+            self._update(player_id)
+
+    def best_available(self, budget: float, slot: Optional[str] = None, by: str = 'vorp',
+                       count: int = 1) -> List[Dict[str, Any]]:
+        """Top `count` undrafted players with salary <= budget that can fill `slot` (any slot if None)"""
+        tree = self.trees[(by, slot or 'UTIL')]
+        found = []
+        start = 0
+        while len(found) < count:
+            index = tree.first_at_most(budget, start)
+            if index is None:
+                break
+            found.append(self.rows[self.order[by][index]])
+            start = index + 1
+        return found
+
+    def team_salary(self, team_id: str) -> int:
+        """Salary a team has drafted from these rows (get_best_available_player sums every pick)"""
+        return self.team_salaries.get(team_id, 0)
+
+def projection_preference(row: Dict[str, Any], season_year: int) -> Tuple[float, float]:
+    """Sort key among a player's projection rows: best crosswalk match, then most projected points"""
+    projected = (row.get(f'proj_{season_year}_pts') or 0) * (row.get(f'proj_{season_year}_gp') or 0)
+    return float(row.get('match_confidence') or 0), float(projected)
+
+def load_pool(supabase: Client, season_year: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """(pool, projections): active players with a salary and a projection, aligned by index.
+    nba_espn_projections can match several rows to one player; the preferred one is kept"""
+    players = {row['id']: row for row in iter_rows(supabase, 'nba_players', 'id, position, is_active')
+               if row.get('is_active') is not False}
+    salaries = {row['player_id']: row[SALARY_COLUMN] for row in iter_rows(
+        supabase, 'nba_hoopshype_salaries', f'id, player_id, {SALARY_COLUMN}') if row.get('player_id') and row.get(SALARY_COLUMN)}
+    best: Dict[str, Dict[str, Any]] = {}
+    for row in iter_rows(supabase, 'nba_espn_projections', '*'):
+        player_id = row.get('player_id')
+        if player_id not in players or player_id not in salaries:
+            continue
+        if player_id not in best or projection_preference(row, season_year) > projection_preference(best[player_id], season_year):
+            best[player_id] = row
+    pool, projections = [], []
+    for player_id, row in best.items():
+        pool.append({'player_id': player_id, 'salary': salaries[player_id],
+                     'slots': eligible_slots(players[player_id].get('position'))})
+        projections.append(row)
+    return pool, projections
+
+def load_draft_leagues(supabase: Client, season_year: int,
+                       league_id: Optional[str] = None) -> List[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """(league, season) for leagues whose draft still needs rankings"""
+    filters = [('eq', 'season_year', season_year)]
+    if league_id:
+        filters.append(('eq', 'league_id', league_id))
+    else:
+        filters.append(('in_', 'draft_status', list(RANKED_DRAFT_STATUSES)))
+    seasons = {row['league_id']: row for row in iter_rows(
+        supabase, 'fantasy_league_seasons',
+        'id, league_id, season_year, draft_status, current_teams, roster_positions, custom_scoring_categories', filters)}
+    leagues = iter_rows(supabase, 'fantasy_leagues', 'id, max_teams, fantasy_scoring_format')
+    return [(league, seasons[league['id']]) for league in leagues if league['id'] in seasons]
+
+def drafted_players(supabase: Client, league_ids: List[str]) -> Dict[Tuple[str, str], str]:
+    """(league_id, player_id) -> fantasy_team_id for picks already made in these leagues"""
+    return {(row['league_id'], row['player_id']): row['fantasy_team_id'] for row in iter_rows(
+        supabase, 'fantasy_draft_picks', 'id, league_id, player_id, fantasy_team_id', [('in_', 'league_id', league_ids)])}
+
+def stale_rankings(supabase: Client, rows: List[Dict[str, Any]]) -> Dict[str, List[str]]:
+    """league_id -> player_ids ranked by an earlier run but missing from `rows`"""
+    current = {(row['league_id'], row['player_id']) for row in rows}
+    league_ids = sorted({league_id for league_id, _ in current})
+    stale: Dict[str, List[str]] = {}
+    for row in iter_rows(supabase, TABLE, 'id, league_id, player_id', [('in_', 'league_id', league_ids)]):
+        if (row['league_id'], row['player_id']) not in current:
+            stale.setdefault(row['league_id'], []).append(row['player_id'])
+    return stale
+
+def build_rankings(supabase: Client, season_year: int, league_id: Optional[str] = None,
+                   dry_run: bool = False) -> Dict[str, Any]:
+    """Rank the player pool for every drafting league and write fantasy_draft_rankings"""
+    timings = {}
+    start = time.perf_counter()
+    leagues = load_draft_leagues(supabase, season_year, league_id)
+    pool, projections = load_pool(supabase, season_year) if leagues else ([], [])
+    timings['load'] = time.perf_counter() - start
+    stats = {'leagues': len(leagues), 'players': len(pool), 'rows': 0, 'timings': timings}
+    if not leagues or not pool:
+        timings['rank'] = timings['write'] = 0.0
+        return stats
+
+    start = time.perf_counter()
+    _, scorings = zip(*[league_scoring(league, season) for league, season in leagues])
+    weights, _, inverse = profile_columns(list(scorings))
+    per_game, games = projection_matrix(projections, season_year)
+    totals = (per_game @ weights) * games[:, None]
+
+    rows = []
+    drafted = drafted_players(supabase, [league['id'] for league, _ in leagues])
+    for i, (league, season) in enumerate(leagues):
+        teams = season.get('current_teams') or league.get('max_teams') or DEFAULT_TEAMS
+        ranked = league_rankings(league['id'], pool, totals[:, inverse[i]], games, teams,
+                                 season.get('roster_positions') or DEFAULT_ROSTER_POSITIONS)
+        for row in ranked:
+            row['drafted_by_team_id'] = drafted.get((league['id'], row['player_id']))
+        rows.extend(ranked)
+    timings['rank'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    if not dry_run:
+        progress = log.progress(TABLE, total=len(rows))
+        for chunk in chunked(rows, UPSERT_CHUNK_SIZE):
+            supabase.table(TABLE).upsert(chunk, on_conflict='league_id,player_id').execute()
+            progress.update(len(chunk))
+        progress.done()
+        # Players that left the pool (released, no salary, no projection) must not stay pickable
+        stale = stale_rankings(supabase, rows)
+        for stale_league_id, player_ids in stale.items():
+            for chunk in chunked(player_ids, DELETE_CHUNK_SIZE):
+                supabase.table(TABLE).delete().eq('league_id', stale_league_id).in_('player_id', chunk).execute()
+        stats['stale'] = sum(len(player_ids) for player_ids in stale.values())
+    timings['write'] = time.perf_counter() - start
+
+    stats['rows'] = len(rows)
+    stats['rankings'] = rows
+    return stats
+
+def main():
+    """Main function"""
+    from shared_client import get_client
+
+    parser = argparse.ArgumentParser(description="Build value-over-replacement draft rankings per league")
+    parser.add_argument('--season-year', type=int, default=date.today().year + (date.today().month >= 7),
+                        help="Fantasy season year, e.g. 2026 for 2025-26")
+    parser.add_argument('--league-id', help="Only this league (any draft status)")
+    parser.add_argument('--dry-run', action='store_true', help="Rank without writing")
+    args = parser.parse_args()
+
+    url = os.getenv('VITE_SUPABASE_URL') or os.getenv('SUPABASE_URL')
+    key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('SUPABASE_KEY')
+    if not url or not key:
+        print("❌ Missing Supabase credentials: VITE_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+        sys.exit(1)
+
+    supabase = get_client(url, key)
+    print(f"📋 Building draft rankings{' (dry run)' if args.dry_run else ''}")
+    stats = build_rankings(supabase, args.season_year, args.league_id, args.dry_run)
+    timings = stats['timings']
+    print(f"✅ {stats['leagues']:,} leagues x {stats['players']:,} players → {stats['rows']:,} ranking rows")
+    print(f"   ⏱️  load {timings['load']:.1f}s, rank {timings['rank'] * 1000:.0f} ms, write {timings['write']:.1f}s")
+    if stats.get('stale'):
+        print(f"   🧹 Removed {stats['stale']:,} rankings of players no longer in the pool")
+
+    if args.league_id and stats['rows']:
+        index = DraftRankingIndex(stats['rankings'])
+        for row in index.best_available(math.inf, count=5):
+            print(f"   🏀 #{row['vorp_rank']:<3} vorp {row['vorp']:>7.1f}  ${row['salary']:>12,}  "
+                  f"{row['value_per_dollar']:>6.2f}/$1M  {'/'.join(row['positions']) or 'UTIL'}")
+
+if __name__ == "__main__":
+    main()
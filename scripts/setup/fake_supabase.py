@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+In-Memory Supabase Client
+Drop-in stand-in for supabase.Client covering the fluent subset the import
+scripts use, backed by plain in-memory tables.
+
+    supabase = FakeSupabaseClient({'nba_players': players})
+    import_espn_projections(supabase, "supabase/espn_projections.json")
+    print(supabase.stats())                       # round trips and payload bytes
+    with supabase.budget(max_requests=20):        # fail if an importer gets chattier
+        import_espn_projections(supabase, "supabase/espn_projections.json")
+
+Supported:
+    table/from_ + select(columns, count='exact'), insert, upsert(on_conflict,
+    ignore_duplicates), update, delete, rpc (functions registered with
+    register_rpc), filters eq/neq/gt/gte/lt/lte/is_/in_/like/ilike, order,
+    limit, offset, range, single/maybe_single, and one level of embedded
+    selects such as 'id, nba_players(id, name)' through FOREIGN_KEYS.
+
+Every execute() counts as one round trip; request and response bodies are
+measured as JSON to approximate payload bytes.
+"""
+
+import copy
+import fnmatch
+import json
+import re
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# (table, embedded table) -> foreign key column on `table`
+FOREIGN_KEYS = {
+    ('nba_player_crosswalk', 'nba_players'): 'player_id',
+    ('nba_espn_projections', 'nba_players'): 'player_id',
+    ('nba_hoopshype_salaries', 'nba_players'): 'player_id',
+    ('player_game_logs', 'players'): 'player_id',
+}
+
+# Columns filled in on insert when missing, like the real table defaults
+DEFAULT_COLUMNS = ('id', 'created_at', 'updated_at')
+
+_EMBED_RE = re.compile(r'(\w+)\s*\(([^()]*)\)')
+
+class RequestBudgetExceeded(AssertionError):
+    """Raised when code under budget() issued more requests than allowed"""
+
+class FakeResponse:
+    """Same shape as postgrest's APIResponse"""
+
+    def __init__(self, data: Any, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+def _payload_size(payload: Any) -> int:
+    if payload is None:
+        return 0
+    return len(json.dumps(payload, default=str))
+
+def _sort_key(value: Any) -> Tuple[bool, Any]:
+    # Postgres puts NULLs last when ascending
+    return (value is None, value if value is not None else 0)
+
+def parse_columns(columns: str) -> Tuple[List[str], Dict[str, List[str]]]:
+    """'id, name, nba_players(id, name)' -> (['id', 'name'], {'nba_players': ['id', 'name']})"""
+    embeds = {table: [c.strip() for c in cols.split(',') if c.strip()] for table, cols in _EMBED_RE.findall(columns)}
+    plain = [c.strip() for c in _EMBED_RE.sub('', columns).split(',') if c.strip()]
+    return plain, embeds
+
+class FakeQuery:
+    """One request being built; execute() runs it against the in-memory tables"""
+
+    def __init__(self, client: 'FakeSupabaseClient', table: str):
+        self.client = client
+        self.table = table
+        self.operation = 'select'
+        self.columns = '*'
+        self.count: Optional[str] = None
+        self.payload: Any = None
+        self.on_conflict: Optional[str] = None
+        self.ignore_duplicates = False
+        self.filters: List[Callable[[Dict[str, Any]], bool]] = []
+        self.ordering: List[Tuple[str, bool]] = []
+        self.limit_count: Optional[int] = None
+        self.offset_count = 0
+        self.single_row: Optional[str] = None
+        self.negate_next = False
+
+    # Operations
+
+    def select(self, columns: str = '*', count: Optional[str] = None) -> 'FakeQuery':
+        self.operation, self.columns, self.count = 'select', columns, count
+        return self
+
+    def insert(self, rows: Any, count: Optional[str] = None, **kwargs) -> 'FakeQuery':
+        self.operation, self.payload, self.count = 'insert', rows, count
+        return self
+
+    def upsert(self, rows: Any, on_conflict: Optional[str] = None, ignore_duplicates: bool = False,
+               count: Optional[str] = None, **kwargs) -> 'FakeQuery':
+        self.operation, self.payload, self.count = 'upsert', rows, count
+        self.on_conflict, self.ignore_duplicates = on_conflict, ignore_duplicates
+        return self
+
+    def update(self, values: Dict[str, Any], count: Optional[str] = None, **kwargs) -> 'FakeQuery':
+        self.operation, self.payload, self.count = 'update', values, count
+        return self
+
+    def delete(self, count: Optional[str] = None, **kwargs) -> 'FakeQuery':
+        self.operation, self.count = 'delete', count
+        return self
+
+    # Filters
+
+    def _filter(self, name: str, predicate: Callable[[Dict[str, Any]], bool]) -> 'FakeQuery':
+        if self.negate_next:
+            raise ValueError(f"Unsupported filter not.{name}: the fake client only supports not_ before is_")
+        self.filters.append(predicate)
+        return self
+
+    @property
+    def not_(self) -> 'FakeQuery':
+        """Negate the next filter (not.is.null); only is_ is supported"""
+        self.negate_next = True
+        return self
+
+    def eq(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('eq', lambda row: row.get(column) == value)
+
+    def neq(self, column: str, value: Any) -> 'FakeQuery':
+        # Like SQL, NULL is neither equal nor unequal to anything
+        return self._filter('neq', lambda row: row.get(column) is not None and row.get(column) != value)
+
+    def gt(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('gt', lambda row: row.get(column) is not None and row.get(column) > value)
+
+    def gte(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('gte', lambda row: row.get(column) is not None and row.get(column) >= value)
+
+    def lt(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('lt', lambda row: row.get(column) is not None and row.get(column) < value)
+
+    def lte(self, column: str, value: Any) -> 'FakeQuery':
+        return self._filter('lte', lambda row: row.get(column) is not None and row.get(column) <= value)
+
+    def is_(self, column: str, value: Any) -> 'FakeQuery':
+        negate, self.negate_next = self.negate_next, False
+        if value is None or str(value).lower() == 'null':
+            return self._filter('is', lambda row: (row.get(column) is None) != negate)
+        expected = str(value).lower() == 'true'
+        return self._filter('is', lambda row: (row.get(column) is expected) != negate)
+
+    def in_(self, column: str, values: List[Any]) -> 'FakeQuery':
+        allowed = set(values)
+        return self._filter('in', lambda row: row.get(column) in allowed)
+
+    def like(self, column: str, pattern: str) -> 'FakeQuery':
+        glob = pattern.replace('%', '*').replace('_', '?')
+        return self._filter('like', lambda row: row.get(column) is not None and fnmatch.fnmatchcase(str(row.get(column)), glob))
+
+    def ilike(self, column: str, pattern: str) -> 'FakeQuery':
+        glob = pattern.replace('%', '*').replace('_', '?').lower()
+        return self._filter('ilike', lambda row: row.get(column) is not None and fnmatch.fnmatchcase(str(row.get(column)).lower(), glob))
+
+    # Modifiers
+
+    def order(self, column: str, desc: bool = False, **kwargs) -> 'FakeQuery':
+        self.ordering.append((column, desc))
+        return self
+
+    def limit(self, count: int) -> 'FakeQuery':
+        self.limit_count = count
+        return self
+
+    def offset(self, count: int) -> 'FakeQuery':
+        self.offset_count = count
+        return self
+
+    def range(self, start: int, end: int) -> 'FakeQuery':
+        self.offset_count, self.limit_count = start, end - start + 1
+        return self
+
+    def single(self) -> 'FakeQuery':
+        self.single_row = 'single'
+        return self
+
+    def maybe_single(self) -> 'FakeQuery':
+        self.single_row = 'maybe'
+        return self
+
+    # Execution
+
+    def _matches(self, row: Dict[str, Any]) -> bool:
+        return all(predicate(row) for predicate in self.filters)
+
+    def _project(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        plain, embeds = parse_columns(self.columns)
+        if not plain or '*' in plain:
+            projected = dict(row)
+        else:
+            projected = {column: row.get(column) for column in plain}
+        for embedded, embedded_columns in embeds.items():
+            projected[embedded] = self.client.embed(self.table, embedded, row, embedded_columns)
+        return projected
+
+    def _select(self) -> FakeResponse:
+        rows = [row for row in self.client.tables.get(self.table, []) if self._matches(row)]
+        total = len(rows)
+        for column, desc in reversed(self.ordering):
+            rows.sort(key=lambda row: _sort_key(row.get(column)), reverse=desc)
+        # PostgREST caps every response at the project's max rows
+        limit = min(self.limit_count or self.client.max_rows, self.client.max_rows)
+        rows = rows[self.offset_count:self.offset_count + limit]
+        return FakeResponse([copy.deepcopy(self._project(row)) for row in rows], total if self.count else None)
+
+    def _write_rows(self) -> List[Dict[str, Any]]:
+        rows = self.payload if isinstance(self.payload, list) else [self.payload]
+        table = self.client.tables.setdefault(self.table, [])
+        written = []
+        conflict_columns = [c.strip() for c in (self.on_conflict or 'id').split(',')]
+
+        # Like Postgres, ON CONFLICT DO UPDATE rejects a payload that repeats a conflict key
+        if self.operation == 'upsert' and not self.ignore_duplicates:
+            seen = set()
+            for row in rows:
+                if all(row.get(c) is not None for c in conflict_columns):
+                    key = tuple(row.get(c) for c in conflict_columns)
+                    if key in seen:
+                        raise Exception(f"ON CONFLICT DO UPDATE command cannot affect row a second time "
+                                        f"({self.table}: {dict(zip(conflict_columns, key))})")
+                    seen.add(key)
+
+        for row in rows:
+            row = copy.deepcopy(row)
+            existing = None
+            if self.operation == 'upsert' and all(row.get(c) is not None for c in conflict_columns):
+                key = tuple(row.get(c) for c in conflict_columns)
+                existing = next((r for r in table if tuple(r.get(c) for c in conflict_columns) == key), None)
+
+            if existing is not None:
+                if self.ignore_duplicates:
+                    continue
+                existing.update(row)
+                existing['updated_at'] = row.get('updated_at') or _now()
+                written.append(existing)
+                continue
+
+            for column in DEFAULT_COLUMNS:
+                if row.get(column) is None:
+                    row[column] = str(uuid.uuid4()) if column == 'id' else _now()
+            table.append(row)
+            written.append(row)
+        return written
+
+    def execute(self) -> FakeResponse:
+        self.client.record_request(self.operation, self.table, self.payload)
+
+        if self.operation == 'select':
+            response = self._select()
+        elif self.operation in ('insert', 'upsert'):
+            written = self._write_rows()
+            response = FakeResponse(copy.deepcopy(written), len(written) if self.count else None)
+        elif self.operation == 'update':
+            updated = [row for row in self.client.tables.get(self.table, []) if self._matches(row)]
+            for row in updated:
+                row.update(copy.deepcopy(self.payload))
+                row['updated_at'] = self.payload.get('updated_at') or _now()
+            response = FakeResponse(copy.deepcopy(updated), len(updated) if self.count else None)
+        else:
+            table = self.client.tables.get(self.table, [])
+            deleted = [row for row in table if self._matches(row)]
+            self.client.tables[self.table] = [row for row in table if not self._matches(row)]
+            response = FakeResponse(deleted, len(deleted) if self.count else None)
+
+        if self.single_row:
+            if len(response.data) > 1 or (self.single_row == 'single' and not response.data):
+                raise Exception(f"Expected a single row from {self.table}, got {len(response.data)}")
+            response.data = response.data[0] if response.data else None
+
+        self.client.record_response(response.data)
+        return response
+
+class FakeRpc:
+    """rpc(name, params) - runs a function registered with register_rpc"""
+
+    def __init__(self, client: 'FakeSupabaseClient', name: str, params: Optional[Dict[str, Any]]):
+        self.client = client
+        self.name = name
+        self.params = params or {}
+
+    def execute(self) -> FakeResponse:
+        self.client.record_request('rpc', self.name, self.params)
+        function = self.client.rpcs.get(self.name)
+        if function is None:
+            raise Exception(f"Could not find the function public.{self.name} in the fake client")
+        response = FakeResponse(function(self.client, self.params))
+        self.client.record_response(response.data)
+        return response
+
+class FakeSupabaseClient:
+    """In-memory stand-in for supabase.Client, counting every round trip"""
+
+    def __init__(self, tables: Optional[Dict[str, List[Dict[str, Any]]]] = None, max_rows: int = 1000):
+        self.tables: Dict[str, List[Dict[str, Any]]] = {name: copy.deepcopy(rows) for name, rows in (tables or {}).items()}
+        self.max_rows = max_rows
+        self.rpcs: Dict[str, Callable[['FakeSupabaseClient', Dict[str, Any]], Any]] = {}
+        self.reset_stats()
+        for live_table in ('nba_espn_projections', 'nba_hoopshype_salaries'):
+            self.register_rpc(f"swap_{live_table}_staging", staging_swap(live_table, f"{live_table}_staging"))
+
+    # Client API
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def from_(self, name: str) -> FakeQuery:
+        return self.table(name)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> FakeRpc:
+        return FakeRpc(self, name, params)
+
+    def register_rpc(self, name: str, function: Callable[['FakeSupabaseClient', Dict[str, Any]], Any]) -> None:
+        """function(client, params) -> response data"""
+        self.rpcs[name] = function
+
+    def embed(self, table: str, embedded: str, row: Dict[str, Any], columns: List[str]) -> Optional[Dict[str, Any]]:
+        """The `embedded` row referenced by `row` (many-to-one only)"""
+        foreign_key = FOREIGN_KEYS.get((table, embedded))
+        if foreign_key is None:
+            raise Exception(f"Could not find a relationship between '{table}' and '{embedded}' in the fake client")
+        target = next((r for r in self.tables.get(embedded, []) if r.get('id') == row.get(foreign_key)), None)
+        if target is None:
+            return None
+        return dict(target) if '*' in columns else {column: target.get(column) for column in columns}
+
+    # Request accounting
+
+    def reset_stats(self) -> None:
+        self.requests = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.requests_by_target: Dict[str, int] = {}
+
+    def record_request(self, operation: str, target: str, payload: Any) -> None:
+        self.requests += 1
+        self.bytes_sent += _payload_size(payload)
+        label = f"{operation} {target}"
+        self.requests_by_target[label] = self.requests_by_target.get(label, 0) + 1
+
+    def record_response(self, data: Any) -> None:
+        self.bytes_received += _payload_size(data)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            'requests_by_target': dict(sorted(self.requests_by_target.items())),
+        }
+
+    @contextmanager
+    def budget(self, max_requests: Optional[int] = None, max_bytes: Optional[int] = None) -> Iterator[None]:
+        """Raise RequestBudgetExceeded if the block issues more requests/bytes than allowed"""
+        start_requests = self.requests
+        start_bytes = self.bytes_sent + self.bytes_received
+        yield
+        used_requests = self.requests - start_requests
+        used_bytes = self.bytes_sent + self.bytes_received - start_bytes
+        if max_requests is not None and used_requests > max_requests:
+            raise RequestBudgetExceeded(f"{used_requests} requests issued, budget is {max_requests}")
+        if max_bytes is not None and used_bytes > max_bytes:
+            raise RequestBudgetExceeded(f"{used_bytes} payload bytes transferred, budget is {max_bytes}")
+
+def staging_swap(live_table: str, staging_table: str) -> Callable[[FakeSupabaseClient, Dict[str, Any]], Dict[str, Any]]:
+    """RPC mirroring the swap_*_staging migrations: replace live rows with one load"""
+    def swap(client: FakeSupabaseClient, params: Dict[str, Any]) -> Dict[str, Any]:
+        load_id = params.get('p_load_id')
+        staged = [row for row in client.tables.get(staging_table, []) if row.get('load_id') == load_id]
+        if not staged:
+            return {'success': False, 'error': f"No staged rows for load {load_id}"}
+        replaced = len(client.tables.get(live_table, []))
+        client.tables[live_table] = [{k: v for k, v in row.items() if k != 'load_id'} for row in staged]
+        client.tables[staging_table] = [row for row in client.tables[staging_table] if row.get('load_id') != load_id]
+        return {'success': True, 'replaced_count': replaced, 'inserted_count': len(staged)}
+    return swap
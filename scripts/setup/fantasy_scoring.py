@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Fantasy Scoring Engine
+One definition of every fantasy scoring format, applied to a whole season of
+game logs at once.
+
+A format is a weight per box score stat plus optional double-double and
+triple-double bonuses (the formats in src/utils/fantasyScoring.ts, and the
+NBA's own formula behind nba_fantasy_pts). All formats are stacked into a
+(stats x formats) weight matrix, so scoring N game logs for F formats is
+
+    points = stats (N x S) @ weights (S x F) + bonus flags (N x 2) @ bonuses (2 x F)
+
+Made/missed rules are linear too: Yahoo's +0.5 per make, -0.5 per miss is
+fgm * 1.0 + fga * -0.5.
+
+The job scores player_game_logs (regular season) and nba_boxscores
+(preseason, live season) and upserts one row per player, game and format into
+player_fantasy_points, which the client reads instead of scoring logs in the
+browser.
+
+Usage:
+    python3 scripts/setup/fantasy_scoring.py [--season 2024-25] [--source player_game_logs] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from supabase import Client
+
+from supabase_bulk import chunked, iter_rows
+from setup_log import get_logger
+
+log = get_logger('fantasy_scoring')
+
+TABLE = 'player_fantasy_points'
+SOURCES = ('player_game_logs', 'nba_boxscores')
+
+# Stat columns a format can weight (same names in player_game_logs and nba_boxscores)
+SCORING_STATS = ('pts', 'reb', 'ast', 'stl', 'blk', 'tov', 'fgm', 'fga', 'fg3m', 'ftm', 'fta', 'oreb', 'dreb')
+
+# Categories that count towards double- and triple-doubles
+DOUBLE_DOUBLE_STATS = ('pts', 'reb', 'ast', 'stl', 'blk')
+DOUBLE_DOUBLE_THRESHOLD = 10
+
+# Keep in sync with src/utils/fantasyScoring.ts (names match leagueSettings.fantasy_scoring_format)
+SCORING_FORMATS: Dict[str, Dict[str, Any]] = {
+    'FanDuel': {
+        'weights': {'pts': 1.0, 'reb': 1.2, 'ast': 1.5, 'stl': 2.0, 'blk': 2.0, 'tov': -1.0},
+    },
+    'DraftKings': {
+        'weights': {'pts': 1.0, 'reb': 1.25, 'ast': 1.5, 'stl': 2.0, 'blk': 2.0, 'tov': -0.5},
+        'double_double': 1.5,
+        'triple_double': 3.0,  # On top of the double-double bonus
+    },
+    'Yahoo': {
+        'weights': {'pts': 1.0, 'reb': 1.0, 'ast': 1.0, 'stl': 2.0, 'blk': 2.0, 'tov': -1.0,
+                    'fgm': 1.0, 'fga': -0.5, 'ftm': 1.0, 'fta': -0.5},
+    },
+    'ESPN': {
+        'weights': {'pts': 1.0, 'reb': 1.0, 'ast': 1.0, 'stl': 2.0, 'blk': 2.0, 'tov': -1.0},
+    },
+    'NBA': {
+        'weights': {'pts': 1.0, 'reb': 1.2, 'ast': 1.5, 'stl': 3.0, 'blk': 3.0, 'tov': -1.0},
+    },
+}
+
+UPSERT_CHUNK_SIZE = 1000
+
+def weight_matrix(formats: Dict[str, Dict[str, Any]], stats: Sequence[str] = SCORING_STATS) -> Tuple[np.ndarray, np.ndarray]:
+    """(stats x formats) weights and (2 x formats) double/triple-double bonuses"""
+    index = {stat: i for i, stat in enumerate(stats)}
+    weights = np.zeros((len(stats), len(formats)))
+    bonuses = np.zeros((2, len(formats)))
+    for j, scoring in enumerate(formats.values()):
+        for stat, weight in scoring['weights'].items():
+            if stat not in index:
+                raise ValueError(f"Unknown scoring stat: {stat}")
+            weights[index[stat], j] = weight
+        bonuses[:, j] = scoring.get('double_double', 0.0), scoring.get('triple_double', 0.0)
+    return weights, bonuses
+
+def stat_matrix(rows: List[Dict[str, Any]], stats: Sequence[str] = SCORING_STATS) -> np.ndarray:
+    """(rows x stats) matrix, missing values as 0"""
+    matrix = np.zeros((len(rows), len(stats)))
+    for j, stat in enumerate(stats):
+        matrix[:, j] = np.fromiter((row.get(stat) or 0 for row in rows), dtype=np.float64, count=len(rows))
+    return matrix
+
+def bonus_flags(matrix: np.ndarray, stats: Sequence[str] = SCORING_STATS) -> np.ndarray:
+    """(rows x 2) double-double and triple-double indicators"""
+    columns = [stats.index(stat) for stat in DOUBLE_DOUBLE_STATS]
+    categories = (matrix[:, columns] >= DOUBLE_DOUBLE_THRESHOLD).sum(axis=1)
+    return np.stack([categories >= 2, categories >= 3], axis=1).astype(np.float64)
+
+def score_matrix(matrix: np.ndarray, formats: Dict[str, Dict[str, Any]] = SCORING_FORMATS,
+                 stats: Sequence[str] = SCORING_STATS) -> np.ndarray:
+    """(rows x formats) fantasy points, rounded to 2 decimals"""
+    weights, bonuses = weight_matrix(formats, stats)
+    return np.round(matrix @ weights + bonus_flags(matrix, stats) @ bonuses, 2)
+
+def score_rows(rows: List[Dict[str, Any]], formats: Dict[str, Dict[str, Any]] = SCORING_FORMATS) -> np.ndarray:
+    """Fantasy points for game log rows, one column per format"""
+    return score_matrix(stat_matrix(rows), formats)
+
+def load_game_logs(supabase: Client, source: str, season: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Every scorable row of a game log table (optionally one season)"""
+    columns = ', '.join(('id', 'nba_player_id', 'game_id', 'game_date', 'season_year') + SCORING_STATS)
+    if source == 'player_game_logs':
+        columns += ', nba_fantasy_pts'
+    filters = [('eq', 'season_year', season)] if season else None
+    return list(iter_rows(supabase, source, columns, filters))
+
+def fantasy_point_rows(logs: List[Dict[str, Any]], points: np.ndarray, source: str,
+                       formats: Sequence[str]) -> List[Dict[str, Any]]:
+    """player_fantasy_points rows: one per game log and format"""
+    rows = []
+    for log_row, row_points in zip(logs, points.tolist()):
+        base = {
+            'nba_player_id': log_row['nba_player_id'],
+            'game_id': log_row['game_id'],
+            'game_date': log_row.get('game_date'),
+            'season_year': log_row.get('season_year'),
+            'source': source,
+        }
+        rows.extend(dict(base, scoring_format=name, fantasy_pts=value) for name, value in zip(formats, row_points))
+    return rows
+
+def nba_agreement(logs: List[Dict[str, Any]], points: np.ndarray, formats: Sequence[str]) -> Optional[float]:
+    """Share of logs where the NBA format reproduces the API's nba_fantasy_pts"""
+    if 'NBA' not in formats:
+        return None
+    reported = [(i, row['nba_fantasy_pts']) for i, row in enumerate(logs) if row.get('nba_fantasy_pts') is not None]
+    if not reported:
+        return None
+    rows, values = zip(*reported)
+    computed = points[list(rows), list(formats).index('NBA')]
+    return float(np.mean(np.abs(computed - np.array(values, dtype=np.float64)) < 0.01))
+
+def score_source(supabase: Client, source: str, season: Optional[str], dry_run: bool) -> Dict[str, Any]:
+    """Score one game log table for every format and materialize the points"""
+    start = time.perf_counter()
+    logs = load_game_logs(supabase, source, season)
+    loaded = time.perf_counter()
+    formats = list(SCORING_FORMATS)
+    points = score_rows(logs, SCORING_FORMATS) if logs else np.zeros((0, len(formats)))
+    scored = time.perf_counter()
+
+    rows = fantasy_point_rows(logs, points, source, formats)
+    if not dry_run:
+        progress = log.progress(f'{source} points', total=len(rows))
+        for chunk in chunked(rows, UPSERT_CHUNK_SIZE):
+            supabase.table(TABLE).upsert(chunk, on_conflict='source,nba_player_id,game_id,scoring_format').execute()
+            progress.update(len(chunk))
+        progress.done()
+
+    return {
+        'source': source,
+        'logs': len(logs),
+        'rows': len(rows),
+        'load_seconds': loaded - start,
+        'score_seconds': scored - loaded,
+        'write_seconds': time.perf_counter() - scored,
+        'nba_agreement': nba_agreement(logs, points, formats),
+    }
+
+def main():
+    """Main function"""
+    from shared_client import get_client
+
+    parser = argparse.ArgumentParser(description="Materialize fantasy points for every scoring format")
+    parser.add_argument('--season', help="Only this season_year, e.g. 2024-25 (default: all)")
+    parser.add_argument('--source', choices=SOURCES, action='append', help="Game log table (default: both)")
+    parser.add_argument('--dry-run', action='store_true', help="Score without writing player_fantasy_points")
+    args = parser.parse_args()
+
+    url = os.getenv('VITE_SUPABASE_URL') or os.getenv('SUPABASE_URL')
+    key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('SUPABASE_KEY')
+    if not url or not key:
+        print("❌ Missing Supabase credentials: VITE_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+        sys.exit(1)
+
+    supabase = get_client(url, key)
+    print(f"🧮 Scoring game logs for {', '.join(SCORING_FORMATS)}{' (dry run)' if args.dry_run else ''}")
+    failed = []
+    for source in args.source or SOURCES:
+        try:
+            stats = score_source(supabase, source, args.season, args.dry_run)
+        except Exception as e:
+            print(f"   ❌ {source}: {e}")
+            failed.append(source)
+            continue
+        print(f"   ✅ {source}: {stats['logs']:,} game logs → {stats['rows']:,} rows "
+              f"(load {stats['load_seconds']:.1f}s, score {stats['score_seconds'] * 1000:.0f} ms, "
+              f"write {stats['write_seconds']:.1f}s)")
+        if stats['nba_agreement'] is not None:
+            print(f"   📊 NBA format matches nba_fantasy_pts on {stats['nba_agreement'] * 100:.1f}% of logs")
+
+    if failed:
+        print(f"❌ Scoring failed for {', '.join(failed)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
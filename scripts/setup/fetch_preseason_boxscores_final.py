@@ -10,13 +10,18 @@ import json
 import time
 from datetime import datetime
 from typing import List, Dict, Optional
-from supabase import create_client, Client
+from supabase import Client
+from shared_client import get_client
 from dotenv import load_dotenv
 from nba_api.stats.endpoints import boxscoretraditionalv3
+from nba_api_decode import decode_data_set
+from setup_log import get_logger
 
 # Load environment variables from .env.local
 load_dotenv('.env.local')
 
+log = get_logger('preseason_boxscores')
+
 def setup_supabase() -> Client:
     """Initialize Supabase client"""
     # Try different environment variable names
@@ -35,7 +40,7 @@ def setup_supabase() -> Client:
         raise Exception("Missing Supabase environment variables")
     
     print(f"✅ Supabase client initialized with URL: {url[:30]}...")
-    return create_client(url, key)
+    return get_client(url, key)
 
 def convert_minutes_to_integer(minutes_str):
     """Convert MM:SS format to integer minutes"""
@@ -81,14 +86,14 @@ def get_or_create_game(supabase: Client, game_id: str, game_info: Dict):
         result = supabase.table('nba_games').insert(new_game).execute()
         
         if result.data and len(result.data) > 0:
-            print(f"✅ Created game: {game_id}")
+            log.debug(f"✅ Created game: {game_id}")
             return True
         else:
-            print(f"❌ Failed to create game: {game_id}")
+            log.warning(f"❌ Failed to create game: {game_id}")
             return False
             
     except Exception as e:
-        print(f"❌ Error with game {game_id}: {e}")
+        log.error(f"❌ Error with game {game_id}: {e}")
         return False
 
 def get_or_create_player(supabase: Client, nba_player_id: int, player_name: str, team_id: int):
@@ -116,19 +121,19 @@ def get_or_create_player(supabase: Client, nba_player_id: int, player_name: str,
             return None
             
     except Exception as e:
-        print(f"❌ Error with player {player_name}: {e}")
+        log.error(f"❌ Error with player {player_name}: {e}")
         return None
 
 def fetch_box_score(game_id: str) -> Optional[Dict]:
     """Fetch box score for a specific game"""
     try:
-        print(f"📊 Fetching box score for game {game_id}...")
+        log.debug(f"📊 Fetching box score for game {game_id}...")
         
         # Get box score from NBA API
         box_score = boxscoretraditionalv3.BoxScoreTraditionalV3(game_id=game_id)
-        player_stats = box_score.player_stats.get_data_frame()
+        player_stats = decode_data_set(box_score.player_stats, 'PlayerStats').records()
         
-        print(f"✅ Retrieved {len(player_stats)} players from NBA API")
+        log.debug(f"✅ Retrieved {len(player_stats)} players from NBA API")
         
         return {
             'game_id': game_id,
@@ -137,7 +142,7 @@ def fetch_box_score(game_id: str) -> Optional[Dict]:
         }
         
     except Exception as e:
-        print(f"❌ Error fetching box score for game {game_id}: {e}")
+        log.error(f"❌ Error fetching box score for game {game_id}: {e}")
         return None
 
 def store_box_score_data(supabase: Client, box_score_data: Dict, game_info: Dict):
@@ -146,10 +151,10 @@ def store_box_score_data(supabase: Client, box_score_data: Dict, game_info: Dict
         game_id = box_score_data['game_id']
         stored_count = 0
         
-        print(f"💾 Storing {len(box_score_data['player_stats'])} players for game {game_id}...")
+        log.debug(f"💾 Storing {len(box_score_data['player_stats'])} players for game {game_id}...")
         
         # Store player stats
-        for _, player_stat in box_score_data['player_stats'].iterrows():
+        for player_stat in box_score_data['player_stats']:
             nba_player_id = int(float(player_stat.get('personId')))
             player_name = player_stat.get('nameI')
             team_id = int(float(player_stat.get('teamId')))
@@ -158,7 +163,7 @@ def store_box_score_data(supabase: Client, box_score_data: Dict, game_info: Dict
             player_id = get_or_create_player(supabase, nba_player_id, player_name, team_id)
             
             if not player_id:
-                print(f"❌ Failed to get/create player: {player_name}")
+                log.warning(f"❌ Failed to get/create player: {player_name}")
                 continue
             
             minutes_played = convert_minutes_to_integer(player_stat.get('minutes'))
@@ -215,18 +220,18 @@ def store_box_score_data(supabase: Client, box_score_data: Dict, game_info: Dict
                 
                 if result.data:
                     stored_count += 1
-                    print(f"✅ Stored stats for {player_name} - {transformed_player['pts']} pts")
+                    log.debug(f"✅ Stored stats for {player_name} - {transformed_player['pts']} pts")
                 else:
-                    print(f"❌ Failed to store stats for {player_name}")
+                    log.warning(f"❌ Failed to store stats for {player_name}")
                     
             except Exception as e:
-                print(f"❌ Database error for {player_name}: {e}")
+                log.error(f"❌ Database error for {player_name}: {e}")
         
-        print(f"📊 Successfully stored {stored_count}/{len(box_score_data['player_stats'])} players for game {game_id}")
+        log.debug(f"📊 Successfully stored {stored_count}/{len(box_score_data['player_stats'])} players for game {game_id}")
         return stored_count
         
     except Exception as e:
-        print(f"❌ Error storing box score data: {e}")
+        log.error(f"❌ Error storing box score data: {e}")
         return 0
 
 def main():
@@ -251,17 +256,19 @@ def main():
     
     print(f"\n🎮 Processing {len(preseason_games)} games...")
     print("-" * 60)
+    progress = log.progress('games', total=len(preseason_games))
     
     for i, game_info in enumerate(preseason_games, 1):
+        progress.update()
         game_id = game_info['game_id']
         date = game_info['date']
         matchup = f"{game_info['away_team']} @ {game_info['home_team']}"
         
-        print(f"\n[{i}/{len(preseason_games)}] 🎮 {game_id}: {matchup} ({date})")
+        log.debug(f"[{i}/{len(preseason_games)}] 🎮 {game_id}: {matchup} ({date})")
         
         # Step 1: Create or verify game exists
         if not get_or_create_game(supabase, game_id, game_info):
-            print(f"❌ Failed to create game {game_id}. Skipping.")
+            log.warning(f"❌ Failed to create game {game_id}. Skipping.")
             continue
         
         # Step 2: Fetch box score
@@ -273,11 +280,13 @@ def main():
             total_players_imported += stored_count
             successful_games += 1
         else:
-            print(f"❌ Failed to fetch box score for game {game_id}")
+            log.warning(f"❌ Failed to fetch box score for game {game_id}")
         
         # Rate limiting
         time.sleep(1)
     
+    progress.done(games=successful_games, players=total_players_imported)
+    
     print(f"\n🎯 Import Summary:")
     print(f"   Total games processed: {len(preseason_games)}")
     print(f"   Successful games: {successful_games}")
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+HTTP Record/Replay Fixtures
+Capture the stats.nba.com and Supabase (PostgREST) traffic of a real import run
+and serve it back later without a network, so importers and the whole
+supa_setup.py pipeline can be benchmarked deterministically.
+
+Recording wraps requests (nba_api, scrapers) and httpx (supabase-py) and appends
+every response to <fixtures dir>/http_fixtures-<pid>.jsonl.gz (one file per
+process, so subprocess steps can record side by side). Replaying answers the
+same calls from those files instead of the network; nothing leaves the machine.
+
+Requests are matched on method + path + query string (not host or body), so a
+replay works against any Supabase URL and with fresh load ids/timestamps in
+write bodies. A request made several times gets its recorded responses in
+order, and the last one repeats after that. Responses are also recorded under
+the supa_setup step that made the request (setup_log.current_step()), and each
+step replays only its own: steps running side by side that issue the same
+request (e.g. the snapshot version checks) can't receive each other's responses
+whatever order they arrive in. Requests outside any step, and fixtures recorded
+without steps, share one queue per request. An unrecorded request fails like a
+connection error.
+
+Usage:
+    python3 scripts/setup/http_fixtures.py record fixtures/ scripts/setup/import_espn_projections.py
+    python3 scripts/setup/http_fixtures.py replay fixtures/ scripts/setup/import_espn_projections.py
+    python3 scripts/setup/supa_setup.py --record fixtures/    # or --replay fixtures/
+
+For repeatable replays also point HOOPGEEK_CACHE_DIR at an empty directory so
+no player snapshot from a previous run is reused.
+"""
+
+import argparse
+import atexit
+import base64
+import glob
+import gzip
+import json
+import os
+import runpy
+import sys
+import threading
+from collections import defaultdict, deque
+from typing import Any, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from setup_log import current_step
+
+FIXTURES_PATTERN = 'http_fixtures-*.jsonl.gz'
+
+# Environment variables that turn recording/replay on (read by install_from_env)
+RECORD_ENV = 'HOOPGEEK_HTTP_RECORD'
+REPLAY_ENV = 'HOOPGEEK_HTTP_REPLAY'
+
+# Response headers worth keeping (PostgREST counts come back in Content-Range)
+KEPT_HEADERS = ('content-type', 'content-range')
+
+# Credentials the importers insist on; any value works during a replay
+REPLAY_CREDENTIALS = {
+    'VITE_SUPABASE_URL': 'http://replay.local',
+    'SUPABASE_URL': 'http://replay.local',
+    'SUPABASE_SERVICE_ROLE_KEY': 'replay',
+    'SUPABASE_KEY': 'replay',
+}
+
+_installed: Optional[str] = None
+
+def request_key(method: str, url: str) -> str:
+    """'GET /rest/v1/nba_players?select=id' - host and body are ignored"""
+    parts = urlsplit(str(url))
+    return f"{method.upper()} {parts.path}{'?' + parts.query if parts.query else ''}"
+
+class Recorder:
+    """Appends responses to the fixtures file (thread-safe)"""
+
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, FIXTURES_PATTERN.replace('*', str(os.getpid())))
+        self.lock = threading.Lock()
+        self.file = gzip.open(self.path, 'at', encoding='utf-8')
+        self.count = 0
+
+    def record(self, method: str, url: str, status: int, headers: Any, body: bytes) -> None:
+        entry = {
+            'step': current_step(),
+            'key': request_key(method, url),
+            'status': status,
+            'headers': {name: headers[name] for name in KEPT_HEADERS if name in headers},
+            'body': base64.b64encode(body or b'').decode('ascii'),
+        }
+        line = json.dumps(entry) + '\n'
+        with self.lock:
+            self.file.write(line)
+            self.count += 1
+
+    def close(self) -> None:
+        with self.lock:
+            self.file.close()
+
+class Player:
+    """Serves recorded responses in the order they were recorded, per step"""
+
+    def __init__(self, directory: str):
+        self.lock = threading.Lock()
+        self.responses: Dict[Tuple[Optional[str], str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        paths = sorted(glob.glob(os.path.join(directory, FIXTURES_PATTERN)))
+        if not paths:
+            raise FileNotFoundError(f"No HTTP fixtures in {directory}")
+        for path in paths:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    entry = json.loads(line)
+                    self.responses[(entry.get('step'), entry['key'])].append(entry)
+
+    def next(self, method: str, url: str) -> Optional[Tuple[int, Dict[str, str], bytes]]:
+        """(status, headers, body) for a request, None if it was never recorded"""
+        key = request_key(method, url)
+        with self.lock:
+            queue = self.responses.get((current_step(), key)) or self.responses.get((None, key))
+            if not queue:
+                return None
+            entry = queue.popleft() if len(queue) > 1 else queue[0]
+        return entry['status'], entry['headers'], base64.b64decode(entry['body'])
+
+def _install_requests(recorder: Optional[Recorder], player: Optional[Player]) -> None:
+    try:
+        import requests
+        from requests.structures import CaseInsensitiveDict
+    except ImportError:
+        return
+    original_send = requests.Session.send
+
+    def send(self, request, **kwargs):
+        if player is not None:
+            recorded = player.next(request.method, request.url)
+            if recorded is None:
+                raise requests.ConnectionError(f"No recorded response for {request_key(request.method, request.url)}")
+            status, headers, body = recorded
+            response = requests.Response()
+            response.status_code = status
+            response.headers = CaseInsensitiveDict(headers)
+            response._content = body
+            response.url = request.url
+            response.request = request
+            response.encoding = 'utf-8'
+            return response
+
+        response = original_send(self, request, **kwargs)
+        if not kwargs.get('stream'):
+            recorder.record(request.method, request.url, response.status_code, response.headers, response.content)
+        return response
+
+    requests.Session.send = send
+
+def _install_httpx(recorder: Optional[Recorder], player: Optional[Player]) -> None:
+    try:
+        import httpx
+    except ImportError:
+        return
+    original_send = httpx.Client.send
+
+    def send(self, request, *args, **kwargs):
+        if player is not None:
+            recorded = player.next(request.method, str(request.url))
+            if recorded is None:
+                raise httpx.ConnectError(f"No recorded response for {request_key(request.method, request.url)}", request=request)
+            status, headers, body = recorded
+            return httpx.Response(status, headers=headers, content=body, request=request)
+
+        response = original_send(self, request, *args, **kwargs)
+        if response.is_stream_consumed:
+            recorder.record(request.method, str(request.url), response.status_code, response.headers, response.content)
+        return response
+
+    httpx.Client.send = send
+
+def install(mode: str, directory: str) -> None:
+    """Start recording to / replaying from `directory` for the rest of the process"""
+    global _installed
+    if _installed:
+        if _installed != mode:
+            raise RuntimeError(f"HTTP fixtures already installed in {_installed} mode")
+        return
+
+    if mode == 'record':
+        recorder, player = Recorder(directory), None
+        atexit.register(recorder.close)
+    elif mode == 'replay':
+        recorder, player = None, Player(directory)
+        for name, value in REPLAY_CREDENTIALS.items():
+            os.environ.setdefault(name, value)
+    else:
+        raise ValueError(f"Unknown mode: {mode}")
+
+    _install_requests(recorder, player)
+    _install_httpx(recorder, player)
+    _installed = mode
+
+def install_from_env() -> Optional[str]:
+    """Install recording/replay if HOOPGEEK_HTTP_RECORD or HOOPGEEK_HTTP_REPLAY is set"""
+    if os.environ.get(REPLAY_ENV):
+        install('replay', os.environ[REPLAY_ENV])
+        return 'replay'
+    if os.environ.get(RECORD_ENV):
+        install('record', os.environ[RECORD_ENV])
+        return 'record'
+    return None
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Record or replay an import script's HTTP traffic")
+    parser.add_argument('mode', choices=['record', 'replay'])
+    parser.add_argument('fixtures', help="Fixtures directory")
+    parser.add_argument('script', help="Import script to run")
+    args = parser.parse_args()
+
+    os.environ[RECORD_ENV if args.mode == 'record' else REPLAY_ENV] = os.path.abspath(args.fixtures)
+    install_from_env()
+
+    print(f"{'🎙️  Recording' if args.mode == 'record' else '▶️  Replaying'} HTTP fixtures: {args.fixtures}")
+    script = os.path.abspath(args.script)
+    sys.path.insert(0, os.path.dirname(script))
+    sys.argv = [script]
+    runpy.run_path(script, run_name='__main__')
+
+if __name__ == "__main__":
+    main()
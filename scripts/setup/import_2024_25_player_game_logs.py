@@ -13,9 +13,15 @@ import json
 # Add the parent directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from supabase import create_client, Client
+from supabase import Client
+from shared_client import get_client
+from player_snapshot import load_players_by_nba_id
 from nba_api.stats.endpoints import playergamelogs
 from nba_api.stats.library.parameters import Season, SeasonType
+from nba_api_decode import decode_endpoint
+from setup_log import get_logger
+
+log = get_logger('player_game_logs')
 
 def get_supabase_credentials():
     """Get Supabase credentials from environment variables"""
@@ -35,7 +41,7 @@ def get_supabase_credentials():
 def setup_supabase():
     """Initialize Supabase client"""
     url, key = get_supabase_credentials()
-    supabase: Client = create_client(url, key)
+    supabase: Client = get_client(url, key)
     return supabase
 
 def safe_int(value):
@@ -80,24 +86,8 @@ def get_all_players(supabase):
     print("📋 Fetching all players from database...")
     
     try:
-        # Get all players using pagination
-        all_players = []
-        page_size = 1000
-        offset = 0
-        
-        while True:
-            result = supabase.table('players').select('id, nba_player_id, name').limit(page_size).offset(offset).execute()
-            
-            if not result.data:
-                break
-                
-            all_players.extend(result.data)
-            offset += page_size
-            
-            if len(result.data) < page_size:
-                break
-        
-        players = {player['nba_player_id']: player for player in all_players}
+        # Local player snapshot shared by all importers (rebuilt only if the table changed)
+        players = load_players_by_nba_id(supabase, 'players')
         print(f"✅ Found {len(players)} players in database")
         
         return players
@@ -126,7 +116,7 @@ def import_player_game_logs(supabase, season="2024-25", season_type="Regular Sea
         )
         
         # Get the data
-        game_logs_data = game_logs.get_data_frames()[0]  # Get the main dataframe
+        game_logs_data = decode_endpoint(game_logs)[0].records()  # Get the main result set
         
         print(f"✅ Found {len(game_logs_data)} game log records from NBA API")
         
@@ -142,11 +132,14 @@ def import_player_game_logs(supabase, season="2024-25", season_type="Regular Sea
         total_skipped = 0
         total_errors = 0
         
+        progress = log.progress('game logs', total=len(game_logs_data))
+        
         for i in range(0, len(game_logs_data), batch_size):
             batch = game_logs_data[i:i + batch_size]
+            progress.update(len(batch))
             batch_data = []
             
-            for _, row in batch.iterrows():
+            for row in batch:
                 try:
                     # Get player info
                     nba_player_id = safe_int(row.get('PLAYER_ID'))
@@ -235,7 +228,7 @@ def import_player_game_logs(supabase, season="2024-25", season_type="Regular Sea
                     batch_data.append(game_log)
                     
                 except Exception as e:
-                    print(f"⚠️ Error processing game log row: {e}")
+                    log.warning(f"⚠️ Error processing game log row: {e}")
                     total_errors += 1
                     continue
             
@@ -250,16 +243,18 @@ def import_player_game_logs(supabase, season="2024-25", season_type="Regular Sea
                     batch_imported = len(result.data)
                     total_imported += batch_imported
                     
-                    print(f"   Processed batch {i//batch_size + 1}/{(len(game_logs_data) + batch_size - 1)//batch_size}: {batch_imported} records imported")
+                    log.debug(f"   Processed batch {i//batch_size + 1}/{(len(game_logs_data) + batch_size - 1)//batch_size}: {batch_imported} records imported")
                     
                 except Exception as e:
-                    print(f"❌ Error importing batch: {e}")
+                    log.error(f"❌ Error importing batch: {e}", rows=len(batch_data))
                     total_errors += len(batch_data)
                     continue
             
             # Rate limiting
             time.sleep(0.1)  # 100ms delay between batches
         
+        progress.done(imported=total_imported, skipped=total_skipped, errors=total_errors)
+        
         # Summary
         print("=" * 80)
         print("🎉 Player Game Logs Import Complete!")
@@ -2,22 +2,36 @@
 """
 NBA Career Stats Import using nba_api library
 Imports detailed career statistics using the official nba_api Python library
+
+Every result set of the PlayerCareerStats response (regular season, post-season,
+All-Star, college and showcase totals plus season rankings) goes to its own
+table, see RESULT_SET_TABLES. Only the table's known columns are written, so a
+header added to the API doesn't fail the upsert. Rows are collected for
+PLAYER_CHUNK_SIZE players and written with one upsert per result set.
 """
 
 import os
 import sys
 import time
 from datetime import datetime
-from supabase import create_client, Client
+from supabase import Client
+from shared_client import get_client
+from player_snapshot import load_players
 from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from nba_api_decode import ResultSet, decode
+from fantasy_scoring import SCORING_FORMATS
+from setup_log import get_logger
 
 # Configuration (support both frontend and backend env var names)
 SUPABASE_URL = os.getenv('SUPABASE_URL') or os.getenv('VITE_SUPABASE_URL', 'https://qbznyaimnrpibmahisue.supabase.co')
 SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('SUPABASE_KEY')
 
+log = get_logger('career_stats')
+
 def setup_supabase() -> Client:
     """Initialize Supabase client"""
-    print("🔧 Setting up Supabase client...")
+    log.info("🔧 Setting up Supabase client...")
     
     if not SUPABASE_URL:
         raise Exception("SUPABASE_URL/VITE_SUPABASE_URL environment variable is not set")
@@ -25,70 +39,69 @@ def setup_supabase() -> Client:
     if not SUPABASE_SERVICE_KEY:
         raise Exception("SUPABASE_SERVICE_ROLE_KEY/SUPABASE_KEY environment variable is not set")
     
-    print(f"   Using Supabase URL: {SUPABASE_URL}")
-    print(f"   Service key: {'*' * 20}{SUPABASE_SERVICE_KEY[-10:] if SUPABASE_SERVICE_KEY else 'None'}")
+    log.info(f"   Using Supabase URL: {SUPABASE_URL}")
+    log.info(f"   Service key: {'*' * 20}{SUPABASE_SERVICE_KEY[-10:] if SUPABASE_SERVICE_KEY else 'None'}")
     
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
-    print("✅ Supabase client initialized")
+    supabase: Client = get_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    log.info("✅ Supabase client initialized")
     return supabase
 
 def get_players_for_career_stats(supabase: Client, limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """Get players that need career stats imported (backwards-compatible helper)."""
     # Kept for compatibility; fetches up to `limit` or defaults to API cap (~1000)
-    print("📋 Fetching players (non-paginated)...")
+    log.info("📋 Fetching players (non-paginated)...")
     query = supabase.table('players').select('id, nba_player_id, name, is_active').order('id')
     if limit:
         query = query.limit(limit)
     result = query.execute()
     players = result.data or []
-    print(f"✅ Found {len(players)} players (non-paginated)")
+    log.info(f"✅ Found {len(players)} players (non-paginated)")
     return players
 
-def get_all_players_paginated(supabase: Client, page_size: int = 1000) -> List[Dict[str, Any]]:
-    """Fetch all players in paginated batches to bypass 1000-row limit."""
-    print("📋 Fetching players for career stats import (paginated)...")
-    all_players: List[Dict[str, Any]] = []
-    # First query just to get count
-    head = supabase.table('players').select('id', count='exact').limit(1).execute()
-    total = head.count or 0
-    print(f"   Total players in DB: {total}")
-    if total == 0:
-        return []
-    pages = (total + page_size - 1) // page_size
-    for page in range(pages):
-        start = page * page_size
-        end = min(start + page_size - 1, total - 1)
-        print(f"   Fetching players {start+1}-{end+1}...")
-        batch = (
-            supabase
-            .table('players')
-            .select('id, nba_player_id, name, is_active')
-            .order('id')
-            .range(start, end)
-            .execute()
-        )
-        data = batch.data or []
-        all_players.extend(data)
-        # Gentle pace between pages
-        time.sleep(0.5)
-    print(f"✅ Found {len(all_players)} players (paginated)")
+def get_all_players_paginated(supabase: Client) -> List[Dict[str, Any]]:
+    """Fetch all players from the local player snapshot (rebuilt with a paginated read if stale)."""
+    log.info("📋 Fetching players for career stats import (player snapshot)...")
+    all_players = load_players(supabase, 'players')
+    log.info(f"✅ Found {len(all_players)} players (snapshot)")
     return all_players
 
-def calculate_fantasy_points(stats: Dict[str, Any]) -> float:
-    """Calculate fantasy points based on standard scoring"""
-    try:
-        pts = float(stats.get('PTS', 0) or 0)
-        reb = float(stats.get('REB', 0) or 0)
-        ast = float(stats.get('AST', 0) or 0)
-        stl = float(stats.get('STL', 0) or 0)
-        blk = float(stats.get('BLK', 0) or 0)
-        tov = float(stats.get('TOV', 0) or 0)
-        
-        # Standard fantasy scoring: 1pt per point, 1.2 per rebound, 1.5 per assist, 2 per steal/block, -1 per turnover
-        fantasy_pts = pts + (reb * 1.2) + (ast * 1.5) + (stl * 2) + (blk * 2) - tov
-        return round(fantasy_pts, 2)
-    except:
-        return 0.0
+# Columns of the career stats tables (20261019_add_player_career_stats_result_sets.sql)
+STAT_COLUMNS = ('gp', 'gs', 'min_total', 'fgm', 'fga', 'fg_pct', 'fg3m', 'fg3a', 'fg3_pct', 'ftm', 'fta', 'ft_pct',
+                'oreb', 'dreb', 'reb', 'ast', 'stl', 'blk', 'tov', 'pf', 'pts')
+CAREER_COLUMNS = frozenset(('player_id', 'nba_player_id', 'league_id', 'team_id', 'fantasy_pts') + STAT_COLUMNS)
+SEASON_COLUMNS = CAREER_COLUMNS | {'season_id', 'team_abbreviation', 'player_age'}
+RANKING_COLUMNS = (SEASON_COLUMNS - {'fantasy_pts', 'pf'}) | {'eff'}
+COLLEGE_COLUMNS = frozenset(('organization_id', 'school_name'))
+
+# PlayerCareerStats result set -> (table, upsert conflict key, columns)
+RESULT_SET_TABLES = {
+    'CareerTotalsRegularSeason': ('player_career_totals_regular_season', 'player_id', CAREER_COLUMNS),
+    'SeasonTotalsRegularSeason': ('player_season_totals_regular_season', 'player_id,season_id', SEASON_COLUMNS),
+    'SeasonRankingsRegularSeason': ('player_season_rankings_regular_season', 'player_id,season_id', RANKING_COLUMNS),
+    'CareerTotalsPostSeason': ('player_career_totals_post_season', 'player_id', CAREER_COLUMNS),
+    'SeasonTotalsPostSeason': ('player_season_totals_post_season', 'player_id,season_id', SEASON_COLUMNS),
+    'SeasonRankingsPostSeason': ('player_season_rankings_post_season', 'player_id,season_id', RANKING_COLUMNS),
+    'CareerTotalsAllStarSeason': ('player_career_totals_all_star_season', 'player_id', CAREER_COLUMNS),
+    'SeasonTotalsAllStarSeason': ('player_season_totals_all_star_season', 'player_id,season_id', SEASON_COLUMNS),
+    'CareerTotalsCollegeSeason': ('player_career_totals_college_season', 'player_id', CAREER_COLUMNS | COLLEGE_COLUMNS),
+    'SeasonTotalsCollegeSeason': ('player_season_totals_college_season', 'player_id,season_id', SEASON_COLUMNS | COLLEGE_COLUMNS),
+    'CareerTotalsShowcaseSeason': ('player_career_totals_showcase_season', 'player_id', CAREER_COLUMNS),
+    'SeasonTotalsShowcaseSeason': ('player_season_totals_showcase_season', 'player_id,season_id', SEASON_COLUMNS),
+}
+
+# Header -> column names that differ from header.lower() (RANK_ prefixes are dropped first)
+COLUMN_NAMES = {'MIN': 'min_total'}
+TEXT_COLUMNS = {'SEASON_ID', 'TEAM_ABBREVIATION', 'SCHOOL_NAME'}
+SKIPPED_COLUMNS = {'PLAYER_ID'}
+
+# (result set, header) pairs with no column in their table, warned about once
+unknown_headers = set()
+
+# Career totals use FanDuel weights (no bonuses: totals can't tell double-doubles apart)
+FANTASY_WEIGHTS = {stat.upper(): weight for stat, weight in SCORING_FORMATS['FanDuel']['weights'].items()}
+
+# Players whose rows are collected before one upsert per table
+PLAYER_CHUNK_SIZE = 25
 
 def safe_int(value):
     """Safely convert to int"""
@@ -104,139 +117,96 @@ def safe_float(value):
     except (ValueError, TypeError):
         return None
 
-def import_career_totals_regular_season(supabase: Client, player_id: int, nba_player_id: int, career_data: Dict[str, Any]) -> bool:
-    """Import career totals for regular season"""
-    try:
-        if 'CareerTotalsRegularSeason' not in career_data:
-            return False
-        
-        totals = career_data['CareerTotalsRegularSeason']
-        if not totals:
-            return False
-        
-        # Get the first (and usually only) entry
-        stats = totals[0]
-        
-        fantasy_pts = calculate_fantasy_points(stats)
-        
-        data = {
-            'player_id': player_id,
-            'nba_player_id': nba_player_id,
-            'league_id': safe_int(stats.get('LEAGUE_ID')),
-            'team_id': safe_int(stats.get('TEAM_ID')),
-            'gp': safe_int(stats.get('GP')),
-            'gs': safe_int(stats.get('GS')),
-            'min_total': safe_int(stats.get('MIN')),
-            'fgm': safe_int(stats.get('FGM')),
-            'fga': safe_int(stats.get('FGA')),
-            'fg_pct': safe_float(stats.get('FG_PCT')),
-            'fg3m': safe_int(stats.get('FG3M')),
-            'fg3a': safe_int(stats.get('FG3A')),
-            'fg3_pct': safe_float(stats.get('FG3_PCT')),
-            'ftm': safe_int(stats.get('FTM')),
-            'fta': safe_int(stats.get('FTA')),
-            'ft_pct': safe_float(stats.get('FT_PCT')),
-            'oreb': safe_int(stats.get('OREB')),
-            'dreb': safe_int(stats.get('DREB')),
-            'reb': safe_int(stats.get('REB')),
-            'ast': safe_int(stats.get('AST')),
-            'stl': safe_int(stats.get('STL')),
-            'blk': safe_int(stats.get('BLK')),
-            'tov': safe_int(stats.get('TOV')),
-            'pf': safe_int(stats.get('PF')),
-            'pts': safe_int(stats.get('PTS')),
-            'fantasy_pts': fantasy_pts
-        }
-        
-        # Remove None values
-        data = {k: v for k, v in data.items() if v is not None}
-        
-        # Upsert the data
-        result = supabase.table('player_career_totals_regular_season').upsert(
-            data, 
-            on_conflict='player_id'
-        ).execute()
-        
-        return len(result.data) > 0
-        
-    except Exception as e:
-        print(f"❌ Error importing regular season career totals: {e}")
-        return False
+def safe_str(value):
+    """Safely convert to string"""
+    return str(value) if value is not None and value != '' else None
 
-def import_season_totals_regular_season(supabase: Client, player_id: int, nba_player_id: int, career_data: Dict[str, Any]) -> int:
-    """Import season totals for regular season (year by year)"""
-    try:
-        if 'SeasonTotalsRegularSeason' not in career_data:
-            return 0
-        
-        seasons = career_data['SeasonTotalsRegularSeason']
-        if not seasons:
-            return 0
-        
-        imported_count = 0
-        
-        for season_stats in seasons:
-            fantasy_pts = calculate_fantasy_points(season_stats)
-            
-            data = {
-                'player_id': player_id,
-                'nba_player_id': nba_player_id,
-                'season_id': season_stats.get('SEASON_ID'),
-                'league_id': safe_int(season_stats.get('LEAGUE_ID')),
-                'team_id': safe_int(season_stats.get('TEAM_ID')),
-                'team_abbreviation': season_stats.get('TEAM_ABBREVIATION'),
-                'player_age': safe_int(season_stats.get('PLAYER_AGE')),
-                'gp': safe_int(season_stats.get('GP')),
-                'gs': safe_int(season_stats.get('GS')),
-                'min_total': safe_int(season_stats.get('MIN')),
-                'fgm': safe_int(season_stats.get('FGM')),
-                'fga': safe_int(season_stats.get('FGA')),
-                'fg_pct': safe_float(season_stats.get('FG_PCT')),
-                'fg3m': safe_int(season_stats.get('FG3M')),
-                'fg3a': safe_int(season_stats.get('FG3A')),
-                'fg3_pct': safe_float(season_stats.get('FG3_PCT')),
-                'ftm': safe_int(season_stats.get('FTM')),
-                'fta': safe_int(season_stats.get('FTA')),
-                'ft_pct': safe_float(season_stats.get('FT_PCT')),
-                'oreb': safe_int(season_stats.get('OREB')),
-                'dreb': safe_int(season_stats.get('DREB')),
-                'reb': safe_int(season_stats.get('REB')),
-                'ast': safe_int(season_stats.get('AST')),
-                'stl': safe_int(season_stats.get('STL')),
-                'blk': safe_int(season_stats.get('BLK')),
-                'tov': safe_int(season_stats.get('TOV')),
-                'pf': safe_int(season_stats.get('PF')),
-                'pts': safe_int(season_stats.get('PTS')),
-                'fantasy_pts': fantasy_pts
-            }
-            
-            # Remove None values
-            data = {k: v for k, v in data.items() if v is not None}
-            
-            # Skip if no season_id
-            if not data.get('season_id'):
-                continue
-            
-            # Upsert the data
-            result = supabase.table('player_season_totals_regular_season').upsert(
-                data, 
-                on_conflict='player_id,season_id'
-            ).execute()
-            
-            if len(result.data) > 0:
-                imported_count += 1
-        
-        return imported_count
-        
-    except Exception as e:
-        print(f"❌ Error importing regular season totals: {e}")
-        return 0
+def fantasy_points_column(columns: Dict[str, List[Any]], count: int) -> List[float]:
+    """Fantasy points for every row of a totals result set"""
+    totals = [0.0] * count
+    for header, weight in FANTASY_WEIGHTS.items():
+        for i, value in enumerate(columns.get(header, ())):
+            totals[i] += (safe_float(value) or 0.0) * weight
+    return [round(total, 2) for total in totals]
+
+def result_set_rows(result_set: ResultSet, player_id: Any, nba_player_id: int) -> List[Dict[str, Any]]:
+    """Table rows for one result set, converted column by column (unknown headers dropped)"""
+    if not len(result_set):
+        return []
+    _, _, known = RESULT_SET_TABLES[result_set.name]
+    columns = result_set.columns()
+    names, converted = [], []
+    for header, values in columns.items():
+        if header in SKIPPED_COLUMNS:
+            continue
+        is_rank = header.startswith('RANK_')
+        stat = header[len('RANK_'):] if is_rank else header
+        name = COLUMN_NAMES.get(stat, stat.lower())
+        if name not in known:
+            if (result_set.name, header) not in unknown_headers:
+                unknown_headers.add((result_set.name, header))
+                log.warning(f"⚠️  Skipping {result_set.name}.{header}: no such column", result_set=result_set.name)
+            continue
+        if header in TEXT_COLUMNS:
+            convert = safe_str
+        elif stat.endswith('_PCT') and not is_rank:
+            convert = safe_float
+        else:
+            convert = safe_int  # ranks come back as 'NR' when unranked -> None
+        names.append(name)
+        converted.append([convert(value) for value in values])
+
+    rows = [
+        {'player_id': player_id, 'nba_player_id': nba_player_id, **dict(zip(names, values))}
+        for values in zip(*converted)
+    ]
+    if not result_set.name.startswith('SeasonRankings'):
+        for row, fantasy_pts in zip(rows, fantasy_points_column(columns, len(rows))):
+            row['fantasy_pts'] = fantasy_pts
+    if 'season_id' in names:
+        rows = [row for row in rows if row['season_id']]
+    return rows
+
+def collect_career_rows(pending: Dict[str, List[Dict[str, Any]]], player_id: Any, nba_player_id: int,
+                        career_data: Dict[str, Any]) -> Dict[str, int]:
+    """Add the rows of every known result set to `pending`, returns rows per result set"""
+    counts = {}
+    for result_set in decode(career_data):
+        if result_set.name not in RESULT_SET_TABLES:
+            continue
+        rows = result_set_rows(result_set, player_id, nba_player_id)
+        if rows:
+            pending[result_set.name].extend(rows)
+            counts[result_set.name] = len(rows)
+    return counts
+
+def dedupe_rows(rows: List[Dict[str, Any]], on_conflict: str) -> List[Dict[str, Any]]:
+    """Last row per conflict key (traded players have a row per team plus TOT for a season)"""
+    keys = on_conflict.split(',')
+    latest = {tuple(row.get(key) for key in keys): row for row in rows}
+    return list(latest.values())
+
+def flush_career_rows(supabase: Client, pending: Dict[str, List[Dict[str, Any]]], imported: Dict[str, int]) -> int:
+    """One upsert per result set for the collected rows, returns rows that failed"""
+    failed = 0
+    for set_name, rows in pending.items():
+        if not rows:
+            continue
+        table, on_conflict, _ = RESULT_SET_TABLES[set_name]
+        batch = dedupe_rows(rows, on_conflict)
+        try:
+            result = supabase.table(table).upsert(batch, on_conflict=on_conflict).execute()
+            imported[set_name] += len(result.data)
+        except Exception as e:
+            log.error(f"❌ Error upserting {len(batch)} rows into {table}: {e}", table=table, rows=len(batch))
+            failed += len(batch)
+    pending.clear()
+    return failed
 
 def main():
     """Main function"""
-    print("🚀 Starting NBA Career Stats Import using nba_api")
-    print(f"🕐 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-" * 60)
+    log.info("🚀 Starting NBA Career Stats Import using nba_api")
+    log.info(f"🕐 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     try:
         # Import nba_api
@@ -246,124 +216,101 @@ def main():
         supabase = setup_supabase()
         
         # Get ALL players to process using pagination to bypass 1000-row cap
-        players = get_all_players_paginated(supabase, page_size=1000)
+        players = get_all_players_paginated(supabase)
         
         if not players:
-            print("❌ No players found in database")
+            log.error("❌ No players found in database")
             return
         
         # Process players
         successful_updates = 0
         failed_updates = 0
         skipped_players = 0
-        total_career_records = 0
-        total_season_records = 0
+        failed_rows = 0
+        pending: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        imported: Dict[str, int] = defaultdict(int)
         
-        print(f"📝 Processing {len(players)} players...")
+        log.info(f"📝 Processing {len(players)} players...")
+        progress = log.progress('players', total=len(players))
         
         for i, player in enumerate(players, 1):
+            progress.update()
             try:
                 nba_player_id = player['nba_player_id']
                 player_id = player['id']
                 player_name = player['name']
                 
-                print(f"🏀 Fetching career stats for {player_name} (ID: {nba_player_id})...")
+                log.debug(f"🏀 Fetching career stats for {player_name} (ID: {nba_player_id})...")
                 
                 # Fetch career stats using nba_api
                 try:
                     career_stats = playercareerstats.PlayerCareerStats(player_id=nba_player_id)
                     career_data = career_stats.get_dict()
                 except Exception as e:
-                    print(f"⚠️  Error fetching career stats for {player_name}: {e}")
+                    log.warning(f"⚠️  Error fetching career stats for {player_name}: {e}", nba_player_id=nba_player_id)
                     skipped_players += 1
                     continue
                 
                 if not career_data or not career_data.get('resultSets'):
-                    print(f"⚠️  No career stats found for {player_name}")
+                    log.debug(f"⚠️  No career stats found for {player_name}")
                     skipped_players += 1
                     continue
                 
-                # Parse the result sets
-                parsed_data = {}
-                for result_set in career_data['resultSets']:
-                    set_name = result_set['name']
-                    headers = result_set['headers']
-                    rows = result_set['rowSet']
-                    
-                    if rows and len(rows) > 0:
-                        # Convert to list of dictionaries
-                        set_data = []
-                        for row in rows:
-                            row_dict = {}
-                            for j, header in enumerate(headers):
-                                if j < len(row):
-                                    row_dict[header] = row[j]
-                            set_data.append(row_dict)
-                        
-                        parsed_data[set_name] = set_data
+                # Rows of every result set, upserted once per chunk of players
+                counts = collect_career_rows(pending, player_id, nba_player_id, career_data)
                 
-                # Import different types of career data
-                career_imported = 0
-                season_imported = 0
-                
-                # Import career totals
-                if import_career_totals_regular_season(supabase, player_id, nba_player_id, parsed_data):
-                    career_imported += 1
-                
-                # Import season totals
-                season_imported += import_season_totals_regular_season(supabase, player_id, nba_player_id, parsed_data)
-                
-                if career_imported > 0 or season_imported > 0:
+                if counts:
                     successful_updates += 1
-                    total_career_records += career_imported
-                    total_season_records += season_imported
-                    print(f"✅ Updated {player_name} - {career_imported} career records, {season_imported} season records")
+                    summary = ', '.join(f"{count} {name}" for name, count in counts.items())
+                    log.debug(f"✅ Parsed {player_name} - {summary}")
                 else:
                     failed_updates += 1
-                    print(f"❌ No data imported for {player_name}")
+                    log.debug(f"❌ No data imported for {player_name}")
                 
-                # Progress indicator
-                if i % 10 == 0:
-                    print(f"📈 Progress: {i}/{len(players)} players processed")
+                if i % PLAYER_CHUNK_SIZE == 0:
+                    failed_rows += flush_career_rows(supabase, pending, imported)
                 
                 # Rate limiting - be respectful to NBA API
                 time.sleep(2)  # 2 second delay between requests
 
                 # Periodic cool-down every 500 players
                 if i % 500 == 0:
-                    print("⏸️  Cool-down pause (30s) to avoid rate limits...")
+                    log.info("⏸️  Cool-down pause (30s) to avoid rate limits...")
                     time.sleep(30)
                 
             except Exception as e:
-                print(f"❌ Error processing player {player.get('name', 'Unknown')}: {e}")
+                log.error(f"❌ Error processing player {player.get('name', 'Unknown')}: {e}")
                 failed_updates += 1
                 continue
         
+        # Upsert the last partial chunk
+        failed_rows += flush_career_rows(supabase, pending, imported)
+        progress.done(updated=successful_updates, skipped=skipped_players, failed=failed_updates)
+        
         # Summary
-        print("\n" + "="*60)
-        print("🎉 NBA Career Stats Import Complete!")
-        print(f"📊 Summary:")
-        print(f"   Total players processed: {len(players)}")
-        print(f"   ✅ Successful updates: {successful_updates}")
-        print(f"   ⚠️  Skipped (no data): {skipped_players}")
-        print(f"   ❌ Failed updates: {failed_updates}")
-        print(f"   📈 Success rate: {(successful_updates / len(players) * 100):.1f}%")
-        print(f"   📊 Total career records: {total_career_records}")
-        print(f"   📊 Total season records: {total_season_records}")
-        print(f"🕐 Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print("="*60)
+        log.info("🎉 NBA Career Stats Import Complete!")
+        log.info("📊 Summary:")
+        log.info(f"   Total players processed: {len(players)}")
+        log.info(f"   ✅ Successful updates: {successful_updates}")
+        log.info(f"   ⚠️  Skipped (no data): {skipped_players}")
+        log.info(f"   ❌ Failed updates: {failed_updates}")
+        log.info(f"   📈 Success rate: {(successful_updates / len(players) * 100):.1f}%")
+        log.info(f"   ❌ Rows that failed to upsert: {failed_rows}")
+        for set_name, (table, _, _) in RESULT_SET_TABLES.items():
+            log.info(f"   📊 {table}: {imported[set_name]} rows")
+        log.info(f"🕐 Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Verify some updates
         if successful_updates > 0:
-            print("\n🔍 Verifying career stats...")
+            log.info("🔍 Verifying career stats...")
             result = supabase.table('player_career_totals_regular_season').select('player_id, gp, pts, reb, ast, fantasy_pts').limit(5).execute()
             for stats in result.data:
                 player_result = supabase.table('players').select('name').eq('id', stats['player_id']).execute()
                 player_name = player_result.data[0]['name'] if player_result.data else 'Unknown'
-                print(f"   • {player_name}: {stats['gp']} games, {stats['pts']} pts, {stats['reb']} reb, {stats['ast']} ast, {stats['fantasy_pts']} fantasy pts")
+                log.info(f"   • {player_name}: {stats['gp']} games, {stats['pts']} pts, {stats['reb']} reb, {stats['ast']} ast, {stats['fantasy_pts']} fantasy pts")
         
     except Exception as e:
-        print(f"❌ Fatal error: {e}")
+        log.error(f"❌ Fatal error: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -7,9 +7,12 @@ This provides much more detailed information than PlayerIndex
 import os
 import time
 import requests
-from supabase import create_client, Client
+from supabase import Client
+from shared_client import get_client
+from player_snapshot import load_players_by_nba_id
 from nba_api.stats.endpoints import CommonPlayerInfo
-import pandas as pd
+from nba_api_decode import decode_endpoint, is_missing
+from setup_log import get_logger
 from typing import Dict, Any, Optional
 
 # Supabase setup
@@ -20,17 +23,18 @@ if not SUPABASE_URL or not SUPABASE_KEY:
     print("❌ Error: VITE_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY environment variables must be set")
     exit(1)
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+supabase: Client = get_client(SUPABASE_URL, SUPABASE_KEY)
+log = get_logger('comprehensive_player_data')
 
 def safe_str(value: Any) -> Optional[str]:
     """Safely convert value to string, handling None and empty values"""
-    if value is None or value == '' or pd.isna(value):
+    if is_missing(value):
         return None
     return str(value).strip()
 
 def safe_int(value: Any) -> Optional[int]:
     """Safely convert value to int, handling None and empty values"""
-    if value is None or value == '' or pd.isna(value):
+    if is_missing(value):
         return None
     try:
         return int(value)
@@ -39,7 +43,7 @@ def safe_int(value: Any) -> Optional[int]:
 
 def safe_float(value: Any) -> Optional[float]:
     """Safely convert value to float, handling None and empty values"""
-    if value is None or value == '' or pd.isna(value):
+    if is_missing(value):
         return None
     try:
         return float(value)
@@ -48,7 +52,7 @@ def safe_float(value: Any) -> Optional[float]:
 
 def parse_height(height_str: str) -> Optional[str]:
     """Parse height string like '6-9' to inches or return as-is"""
-    if not height_str or pd.isna(height_str):
+    if not height_str or is_missing(height_str):
         return None
     
     height_str = str(height_str).strip()
@@ -70,7 +74,7 @@ def parse_height(height_str: str) -> Optional[str]:
 
 def parse_birthdate(birthdate_str: str) -> Optional[str]:
     """Parse birthdate string to date format"""
-    if not birthdate_str or pd.isna(birthdate_str):
+    if not birthdate_str or is_missing(birthdate_str):
         return None
     
     try:
@@ -86,24 +90,8 @@ def get_all_players(supabase: Client) -> Dict[int, Dict[str, Any]]:
     print("📋 Fetching all players from database...")
     
     try:
-        # Get all players using pagination
-        all_players = []
-        page_size = 1000
-        offset = 0
-        
-        while True:
-            result = supabase.table('nba_players').select('id, nba_player_id, name').limit(page_size).offset(offset).execute()
-            
-            if not result.data:
-                break
-                
-            all_players.extend(result.data)
-            offset += page_size
-            
-            if len(result.data) < page_size:
-                break
-        
-        players = {player['nba_player_id']: player for player in all_players}
+        # Local player snapshot shared by all importers (rebuilt only if the table changed)
+        players = load_players_by_nba_id(supabase, 'nba_players')
         print(f"✅ Found {len(players)} players in database")
         
         return players
@@ -147,14 +135,14 @@ def update_player_comprehensive_data(supabase: Client, nba_player_id: int, playe
         result = supabase.table('nba_players').update(parsed_data).eq('nba_player_id', nba_player_id).execute()
         
         if result.data:
-            print(f"✅ Updated {player_data.get('DISPLAY_FIRST_LAST', 'Unknown Player')} with comprehensive data")
+            log.debug(f"✅ Updated {player_data.get('DISPLAY_FIRST_LAST', 'Unknown Player')} with comprehensive data")
             return True
         else:
-            print(f"❌ Failed to update {player_data.get('DISPLAY_FIRST_LAST', 'Unknown Player')}")
+            log.warning(f"❌ Failed to update {player_data.get('DISPLAY_FIRST_LAST', 'Unknown Player')}", nba_player_id=nba_player_id)
             return False
             
     except Exception as e:
-        print(f"❌ Error updating player {nba_player_id}: {e}")
+        log.error(f"❌ Error updating player {nba_player_id}: {e}", nba_player_id=nba_player_id)
         return False
 
 def import_comprehensive_player_data(active_only: bool = True) -> None:
@@ -179,48 +167,45 @@ def import_comprehensive_player_data(active_only: bool = True) -> None:
     failed_updates = 0
     not_found = 0
     
-    print(f"📝 Processing {len(players)} players...")
+    log.info(f"📝 Processing {len(players)} players...")
+    progress = log.progress('players', total=len(players))
     
-    for i, (nba_player_id, player_info) in enumerate(players.items(), 1):
+    for nba_player_id, player_info in players.items():
+        progress.update()
         try:
             # Get comprehensive player data from NBA API
             player_info_api = CommonPlayerInfo(player_id=nba_player_id)
-            data_frames = player_info_api.get_data_frames()
+            result_sets = decode_endpoint(player_info_api)
             
-            if not data_frames or len(data_frames) == 0:
-                print(f"⚠️ No data found for player {player_info['name']} (ID: {nba_player_id})")
+            if not result_sets:
+                log.debug(f"⚠️ No data found for player {player_info['name']} (ID: {nba_player_id})")
                 not_found += 1
                 continue
             
-            # Get the main player data (first dataframe)
-            main_data = data_frames[0]
+            # Get the main player data (first result set, first row)
+            player_data = result_sets[0].first()
             
-            if main_data.empty:
-                print(f"⚠️ Empty data for player {player_info['name']} (ID: {nba_player_id})")
+            if player_data is None:
+                log.debug(f"⚠️ Empty data for player {player_info['name']} (ID: {nba_player_id})")
                 not_found += 1
                 continue
             
-            # Convert to dict for easier handling
-            player_data = main_data.iloc[0].to_dict()
-            
             # Update in database
             if update_player_comprehensive_data(supabase, nba_player_id, player_data):
                 successful_updates += 1
             else:
                 failed_updates += 1
             
-            # Progress indicator
-            if i % 50 == 0:
-                print(f"📈 Progress: {i}/{len(players)} players processed")
-            
             # Rate limiting - be more conservative with CommonPlayerInfo
             time.sleep(0.2)  # 200ms delay between requests
             
         except Exception as e:
-            print(f"❌ Error processing player {player_info['name']} (ID: {nba_player_id}): {e}")
+            log.error(f"❌ Error processing player {player_info['name']} (ID: {nba_player_id}): {e}", nba_player_id=nba_player_id)
             failed_updates += 1
             continue
     
+    progress.done(updated=successful_updates, not_found=not_found, failed=failed_updates)
+    
     # Summary
     print("\n" + "="*50)
     print("🎉 Comprehensive Player Data Import Complete!")
@@ -232,5 +217,9 @@ def import_comprehensive_player_data(active_only: bool = True) -> None:
     print(f"   📈 Success rate: {(successful_updates / len(players) * 100):.1f}%")
     print("="*50)
 
+def main():
+    """Main function"""
+    import_comprehensive_player_data(active_only=True)
+
 if __name__ == "__main__":
-    import_comprehensive_player_data(active_only=True)
\ No newline at end of file
+    main()
\ No newline at end of file
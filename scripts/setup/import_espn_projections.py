@@ -7,12 +7,21 @@ Imports ESPN fantasy basketball player projections from JSON into the database.
 import os
 import json
 import sys
+from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
-from supabase import create_client, Client
+from supabase import Client
+from shared_client import get_client
+from supabase_bulk import iter_rows, reload_via_staging
+from player_snapshot import load_players
+from player_matching import PlayerNameIndex
+from player_crosswalk import PlayerCrosswalk
+from setup_log import get_logger
 
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+log = get_logger('espn_projections')
+
 def get_supabase_client() -> Client:
     """Get Supabase client"""
     url = os.getenv("VITE_SUPABASE_URL")
@@ -21,96 +30,87 @@ def get_supabase_client() -> Client:
     if not url or not service_key:
         raise ValueError("Missing required environment variables: VITE_SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY")
     
-    return create_client(url, service_key)
+    return get_client(url, service_key)
 
 def manual_match_projections(supabase: Client) -> int:
-    """Manually match ESPN projections to players using exact and fuzzy name matching"""
-    print("   🔍 Fetching players for matching...")
-    
-    # Get active players first (most likely to be in ESPN projections)
-    active_players_result = supabase.table('nba_players').select('id, name, team_name, is_active').eq('is_active', True).execute()
-    active_players = active_players_result.data if active_players_result.data else []
-    
-    # Get all players as fallback
-    all_players_result = supabase.table('nba_players').select('id, name, team_name, is_active').execute()
-    all_players = all_players_result.data if all_players_result.data else []
-    
-    if not all_players:
-        print("   ❌ No players found in database")
-        return 0
-    
-    print(f"   📋 Found {len(active_players)} active players, {len(all_players)} total players")
-    
-    # Get all unmatched projections
-    projections_result = supabase.table('nba_espn_projections').select('id, espn_name, espn_team').is_('player_id', 'null').execute()
-    projections = projections_result.data if projections_result.data else []
+    """
+    Match unmatched ESPN projections to players using exact and fuzzy name matching.
+    
+    Uses a constant number of requests regardless of row count: one paginated
+    pass over the unmatched projections and the crosswalk, the player snapshot
+    check (only if some names are new) and one bulk write-back.
+    """
+    log.info("   🔍 Fetching unmatched projections...")
+    projections = list(iter_rows(
+        supabase,
+        'nba_espn_projections',
+        'id, espn_name, espn_team',
+        filters=[('is_', 'player_id', 'null')]
+    ))
     
     if not projections:
-        print("   ✅ All projections already matched")
+        log.info("   ✅ All projections already matched")
         return 0
     
-    print(f"   📊 Found {len(projections)} unmatched projections")
+    log.info(f"   📊 Found {len(projections)} unmatched projections")
     
-    matched_count = 0
+    # Known names resolve from the crosswalk
+    crosswalk = PlayerCrosswalk(supabase, 'espn')
+    crosswalk.load()
+    new_names = crosswalk.missing([(projection['espn_name'], projection['espn_team']) for projection in projections])
     
-    # Create lookup dictionaries for faster matching
-    def create_lookup_dict(players_list):
-        lookup = {}
-        for player in players_list:
-            # Create multiple lookup keys for each player
-            name_key = player['name'].lower().strip()
-            lookup[name_key] = player
-            
-            # Also try without common suffixes
-            name_no_suffix = name_key.replace(' jr', '').replace(' sr', '').replace(' iii', '').replace(' ii', '').replace(' iv', '')
-            if name_no_suffix != name_key:
-                lookup[name_no_suffix] = player
-            
-            # Try without accents/special characters
-            import unicodedata
-            name_no_accents = ''.join(c for c in unicodedata.normalize('NFD', name_key) if unicodedata.category(c) != 'Mn')
-            if name_no_accents != name_key:
-                lookup[name_no_accents] = player
-                
-        return lookup
+    # Every player goes into one index; active players win name collisions and ties
+    player_index = None
+    if new_names:
+        log.info("   🔍 Loading players for matching...")
+        player_index = PlayerNameIndex(load_players(supabase, 'nba_players'))
+        log.info(f"   📋 Indexed {len(player_index.players)} players ({len(player_index)} names)")
     
-    # Create lookups for active players first, then all players
-    active_lookup = create_lookup_dict(active_players)
-    all_lookup = create_lookup_dict(all_players)
+    matched_at = datetime.now(timezone.utc).isoformat()
+    updates = []
     
     # Match projections
     for projection in projections:
-        espn_name = projection['espn_name'].lower().strip()
+        espn_name = projection['espn_name']
         espn_team = projection['espn_team']
         
-        # Try active players first
-        player = None
-        confidence = 0.0
+        match = crosswalk.resolve(espn_name, espn_team)
+        if not match and player_index:
+            match = player_index.match(espn_name, espn_team)
+            if match:
+                crosswalk.record(espn_name, espn_team, match)
         
-        if espn_name in active_lookup:
-            player = active_lookup[espn_name]
-            confidence = 1.0
-        elif espn_name in all_lookup:
-            player = all_lookup[espn_name]
-            confidence = 0.9  # Slightly lower confidence for inactive players
+        if not match:
+            continue
         
-        if player:
-            # Update the projection with the matched player
-            try:
-                supabase.table('nba_espn_projections').update({
-                    'player_id': player['id'],
-                    'matched_at': 'now()',
-                    'match_confidence': confidence
-                }).eq('id', projection['id']).execute()
-                
-                matched_count += 1
-                status = "🟢" if player['is_active'] else "🟡"
-                print(f"   {status} {projection['espn_name']} → {player['name']} (Active: {player['is_active']})")
-                
-            except Exception as e:
-                print(f"   ❌ Error updating {projection['espn_name']}: {e}")
+        player = match['player']
+        updates.append({
+            'id': projection['id'],
+            'espn_name': espn_name,
+            'player_id': player['id'],
+            'matched_at': matched_at,
+            'match_confidence': match['confidence']
+        })
+        
+        status = "🟢" if player['is_active'] else "🟡"
+        log.debug(f"   {status} {espn_name} → {player['name']} (Active: {player['is_active']}) [{match['method']} {match['confidence']:.2f}]")
+    
+    if not updates:
+        return 0
     
-    return matched_count
+    # Write every match back in one request (upsert on the primary key only touches these columns)
+    try:
+        supabase.table('nba_espn_projections').upsert(updates, on_conflict='id').execute()
+    except Exception as e:
+        log.error(f"   ❌ Error updating matched projections: {e}")
+        return 0
+    
+    try:
+        crosswalk.save()
+    except Exception as e:
+        log.warning(f"   ⚠️  Warning: Could not save crosswalk mappings: {e}")
+    
+    return len(updates)
 
 def parse_stat_value(value, is_integer=False):
     """Parse a stat value, handling empty strings and dashes."""
@@ -134,69 +134,41 @@ def parse_stat_value(value, is_integer=False):
 def import_espn_projections(supabase: Client, json_file: str):
     """Import ESPN projections from JSON file, only importing those that match existing players"""
     if not os.path.exists(json_file):
-        print(f"❌ File {json_file} does not exist")
+        log.error(f"❌ File {json_file} does not exist")
         return
     
     with open(json_file, 'r', encoding='utf-8') as f:
         projections = json.load(f)
     
-    print(f"📊 Loaded {len(projections)} ESPN projections from {json_file}")
-    
-    # Get all players for matching (with pagination to get ALL players)
-    print("🔍 Fetching all players for matching...")
-    all_players = []
-    page_size = 1000
-    offset = 0
-    
-    while True:
-        result = supabase.table('nba_players').select('id, name, team_name, is_active').limit(page_size).offset(offset).execute()
-        if not result.data:
-            break
-        all_players.extend(result.data)
-        print(f"   📄 Fetched page {offset//page_size + 1}: {len(result.data)} players (total: {len(all_players)})")
-        offset += page_size
-        if len(result.data) < page_size:
-            break
-    
-    print(f"   ✅ Fetched {len(all_players)} players from database")
-    
-    if not all_players:
-        print("❌ No players found in database")
-        return
-    
-    print(f"📋 Found {len(all_players)} players in database")
-    
-    # Create lookup dictionary for matching
-    def create_lookup_dict(players_list):
-        lookup = {}
-        for player in players_list:
-            # Create multiple lookup keys for each player
-            name_key = player['name'].lower().strip()
-            lookup[name_key] = player
-            
-            # Also try without common suffixes
-            name_no_suffix = name_key.replace(' jr', '').replace(' sr', '').replace(' iii', '').replace(' ii', '').replace(' iv', '')
-            if name_no_suffix != name_key:
-                lookup[name_no_suffix] = player
-            
-            # Try without accents/special characters
-            import unicodedata
-            name_no_accents = ''.join(c for c in unicodedata.normalize('NFD', name_key) if unicodedata.category(c) != 'Mn')
-            if name_no_accents != name_key:
-                lookup[name_no_accents] = player
-                
-        return lookup
-    
-    player_lookup = create_lookup_dict(all_players)
+    log.info(f"📊 Loaded {len(projections)} ESPN projections from {json_file}")
     
-    print(f"   📋 Created lookup dictionary with {len(player_lookup)} keys")
+    # Resolve known names from the crosswalk, only new names need the matcher
+    crosswalk = PlayerCrosswalk(supabase, 'espn')
+    known_count = crosswalk.load()
+    new_names = crosswalk.missing([(projection.get("Name"), projection.get("Team", "")) for projection in projections])
+    log.info(f"🔗 Crosswalk: {known_count} known players, {len(new_names)} new players to match")
     
-    # Clear existing projections
-    try:
-        supabase.table("nba_espn_projections").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
-        print("🗑️  Cleared existing ESPN projections")
-    except Exception as e:
-        print(f"⚠️  Warning: Could not clear existing projections: {e}")
+    player_index = None
+    if new_names:
+        # Get all players for matching (with pagination to get ALL players)
+        log.info("🔍 Fetching all players for matching...")
+        # Local snapshot, only re-read over the network if nba_players changed
+        all_players = load_players(supabase, 'nba_players')
+        
+        log.info(f"   ✅ Loaded {len(all_players)} players from the player snapshot")
+        
+        if not all_players and not known_count:
+            log.error("❌ No players found in database")
+            return
+        
+        log.info(f"📋 Found {len(all_players)} players in database")
+        
+        # Build the name index once for all new names
+        player_index = PlayerNameIndex(all_players)
+        
+        log.info(f"   📋 Created name index with {len(player_index)} names")
+    else:
+        log.info("⚡ Every name is in the crosswalk, skipping the player fetch")
     
     # Track statistics
     imported_count = 0
@@ -204,11 +176,14 @@ def import_espn_projections(supabase: Client, json_file: str):
     error_count = 0
     matched_players = []
     unmatched_players = []
+    projection_rows = []
     
-    print("\n🔍 Matching and importing projections...")
+    log.info("🔍 Matching and importing projections...")
+    progress = log.progress('projections', total=len(projections))
     
     # Process each projection
     for projection in projections:
+        progress.update()
         try:
             # Extract basic info
             espn_name = projection.get("Name", "")
@@ -216,19 +191,18 @@ def import_espn_projections(supabase: Client, json_file: str):
             espn_position = projection.get("Position", "")
             
             if not espn_name:
-                print(f"⚠️  Skipping projection with no name")
+                log.debug(f"⚠️  Skipping projection with no name")
                 skipped_count += 1
                 continue
             
-            # Try to match the player
-            espn_name_lower = espn_name.lower().strip()
-            matched_player = None
-            confidence = 0.0
-            
-            
-            if espn_name_lower in player_lookup:
-                matched_player = player_lookup[espn_name_lower]
-                confidence = 1.0 if matched_player['is_active'] else 0.9
+            # Known names come from the crosswalk, new ones go through the matcher
+            match = crosswalk.resolve(espn_name, espn_team)
+            if not match and player_index:
+                match = player_index.match(espn_name, espn_team)
+                if match:
+                    crosswalk.record(espn_name, espn_team, match)
+            matched_player = match['player'] if match else None
+            confidence = match['confidence'] if match else 0.0
             
             if not matched_player:
                 # Player not found - skip this projection
@@ -246,7 +220,8 @@ def import_espn_projections(supabase: Client, json_file: str):
                 'matched_name': matched_player['name'],
                 'matched_team': matched_player['team_name'],
                 'is_active': matched_player['is_active'],
-                'confidence': confidence
+                'confidence': confidence,
+                'method': match['method']
             })
             
             # Extract 2025 statistics
@@ -282,8 +257,8 @@ def import_espn_projections(supabase: Client, json_file: str):
             # Extract 2026 outlook
             outlook_2026 = projection.get("2026 Outlook", "")
             
-            # Insert into database with matched player_id
-            supabase.table("nba_espn_projections").insert({
+            # Queue the row with matched player_id for the bulk reload
+            projection_rows.append({
                 "espn_name": espn_name,
                 "espn_team": espn_team,
                 "espn_position": espn_position,
@@ -315,47 +290,74 @@ def import_espn_projections(supabase: Client, json_file: str):
                 "proj_2026_to": proj_2026_to,
                 "proj_2026_pts": proj_2026_pts,
                 "outlook_2026": outlook_2026
-            }).execute()
-            
-            imported_count += 1
+            })
             
         except Exception as e:
-            print(f"❌ Error importing projection for {espn_name}: {e}")
+            log.error(f"❌ Error importing projection for {espn_name}: {e}")
             error_count += 1
     
-    # Print summary
-    print(f"\n📊 IMPORT SUMMARY:")
-    print(f"✅ Successfully imported: {imported_count} projections")
-    print(f"⏭️  Skipped (no match): {skipped_count} projections")
-    print(f"❌ Failed to import: {error_count} projections")
+    progress.done(matched=len(matched_players), unmatched=len(unmatched_players))
+    
+    # Load everything into staging and swap it in, readers never see an empty table
+    if projection_rows:
+        log.info(f"💾 Loading {len(projection_rows)} projections via staging table...")
+        try:
+            swap_result = reload_via_staging(
+                supabase,
+                "nba_espn_projections_staging",
+                "swap_nba_espn_projections_staging",
+                projection_rows
+            )
+            imported_count = swap_result.get('inserted_count', len(projection_rows))
+            log.info(f"🔄 Swapped in {imported_count} projections (replaced {swap_result.get('replaced_count', 0)})")
+        except Exception as e:
+            log.error(f"❌ Error reloading projections, existing data left untouched: {e}")
+            error_count += len(projection_rows)
+    else:
+        log.warning("⚠️  No matched projections, existing data left untouched")
+    
+    # Remember new matches so the next reload resolves them without matching
+    try:
+        saved_count = crosswalk.save()
+        if saved_count:
+            log.info(f"🔗 Saved {saved_count} new crosswalk mappings")
+    except Exception as e:
+        log.warning(f"⚠️  Warning: Could not save crosswalk mappings: {e}")
     
-    # Show matched players
-    if matched_players:
-        print(f"\n🎯 MATCHED PLAYERS ({len(matched_players)}):")
+    # Print summary
+    log.info("📊 IMPORT SUMMARY:")
+    log.info(f"✅ Successfully imported: {imported_count} projections")
+    log.info(f"⏭️  Skipped (no match): {skipped_count} projections")
+    log.info(f"❌ Failed to import: {error_count} projections")
+    
+    # Show matched players (per-row detail, debug level only)
+    if matched_players and log.enabled('debug'):
+        log.debug(f"\n🎯 MATCHED PLAYERS ({len(matched_players)}):")
         for match in matched_players:
             status = "🟢" if match['is_active'] else "🟡"
-            print(f"   {status} {match['espn_name']} → {match['matched_name']} ({match['matched_team']}) - Active: {match['is_active']}")
+            log.debug(f"   {status} {match['espn_name']} → {match['matched_name']} ({match['matched_team']}) - Active: {match['is_active']} [{match['method']} {match['confidence']:.2f}]")
     
     # Show unmatched players
     if unmatched_players:
-        print(f"\n❌ UNMATCHED PLAYERS ({len(unmatched_players)}):")
-        print("   These players need manual name fixes in the JSON file:")
+        log.warning(f"❌ UNMATCHED PLAYERS ({len(unmatched_players)}):")
+        log.info("   These players need manual name fixes in the JSON file:")
         for unmatched in unmatched_players:
-            print(f"   • {unmatched['espn_name']} ({unmatched['espn_team']}) - {unmatched['espn_position']}")
+            log.info(f"   • {unmatched['espn_name']} ({unmatched['espn_team']}) - {unmatched['espn_position']}")
     
-    print(f"\n💡 To fix unmatched players:")
-    print(f"   1. Edit the JSON file: {json_file}")
-    print(f"   2. Change the 'Name' field to match a player in your database")
-    print(f"   3. Re-run this script")
+    log.info("💡 To fix unmatched players:")
+    log.info(f"   1. Edit the JSON file: {json_file}")
+    log.info("   2. Change the 'Name' field to match a player in your database")
+    log.info("   3. Re-run this script")
+    log.info("   (Wrong matches are fixed by editing player_id in nba_player_crosswalk)")
 
 def main():
     """Main function"""
     try:
         supabase = get_supabase_client()
         import_espn_projections(supabase, "supabase/espn_projections.json")
-        print("\n🎉 ESPN projections import completed!")
+        log.info("🎉 ESPN projections import completed!")
     except Exception as e:
-        print(f"❌ Error: {e}")
+        log.error(f"❌ Error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -7,11 +7,19 @@ import json
 import os
 import sys
 from typing import Dict, List, Any, Optional
-from supabase import create_client, Client
+from supabase import Client
+from shared_client import get_client
+from supabase_bulk import reload_via_staging
+from player_snapshot import load_players
+from player_matching import PlayerNameIndex
+from player_crosswalk import PlayerCrosswalk
+from setup_log import get_logger
 
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+log = get_logger('hoopshype_salaries')
+
 def get_supabase_client() -> Client:
     """Get Supabase client"""
     url = os.getenv("VITE_SUPABASE_URL")
@@ -20,7 +28,7 @@ def get_supabase_client() -> Client:
     if not url or not service_key:
         raise ValueError("Missing required environment variables: VITE_SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY")
     
-    return create_client(url, service_key)
+    return get_client(url, service_key)
 
 def parse_salary_value(salary_str: Optional[str]) -> Optional[int]:
     """Parse salary string to integer (remove $ and commas)"""
@@ -79,74 +87,45 @@ def normalize_team_name(team_name: str) -> str:
 
 def import_hoopshype_salaries(supabase: Client) -> None:
     """Import HoopsHype salary data"""
-    print("🏀 Importing HoopsHype Salary Data")
-    print("=" * 50)
+    log.info("🏀 Importing HoopsHype Salary Data")
     
     # Load the salary data
     salary_file = "scripts/supabase/hoopshype_salaries.json"
     if not os.path.exists(salary_file):
-        print(f"❌ Salary file not found: {salary_file}")
+        log.error(f"❌ Salary file not found: {salary_file}")
         return
     
     with open(salary_file, "r", encoding="utf-8") as f:
         salary_data = json.load(f)
     
-    print(f"📊 Loaded {len(salary_data)} players from salary data")
-    
-    # Clear existing salary data to prevent duplicates
-    try:
-        supabase.table("nba_hoopshype_salaries").delete().neq("id", "00000000-0000-0000-0000-000000000000").execute()
-        print("🗑️  Cleared existing HoopsHype salary data")
-    except Exception as e:
-        print(f"⚠️  Warning: Could not clear existing salary data: {e}")
-    
-    # Get all players for matching (with pagination to get ALL players)
-    print("🔍 Fetching all players for matching...")
-    all_players = []
-    page_size = 1000
-    offset = 0
-    
-    while True:
-        result = supabase.table('nba_players').select('id, name, team_name, is_active').limit(page_size).offset(offset).execute()
-        if not result.data:
-            break
-        all_players.extend(result.data)
-        print(f"   📄 Fetched page {offset//page_size + 1}: {len(result.data)} players (total: {len(all_players)})")
-        offset += page_size
-        if len(result.data) < page_size:
-            break
+    log.info(f"📊 Loaded {len(salary_data)} players from salary data")
     
-    print(f"   ✅ Fetched {len(all_players)} players from database")
-    
-    if not all_players:
-        print("❌ No players found in database")
-        return
-    
-    print(f"📋 Found {len(all_players)} players in database")
-    
-    # Create lookup dictionary for matching (same as ESPN script)
-    def create_lookup_dict(players_list):
-        lookup = {}
-        for player in players_list:
-            # Create multiple lookup keys for each player
-            name_key = player['name'].lower().strip()
-            lookup[name_key] = player
-            
-            # Also try without common suffixes
-            name_no_suffix = name_key.replace(' jr', '').replace(' sr', '').replace(' iii', '').replace(' ii', '').replace(' iv', '')
-            if name_no_suffix != name_key:
-                lookup[name_no_suffix] = player
-            
-            # Try without accents/special characters
-            import unicodedata
-            name_no_accents = ''.join(c for c in unicodedata.normalize('NFD', name_key) if unicodedata.category(c) != 'Mn')
-            if name_no_accents != name_key:
-                lookup[name_no_accents] = player
-                
-        return lookup
+    # Resolve known names from the crosswalk, only new names need the matcher
+    crosswalk = PlayerCrosswalk(supabase, 'hoopshype')
+    known_count = crosswalk.load()
+    new_names = crosswalk.missing([(player.get("Name"), player.get("Team")) for player in salary_data])
+    log.info(f"🔗 Crosswalk: {known_count} known players, {len(new_names)} new players to match")
     
-    player_lookup = create_lookup_dict(all_players)
-    print(f"   📋 Created lookup dictionary with {len(player_lookup)} keys")
+    player_index = None
+    if new_names:
+        # Get all players for matching (with pagination to get ALL players)
+        log.info("🔍 Fetching all players for matching...")
+        # Local snapshot, only re-read over the network if nba_players changed
+        all_players = load_players(supabase, 'nba_players')
+        
+        log.info(f"   ✅ Loaded {len(all_players)} players from the player snapshot")
+        
+        if not all_players and not known_count:
+            log.error("❌ No players found in database")
+            return
+        
+        log.info(f"📋 Found {len(all_players)} players in database")
+        
+        # Build the name index once for all new names (shared with the ESPN import)
+        player_index = PlayerNameIndex(all_players)
+        log.info(f"   📋 Created name index with {len(player_index)} names")
+    else:
+        log.info("⚡ Every name is in the crosswalk, skipping the player fetch")
     
     # Track statistics
     imported_count = 0
@@ -154,16 +133,19 @@ def import_hoopshype_salaries(supabase: Client) -> None:
     error_count = 0
     matched_players = []
     unmatched_players = []
+    salary_rows = []
     
-    print("\n🔍 Matching and importing salary data...")
+    log.info("🔍 Matching and importing salary data...")
+    progress = log.progress('salary records', total=len(salary_data))
     
     for player_data in salary_data:
+        progress.update()
         try:
             player_name = player_data.get("Name")
             team_name = player_data.get("Team")
             
             if not player_name:
-                print(f"⚠️  Skipping player with no name")
+                log.debug(f"⚠️  Skipping player with no name")
                 continue
             
             # Normalize team name
@@ -180,14 +162,15 @@ def import_hoopshype_salaries(supabase: Client) -> None:
             # Calculate contract years remaining
             contract_years = calculate_contract_years_remaining(salaries)
             
-            # Try to match the player using improved lookup
-            player_name_lower = player_name.lower().strip()
-            matched_player = None
-            confidence = 0.0
-            
-            if player_name_lower in player_lookup:
-                matched_player = player_lookup[player_name_lower]
-                confidence = 1.0 if matched_player['is_active'] else 0.9
+            # Known names come from the crosswalk, new ones go through the matcher
+            # (the raw team keeps HoopsHype's logo id for teams it could not name)
+            match = crosswalk.resolve(player_name, team_name)
+            if not match and player_index:
+                match = player_index.match(player_name, normalized_team)
+                if match:
+                    crosswalk.record(player_name, team_name, match)
+            matched_player = match['player'] if match else None
+            confidence = match['confidence'] if match else 0.0
             
             if not matched_player:
                 # Player not found - skip this salary record
@@ -207,68 +190,92 @@ def import_hoopshype_salaries(supabase: Client) -> None:
                 'confidence': confidence
             })
             
-            # Insert salary data into nba_hoopshype_salaries table
+            # Queue salary data for the bulk nba_hoopshype_salaries reload
             player_id = matched_player['id']
             
-            salary_data = {
+            salary_rows.append({
                 "player_name": player_name,
                 "team_name": normalized_team,
                 "player_id": player_id,
                 "matched_at": "now()",
-                "match_confidence": 1.0,
+                "match_confidence": confidence,
                 "salary_2025_26": salaries["2025-26"],
                 "salary_2026_27": salaries["2026-27"],
                 "salary_2027_28": salaries["2027-28"],
                 "salary_2028_29": salaries["2028-29"],
                 "contract_years_remaining": contract_years
-            }
-            
-            # Remove None values
-            salary_data = {k: v for k, v in salary_data.items() if v is not None}
-            
-            supabase.table("nba_hoopshype_salaries").insert(salary_data).execute()
+            })
             
             status = "🟢" if matched_player['is_active'] else "🟡"
-            print(f"   {status} {player_name} → {matched_player['name']} ({matched_player['team_name']}) - {contract_years} years remaining")
-            imported_count += 1
+            log.debug(f"   {status} {player_name} → {matched_player['name']} ({matched_player['team_name']}) - {contract_years} years remaining")
             
         except Exception as e:
-            print(f"❌ Error importing salary for {player_name}: {e}")
+            log.error(f"❌ Error importing salary for {player_name}: {e}")
             error_count += 1
     
+    progress.done(matched=len(matched_players), unmatched=len(unmatched_players))
+    
+    # Load everything into staging and swap it in, readers never see an empty table
+    # (None values are kept: a bulk insert needs the same keys on every row)
+    if salary_rows:
+        log.info(f"💾 Loading {len(salary_rows)} salary records via staging table...")
+        try:
+            swap_result = reload_via_staging(
+                supabase,
+                "nba_hoopshype_salaries_staging",
+                "swap_nba_hoopshype_salaries_staging",
+                salary_rows
+            )
+            imported_count = swap_result.get('inserted_count', len(salary_rows))
+            log.info(f"🔄 Swapped in {imported_count} salary records (replaced {swap_result.get('replaced_count', 0)})")
+        except Exception as e:
+            log.error(f"❌ Error reloading salaries, existing data left untouched: {e}")
+            error_count += len(salary_rows)
+    else:
+        log.warning("⚠️  No matched salary records, existing data left untouched")
+    
+    # Remember new matches so the next reload resolves them without matching
+    try:
+        saved_count = crosswalk.save()
+        if saved_count:
+            log.info(f"🔗 Saved {saved_count} new crosswalk mappings")
+    except Exception as e:
+        log.warning(f"⚠️  Warning: Could not save crosswalk mappings: {e}")
+    
     # Print summary
-    print(f"\n📊 IMPORT SUMMARY:")
-    print(f"✅ Successfully imported: {imported_count} salary records")
-    print(f"⏭️  Skipped (no match): {skipped_count} salary records")
-    print(f"❌ Failed to import: {error_count} salary records")
+    log.info("📊 IMPORT SUMMARY:")
+    log.info(f"✅ Successfully imported: {imported_count} salary records")
+    log.info(f"⏭️  Skipped (no match): {skipped_count} salary records")
+    log.info(f"❌ Failed to import: {error_count} salary records")
     
-    # Show matched players
-    if matched_players:
-        print(f"\n🎯 MATCHED PLAYERS ({len(matched_players)}):")
+    # Show matched players (per-row detail, debug level only)
+    if matched_players and log.enabled('debug'):
+        log.debug(f"\n🎯 MATCHED PLAYERS ({len(matched_players)}):")
         for match in matched_players:
             status = "🟢" if match['is_active'] else "🟡"
-            print(f"   {status} {match['player_name']} → {match['matched_name']} ({match['matched_team']}) - Active: {match['is_active']}")
+            log.debug(f"   {status} {match['player_name']} → {match['matched_name']} ({match['matched_team']}) - Active: {match['is_active']}")
     
     # Show unmatched players
     if unmatched_players:
-        print(f"\n❌ UNMATCHED PLAYERS ({len(unmatched_players)}):")
-        print("   These players need manual name fixes in the JSON file:")
+        log.warning(f"❌ UNMATCHED PLAYERS ({len(unmatched_players)}):")
+        log.info("   These players need manual name fixes in the JSON file:")
         for unmatched in unmatched_players:
-            print(f"   • {unmatched['player_name']} ({unmatched['team_name']})")
+            log.info(f"   • {unmatched['player_name']} ({unmatched['team_name']})")
     
-    print(f"\n💡 To fix unmatched players:")
-    print(f"   1. Edit the JSON file: {salary_file}")
-    print(f"   2. Change the 'Name' field to match a player in your database")
-    print(f"   3. Re-run this script")
+    log.info("💡 To fix unmatched players:")
+    log.info(f"   1. Edit the JSON file: {salary_file}")
+    log.info("   2. Change the 'Name' field to match a player in your database")
+    log.info("   3. Re-run this script")
+    log.info("   (Wrong matches are fixed by editing player_id in nba_player_crosswalk)")
 
 def main():
     """Main function"""
     try:
         supabase = get_supabase_client()
         import_hoopshype_salaries(supabase)
-        print("\n🎉 HoopsHype salary import completed!")
+        log.info("🎉 HoopsHype salary import completed!")
     except Exception as e:
-        print(f"❌ Error: {e}")
+        log.error(f"❌ Error: {e}")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -10,14 +10,18 @@ import json
 import time
 import requests
 from datetime import datetime
-from supabase import create_client, Client
+from supabase import Client
+from shared_client import get_client
 from typing import List, Dict, Any
+from setup_log import get_logger
 
 # Configuration
 SUPABASE_URL = os.getenv('VITE_SUPABASE_URL', 'https://qbznyaimnrpibmahisue.supabase.co')
 SUPABASE_SERVICE_KEY = os.getenv('SUPABASE_SERVICE_ROLE_KEY')
 USER_UID = "fd58dfb7-ad5d-43e2-b2c4-c254e2a29211"
 
+log = get_logger('nba_players')
+
 # NBA API Configuration - Multiple endpoints to try
 NBA_API_ENDPOINTS = [
     "https://stats.nba.com/stats/commonallplayers?LeagueID=00&Season=2024-25&IsOnlyCurrentSeason=0",
@@ -40,7 +44,7 @@ NBA_HEADERS = {
 
 def setup_supabase() -> Client:
     """Initialize Supabase client"""
-    print("🔧 Setting up Supabase client...")
+    log.info("🔧 Setting up Supabase client...")
     
     if not SUPABASE_URL:
         raise Exception("VITE_SUPABASE_URL environment variable is not set")
@@ -48,26 +52,26 @@ def setup_supabase() -> Client:
     if not SUPABASE_SERVICE_KEY:
         raise Exception("SUPABASE_SERVICE_ROLE_KEY environment variable is not set")
     
-    print(f"   Using Supabase URL: {SUPABASE_URL}")
-    print(f"   Service key: {'*' * 20}{SUPABASE_SERVICE_KEY[-10:] if SUPABASE_SERVICE_KEY else 'None'}")
+    log.info(f"   Using Supabase URL: {SUPABASE_URL}")
+    log.info(f"   Service key: {'*' * 20}{SUPABASE_SERVICE_KEY[-10:] if SUPABASE_SERVICE_KEY else 'None'}")
     
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
-    print("✅ Supabase client initialized")
+    supabase: Client = get_client(SUPABASE_URL, SUPABASE_SERVICE_KEY)
+    log.info("✅ Supabase client initialized")
     return supabase
 
 def fetch_nba_players() -> List[Dict[str, Any]]:
     """Fetch all players from NBA API with multiple endpoint fallbacks"""
-    print("🏀 Fetching players from NBA API...")
+    log.info("🏀 Fetching players from NBA API...")
     
     max_retries = 2
     retry_delay = 3
     
     for endpoint_idx, endpoint in enumerate(NBA_API_ENDPOINTS):
-        print(f"   Trying endpoint {endpoint_idx + 1}/{len(NBA_API_ENDPOINTS)}: {endpoint}")
+        log.info(f"   Trying endpoint {endpoint_idx + 1}/{len(NBA_API_ENDPOINTS)}: {endpoint}")
         
         for attempt in range(max_retries):
             try:
-                print(f"     Attempt {attempt + 1}/{max_retries}...")
+                log.info(f"     Attempt {attempt + 1}/{max_retries}...")
                 
                 # Create session for connection pooling
                 session = requests.Session()
@@ -85,7 +89,7 @@ def fetch_nba_players() -> List[Dict[str, Any]]:
                 headers = players_data['headers']
                 rows = players_data['rowSet']
                 
-                print(f"📊 Found {len(rows)} players from NBA API")
+                log.info(f"📊 Found {len(rows)} players from NBA API")
                 
                 # Convert to list of dictionaries
                 players = []
@@ -99,27 +103,27 @@ def fetch_nba_players() -> List[Dict[str, Any]]:
                 return players
                 
             except requests.exceptions.RequestException as e:
-                print(f"     ❌ Attempt {attempt + 1} failed: {e}")
+                log.warning(f"     ❌ Attempt {attempt + 1} failed: {e}")
                 if attempt < max_retries - 1:
-                    print(f"     ⏳ Retrying in {retry_delay} seconds...")
+                    log.info(f"     ⏳ Retrying in {retry_delay} seconds...")
                     time.sleep(retry_delay)
                 else:
-                    print(f"     ❌ All attempts failed for this endpoint")
+                    log.error("     ❌ All attempts failed for this endpoint")
             except Exception as e:
-                print(f"     ❌ Error processing response: {e}")
+                log.error(f"     ❌ Error processing response: {e}")
                 break
         
         # Try next endpoint
         if endpoint_idx < len(NBA_API_ENDPOINTS) - 1:
-            print(f"   Moving to next endpoint...")
+            log.info("   Moving to next endpoint...")
             time.sleep(1)
     
-    print(f"❌ All endpoints failed. Using mock data instead...")
+    log.error("❌ All endpoints failed. Using mock data instead...")
     return get_mock_players()
 
 def get_mock_players() -> List[Dict[str, Any]]:
     """Get mock NBA players data as fallback"""
-    print("🏀 Using mock NBA players data as fallback...")
+    log.info("🏀 Using mock NBA players data as fallback...")
     
     mock_players = [
         {
@@ -224,7 +228,7 @@ def get_mock_players() -> List[Dict[str, Any]]:
         }
     ]
     
-    print(f"📊 Using {len(mock_players)} mock players")
+    log.info(f"📊 Using {len(mock_players)} mock players")
     return mock_players
 
 def parse_player_data(player: Dict[str, Any]) -> Dict[str, Any]:
@@ -321,7 +325,7 @@ def parse_player_data(player: Dict[str, Any]) -> Dict[str, Any]:
 
 def import_players_to_database(supabase: Client, players: List[Dict[str, Any]]) -> Dict[str, int]:
     """Import players to Supabase database using upsert function"""
-    print("💾 Importing players to database...")
+    log.info("💾 Importing players to database...")
     
     stats = {
         'total': len(players),
@@ -333,15 +337,17 @@ def import_players_to_database(supabase: Client, players: List[Dict[str, Any]])
     # Process players in batches
     batch_size = 25  # Smaller batches for better reliability
     total_batches = (len(players) + batch_size - 1) // batch_size
+    progress = log.progress('players', total=len(players))
     
     for batch_num in range(total_batches):
         start_idx = batch_num * batch_size
         end_idx = min(start_idx + batch_size, len(players))
         batch = players[start_idx:end_idx]
         
-        print(f"📦 Processing batch {batch_num + 1}/{total_batches} ({len(batch)} players)")
+        log.debug(f"📦 Processing batch {batch_num + 1}/{total_batches} ({len(batch)} players)")
         
-        for i, player in enumerate(batch):
+        for player in batch:
+            progress.update()
             try:
                 # Parse player data
                 player_data = parse_player_data(player)
@@ -386,28 +392,24 @@ def import_players_to_database(supabase: Client, players: List[Dict[str, Any]])
                         stats['imported'] += 1
                 else:
                     stats['errors'] += 1
-                    print(f"⚠️  Error upserting player {player_data['name']}")
-                
-                # Progress indicator
-                if (i + 1) % 5 == 0:
-                    print(f"   Processed {i + 1}/{len(batch)} players in this batch")
+                    log.warning(f"⚠️  Error upserting player {player_data['name']}")
                 
             except Exception as e:
                 stats['errors'] += 1
-                print(f"❌ Error processing player {player.get('DISPLAY_FIRST_LAST', 'Unknown')}: {e}")
+                log.error(f"❌ Error processing player {player.get('DISPLAY_FIRST_LAST', 'Unknown')}: {e}")
         
         # Add a small delay between batches
         if batch_num < total_batches - 1:
             time.sleep(0.2)
     
+    progress.done(imported=stats['imported'], updated=stats['updated'], errors=stats['errors'])
     return stats
 
 def main():
     """Main function"""
-    print("🚀 Starting NBA Players Import Script (Robust Version)")
-    print(f"👤 User UID: {USER_UID}")
-    print(f"🕐 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("-" * 60)
+    log.info("🚀 Starting NBA Players Import Script (Robust Version)")
+    log.info(f"👤 User UID: {USER_UID}")
+    log.info(f"🕐 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     try:
         # Setup
@@ -420,30 +422,29 @@ def main():
         stats = import_players_to_database(supabase, players)
         
         # Print final results
-        print("-" * 60)
-        print("🎉 Import completed successfully!")
-        print(f"📊 Final Statistics:")
-        print(f"   Total players processed: {stats['total']}")
-        print(f"   New players imported: {stats['imported']}")
-        print(f"   Existing players updated: {stats['updated']}")
-        print(f"   Errors: {stats['errors']}")
-        print(f"🕐 Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        log.info("🎉 Import completed successfully!")
+        log.info("📊 Final Statistics:")
+        log.info(f"   Total players processed: {stats['total']}")
+        log.info(f"   New players imported: {stats['imported']}")
+        log.info(f"   Existing players updated: {stats['updated']}")
+        log.info(f"   Errors: {stats['errors']}")
+        log.info(f"🕐 Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Verify import
-        print("\n🔍 Verifying import...")
+        log.info("🔍 Verifying import...")
         result = supabase.table('nba_players').select('id', count='exact').execute()
         total_in_db = result.count
-        print(f"✅ Total players in database: {total_in_db}")
+        log.info(f"✅ Total players in database: {total_in_db}")
         
         # Show some sample players
-        print("\n📋 Sample of imported players:")
+        log.info("📋 Sample of imported players:")
         sample = supabase.table('nba_players').select('name, position, team_name, is_active').limit(10).execute()
         for player in sample.data:
             status = "Active" if player['is_active'] else "Inactive"
-            print(f"   • {player['name']} ({player['position']}) - {player['team_name']} - {status}")
+            log.info(f"   • {player['name']} ({player['position']}) - {player['team_name']} - {status}")
         
     except Exception as e:
-        print(f"❌ Fatal error: {e}")
+        log.error(f"❌ Fatal error: {e}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
@@ -26,6 +26,7 @@ from typing import Dict, List, Optional, Any
 from supabase import create_client, Client
 from nba_api.stats.endpoints import teamdetails
 from nba_api.stats.static import teams
+from nba_api_decode import decode_data_set
 
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -87,16 +88,16 @@ def import_team_data(supabase: Client, team_id: int) -> bool:
         team_details = teamdetails.TeamDetails(team_id=team_id)
         
         # Extract team background data
-        team_background = team_details.team_background.get_data_frame()
-        if team_background.empty:
+        team_background = decode_data_set(team_details.team_background).first()
+        if team_background is None:
             print(f"⚠️ No background data found for team ID: {team_id}")
             return False
         
-        bg = team_background.iloc[0]
+        bg = team_background
         
         # Extract social media links
-        social_sites = team_details.team_social_sites.get_data_frame()
-        social_links = extract_social_media_links(social_sites.to_dict('records'))
+        social_sites = decode_data_set(team_details.team_social_sites).records()
+        social_links = extract_social_media_links(social_sites)
         
         # Upsert main team record
         team_uuid = supabase.rpc('upsert_nba_team', {
@@ -121,8 +122,8 @@ def import_team_data(supabase: Client, team_id: int) -> bool:
         print(f"✅ Upserted team: {bg['CITY']} {bg['NICKNAME']}")
         
         # Import team history
-        team_history = team_details.team_history.get_data_frame()
-        for _, history in team_history.iterrows():
+        team_history = decode_data_set(team_details.team_history).records()
+        for history in team_history:
             supabase.rpc('add_team_history', {
                 'p_team_id': int(bg['TEAM_ID']),
                 'p_city': history['CITY'],
@@ -131,19 +132,19 @@ def import_team_data(supabase: Client, team_id: int) -> bool:
                 'p_year_active_till': int(history['YEARACTIVETILL']) if history['YEARACTIVETILL'] else None
             }).execute()
         
-        if not team_history.empty:
+        if team_history:
             print(f"✅ Added {len(team_history)} history records")
         
         # Import team awards
         awards_data = [
-            ('championship', team_details.team_awards_championships.get_data_frame()),
-            ('conference', team_details.team_awards_conf.get_data_frame()),
-            ('division', team_details.team_awards_div.get_data_frame())
+            ('championship', decode_data_set(team_details.team_awards_championships).records()),
+            ('conference', decode_data_set(team_details.team_awards_conf).records()),
+            ('division', decode_data_set(team_details.team_awards_div).records())
         ]
         
         total_awards = 0
-        for award_type, awards_df in awards_data:
-            for _, award in awards_df.iterrows():
+        for award_type, awards in awards_data:
+            for award in awards:
                 supabase.rpc('add_team_award', {
                     'p_team_id': int(bg['TEAM_ID']),
                     'p_award_type': award_type,
@@ -156,8 +157,8 @@ def import_team_data(supabase: Client, team_id: int) -> bool:
             print(f"✅ Added {total_awards} award records")
         
         # Import Hall of Fame members
-        hof_df = team_details.team_hof.get_data_frame()
-        for _, hof in hof_df.iterrows():
+        hof_members = decode_data_set(team_details.team_hof).records()
+        for hof in hof_members:
             supabase.rpc('add_team_hof', {
                 'p_team_id': int(bg['TEAM_ID']),
                 'p_player_name': hof['PLAYER'],
@@ -168,12 +169,12 @@ def import_team_data(supabase: Client, team_id: int) -> bool:
                 'p_year': int(hof['YEAR']) if hof['YEAR'] else None
             }).execute()
         
-        if not hof_df.empty:
-            print(f"✅ Added {len(hof_df)} Hall of Fame records")
+        if hof_members:
+            print(f"✅ Added {len(hof_members)} Hall of Fame records")
         
         # Import retired numbers
-        retired_df = team_details.team_retired.get_data_frame()
-        for _, retired in retired_df.iterrows():
+        retired_numbers = decode_data_set(team_details.team_retired).records()
+        for retired in retired_numbers:
             supabase.rpc('add_team_retired', {
                 'p_team_id': int(bg['TEAM_ID']),
                 'p_player_name': retired['PLAYER'],
@@ -184,8 +185,8 @@ def import_team_data(supabase: Client, team_id: int) -> bool:
                 'p_year': int(retired['YEAR']) if retired['YEAR'] else None
             }).execute()
         
-        if not retired_df.empty:
-            print(f"✅ Added {len(retired_df)} retired number records")
+        if retired_numbers:
+            print(f"✅ Added {len(retired_numbers)} retired number records")
         
         return True
         
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+League Scoring Batch Job
+Scores projections and weekly game logs for every fantasy league in one pass.
+
+Each league's scoring (its fantasy_scoring_format, or the season's
+custom_scoring_categories for 'Custom' leagues) becomes a column of one
+(stats x leagues) weight matrix, built with fantasy_scoring.weight_matrix.
+Most leagues share a preset, so identical columns are collapsed into scoring
+profiles first (np.unique over the columns): 10,000 leagues on presets are a
+handful of profiles, and each custom league adds at most one. Then
+
+    projections (players x S) @ weights (S x profiles)
+    weekly totals (player-weeks x S) @ weights + double/triple-double counts @ bonuses
+
+Scoring is linear, so game logs are summed per player and week before the
+multiply (bonuses are counted per game first).
+
+Written in bulk:
+    fantasy_scoring_profiles        profile_key -> weights and bonuses
+    fantasy_league_scoring          league -> profile_key
+    fantasy_profile_projections     projected points per profile and player
+    fantasy_profile_weekly_points   points per profile, week and player
+
+The fantasy_league_player_projections and fantasy_league_player_weekly_points
+views join them back to league-specific totals.
+
+Usage:
+    python3 scripts/setup/league_scoring.py [--season-year 2026] [--source nba_boxscores] [--dry-run]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from supabase import Client
+
+from fantasy_scoring import SCORING_FORMATS, SCORING_STATS, SOURCES, bonus_flags, load_game_logs, stat_matrix, weight_matrix
+from player_snapshot import load_players_by_nba_id
+from supabase_bulk import chunked, iter_rows
+from setup_log import get_logger
+
+log = get_logger('league_scoring')
+
+DEFAULT_FORMAT = 'FanDuel'  # What fantasyScoring.ts falls back to (also for 'Custom' without categories)
+UPSERT_CHUNK_SIZE = 1000
+
+# Scoring category keys (LeagueSettings.scoring_categories and the draft settings'
+# PTS/REB/... style) -> engine stat or bonus
+CATEGORY_STATS = {
+    'points': 'pts', 'pts': 'pts',
+    'rebounds': 'reb', 'reb': 'reb',
+    'assists': 'ast', 'ast': 'ast',
+    'steals': 'stl', 'stl': 'stl',
+    'blocks': 'blk', 'blk': 'blk',
+    'turnovers': 'tov', 'to': 'tov', 'tov': 'tov',
+    'three_pointers_made': 'fg3m', '3pm': 'fg3m', 'fg3m': 'fg3m',
+    'field_goals_made': 'fgm', 'fgm': 'fgm',
+    'field_goals_attempted': 'fga', 'fga': 'fga',
+    'free_throws_made': 'ftm', 'ftm': 'ftm',
+    'free_throws_attempted': 'fta', 'fta': 'fta',
+    'offensive_rebounds': 'oreb', 'oreb': 'oreb',
+    'defensive_rebounds': 'dreb', 'dreb': 'dreb',
+}
+CATEGORY_BONUSES = {
+    'double_doubles': 'double_double', 'dd': 'double_double',
+    'triple_doubles': 'triple_double', 'td': 'triple_double',
+}
+
+# nba_espn_projections per-game columns -> engine stat (shooting makes/attempts aren't projected)
+PROJECTION_STATS = {'pts': 'pts', 'reb': 'reb', 'ast': 'ast', 'stl': 'stl', 'blk': 'blk', 'to': 'tov', '3pm': 'fg3m'}
+
+def season_label(season_year: int) -> str:
+    """2026 -> '2025-26' (game log season_year)"""
+    return f"{season_year - 1}-{str(season_year)[2:]}"
+
+def custom_scoring(categories: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Engine scoring from custom categories; percentage categories can't be per-game points and are ignored"""
+    scoring: Dict[str, Any] = {'weights': {}}
+    for category, value in (categories or {}).items():
+        key = category.lower()
+        if not value:
+            continue
+        if key in CATEGORY_STATS:
+            scoring['weights'][CATEGORY_STATS[key]] = float(value)
+        elif key in CATEGORY_BONUSES:
+            scoring[CATEGORY_BONUSES[key]] = float(value)
+    return scoring if scoring['weights'] else None
+
+def league_scoring(league: Dict[str, Any], season: Optional[Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """(scoring format, engine scoring) for one league"""
+    scoring_format = league.get('fantasy_scoring_format') or DEFAULT_FORMAT
+    if scoring_format == 'Custom':
+        scoring = custom_scoring((season or {}).get('custom_scoring_categories') or {})
+        if scoring:
+            return scoring_format, scoring
+    return scoring_format, SCORING_FORMATS.get(scoring_format, SCORING_FORMATS[DEFAULT_FORMAT])
+
+def profile_columns(scorings: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Collapse per-league scoring into unique profiles.
+
+    Returns (weights S x U, bonuses 2 x U, inverse) where inverse[i] is the
+    profile column of league i.
+    """
+    weights, bonuses = weight_matrix(dict(enumerate(scorings)))
+    stacked = np.vstack([weights, bonuses])
+    unique, inverse = np.unique(stacked, axis=1, return_inverse=True)
+    return unique[:len(SCORING_STATS)], unique[len(SCORING_STATS):], inverse.reshape(-1)
+
+def profile_key(weights: np.ndarray, bonuses: np.ndarray) -> str:
+    """Stable id of a scoring profile (same weights -> same key, across runs)"""
+    canonical = {stat: round(float(w), 4) for stat, w in zip(SCORING_STATS, weights) if w}
+    canonical['double_double'], canonical['triple_double'] = (round(float(b), 4) for b in bonuses)
+    return hashlib.sha1(json.dumps(canonical, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+def projection_seasons(projections: List[Dict[str, Any]]) -> List[int]:
+    """Season years with proj_{year}_gp columns in nba_espn_projections rows"""
+    columns = projections[0].keys() if projections else ()
+    return sorted(int(column.split('_')[1]) for column in columns
+                  if column.startswith('proj_') and column.endswith('_gp') and column.split('_')[1].isdigit())
+
+def projection_matrix(projections: List[Dict[str, Any]], season_year: int) -> Tuple[np.ndarray, np.ndarray]:
+    """(players x S) projected per-game stats and projected games; raises ValueError
+    if the rows have no proj_{season_year}_* columns (they would all score 0)"""
+    if projections and season_year not in projection_seasons(projections):
+        available = ', '.join(str(year) for year in projection_seasons(projections)) or 'none'
+        raise ValueError(f"nba_espn_projections has no proj_{season_year}_* columns (seasons available: {available})")
+    matrix = np.zeros((len(projections), len(SCORING_STATS)))
+    for column, stat in PROJECTION_STATS.items():
+        j = SCORING_STATS.index(stat)
+        matrix[:, j] = np.fromiter((row.get(f'proj_{season_year}_{column}') or 0 for row in projections),
+                                   dtype=np.float64, count=len(projections))
+    games = np.fromiter((row.get(f'proj_{season_year}_gp') or 0 for row in projections),
+                        dtype=np.float64, count=len(projections))
+    return matrix, games
+
+def week_numbers(game_dates: Sequence[str], weeks: List[Dict[str, Any]]) -> np.ndarray:
+    """Fantasy week of each game date (0 if outside every week); `weeks` must not be empty"""
+    ordered = sorted(weeks, key=lambda week: week['start_date'])
+    starts = np.array([week['start_date'][:10] for week in ordered], dtype='datetime64[D]')
+    ends = np.array([week['end_date'][:10] for week in ordered], dtype='datetime64[D]')
+    numbers = np.array([week['week_number'] for week in ordered])
+    dates = np.array([str(value)[:10] for value in game_dates], dtype='datetime64[D]')
+    slot = np.clip(np.searchsorted(starts, dates, side='right') - 1, 0, None)
+    valid = (dates >= starts[slot]) & (dates <= ends[slot])
+    return np.where(valid, numbers[slot], 0)
+
+def weekly_totals(logs: List[Dict[str, Any]], weeks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Game logs summed per (player, week): keys, stat sums, bonus counts and games"""
+    matrix = stat_matrix(logs)
+    flags = bonus_flags(matrix)
+    week = week_numbers([row['game_date'] for row in logs], weeks)
+    player = np.array([row['nba_player_id'] for row in logs], dtype=np.int64)
+    keep = week > 0
+    pairs, inverse = np.unique(np.stack([player[keep], week[keep]], axis=1), axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    stats = np.zeros((len(pairs), len(SCORING_STATS)))
+    bonuses = np.zeros((len(pairs), 2))
+    np.add.at(stats, inverse, matrix[keep])
+    np.add.at(bonuses, inverse, flags[keep])
+    return {
+        'pairs': pairs,
+        'stats': stats,
+        'bonuses': bonuses,
+        'games': np.bincount(inverse, minlength=len(pairs)),
+    }
+
+def load_leagues(supabase: Client, season_year: int) -> List[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """(league, its season row) for every league with a season in `season_year`"""
+    seasons = {row['league_id']: row for row in iter_rows(
+        supabase, 'fantasy_league_seasons',
+        'id, league_id, season_year, custom_scoring_categories, starters_multiplier, rotation_multiplier, bench_multiplier',
+        [('eq', 'season_year', season_year)])}
+    leagues = iter_rows(supabase, 'fantasy_leagues', 'id, fantasy_scoring_format')
+    return [(league, seasons[league['id']]) for league in leagues if league['id'] in seasons]
+
+def upsert(supabase: Client, table: str, rows: List[Dict[str, Any]], on_conflict: str) -> None:
+    progress = log.progress(table, total=len(rows))
+    for chunk in chunked(rows, UPSERT_CHUNK_SIZE):
+        supabase.table(table).upsert(chunk, on_conflict=on_conflict).execute()
+        progress.update(len(chunk))
+    progress.done()
+
+def score_leagues(supabase: Client, season_year: int, source: str, dry_run: bool = False) -> Dict[str, Any]:
+    """Build profiles for every league and materialize projected and weekly points"""
+    timings = {}
+    start = time.perf_counter()
+    leagues = load_leagues(supabase, season_year)
+    projections = [row for row in iter_rows(supabase, 'nba_espn_projections', '*') if row.get('player_id')]
+    weeks = list(iter_rows(supabase, 'fantasy_season_weeks', 'id, week_number, start_date, end_date',
+                           [('eq', 'season_year', season_year)]))
+    logs = load_game_logs(supabase, source, season_label(season_year))
+    timings['load'] = time.perf_counter() - start
+
+    stats = {'leagues': len(leagues), 'profiles': 0, 'projections': 0, 'weekly': 0, 'logs': len(logs), 'timings': timings}
+    if not leagues:
+        return stats
+
+    start = time.perf_counter()
+    formats, scorings = zip(*[league_scoring(league, season) for league, season in leagues])
+    weights, bonuses, inverse = profile_columns(list(scorings))
+    keys = [profile_key(weights[:, j], bonuses[:, j]) for j in range(weights.shape[1])]
+
+    per_game, games = projection_matrix(projections, season_year)
+    projected_fpg = np.round(per_game @ weights, 2)
+
+    totals = weekly_totals(logs, weeks) if logs and weeks else None
+    # nba_players.id for the weekly rows; the logs' own player_id is players.id
+    # (an INTEGER) in player_game_logs, so it is not used
+    player_ids = {nba_player_id: player['id'] for nba_player_id, player in
+                  load_players_by_nba_id(supabase, 'nba_players').items()} if totals else {}
+    weekly = np.round(totals['stats'] @ weights + totals['bonuses'] @ bonuses, 2) if totals else np.zeros((0, len(keys)))
+    timings['score'] = time.perf_counter() - start
+
+    profile_rows = [
+        {'profile_key': key,
+         'weights': {stat: float(w) for stat, w in zip(SCORING_STATS, weights[:, j]) if w},
+         'double_double': float(bonuses[0, j]), 'triple_double': float(bonuses[1, j])}
+        for j, key in enumerate(keys)
+    ]
+    league_rows = [
+        {'league_id': league['id'], 'season_year': season_year, 'scoring_format': scoring_format,
+         'profile_key': keys[inverse[i]]}
+        for i, ((league, _), scoring_format) in enumerate(zip(leagues, formats))
+    ]
+    projection_rows = [
+        {'profile_key': key, 'player_id': row['player_id'], 'season_year': season_year,
+         'projected_games': int(games[p]), 'projected_fpg': float(projected_fpg[p, j]),
+         'projected_total': round(float(projected_fpg[p, j] * games[p]), 2)}
+        for j, key in enumerate(keys) for p, row in enumerate(projections)
+    ]
+    weekly_rows = [] if totals is None else [
+        {'profile_key': key, 'season_year': season_year, 'week_number': int(week), 'nba_player_id': int(player),
+         'player_id': player_ids.get(int(player)), 'games': int(totals['games'][k]),
+         'fantasy_pts': float(weekly[k, j])}
+        for j, key in enumerate(keys) for k, (player, week) in enumerate(totals['pairs'])
+    ]
+
+    start = time.perf_counter()
+    if not dry_run:
+        upsert(supabase, 'fantasy_scoring_profiles', profile_rows, 'profile_key')
+        upsert(supabase, 'fantasy_league_scoring', league_rows, 'league_id')
+        upsert(supabase, 'fantasy_profile_projections', projection_rows, 'profile_key,player_id,season_year')
+        upsert(supabase, 'fantasy_profile_weekly_points', weekly_rows, 'profile_key,season_year,week_number,nba_player_id')
+    timings['write'] = time.perf_counter() - start
+
+    stats.update(profiles=len(keys), projections=len(projection_rows), weekly=len(weekly_rows))
+    return stats
+
+def main():
+    """Main function"""
+    from shared_client import get_client
+
+    parser = argparse.ArgumentParser(description="Score projections and weekly game logs for every league")
+    parser.add_argument('--season-year', type=int, default=date.today().year + (date.today().month >= 7),
+                        help="Fantasy season year, e.g. 2026 for 2025-26")
+    parser.add_argument('--source', choices=SOURCES, default='nba_boxscores', help="Game log table")
+    parser.add_argument('--dry-run', action='store_true', help="Score without writing")
+    args = parser.parse_args()
+
+    url = os.getenv('VITE_SUPABASE_URL') or os.getenv('SUPABASE_URL')
+    key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('SUPABASE_KEY')
+    if not url or not key:
+        print("❌ Missing Supabase credentials: VITE_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+        sys.exit(1)
+
+    supabase = get_client(url, key)
+    print(f"🧮 Scoring {season_label(args.season_year)} for every league{' (dry run)' if args.dry_run else ''}")
+    stats = score_leagues(supabase, args.season_year, args.source, args.dry_run)
+    timings = stats['timings']
+    print(f"✅ {stats['leagues']:,} leagues → {stats['profiles']} scoring profiles")
+    print(f"   📈 {stats['projections']:,} projection rows, {stats['weekly']:,} weekly rows from {stats['logs']:,} game logs")
+    print(f"   ⏱️  load {timings['load']:.1f}s, score {timings['score'] * 1000:.0f} ms, write {timings['write']:.1f}s")
+
+if __name__ == "__main__":
+    main()
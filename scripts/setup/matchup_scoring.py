@@ -0,0 +1,314 @@
+#!/usr/bin/env python3
+"""
+Incremental Matchup Scoring
+Applies newly ingested game logs to materialized weekly team and matchup scores.
+
+Each run reads the game log rows changed since the last run (updated_at at or after
+the source and season's cursor in fantasy_scoring_cursors, less CURSOR_OVERLAP for
+rows committed late with an older timestamp) and diffs them against the stats
+already applied (fantasy_scored_game_logs), so a corrected or re-imported
+box score only moves scores by the difference. Scoring is linear, so the delta
+of a log's points is the points of its stat delta:
+
+    delta points (logs x profiles) = delta stats @ weights + delta bonus flags @ bonuses
+
+using the same scoring profiles as league_scoring.py. Every delta is credited
+to the fantasy teams whose lineup (fantasy_lineups, set per week) holds the
+player (matched through nba_player_id, since lineups reference nba_players) in
+the game's fantasy week, scaled by the lineup tier's multiplier, and
+apply_fantasy_score_deltas adds them to fantasy_team_week_scores and refreshes
+the affected fantasy_matchups scores in the same transaction as the ledger.
+A night of games touches only the teams that rostered someone who played.
+
+Rerunning is safe: logs already in the ledger produce a zero delta. Scores
+are fed from one source at a time; both tables describe the same games.
+
+Deltas only follow the game logs, so a lineup edited after its games were
+applied, or a league changing its scoring, needs the week rebuilt:
+--rebuild --week N zeroes that week's team and matchup scores, clears the
+week's ledger and reapplies every game log of the week.
+
+Usage:
+    python3 scripts/setup/matchup_scoring.py [--season-year 2026] [--source nba_boxscores] [--dry-run]
+    python3 scripts/setup/matchup_scoring.py --rebuild --week 3
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from supabase import Client
+
+from fantasy_scoring import SCORING_STATS, SOURCES, bonus_flags, stat_matrix
+from league_scoring import league_scoring, load_leagues, profile_columns, season_label, week_numbers
+from supabase_bulk import batched, chunked, iter_rows
+from setup_log import get_logger
+
+log = get_logger('matchup_scoring')
+
+CURSOR_TABLE = 'fantasy_scoring_cursors'
+LEDGER_TABLE = 'fantasy_scored_game_logs'
+APPLY_FUNCTION = 'apply_fantasy_score_deltas'
+RESET_FUNCTION = 'reset_fantasy_week_scores'
+
+# Re-read window before the cursor, for rows committed after a newer row was read
+CURSOR_OVERLAP = timedelta(minutes=10)
+
+# Lineup tiers and the fantasy_league_seasons multiplier (and default) for each
+TIERS = ('starters', 'rotation', 'bench')
+DEFAULT_MULTIPLIERS = {'starters': 1.0, 'rotation': 0.75, 'bench': 0.5}
+
+LOG_BATCH_SIZE = 2000  # Game logs applied per transaction
+FILTER_CHUNK_SIZE = 200  # Values per in_() filter, keeps request URLs short
+
+def load_cursor(supabase: Client, source: str, season_year: int) -> Optional[str]:
+    """updated_at of the newest log of the season applied from `source` (None before the first run)"""
+    rows = (supabase.table(CURSOR_TABLE).select('last_updated_at')
+            .eq('source', source).eq('season_year', season_year).execute().data or [])
+    return rows[0]['last_updated_at'] if rows else None
+
+def overlap_since(since: Optional[str]) -> Optional[str]:
+    """The cursor moved back by CURSOR_OVERLAP; the ledger makes re-read rows no-ops"""
+    if not since:
+        return None
+    return (datetime.fromisoformat(since.replace('Z', '+00:00')) - CURSOR_OVERLAP).isoformat()
+
+def load_logs(supabase: Client, source: str, season_year: int, since: Optional[str] = None,
+              dates: Optional[Tuple[str, str]] = None) -> List[Dict[str, Any]]:
+    """Game logs of the season changed at or after `since` (and within `dates`), one per player and game"""
+    columns = ', '.join(('id', 'nba_player_id', 'game_id', 'game_date', 'updated_at') + SCORING_STATS)
+    filters = [('eq', 'season_year', season_label(season_year))]
+    if since:
+        # >= so rows sharing the cursor's timestamp aren't missed; the ledger makes them no-ops
+        filters.append(('gte', 'updated_at', since))
+    if dates:
+        filters.extend([('gte', 'game_date', dates[0]), ('lte', 'game_date', dates[1])])
+    latest: Dict[Tuple[int, str], Dict[str, Any]] = {}
+    for row in iter_rows(supabase, source, columns, filters):
+        key = (row['nba_player_id'], row['game_id'])
+        if key not in latest or row['updated_at'] > latest[key]['updated_at']:
+            latest[key] = row
+    return list(latest.values())
+
+def load_player_ids(supabase: Client, nba_player_ids: List[int]) -> Dict[int, str]:
+    """nba_players.id (what fantasy_lineups.player_id references) per NBA player id"""
+    ids = {}
+    for chunk in chunked(sorted(set(nba_player_ids)), FILTER_CHUNK_SIZE):
+        for row in iter_rows(supabase, 'nba_players', 'id, nba_player_id', [('in_', 'nba_player_id', list(chunk))]):
+            ids[row['nba_player_id']] = row['id']
+    return ids
+
+def load_ledger(supabase: Client, source: str, logs: List[Dict[str, Any]]) -> Dict[Tuple[int, str], Dict[str, Any]]:
+    """Stats already applied for these logs, keyed by (nba_player_id, game_id)"""
+    wanted = {(row['nba_player_id'], row['game_id']) for row in logs}
+    game_ids = sorted({game_id for _, game_id in wanted})
+    applied = {}
+    for chunk in chunked(game_ids, FILTER_CHUNK_SIZE):
+        rows = iter_rows(supabase, LEDGER_TABLE, 'id, nba_player_id, game_id, stats',
+                         [('eq', 'source', source), ('in_', 'game_id', list(chunk))])
+        for row in rows:
+            key = (row['nba_player_id'], row['game_id'])
+            if key in wanted:
+                applied[key] = row['stats'] or {}
+    return applied
+
+def log_deltas(logs: List[Dict[str, Any]], applied: Dict[Tuple[int, str], Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """(delta stats, delta bonus flags, is-new) per log against the applied ledger"""
+    current = stat_matrix(logs)
+    previous = stat_matrix([applied.get((row['nba_player_id'], row['game_id']), {}) for row in logs])
+    is_new = np.array([(row['nba_player_id'], row['game_id']) not in applied for row in logs], dtype=bool)
+    return current - previous, bonus_flags(current) - bonus_flags(previous), is_new
+
+def load_lineups(supabase: Client, season_year: int, player_ids: List[str], weeks: List[int]) -> List[Dict[str, Any]]:
+    """Lineup slots holding any of these players in any of these weeks"""
+    lineups = []
+    for chunk in chunked(sorted(player_ids), FILTER_CHUNK_SIZE):
+        lineups.extend(iter_rows(
+            supabase, 'fantasy_lineups', 'id, league_id, fantasy_team_id, matchup_id, week_number, lineup_type, player_id',
+            [('eq', 'season_year', season_year), ('in_', 'player_id', list(chunk)), ('in_', 'week_number', weeks)]))
+    return [slot for slot in lineups if slot['lineup_type'] in TIERS]
+
+def team_week_deltas(logs: List[Dict[str, Any]], week: np.ndarray, points: np.ndarray, is_new: np.ndarray,
+                     player_ids: Dict[int, str], lineups: List[Dict[str, Any]], profile_of: Dict[str, int],
+                     multipliers: Dict[str, Dict[str, float]], season_year: int) -> List[Dict[str, Any]]:
+    """
+    Sum log point deltas into per team-and-matchup deltas.
+
+    points is (logs x profiles); player_ids maps a log's nba_player_id to the
+    nba_players id lineups hold, profile_of a league to its profile column and
+    multipliers a league to its tier multipliers.
+    """
+    logs_by_slot: Dict[Tuple[str, int], List[int]] = {}
+    for i, row in enumerate(logs):
+        player_id = player_ids.get(row['nba_player_id'])
+        if week[i] > 0 and player_id:
+            logs_by_slot.setdefault((player_id, int(week[i])), []).append(i)
+
+    groups: Dict[Tuple[str, str], int] = {}
+    group_rows, group_index, cells, tier_index, scale = [], [], [], [], []
+    for slot in lineups:
+        matched = logs_by_slot.get((slot['player_id'], slot['week_number']))
+        if not matched or slot['league_id'] not in profile_of:
+            continue
+        key = (slot['fantasy_team_id'], slot['matchup_id'])
+        if key not in groups:
+            groups[key] = len(groups)
+            group_rows.append(slot)
+        tier = slot['lineup_type']
+        for i in matched:
+            group_index.append(groups[key])
+            cells.append((i, profile_of[slot['league_id']]))
+            tier_index.append(TIERS.index(tier))
+            scale.append(multipliers[slot['league_id']][tier])
+
+    if not groups:
+        return []
+
+    rows, columns = zip(*cells)
+    contribution = points[list(rows), list(columns)] * np.array(scale)
+    tier_scores = np.zeros((len(groups), len(TIERS)))
+    games = np.zeros(len(groups), dtype=np.int64)
+    np.add.at(tier_scores, (group_index, tier_index), contribution)
+    np.add.at(games, group_index, is_new[list(rows)])
+
+    return [
+        {'league_id': slot['league_id'], 'fantasy_team_id': slot['fantasy_team_id'], 'matchup_id': slot['matchup_id'],
+         'season_year': season_year, 'week_number': slot['week_number'],
+         **{f'{tier}_score': round(float(tier_scores[g, t]), 2) for t, tier in enumerate(TIERS)},
+         'total_score': round(float(tier_scores[g].sum()), 2), 'games_played': int(games[g])}
+        for g, slot in enumerate(group_rows)
+    ]
+
+def ledger_rows(logs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """fantasy_scored_game_logs rows: the stats now applied for each log"""
+    return [
+        {'nba_player_id': row['nba_player_id'], 'game_id': row['game_id'], 'game_date': str(row['game_date'])[:10],
+         'stats': {stat: row.get(stat) or 0 for stat in SCORING_STATS}}
+        for row in logs
+    ]
+
+def reset_week(supabase: Client, season_year: int, week: Dict[str, Any]) -> Dict[str, Any]:
+    """Zero a week's team and matchup scores and clear its ledger, ahead of a rebuild"""
+    result = supabase.rpc(RESET_FUNCTION, {
+        'p_season_year': season_year, 'p_week_number': week['week_number'],
+        'p_start_date': week['start_date'][:10], 'p_end_date': week['end_date'][:10]}).execute()
+    outcome = result.data or {}
+    if not outcome.get('success'):
+        raise Exception(f"{RESET_FUNCTION} failed: {outcome.get('error', 'unknown error')}")
+    return outcome
+
+def score_matchups(supabase: Client, season_year: int, source: str, dry_run: bool = False,
+                   rebuild_week: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Apply the game logs changed since the last run to team and matchup scores.
+
+    With rebuild_week, the week is reset and every game log in it reapplied
+    instead; the cursor is left where it is.
+    """
+    timings = {}
+    start = time.perf_counter()
+    weeks = list(iter_rows(supabase, 'fantasy_season_weeks', 'id, week_number, start_date, end_date',
+                           [('eq', 'season_year', season_year)]))
+    if rebuild_week is None:
+        since = load_cursor(supabase, source, season_year)
+        logs = load_logs(supabase, source, season_year, since=overlap_since(since))
+    else:
+        rebuilt = next((week for week in weeks if week['week_number'] == rebuild_week), None)
+        if not rebuilt:
+            raise ValueError(f"No fantasy week {rebuild_week} in the {season_label(season_year)} season")
+        since = None
+        logs = load_logs(supabase, source, season_year, dates=(rebuilt['start_date'][:10], rebuilt['end_date'][:10]))
+        if not dry_run:
+            reset_week(supabase, season_year, rebuilt)
+    stats = {'since': since, 'logs': len(logs), 'changed': 0, 'team_weeks': 0, 'matchups': 0, 'timings': timings}
+    leagues = load_leagues(supabase, season_year) if logs and weeks else []
+    timings['load'] = time.perf_counter() - start
+    if not leagues:
+        timings['apply'] = 0.0
+        return stats
+
+    _, scorings = zip(*[league_scoring(league, season) for league, season in leagues])
+    weights, bonuses, inverse = profile_columns(list(scorings))
+    profile_of = {league['id']: int(inverse[i]) for i, (league, _) in enumerate(leagues)}
+    multipliers = {
+        league['id']: {tier: float((season or {}).get(f'{tier}_multiplier') or DEFAULT_MULTIPLIERS[tier]) for tier in TIERS}
+        for league, season in leagues
+    }
+
+    start = time.perf_counter()
+    progress = log.progress(f'{source} logs', total=len(logs))
+    for batch in batched(logs, LOG_BATCH_SIZE):
+        # A rebuild starts from a cleared ledger (also in a dry run, which skips the reset)
+        applied = {} if rebuild_week is not None else load_ledger(supabase, source, batch)
+        delta, delta_flags, is_new = log_deltas(batch, applied)
+        changed = is_new | np.any(delta != 0, axis=1)
+        batch = [row for row, keep in zip(batch, changed) if keep]
+        if not batch:
+            progress.update(len(changed))
+            continue
+        delta, delta_flags, is_new = delta[changed], delta_flags[changed], is_new[changed]
+
+        week = week_numbers([row['game_date'] for row in batch], weeks)
+        points = delta @ weights + delta_flags @ bonuses
+        player_ids = load_player_ids(supabase, [row['nba_player_id'] for row, w in zip(batch, week) if w > 0])
+        played = sorted({player_ids[row['nba_player_id']] for row, w in zip(batch, week)
+                         if w > 0 and row['nba_player_id'] in player_ids})
+        lineups = load_lineups(supabase, season_year, played, sorted({int(w) for w in week if w > 0})) if played else []
+        deltas = team_week_deltas(batch, week, points, is_new, player_ids, lineups, profile_of, multipliers, season_year)
+
+        stats['changed'] += len(batch)
+        stats['team_weeks'] += len(deltas)
+        if not dry_run:
+            result = supabase.rpc(APPLY_FUNCTION, {
+                'p_source': source, 'p_deltas': deltas, 'p_logs': ledger_rows(batch)}).execute()
+            outcome = result.data or {}
+            if not outcome.get('success'):
+                raise Exception(f"{APPLY_FUNCTION} failed: {outcome.get('error', 'unknown error')}")
+            stats['matchups'] += outcome.get('matchups', 0)
+        progress.update(len(changed))
+    progress.done()
+
+    if not dry_run and rebuild_week is None:
+        newest = max(row['updated_at'] for row in logs)
+        if not since or newest > since:
+            supabase.table(CURSOR_TABLE).upsert({'source': source, 'season_year': season_year, 'last_updated_at': newest},
+                                                on_conflict='source,season_year').execute()
+    timings['apply'] = time.perf_counter() - start
+    return stats
+
+def main():
+    """Main function"""
+    from shared_client import get_client
+
+    parser = argparse.ArgumentParser(description="Apply new game logs to weekly team and matchup scores")
+    parser.add_argument('--season-year', type=int, default=date.today().year + (date.today().month >= 7),
+                        help="Fantasy season year, e.g. 2026 for 2025-26")
+    parser.add_argument('--source', choices=SOURCES, default='nba_boxscores', help="Game log table")
+    parser.add_argument('--dry-run', action='store_true', help="Compute deltas without writing")
+    parser.add_argument('--rebuild', action='store_true', help="Reset and reapply one week (with --week)")
+    parser.add_argument('--week', type=int, help="Fantasy week number to rebuild")
+    args = parser.parse_args()
+    if args.rebuild and args.week is None:
+        parser.error("--rebuild needs --week")
+
+    url = os.getenv('VITE_SUPABASE_URL') or os.getenv('SUPABASE_URL')
+    key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('SUPABASE_KEY')
+    if not url or not key:
+        print("❌ Missing Supabase credentials: VITE_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+        sys.exit(1)
+
+    supabase = get_client(url, key)
+    action = f"Rebuilding week {args.week} of" if args.rebuild else "Scoring"
+    print(f"🏆 {action} {season_label(args.season_year)} matchups from {args.source}{' (dry run)' if args.dry_run else ''}")
+    stats = score_matchups(supabase, args.season_year, args.source, args.dry_run, args.week if args.rebuild else None)
+    timings = stats['timings']
+    print(f"✅ {stats['logs']:,} logs since {stats['since'] or 'the start'} → {stats['changed']:,} changed")
+    print(f"   📊 {stats['team_weeks']:,} team-week deltas, {stats['matchups']:,} matchups refreshed")
+    print(f"   ⏱️  load {timings['load']:.1f}s, apply {timings['apply']:.1f}s")
+
+if __name__ == "__main__":
+    main()
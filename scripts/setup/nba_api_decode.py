@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+nba_api Response Decoding
+Turns nba_api payloads (resultSets of headers + rowSet) straight into rows,
+named tuples or typed column arrays, so importers don't build a pandas
+DataFrame just to iterate it again with iterrows() or iloc[0].
+
+pandas is only imported when a caller asks for a DataFrame (to_data_frame).
+
+Usage:
+    from nba_api_decode import decode_endpoint, decode_data_set
+
+    games = decode_endpoint(leaguegamefinder.LeagueGameFinder(...))[0]
+    for row in games.records():            # dicts keyed by header
+        ...
+    pts = games.columns(typed=True)['PTS']  # array('q') / array('d') / list
+
+    # V3 endpoints (boxscoretraditionalv3, ...) have no resultSets
+    player_stats = decode_data_set(box_score.player_stats, 'PlayerStats')
+"""
+
+import math
+from array import array
+from collections import namedtuple
+from typing import Any, Dict, Iterator, List, Optional
+
+class ResultSet:
+    """One nba_api result set: column headers plus rows as lists"""
+
+    __slots__ = ('name', 'headers', 'rows', '_positions', '_row_type')
+
+    def __init__(self, name: str, headers: List[str], rows: List[List[Any]]):
+        self.name = name
+        self.headers = list(headers)
+        self.rows = rows
+        self._positions = {header: i for i, header in enumerate(self.headers)}
+        self._row_type = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __repr__(self) -> str:
+        return f"ResultSet({self.name!r}, {len(self.headers)} columns, {len(self.rows)} rows)"
+
+    def records(self) -> List[Dict[str, Any]]:
+        """Rows as dicts keyed by header"""
+        headers = self.headers
+        return [dict(zip(headers, row)) for row in self.rows]
+
+    def first(self) -> Optional[Dict[str, Any]]:
+        """First row as a dict, None if the set is empty"""
+        return dict(zip(self.headers, self.rows[0])) if self.rows else None
+
+    def tuples(self) -> Iterator[tuple]:
+        """Rows as named tuples (row.GAME_ID); invalid header names become _0, _1, ..."""
+        if self._row_type is None:
+            self._row_type = namedtuple(f"{self.name or 'Row'}Row", self.headers, rename=True)
+        make = self._row_type._make
+        return (make(row) for row in self.rows)
+
+    def column(self, header: str) -> List[Any]:
+        """All values of one column"""
+        position = self._positions[header]
+        return [row[position] for row in self.rows]
+
+    def columns(self, typed: bool = False) -> Dict[str, Any]:
+        """Column name -> values; typed=True packs numeric columns into arrays"""
+        transposed = list(zip(*self.rows)) if self.rows else [()] * len(self.headers)
+        if typed:
+            return {header: typed_column(values) for header, values in zip(self.headers, transposed)}
+        return {header: list(values) for header, values in zip(self.headers, transposed)}
+
+    def to_data_frame(self):
+        """pandas DataFrame of the set (imports pandas on first use)"""
+        import pandas as pd
+        return pd.DataFrame(self.rows, columns=self.headers)
+
+def typed_column(values) -> Any:
+    """array('q') for int columns, array('d') for numeric ones (None -> NaN), else a list"""
+    has_float = False
+    for value in values:
+        if value is None or type(value) is float:
+            has_float = True
+        elif type(value) is not int:
+            return list(values)
+    if not has_float:
+        try:
+            return array('q', values)
+        except OverflowError:
+            return list(values)
+    nan = math.nan
+    return array('d', [nan if value is None else value for value in values])
+
+def is_missing(value: Any) -> bool:
+    """True for None, '' and NaN (what pd.isna() was used for in the importers)"""
+    return value is None or value == '' or (type(value) is float and value != value)
+
+def _header_names(headers: List[Any]) -> List[str]:
+    """Flat column names; multi-level headers ({columnNames, columnsToSkip}) use the last level"""
+    if headers and isinstance(headers[0], dict):
+        last = headers[-1]
+        return [''] * last.get('columnsToSkip', 0) + list(last['columnNames'])
+    return headers
+
+def decode(payload: Dict[str, Any]) -> List[ResultSet]:
+    """Result sets of a stats.nba.com JSON payload, in response order"""
+    sets = payload.get('resultSets', payload.get('resultSet'))
+    if sets is None:
+        raise ValueError("Payload has no resultSets")
+    if isinstance(sets, dict):
+        sets = [sets]
+    return [
+        ResultSet(result_set.get('name', ''), _header_names(result_set['headers']), result_set.get('rowSet', []))
+        for result_set in sets
+    ]
+
+def decode_by_name(payload: Dict[str, Any]) -> Dict[str, ResultSet]:
+    """Result sets of a payload keyed by name"""
+    return {result_set.name: result_set for result_set in decode(payload)}
+
+def decode_endpoint(endpoint: Any) -> List[ResultSet]:
+    """Result sets of an nba_api endpoint object (replaces get_data_frames())"""
+    return decode(endpoint.get_dict())
+
+def decode_data_set(data_set: Any, name: str = '') -> ResultSet:
+    """One nba_api DataSet (endpoint.player_stats, ...), also for V3 endpoints"""
+    data = data_set.get_dict()
+    return ResultSet(name, data['headers'], data['data'])
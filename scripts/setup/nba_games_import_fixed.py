@@ -12,9 +12,11 @@ import json
 # Add the parent directory to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from supabase import create_client, Client
+from supabase import Client
+from shared_client import get_client
 from nba_api.stats.endpoints import leaguegamefinder
 from nba_api.stats.library.parameters import Season
+from nba_api_decode import decode_endpoint
 
 def get_supabase_credentials():
     """Get Supabase credentials from environment variables"""
@@ -34,7 +36,7 @@ def get_supabase_credentials():
 def setup_supabase():
     """Initialize Supabase client"""
     url, key = get_supabase_credentials()
-    supabase: Client = create_client(url, key)
+    supabase: Client = get_client(url, key)
     return supabase
 
 def get_nba_games_data():
@@ -48,7 +50,7 @@ def get_nba_games_data():
             season_nullable="2024-25",  # Use 2024-25 season (should have games)
             season_type_nullable="Regular Season"
         )
-        games_data = game_finder.get_data_frames()[0]  # Get the games dataframe
+        games_data = decode_endpoint(game_finder)[0]  # Get the games result set
         
         print(f"✅ Found {len(games_data)} games from LeagueGameFinder")
         
@@ -58,12 +60,12 @@ def get_nba_games_data():
         print(f"❌ Error fetching NBA games data: {e}")
         return None
 
-def transform_game_finder_to_nba_games(game_finder_df):
+def transform_game_finder_to_nba_games(game_finder_games):
     """Transform LeagueGameFinder data to our nba_games table format"""
     games = []
     processed_games = set()  # To avoid duplicates
     
-    for _, row in game_finder_df.iterrows():
+    for row in game_finder_games.tuples():
         try:
             game_id = str(getattr(row, 'GAME_ID', ''))
             
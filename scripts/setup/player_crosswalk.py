@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Player Crosswalk
+Persisted external (name, team) -> nba_players.id mappings (nba_player_crosswalk table).
+
+Importers load the crosswalk for their source once, resolve known players with a
+dictionary lookup and only run the name matcher for players never seen before.
+New matches are written back at the end so the next reload skips them too.
+
+Mappings are keyed by the normalized name and the team as the source wrote it
+(HoopsHype's logo id for teams it could not name), so two players sharing a
+name get a mapping each. A traded player is matched again under the new team.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from supabase import Client
+
+from player_matching import normalize_name
+from supabase_bulk import chunked, iter_rows
+
+CROSSWALK_TABLE = 'nba_player_crosswalk'
+
+def crosswalk_key(name: Optional[str], team: Optional[str]) -> str:
+    """external_key of a player: 'normalized name|team', e.g. 'jalen williams|okc'"""
+    return f"{normalize_name(name)}|{(team or '').strip().lower()}"
+
+class PlayerCrosswalk:
+    """Crosswalk for one source, e.g. PlayerCrosswalk(supabase, 'espn')"""
+
+    def __init__(self, supabase: Client, source: str):
+        self.supabase = supabase
+        self.source = source
+        self.mappings: Dict[str, Dict[str, Any]] = {}
+        self.pending: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> int:
+        """Load every mapping for this source, with the mapped player embedded"""
+        self.mappings = {}
+        for row in iter_rows(
+            self.supabase,
+            CROSSWALK_TABLE,
+            'id, external_key, player_id, match_confidence, match_method, nba_players(id, name, team_name, is_active)',
+            filters=[('eq', 'source', self.source)]
+        ):
+            if row.get('nba_players'):
+                self.mappings[row['external_key']] = row
+        return len(self.mappings)
+
+    def missing(self, players: List[Tuple[Optional[str], Optional[str]]]) -> List[Tuple[str, Optional[str]]]:
+        """(name, team) pairs (non-empty name) with no mapping yet"""
+        return [(name, team) for name, team in players if name and crosswalk_key(name, team) not in self.mappings]
+
+    def resolve(self, name: Optional[str], team: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        Look up a known player.
+
+        Returns a match shaped like PlayerNameIndex.match():
+        {'player': row, 'confidence': float, 'method': 'crosswalk'} or None
+        """
+        row = self.mappings.get(crosswalk_key(name, team))
+        if not row:
+            return None
+        return {
+            'player': row['nba_players'],
+            'confidence': float(row.get('match_confidence') or 0.0),
+            'method': 'crosswalk'
+        }
+
+    def record(self, name: str, team: Optional[str], match: Dict[str, Any]) -> None:
+        """Queue a fresh matcher result to be saved"""
+        key = crosswalk_key(name, team)
+        if not normalize_name(name) or key in self.mappings:
+            return
+        self.pending[key] = {
+            'source': self.source,
+            'external_key': key,
+            'external_name': name,
+            'external_team': team,
+            'player_id': match['player']['id'],
+            'match_confidence': match['confidence'],
+            'match_method': match['method'],
+            'matched_at': datetime.now(timezone.utc).isoformat()
+        }
+
+    def save(self) -> int:
+        """Write queued mappings; existing rows (including manual fixes) are left alone"""
+        rows = list(self.pending.values())
+        for chunk in chunked(rows):
+            self.supabase.table(CROSSWALK_TABLE).upsert(
+                chunk,
+                on_conflict='source,external_key',
+                ignore_duplicates=True
+            ).execute()
+        self.pending = {}
+        return len(rows)
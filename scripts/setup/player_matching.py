@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Player Name Matching
+Matches external player names (ESPN, HoopsHype, ...) to nba_players rows.
+
+The index is built once per import:
+1. Exact tier - names normalized (accents folded, punctuation and suffixes dropped)
+2. Fuzzy tier - trigram similarity, tried against the player's team first and
+   then the whole player universe through a trigram inverted index
+
+Every match carries a confidence score so callers can decide what to trust.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Name suffixes ignored when comparing names
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv', 'v'}
+
+# Minimum trigram similarity for a fuzzy match
+TEAM_FUZZY_THRESHOLD = 0.70
+GLOBAL_FUZZY_THRESHOLD = 0.85
+
+# A fuzzy match must beat the best differently-named candidate by this much
+FUZZY_MARGIN = 0.05
+
+# Confidence for exact matches (inactive players are less likely to be the one meant)
+EXACT_ACTIVE_CONFIDENCE = 1.0
+EXACT_INACTIVE_CONFIDENCE = 0.9
+
+# Fuzzy similarity is scaled by these factors to get a confidence
+TEAM_FUZZY_WEIGHT = 0.95
+GLOBAL_FUZZY_WEIGHT = 0.85
+
+_PUNCTUATION_RE = re.compile(r"[.'’`]")
+_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+def fold_accents(text: str) -> str:
+    """Strip diacritics, e.g. 'Jokić' -> 'Jokic'"""
+    return ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+
+def normalize_name(name: Optional[str]) -> str:
+    """
+    Normalize a player name for comparison.
+
+    'Jaren Jackson Jr.' -> 'jaren jackson', "De'Aaron Fox" -> 'deaaron fox',
+    'P.J. Washington' -> 'pj washington', 'Karl-Anthony Towns' -> 'karl anthony towns'
+    """
+    if not name:
+        return ''
+    text = fold_accents(name).lower()
+    text = _PUNCTUATION_RE.sub('', text)
+    tokens = [t for t in _SEPARATOR_RE.split(text) if t]
+    # Drop trailing suffixes but never reduce a name to nothing
+    while len(tokens) > 1 and tokens[-1] in NAME_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+def normalize_team(team: Optional[str]) -> str:
+    """
+    Normalize a team name to its nickname so sources agree.
+
+    'Golden State Warriors', 'Warriors' -> 'warriors'; 'LA Clippers' -> 'clippers'
+    """
+    if not team:
+        return ''
+    tokens = [t for t in _SEPARATOR_RE.split(fold_accents(team).lower()) if t]
+    return tokens[-1] if tokens else ''
+
+def name_trigrams(key: str) -> Set[str]:
+    """Character trigrams of a normalized name, padded so word edges count"""
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+def trigram_similarity(a: Set[str], b: Set[str]) -> float:
+    """Dice coefficient between two trigram sets"""
+    if not a or not b:
+        return 0.0
+    return 2.0 * len(a & b) / (len(a) + len(b))
+
+class PlayerNameIndex:
+    """
+    Name index over a list of player rows.
+
+    Rows need at least `name`; `team_name` enables team-blocked fuzzy matching
+    and `is_active` is used to prefer active players when names collide.
+    """
+
+    def __init__(self, players: Iterable[Dict[str, Any]]):
+        self.players: List[Dict[str, Any]] = []
+        self.exact: Dict[str, int] = {}
+        self.keys: List[str] = []
+        self.grams: List[Set[str]] = []
+        self.by_team: Dict[str, List[int]] = defaultdict(list)
+        self.postings: Dict[str, List[int]] = defaultdict(list)
+
+        # Accepts any iterable so rows can be indexed while they stream in
+        for idx, player in enumerate(players):
+            self.players.append(player)
+            key = normalize_name(player.get('name'))
+            grams = name_trigrams(key) if key else set()
+            self.keys.append(key)
+            self.grams.append(grams)
+
+            if not key:
+                continue
+
+            current = self.exact.get(key)
+            if current is None or (player.get('is_active') and not self.players[current].get('is_active')):
+                self.exact[key] = idx
+
+            team_key = normalize_team(player.get('team_name'))
+            if team_key:
+                self.by_team[team_key].append(idx)
+
+            for gram in grams:
+                self.postings[gram].append(idx)
+
+    def __len__(self) -> int:
+        return len(self.exact)
+
+    def _result(self, idx: int, confidence: float, method: str) -> Dict[str, Any]:
+        return {
+            'player': self.players[idx],
+            'confidence': round(confidence, 3),
+            'method': method
+        }
+
+    def _best(self, scored: Iterable[Tuple[int, float]]) -> Tuple[Optional[int], float, float]:
+        """
+        Pick the best (idx, score) pair, preferring active players on ties.
+
+        Returns (best_idx, best_score, runner_up) where runner_up is the best
+        score of a candidate with a different name.
+        """
+        best_idx, best_score, runner_up = None, 0.0, 0.0
+        for idx, score in scored:
+            if best_idx is None:
+                best_idx, best_score = idx, score
+                continue
+            better = score > best_score or (
+                score == best_score
+                and bool(self.players[idx].get('is_active'))
+                and not self.players[best_idx].get('is_active')
+            )
+            if better:
+                if self.keys[idx] != self.keys[best_idx]:
+                    runner_up = max(runner_up, best_score)
+                best_idx, best_score = idx, score
+            elif self.keys[idx] != self.keys[best_idx]:
+                runner_up = max(runner_up, score)
+        return best_idx, best_score, runner_up
+
+    def _match_team(self, grams: Set[str], team_key: str) -> Optional[Dict[str, Any]]:
+        best_idx, best_score, runner_up = self._best(
+            (idx, trigram_similarity(grams, self.grams[idx]))
+            for idx in self.by_team.get(team_key, ())
+        )
+        if best_idx is None or best_score < TEAM_FUZZY_THRESHOLD:
+            return None
+        # Two similar names on one roster (e.g. Jalen/Jaylin Williams) is too close to call
+        if best_score - runner_up < FUZZY_MARGIN:
+            return None
+        return self._result(best_idx, best_score * TEAM_FUZZY_WEIGHT, 'fuzzy_team')
+
+    def _match_global(self, grams: Set[str]) -> Optional[Dict[str, Any]]:
+        # Count shared trigrams through the inverted index instead of scoring everyone
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            for idx in self.postings.get(gram, ()):
+                shared[idx] += 1
+
+        best_idx, best_score, runner_up = self._best(
+            (idx, 2.0 * count / (len(grams) + len(self.grams[idx])))
+            for idx, count in shared.items()
+        )
+        if best_idx is None or best_score < GLOBAL_FUZZY_THRESHOLD:
+            return None
+        if best_score - runner_up < FUZZY_MARGIN:
+            return None
+        return self._result(best_idx, best_score * GLOBAL_FUZZY_WEIGHT, 'fuzzy')
+
+    def match(self, name: Optional[str], team: Optional[str] = None, fuzzy: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        Find the player meant by an external name.
+
+        Args:
+            name: Name as written by the source
+            team: Team as written by the source (any format), narrows fuzzy matching
+            fuzzy: Set False to only accept exact (normalized) matches
+
+        Returns:
+            {'player': row, 'confidence': 0.0-1.0, 'method': 'exact'|'fuzzy_team'|'fuzzy'}
+            or None if nothing is close enough
+        """
+        key = normalize_name(name)
+        if not key:
+            return None
+
+        idx = self.exact.get(key)
+        if idx is not None:
+            active = self.players[idx].get('is_active')
+            return self._result(idx, EXACT_ACTIVE_CONFIDENCE if active else EXACT_INACTIVE_CONFIDENCE, 'exact')
+
+        if not fuzzy:
+            return None
+
+        grams = name_trigrams(key)
+        team_key = normalize_team(team)
+        if team_key:
+            result = self._match_team(grams, team_key)
+            if result:
+                return result
+
+        return self._match_global(grams)
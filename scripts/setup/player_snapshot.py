@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Player Universe Snapshot
+Local, compact copy of the player table shared by every import step.
+
+Each importer used to page the whole player table over the network just to
+build its nba_player_id -> id map. The snapshot is built once per setup run,
+stored column-wise on disk and memory-mapped on load (a few milliseconds for
+~5,000 players).
+
+Before reuse, one request fetches max(updated_at) and the count of rows with an
+updated_at (NULLs are filtered out, or they would sort first); if either changed
+since the snapshot was taken it is rebuilt.
+
+Usage:
+    python3 scripts/setup/player_snapshot.py   # build snapshots for nba_players and players
+"""
+
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from supabase import Client
+
+from supabase_bulk import iter_rows
+
+# Snapshots live outside the repo data, override with HOOPGEEK_CACHE_DIR
+CACHE_DIR = os.environ.get('HOOPGEEK_CACHE_DIR') or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache'
+)
+
+SNAPSHOT_VERSION = 1
+
+# Snapshots already loaded by this process (steps run in-process by supa_setup share them)
+_loaded: Dict[str, Dict[str, Any]] = {}
+
+# Columns kept per player table (some importers still read the legacy `players` table)
+SNAPSHOT_COLUMNS = {
+    'nba_players': ['id', 'nba_player_id', 'name', 'team_name', 'is_active'],
+    'players': ['id', 'nba_player_id', 'name', 'is_active'],
+}
+
+def snapshot_path(table: str) -> str:
+    return os.path.join(CACHE_DIR, f"player_snapshot_{table}.pkl")
+
+def fetch_table_version(supabase: Client, table: str) -> Optional[Tuple[Optional[str], int]]:
+    """(max updated_at, count of rows with one) in one request, or None if the table can't tell us"""
+    try:
+        result = (
+            supabase.table(table)
+            .select('updated_at', count='exact')
+            # Postgres sorts NULLs first when descending; one NULL would hide every edit
+            .not_.is_('updated_at', 'null')
+            .order('updated_at', desc=True)
+            .limit(1)
+            .execute()
+        )
+    except Exception:
+        return None
+    max_updated_at = result.data[0]['updated_at'] if result.data else None
+    return (max_updated_at, result.count or 0)
+
+def read_snapshot(table: str) -> Optional[Dict[str, Any]]:
+    """Load a snapshot file through mmap, None if missing or unreadable"""
+    path = snapshot_path(table)
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            snapshot = pickle.loads(mapped)
+    except Exception:
+        return None
+    if snapshot.get('snapshot_version') != SNAPSHOT_VERSION:
+        return None
+    return snapshot
+
+def write_snapshot(table: str, snapshot: Dict[str, Any]) -> None:
+    """Write atomically so a concurrent step never reads half a file"""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=f".{table}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, snapshot_path(table))
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def build_snapshot(supabase: Client, table: str = 'nba_players', version: Optional[Tuple[Optional[str], int]] = None) -> Dict[str, Any]:
+    """Read the player table once and store it column-wise"""
+    columns = SNAPSHOT_COLUMNS[table]
+    if version is None:
+        version = fetch_table_version(supabase, table)
+
+    data: Dict[str, List[Any]] = {column: [] for column in columns}
+    for row in iter_rows(supabase, table, ', '.join(columns)):
+        for column in columns:
+            data[column].append(row.get(column))
+
+    snapshot = {
+        'snapshot_version': SNAPSHOT_VERSION,
+        'table': table,
+        'columns': columns,
+        'table_version': version,
+        'built_at': time.time(),
+        'data': data,
+    }
+    write_snapshot(table, snapshot)
+    _loaded[table] = snapshot
+    return snapshot
+
+def load_snapshot(supabase: Client, table: str = 'nba_players', refresh: bool = False) -> Dict[str, Any]:
+    """Reuse the local snapshot if the table hasn't changed, otherwise rebuild it"""
+    version = fetch_table_version(supabase, table)
+    if not refresh and version is not None:
+        snapshot = _loaded.get(table)
+        if snapshot and snapshot.get('table_version') == version:
+            return snapshot
+        snapshot = read_snapshot(table)
+        if snapshot and snapshot.get('table_version') == version:
+            _loaded[table] = snapshot
+            return snapshot
+    return build_snapshot(supabase, table, version)
+
+def load_players(supabase: Client, table: str = 'nba_players', refresh: bool = False) -> List[Dict[str, Any]]:
+    """All player rows (dicts with SNAPSHOT_COLUMNS[table])"""
+    snapshot = load_snapshot(supabase, table, refresh)
+    columns = snapshot['columns']
+    return [dict(zip(columns, values)) for values in zip(*(snapshot['data'][c] for c in columns))]
+
+def load_players_by_nba_id(supabase: Client, table: str = 'nba_players', refresh: bool = False) -> Dict[int, Dict[str, Any]]:
+    """nba_player_id -> player row"""
+    return {player['nba_player_id']: player for player in load_players(supabase, table, refresh)}
+
+def main():
+    """Build fresh snapshots of both player tables"""
+    from shared_client import get_client
+
+    url = os.getenv('VITE_SUPABASE_URL') or os.getenv('SUPABASE_URL')
+    key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('SUPABASE_KEY')
+    if not url or not key:
+        print("❌ Missing Supabase credentials: VITE_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+        sys.exit(1)
+
+    supabase = get_client(url, key)
+    print("📸 Building player universe snapshots...")
+    for table in SNAPSHOT_COLUMNS:
+        start = time.perf_counter()
+        try:
+            snapshot = build_snapshot(supabase, table)
+        except Exception as e:
+            print(f"   ⚠️  Skipped {table}: {e}")
+            continue
+        rows = len(snapshot['data'][snapshot['columns'][0]])
+        size_kb = os.path.getsize(snapshot_path(table)) / 1024
+        print(f"   ✅ {table}: {rows} players, {size_kb:.0f} KB in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Structured Import Logging
+A small shared logger for the import scripts: levels, rate-limited progress
+lines (rows/sec and ETA) instead of one line per row, and JSON lines for
+machines.
+
+Configured from the environment (supa_setup.py sets these for every step):
+    HOOPGEEK_LOG_LEVEL              debug | info (default) | warning | error
+    HOOPGEEK_LOG_FORMAT             text (default) | json
+    HOOPGEEK_LOG_PROGRESS_SECONDS   min seconds between progress lines (default 5)
+
+Usage:
+    from setup_log import get_logger
+
+    log = get_logger('espn_projections')
+    log.info("✅ Loaded players from the player snapshot", players=len(players))
+    progress = log.progress('projections', total=len(projections))
+    for projection in projections:
+        log.debug(f"✅ {name} → {player['name']}")   # per-row detail
+        progress.update()
+    progress.done()
+
+Text output keeps the scripts' emoji lines (fields are appended as key=value);
+JSON output writes one object per line with ts, level, logger, step, msg and
+the fields. Everything goes to sys.stdout at write time, so supa_setup's step
+prefixes keep working (JSON lines are passed through unprefixed).
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+LEVEL_ENV = 'HOOPGEEK_LOG_LEVEL'
+FORMAT_ENV = 'HOOPGEEK_LOG_FORMAT'
+PROGRESS_ENV = 'HOOPGEEK_LOG_PROGRESS_SECONDS'
+STEP_ENV = 'HOOPGEEK_LOG_STEP'
+
+LEVELS = {'debug': 10, 'info': 20, 'warning': 30, 'error': 40}
+FORMATS = ('text', 'json')
+DEFAULT_PROGRESS_SECONDS = 5.0
+
+_settings: Dict[str, Any] = {}
+_loggers: Dict[str, 'ImportLogger'] = {}
+_context = threading.local()
+
+def configure(level: Optional[str] = None, fmt: Optional[str] = None, progress_seconds: Optional[float] = None) -> None:
+    """Set level/format/progress interval for every logger (None: read the environment)"""
+    level = (level or os.environ.get(LEVEL_ENV) or 'info').lower()
+    fmt = (fmt or os.environ.get(FORMAT_ENV) or 'text').lower()
+    if level not in LEVELS:
+        raise ValueError(f"Unknown log level: {level} (expected one of {', '.join(LEVELS)})")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown log format: {fmt} (expected one of {', '.join(FORMATS)})")
+    if progress_seconds is None:
+        progress_seconds = float(os.environ.get(PROGRESS_ENV) or DEFAULT_PROGRESS_SECONDS)
+    _settings.update(level=LEVELS[level], format=fmt, progress_seconds=progress_seconds)
+
+def set_step(name: Optional[str]) -> None:
+    """Tag this thread's JSON records with a supa_setup step name (None to clear)"""
+    _context.step = name
+
+def current_step() -> Optional[str]:
+    return getattr(_context, 'step', None) or os.environ.get(STEP_ENV)
+
+def format_duration(seconds: float) -> str:
+    """'1:02:03' / '2:03'"""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+class ImportLogger:
+    """Leveled logger writing text or JSON lines to stdout"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def enabled(self, level: str) -> bool:
+        """Check before building expensive per-row messages"""
+        return LEVELS[level] >= _settings['level']
+
+    def log(self, level: str, msg: str, **fields: Any) -> None:
+        if LEVELS[level] < _settings['level']:
+            return
+        if _settings['format'] == 'json':
+            record = {
+                'ts': datetime.now(timezone.utc).isoformat(timespec='milliseconds'),
+                'level': level,
+                'logger': self.name,
+                'step': current_step(),
+                'msg': msg,
+            }
+            record.update(fields)
+            line = json.dumps(record, default=str, ensure_ascii=False)
+        elif fields:
+            line = f"{msg} " + ' '.join(f"{key}={value}" for key, value in fields.items())
+        else:
+            line = msg
+        sys.stdout.write(line + '\n')
+
+    def debug(self, msg: str, **fields: Any) -> None:
+        self.log('debug', msg, **fields)
+
+    def info(self, msg: str, **fields: Any) -> None:
+        self.log('info', msg, **fields)
+
+    def warning(self, msg: str, **fields: Any) -> None:
+        self.log('warning', msg, **fields)
+
+    def error(self, msg: str, **fields: Any) -> None:
+        self.log('error', msg, **fields)
+
+    def progress(self, label: str, total: Optional[int] = None, interval: Optional[float] = None) -> 'Progress':
+        """Rate-limited progress reporter for a loop over `total` rows"""
+        return Progress(self, label, total, interval)
+
+class Progress:
+    """Counts processed rows and logs at most one progress line per interval"""
+
+    def __init__(self, logger: ImportLogger, label: str, total: Optional[int], interval: Optional[float]):
+        self.logger = logger
+        self.label = label
+        self.total = total
+        self.interval = _settings['progress_seconds'] if interval is None else interval
+        self.count = 0
+        self.started = time.perf_counter()
+        self.last_report = self.started
+
+    def update(self, count: int = 1, **fields: Any) -> None:
+        """Add processed rows; logs a line if the interval has passed"""
+        self.count += count
+        now = time.perf_counter()
+        if now - self.last_report >= self.interval:
+            self.last_report = now
+            self.report(now, fields)
+
+    def done(self, **fields: Any) -> None:
+        """Final line with the total time and average rate"""
+        now = time.perf_counter()
+        elapsed = now - self.started
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        line = f"🏁 {self.label}: {self.count:,} rows in {format_duration(elapsed)} ({rate:,.1f} rows/s)"
+        if _settings['format'] == 'json':
+            fields = {'event': 'progress_done', 'rows': self.count, 'seconds': round(elapsed, 3),
+                      'rows_per_second': round(rate, 2), **fields}
+        self.logger.info(line, **fields)
+
+    def report(self, now: float, fields: Dict[str, Any]) -> None:
+        elapsed = now - self.started
+        rate = self.count / elapsed if elapsed > 0 else 0.0
+        eta = (self.total - self.count) / rate if self.total and rate > 0 else None
+        if _settings['format'] == 'json':
+            self.logger.info(f"📈 {self.label}", event='progress', rows=self.count, total=self.total,
+                             rows_per_second=round(rate, 2), eta_seconds=None if eta is None else round(eta, 1), **fields)
+            return
+
+        if self.total:
+            line = f"📈 {self.label}: {self.count:,}/{self.total:,} ({self.count / self.total * 100:.1f}%) · {rate:,.1f} rows/s"
+        else:
+            line = f"📈 {self.label}: {self.count:,} · {rate:,.1f} rows/s"
+        if eta is not None:
+            line += f" · ETA {format_duration(eta)}"
+        self.logger.info(line, **fields)
+
+def get_logger(name: str) -> ImportLogger:
+    """Shared logger for an import script"""
+    if not _settings:
+        configure()
+    if name not in _loggers:
+        _loggers[name] = ImportLogger(name)
+    return _loggers[name]
@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""
+Setup Run Metrics
+Per-step timing, throughput and resource numbers for supa_setup.py runs.
+
+While a step runs, every HTTP request it makes (Supabase/PostgREST through
+httpx, nba_api and scrapers through requests) is counted with its latency,
+bytes sent and received and, for PostgREST, rows read and written. Requests
+are attributed to the step running on the calling thread; a request from a
+thread the step spawned itself (a worker pool) counts toward the step only
+while it is the sole step running, and is not counted otherwise.
+
+Memory is ru_maxrss, the process's high-water mark. A step run with --isolate
+has a process of its own, so its peak_rss_mb is its own peak and is compared
+between runs. In-process steps share one process and inherit earlier peaks,
+so for them only peak_rss_growth_mb (how far the step raised the mark) is
+recorded and peak_rss_mb is left out of comparisons.
+
+Each supa_setup run is saved as a JSON report so runs can be compared:
+
+Usage:
+    python3 scripts/setup/setup_metrics.py compare                 # latest run vs the one before
+    python3 scripts/setup/setup_metrics.py compare BASE.json NEW.json
+    python3 scripts/setup/setup_metrics.py run --output m.json script.py   # used by supa_setup --isolate
+"""
+
+import argparse
+import glob
+import json
+import os
+import runpy
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+# Run reports are kept next to the player snapshots, override with HOOPGEEK_CACHE_DIR
+RUNS_DIR = os.path.join(
+    os.environ.get('HOOPGEEK_CACHE_DIR') or os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.cache'
+    ),
+    'setup_runs'
+)
+
+# Upper bounds (ms) of the latency histogram buckets
+LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+# A step regressed if a metric grew by more than this fraction...
+REGRESSION_THRESHOLD = 0.20
+# ...and by more than these absolute amounts (ignores noise on tiny steps)
+REGRESSION_MIN_DELTA = {
+    'wall_seconds': 5.0,
+    'request_count': 10,
+    'bytes_received': 1024 * 1024,
+    'peak_rss_mb': 50.0,
+}
+
+_current = threading.local()
+_hooks_installed = False
+
+# Steps currently recording, for requests made on threads without a step
+_active: List['StepMetrics'] = []
+_active_lock = threading.Lock()
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+def _content_range_rows(content_range: Optional[str]) -> int:
+    """Rows in a PostgREST Content-Range header, e.g. '0-999/*' -> 1000"""
+    if not content_range:
+        return 0
+    span = content_range.split('/')[0]
+    if '-' not in span:
+        return 0
+    start, end = span.split('-', 1)
+    try:
+        return int(end) - int(start) + 1
+    except ValueError:
+        return 0
+
+def _body_rows(body: Any) -> int:
+    """Rows in a PostgREST write body (JSON array or single object)"""
+    if not body:
+        return 0
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    head = body.lstrip()[:1]
+    if head == b'{':
+        return 1
+    if head == b'[':
+        try:
+            return len(json.loads(body))
+        except ValueError:
+            return 0
+    return 0
+
+class StepMetrics:
+    """Counters for one step"""
+
+    def __init__(self, name: str, isolated: bool = False):
+        self.name = name
+        self.isolated = isolated
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.rss_at_start = _peak_rss_mb()
+        self.latencies_ms: List[float] = []
+        self.errors = 0
+        self.by_host: Dict[str, int] = {}
+        self.rows_read = 0
+        self.rows_written = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def record(self, method: str, url: str, seconds: float, sent: Any, received: int,
+               content_range: Optional[str] = None, failed: bool = False) -> None:
+        parsed = urlparse(url)
+        sent_bytes = len(sent) if sent else 0
+        rows_read = rows_written = 0
+        # Row counts only mean something for PostgREST table requests
+        if '/rest/v1/' in parsed.path and '/rest/v1/rpc/' not in parsed.path:
+            if method == 'GET':
+                rows_read = _content_range_rows(content_range)
+            elif method in ('POST', 'PATCH', 'PUT'):
+                rows_written = _body_rows(sent)
+
+        with self.lock:
+            self.latencies_ms.append(seconds * 1000)
+            self.by_host[parsed.netloc] = self.by_host.get(parsed.netloc, 0) + 1
+            self.errors += 1 if failed else 0
+            self.rows_read += rows_read
+            self.rows_written += rows_written
+            self.bytes_sent += sent_bytes
+            self.bytes_received += received
+
+    def to_dict(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies_ms)
+        peak_rss = _peak_rss_mb()
+        histogram = {f"<={bound}ms": 0 for bound in LATENCY_BUCKETS_MS}
+        histogram[f">{LATENCY_BUCKETS_MS[-1]}ms"] = 0
+        for latency in latencies:
+            for bound in LATENCY_BUCKETS_MS:
+                if latency <= bound:
+                    histogram[f"<={bound}ms"] += 1
+                    break
+            else:
+                histogram[f">{LATENCY_BUCKETS_MS[-1]}ms"] += 1
+
+        def percentile(p: float) -> Optional[float]:
+            if not latencies:
+                return None
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 1)
+
+        return {
+            'wall_seconds': round(time.perf_counter() - self.started, 2),
+            'request_count': len(latencies),
+            'request_errors': self.errors,
+            'requests_by_host': self.by_host,
+            'latency_ms': {'p50': percentile(0.50), 'p95': percentile(0.95), 'max': percentile(1.0)},
+            'latency_histogram': histogram,
+            'rows_read': self.rows_read,
+            'rows_written': self.rows_written,
+            'bytes_sent': self.bytes_sent,
+            'bytes_received': self.bytes_received,
+            # In-process steps share one process, so this is its high-water mark when the step ended
+            'peak_rss_mb': peak_rss,
+            'peak_rss_growth_mb': None if peak_rss is None or self.rss_at_start is None
+                                  else round(peak_rss - self.rss_at_start, 1),
+            'isolated': self.isolated,
+        }
+
+def _step_metrics() -> Optional[StepMetrics]:
+    """Metrics of this thread's step, else of the only step running (None if ambiguous)"""
+    metrics = getattr(_current, 'metrics', None)
+    if metrics is not None:
+        return metrics
+    with _active_lock:
+        return _active[0] if len(_active) == 1 else None
+
+def install_hooks() -> None:
+    """Wrap httpx and requests so requests made during a step are recorded (once)"""
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    _hooks_installed = True
+
+    try:
+        import httpx
+    except ImportError:
+        httpx = None
+    if httpx is not None:
+        original_httpx_send = httpx.Client.send
+
+        def httpx_send(self, request, *args, **kwargs):
+            metrics = _step_metrics()
+            if metrics is None:
+                return original_httpx_send(self, request, *args, **kwargs)
+            try:
+                sent = request.content
+            except Exception:
+                sent = None
+            start = time.perf_counter()
+            try:
+                response = original_httpx_send(self, request, *args, **kwargs)
+            except Exception:
+                metrics.record(request.method, str(request.url), time.perf_counter() - start, sent, 0, failed=True)
+                raise
+            received = len(response.content) if response.is_stream_consumed else 0
+            metrics.record(request.method, str(request.url), time.perf_counter() - start, sent, received,
+                           response.headers.get('content-range'), response.status_code >= 400)
+            return response
+
+        httpx.Client.send = httpx_send
+
+    try:
+        import requests
+    except ImportError:
+        requests = None
+    if requests is not None:
+        original_requests_send = requests.Session.send
+
+        def requests_send(self, request, **kwargs):
+            metrics = _step_metrics()
+            if metrics is None:
+                return original_requests_send(self, request, **kwargs)
+            start = time.perf_counter()
+            try:
+                response = original_requests_send(self, request, **kwargs)
+            except Exception:
+                metrics.record(request.method, request.url, time.perf_counter() - start, request.body, 0, failed=True)
+                raise
+            received = len(response.content) if not kwargs.get('stream') else 0
+            metrics.record(request.method, request.url, time.perf_counter() - start, request.body, received,
+                           response.headers.get('content-range'), response.status_code >= 400)
+            return response
+
+        requests.Session.send = requests_send
+
+def start_step(name: str, isolated: bool = False) -> StepMetrics:
+    """Attribute this thread's requests to `name` until end_step()
+    (isolated: the step has the process to itself)"""
+    metrics = StepMetrics(name, isolated)
+    _current.metrics = metrics
+    with _active_lock:
+        _active.append(metrics)
+    return metrics
+
+def end_step() -> Optional[Dict[str, Any]]:
+    """Stop recording on this thread and return the step's metrics"""
+    metrics = getattr(_current, 'metrics', None)
+    _current.metrics = None
+    if metrics is None:
+        return None
+    with _active_lock:
+        _active.remove(metrics)
+    return metrics.to_dict()
+
+def save_run_report(report: Dict[str, Any]) -> str:
+    """Write a run report to RUNS_DIR and return its path"""
+    os.makedirs(RUNS_DIR, exist_ok=True)
+    path = os.path.join(RUNS_DIR, f"setup_run_{report['run_id']}.json")
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+def new_run_id() -> str:
+    return datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+def list_run_reports() -> List[str]:
+    """Saved run reports, oldest first (run ids sort by time)"""
+    return sorted(glob.glob(os.path.join(RUNS_DIR, 'setup_run_*.json')))
+
+def compare_runs(base: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Steps whose metrics got worse between two run reports.
+
+    Only steps that succeeded in both runs are compared, and peak_rss_mb only
+    for steps isolated in both (in-process steps inherit earlier peaks).
+
+    Returns:
+        [{'step', 'metric', 'base', 'new', 'change'}] sorted by step
+    """
+    regressions = []
+    for step, new_step in sorted(new.get('steps', {}).items()):
+        base_step = base.get('steps', {}).get(step)
+        if not base_step or base_step.get('status') != 'success' or new_step.get('status') != 'success':
+            continue
+        base_metrics = base_step.get('metrics') or {}
+        new_metrics = new_step.get('metrics') or {}
+        for metric, min_delta in REGRESSION_MIN_DELTA.items():
+            if metric == 'peak_rss_mb' and not (base_metrics.get('isolated') and new_metrics.get('isolated')):
+                continue
+            before, after = base_metrics.get(metric), new_metrics.get(metric)
+            if before is None or after is None:
+                continue
+            if after - before > min_delta and after > before * (1 + REGRESSION_THRESHOLD):
+                regressions.append({
+                    'step': step,
+                    'metric': metric,
+                    'base': before,
+                    'new': after,
+                    'change': (after - before) / before if before else None,
+                })
+    return regressions
+
+def compare_main(paths: List[str]) -> int:
+    """Print a step-by-step comparison; exit code 1 if anything regressed"""
+    if not paths:
+        paths = list_run_reports()[-2:]
+        if len(paths) < 2:
+            print(f"❌ Need two saved runs in {RUNS_DIR} to compare")
+            return 1
+    if len(paths) != 2:
+        print("❌ Usage: compare [BASE.json NEW.json]")
+        return 1
+
+    with open(paths[0]) as f:
+        base = json.load(f)
+    with open(paths[1]) as f:
+        new = json.load(f)
+
+    print(f"📊 Comparing setup runs {base.get('run_id')} -> {new.get('run_id')}")
+    print(f"   Total: {base.get('total_seconds', 0):.1f}s -> {new.get('total_seconds', 0):.1f}s")
+    print(f"\n{'Step':<40} {'Wall (s)':>17} {'Requests':>15} {'Rows written':>17}")
+    for step, new_step in sorted(new.get('steps', {}).items()):
+        base_metrics = (base.get('steps', {}).get(step) or {}).get('metrics') or {}
+        new_metrics = new_step.get('metrics') or {}
+        columns = []
+        for metric, width in (('wall_seconds', 17), ('request_count', 15), ('rows_written', 17)):
+            before, after = base_metrics.get(metric, '-'), new_metrics.get(metric, '-')
+            columns.append(f"{before} -> {after}".rjust(width))
+        print(f"{step:<40} {' '.join(columns)}")
+
+    regressions = compare_runs(base, new)
+    if not regressions:
+        print("\n✅ No regressions")
+        return 0
+
+    print(f"\n⚠️  {len(regressions)} regression(s):")
+    for r in regressions:
+        change = f" (+{r['change'] * 100:.0f}%)" if r['change'] is not None else ''
+        print(f"   • {r['step']}: {r['metric']} {r['base']} -> {r['new']}{change}")
+    return 1
+
+def run_main(script: str, output: str) -> None:
+    """Run a script as __main__ with metrics recorded, writing them to `output`"""
+    # Recording/replay (if supa_setup asked for it) goes under the metrics hooks
+    import http_fixtures
+    http_fixtures.install_from_env()
+    install_hooks()
+    start_step(os.path.basename(script), isolated=True)
+    try:
+        sys.argv = [script]
+        runpy.run_path(script, run_name='__main__')
+    finally:
+        with open(output, 'w') as f:
+            json.dump(end_step(), f)
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="supa_setup run metrics")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    compare_parser = subparsers.add_parser('compare', help="Flag regressions between two runs")
+    compare_parser.add_argument('runs', nargs='*', help="BASE.json NEW.json (default: the two latest runs)")
+
+    run_parser = subparsers.add_parser('run', help="Run a script with metrics recorded")
+    run_parser.add_argument('--output', required=True, help="Where to write the step metrics")
+    run_parser.add_argument('script')
+
+    args = parser.parse_args()
+    if args.command == 'compare':
+        sys.exit(compare_main(args.runs))
+    run_main(args.script, args.output)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Shared clients for the import scripts
+One Supabase client per process (per URL and key), so steps that supa_setup.py
+runs in the same process reuse its HTTP connections instead of each opening
+their own. Run standalone, a script simply gets its own client as before.
+"""
+
+import threading
+from typing import Dict, Tuple
+from supabase import create_client, Client
+
+_clients: Dict[Tuple[str, str], Client] = {}
+_lock = threading.Lock()
+
+def get_client(url: str, key: str) -> Client:
+    """Supabase client for url/key, created on first use"""
+    with _lock:
+        client = _clients.get((url, key))
+        if client is None:
+            client = create_client(url, key)
+            _clients[(url, key)] = client
+        return client
+
+def share_nba_api_session() -> bool:
+    """
+    Route every nba_api request through one requests.Session (keep-alive).
+
+    Returns False if nba_api isn't installed or this version has no session hook.
+    """
+    try:
+        import requests
+        from nba_api.library.http import NBAHTTP
+    except ImportError:
+        return False
+    if not hasattr(NBAHTTP, 'set_session'):
+        return False
+    NBAHTTP.set_session(requests.Session())
+    return True
@@ -3,67 +3,345 @@
 HoopGeek Database Setup Script
 ==============================
 
-This script sets up the complete HoopGeek database by importing all necessary data in the correct order:
+This script sets up the complete HoopGeek database by importing all necessary data.
+
+Each step declares the steps it depends on. Steps whose dependencies are done
+run concurrently (up to --workers at a time), so a cold setup takes about as
+long as its longest dependency chain. Steps sharing a 'resource' never overlap:
+every step calling stats.nba.com is in the 'nba_api' group, since the API
+throttles or blocks parallel clients. E.g.:
 1. Import players (basic player data)
-2. Import player info (comprehensive player data)
-3. Import 2024-25 games
-4. Import player game logs
+2. Build the player snapshot
+3. Import projections, salaries, player info and career stats
+4. Import games, then player game logs and preseason box scores
+
+By default steps run inside this process: each script's main() is imported and
+called, so interpreter startup, pandas/nba_api imports and the Supabase client
+are paid for once. In-process steps share one working directory (scripts/), so
+no step may os.chdir(); resolve paths from __file__ instead. Pass --isolate to
+run every step as its own subprocess.
+Either way output is streamed live, each line prefixed with the step name.
+
+Every run records per-step wall time, upstream requests (count, latency
+histogram), rows read/written, bytes transferred and peak RSS, and saves them
+as a JSON run report (see setup_metrics.py). `compare` flags regressions.
+
+--record DIR captures every nba_api and Supabase response into fixtures and
+--replay DIR runs the pipeline offline from them (see http_fixtures.py).
+
+Importers log through setup_log.py: progress lines with rows/sec and ETA at the
+default level, per-row detail only with --log-level debug, and one JSON record
+per line with --log-format json. Steps that still print() (the game and box score
+imports) keep plain, step-prefixed text lines, so JSON consumers should skip
+lines that don't start with '{'.
 
 Usage:
-    python3 scripts/supa_setup.py
+    python3 scripts/setup/supa_setup.py [--workers 4] [--isolate] [--record DIR | --replay DIR]
+                                        [--log-level debug|info|warning|error] [--log-format text|json]
+    python3 scripts/setup/supa_setup.py compare [BASE.json NEW.json]
 
 Requirements:
     - Supabase environment variables set
     - All import scripts available in the scripts/ directory
 """
 
+import argparse
+import importlib
+import json
 import os
 import sys
 import subprocess
+import tempfile
+import threading
 import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Dict, List
 
 # Add the scripts directory to the Python path
 script_dir = Path(__file__).parent
 sys.path.insert(0, str(script_dir))
 
-def run_script(script_name, description):
-    """Run a Python script and handle errors"""
-    print(f"\n{'='*60}")
-    print(f"🚀 {description}")
-    print(f"📄 Running: {script_name}")
-    print(f"{'='*60}")
+import setup_log
+import setup_metrics
+
+# Steps running at the same time by default
+DEFAULT_WORKERS = 4
+
+# Resource group of steps calling stats.nba.com (run one at a time)
+NBA_API = 'nba_api'
+
+# Keeps lines from concurrently running steps from interleaving
+print_lock = threading.RLock()
+
+class StepOutput:
+    """
+    Stand-in for sys.stdout/sys.stderr that prefixes every line with the name
+    of the step writing it. Threads not running a step write through unchanged.
+    """
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+    
+    def set_step(self, name):
+        self.local.prefix = f"[{name}] " if name else None
+        self.local.partial = ''
+    
+    def write(self, text):
+        prefix = getattr(self.local, 'prefix', None)
+        if prefix is None:
+            with print_lock:
+                return self.stream.write(text)
+        
+        # Only complete lines are written so each one carries its prefix
+        lines = (self.local.partial + text).split('\n')
+        self.local.partial = lines.pop()
+        if lines:
+            # JSON log records (setup_log) carry the step themselves and stay parseable
+            with print_lock:
+                self.stream.write(''.join(f"{'' if line.startswith('{') else prefix}{line}\n" for line in lines))
+                self.stream.flush()
+        return len(text)
+    
+    def flush(self):
+        prefix = getattr(self.local, 'prefix', None)
+        if prefix is not None and self.local.partial:
+            with print_lock:
+                self.stream.write(f"{prefix}{self.local.partial}\n")
+            self.local.partial = ''
+        self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+def install_step_output():
+    """Route stdout/stderr through StepOutput (once)"""
+    if not isinstance(sys.stdout, StepOutput):
+        sys.stdout = StepOutput(sys.stdout)
+    if not isinstance(sys.stderr, StepOutput):
+        sys.stderr = StepOutput(sys.stderr)
+
+def set_current_step(name):
+    """Prefix this thread's output with `name` (None to stop)"""
+    setup_log.set_step(name)
+    for stream in (sys.stdout, sys.stderr):
+        if isinstance(stream, StepOutput):
+            if name is None:
+                stream.flush()
+            stream.set_step(name)
+
+def prepare_in_process():
+    """One-time setup shared by every in-process step"""
+    # Scripts resolve data paths relative to scripts/, as they do as subprocesses.
+    # The working directory is process-wide and shared by concurrent steps,
+    # so this is the only chdir: steps must never change it
+    os.chdir(script_dir.parent)
+    # Step mains must not see supa_setup's own arguments
+    sys.argv = [sys.argv[0]]
+    
+    import http_fixtures
+    http_fixtures.install_from_env()
+    setup_metrics.install_hooks()
+    
+    from shared_client import share_nba_api_session
+    if share_nba_api_session():
+        print("🔗 nba_api requests share one HTTP session")
+
+def run_step_subprocess(script_path):
+    """Run a script as a child process, streaming its output line by line"""
+    fd, metrics_path = tempfile.mkstemp(prefix='step_metrics_', suffix='.json')
+    os.close(fd)
+    try:
+        # setup_metrics.py runs the script as __main__ and records its requests
+        process = subprocess.Popen([
+            sys.executable, '-u', str(script_dir / 'setup_metrics.py'),
+            'run', '--output', metrics_path, str(script_path)
+        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, cwd=script_dir.parent,
+           env={**os.environ, setup_log.STEP_ENV: script_path.stem})
+        
+        for line in process.stdout:
+            sys.stdout.write(line)
+        
+        success = process.wait() == 0
+        try:
+            with open(metrics_path) as f:
+                metrics = json.load(f)
+        except ValueError:
+            metrics = None
+        return success, metrics
+    finally:
+        os.remove(metrics_path)
+
+def run_step_in_process(script_path):
+    """Import a script and call its main() in this process"""
+    setup_metrics.start_step(script_path.name)
+    try:
+        module = importlib.import_module(script_path.stem)
+        module.main()
+        success = True
+    except SystemExit as e:
+        success = e.code in (None, 0)
+    except Exception as e:
+        print(f"❌ Error running {script_path.name}: {str(e)}")
+        traceback.print_exc()
+        success = False
+    return success, setup_metrics.end_step()
+
+def run_script(script_name, description, isolate=False):
+    """
+    Run one import step, streaming its output, and handle errors
+    
+    Returns:
+        (success, metrics) - metrics as recorded by setup_metrics, None if unavailable
+    """
+    print(f"\n🚀 Started: {description} ({script_name})")
     
     script_path = script_dir / script_name
     
     if not script_path.exists():
         print(f"❌ Error: Script {script_name} not found!")
-        return False
+        return False, None
     
+    set_current_step(script_path.stem)
+    metrics = None
     try:
-        # Run the script
-        result = subprocess.run([
-            sys.executable, str(script_path)
-        ], capture_output=True, text=True, cwd=script_dir.parent)
-        
-        if result.returncode == 0:
-            print(f"✅ {description} completed successfully!")
-            if result.stdout:
-                print("📋 Output:")
-                print(result.stdout)
-            return True
+        if isolate:
+            success, metrics = run_step_subprocess(script_path)
         else:
-            print(f"❌ {description} failed!")
-            print("📋 Error output:")
-            print(result.stderr)
-            if result.stdout:
-                print("📋 Standard output:")
-                print(result.stdout)
+            success, metrics = run_step_in_process(script_path)
+    except BaseException as e:
+        print(f"❌ Error running {script_name}: {str(e)}")
+        traceback.print_exc()
+        success = False
+    finally:
+        set_current_step(None)
+    
+    if success:
+        print(f"✅ {description} completed successfully!")
+    else:
+        print(f"❌ {description} failed!")
+    if metrics:
+        print(f"   ⏱️  {metrics['wall_seconds']:.1f}s, {metrics['request_count']} requests, "
+              f"{metrics['rows_read']} rows read, {metrics['rows_written']} rows written")
+    return success, metrics
+
+def validate_steps(steps: List[Dict[str, Any]]) -> None:
+    """Fail fast on unknown dependencies or cycles"""
+    names = {step['script'] for step in steps}
+    for step in steps:
+        unknown = [dep for dep in step['depends_on'] if dep not in names]
+        if unknown:
+            raise ValueError(f"{step['script']} depends on unknown step(s): {', '.join(unknown)}")
+    
+    # Kahn's algorithm: every step must become ready at some point
+    remaining = {step['script']: set(step['depends_on']) for step in steps}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"Dependency cycle between: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+def run_steps(steps: List[Dict[str, Any]], workers: int = DEFAULT_WORKERS, isolate: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Run steps as a DAG, starting each one as soon as its dependencies are done.
+    
+    A step can start once every dependency succeeded or failed without being
+    required, and no running step holds the same 'resource'. After a required
+    step fails no new steps are started; running steps are allowed to finish.
+    
+    Returns:
+        script -> {'status': 'success'|'failed'|'skipped', 'started', 'finished', 'duration', 'metrics'}
+    """
+    validate_steps(steps)
+    by_name = {step['script']: step for step in steps}
+    results: Dict[str, Dict[str, Any]] = {}
+    pending = list(steps)
+    running = {}
+    busy = set()  # Resources held by running steps
+    stop = False
+    run_start = time.perf_counter()
+    
+    def usable(dep: str) -> bool:
+        outcome = results.get(dep)
+        if outcome is None:
             return False
+        return outcome['status'] == 'success' or (outcome['status'] == 'failed' and not by_name[dep]['required'])
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while pending or running:
+            # Skip steps that can never run, start the ones that are ready
+            for step in list(pending):
+                deps = step['depends_on']
+                if any(dep in results and not usable(dep) for dep in deps):
+                    results[step['script']] = {'status': 'skipped', 'started': None, 'finished': None, 'duration': 0.0, 'metrics': None}
+                    pending.remove(step)
+                elif (not stop and len(running) < workers and all(usable(dep) for dep in deps)
+                      and step.get('resource') not in busy):
+                    started = time.perf_counter() - run_start
+                    future = executor.submit(run_script, step['script'], step['description'], isolate)
+                    running[future] = (step, started)
+                    pending.remove(step)
+                    if step.get('resource'):
+                        busy.add(step['resource'])
             
-    except Exception as e:
-        print(f"❌ Error running {script_name}: {str(e)}")
-        return False
+            if not running:
+                break
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step, started = running.pop(future)
+                busy.discard(step.get('resource'))
+                finished = time.perf_counter() - run_start
+                success, metrics = future.result()
+                results[step['script']] = {
+                    'status': 'success' if success else 'failed',
+                    'started': started,
+                    'finished': finished,
+                    'duration': finished - started,
+                    'metrics': metrics
+                }
+                if not success and step['required']:
+                    with print_lock:
+                        print(f"\n❌ Required step failed: {step['description']}")
+                        print("🛑 No new steps will be started")
+                    stop = True
+            
+            with print_lock:
+                done_count = sum(1 for r in results.values() if r['status'] != 'skipped')
+                print(f"\n📊 Progress: {done_count}/{len(steps)} finished, {len(running)} running")
+    
+    for step in pending:
+        results[step['script']] = {'status': 'skipped', 'started': None, 'finished': None, 'duration': 0.0, 'metrics': None}
+    
+    return results
+
+def critical_path(steps: List[Dict[str, Any]], results: Dict[str, Dict[str, Any]]) -> List[str]:
+    """
+    The chain of steps that determined the total run time.
+    
+    Walks back from the step that finished last, each time to the dependency
+    that finished last (the one it was actually waiting on).
+    """
+    by_name = {step['script']: step for step in steps}
+    ran = {name: r for name, r in results.items() if r['finished'] is not None}
+    if not ran:
+        return []
+    
+    current = max(ran, key=lambda name: ran[name]['finished'])
+    path = [current]
+    while True:
+        deps = [dep for dep in by_name[current]['depends_on'] if dep in ran]
+        if not deps:
+            break
+        current = max(deps, key=lambda name: ran[name]['finished'])
+        path.append(current)
+    return list(reversed(path))
 
 def check_environment():
     """Check if required environment variables are set"""
@@ -91,103 +369,188 @@ def check_environment():
     print("✅ Environment variables are set correctly")
     return True
 
+def build_run_report(run_id, started_at, args, steps, results, total_time, path):
+    """Machine-readable summary of a run (saved by setup_metrics.save_run_report)"""
+    return {
+        'run_id': run_id,
+        'started_at': started_at,
+        'mode': 'subprocess' if args.isolate else 'in-process',
+        'fixtures': 'replay' if args.replay else 'record' if args.record else None,
+        'workers': args.workers,
+        'total_seconds': round(total_time, 2),
+        'critical_path': path,
+        'steps': {
+            step['script']: {
+                'description': step['description'],
+                'status': results[step['script']]['status'],
+                'started_seconds': results[step['script']]['started'],
+                'metrics': results[step['script']]['metrics'],
+            }
+            for step in steps
+        },
+    }
+
 def main():
     """Main setup function"""
+    parser = argparse.ArgumentParser(description="HoopGeek database setup")
+    parser.add_argument('command', nargs='?', choices=['run', 'compare'], default='run',
+                        help="run the setup (default) or compare two saved runs")
+    parser.add_argument('runs', nargs='*', help="compare: BASE.json NEW.json (default: the two latest runs)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS,
+                        help=f"Steps to run at the same time (default: {DEFAULT_WORKERS})")
+    parser.add_argument('--isolate', action='store_true',
+                        help="Run each step in its own subprocess instead of in this process")
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument('--record', metavar='DIR', help="Record all HTTP responses into fixtures")
+    fixtures.add_argument('--replay', metavar='DIR', help="Run offline from recorded fixtures")
+    parser.add_argument('--log-level', choices=list(setup_log.LEVELS),
+                        help="Import log level; debug shows per-row detail (default: info)")
+    parser.add_argument('--log-format', choices=list(setup_log.FORMATS),
+                        help="Import log format; json writes one record per line (default: text)")
+    args = parser.parse_args()
+    
+    # Steps (in-process and subprocess) read the log settings from the environment
+    if args.log_level:
+        os.environ[setup_log.LEVEL_ENV] = args.log_level
+    if args.log_format:
+        os.environ[setup_log.FORMAT_ENV] = args.log_format
+    setup_log.configure()
+    
+    if args.command == 'compare':
+        sys.exit(setup_metrics.compare_main(args.runs))
+    
     print("🏀 HoopGeek Database Setup")
     print("=" * 60)
-    print("This script will import all NBA data in the correct order:")
+    print("This script will import all NBA data, running independent steps in parallel:")
     print("1. Import players (basic player data)")
-    print("2. Import ESPN projections")
-    print("3. Import HoopsHype salaries")
-    print("4. Import player info (comprehensive player data)")
-    print("5. Import career stats")
-    print("6. Import 2024-25 games")
-    print("7. Import player game logs")
-    print("8. Import 2025-26 season")
-    print("9. Import preseason box scores")
+    print("2. Build player universe snapshot")
+    print("3. Import ESPN projections, HoopsHype salaries, player info and career stats")
+    print("4. Import 2024-25 games, then player game logs")
+    print("5. Import 2025-26 season, then preseason box scores")
+    print(f"⚙️  Workers: {args.workers}, steps run {'as subprocesses' if args.isolate else 'in-process'}")
     print("=" * 60)
     
+    # Subprocess steps pick the fixtures directory up from the environment
+    import http_fixtures
+    if args.record:
+        os.environ[http_fixtures.RECORD_ENV] = os.path.abspath(args.record)
+        print(f"🎙️  Recording HTTP fixtures to {args.record}")
+    elif args.replay:
+        os.environ[http_fixtures.REPLAY_ENV] = os.path.abspath(args.replay)
+        os.environ.update({k: v for k, v in http_fixtures.REPLAY_CREDENTIALS.items() if not os.environ.get(k)})
+        print(f"▶️  Replaying HTTP fixtures from {args.replay} (no network)")
+    
     # Check environment
     if not check_environment():
         sys.exit(1)
     
-    # Define the import steps
+    # Define the import steps and what each one needs first
     import_steps = [
         {
             'script': 'import_nba_players_robust.py',
             'description': 'Import NBA Players (Basic Data)',
-            'required': True
+            'required': True,
+            'depends_on': [],
+            'resource': NBA_API
+        },
+        {
+            'script': 'player_snapshot.py',
+            'description': 'Build Player Universe Snapshot',
+            'required': False,
+            'depends_on': ['import_nba_players_robust.py']
         },
         {
             'script': 'import_espn_projections.py',
             'description': 'Import ESPN Fantasy Projections',
-            'required': False
+            'required': False,
+            'depends_on': ['player_snapshot.py']
         },
         {
             'script': 'import_hoopshype_salaries.py',
             'description': 'Import HoopsHype Player Salaries',
-            'required': False
-        },
-        {
-            'script': 'import_player_index.py',
-            'description': 'Import Player Index Data',
-            'required': True
+            'required': False,
+            'depends_on': ['player_snapshot.py']
         },
         {
             'script': 'import_comprehensive_player_data.py',
             'description': 'Import Comprehensive Player Data',
-            'required': True
+            'required': True,
+            'depends_on': ['player_snapshot.py'],
+            'resource': NBA_API
         },
         {
             'script': 'import_career_stats_nba_api.py',
             'description': 'Import Career Stats',
-            'required': True
+            'required': True,
+            'depends_on': ['player_snapshot.py'],
+            'resource': NBA_API
         },
         {
             'script': 'nba_games_import_fixed.py',
             'description': 'Import 2024-25 NBA Games',
-            'required': True
+            'required': True,
+            'depends_on': [],
+            'resource': NBA_API
         },
         {
             'script': 'import_2024_25_player_game_logs.py',
             'description': 'Import 2024-25 Player Game Logs',
-            'required': True
+            'required': True,
+            'depends_on': ['player_snapshot.py', 'nba_games_import_fixed.py'],
+            'resource': NBA_API
         },
         {
             'script': 'import_2025_26_season.py',
             'description': 'Import 2025-26 Season Schedule',
-            'required': True
+            'required': True,
+            'depends_on': []
         },
         {
             'script': 'fetch_preseason_boxscores_final.py',
             'description': 'Import Preseason Box Scores (2025)',
-            'required': False
+            'required': False,
+            'depends_on': ['import_nba_players_robust.py', 'import_2025_26_season.py'],
+            'resource': NBA_API
+        },
+        {
+            'script': 'fantasy_scoring.py',
+            'description': 'Materialize Fantasy Points',
+            'required': False,
+            'depends_on': ['import_2024_25_player_game_logs.py', 'fetch_preseason_boxscores_final.py']
+        },
+        {
+            'script': 'league_scoring.py',
+            'description': 'Score Leagues by Scoring Profile',
+            'required': False,
+            'depends_on': ['fantasy_scoring.py', 'import_espn_projections.py']
+        },
+        {
+            'script': 'matchup_scoring.py',
+            'description': 'Apply New Game Logs to Matchup Scores',
+            'required': False,
+            'depends_on': ['league_scoring.py', 'fetch_preseason_boxscores_final.py']
+        },
+        {
+            'script': 'draft_rankings.py',
+            'description': 'Build Draft Rankings',
+            'required': False,
+            'depends_on': ['import_espn_projections.py', 'import_hoopshype_salaries.py']
         }
     ]
     
-    # Track success/failure
-    successful_imports = []
-    failed_imports = []
+    install_step_output()
+    if not args.isolate:
+        prepare_in_process()
     
-    # Run each import step
-    for i, step in enumerate(import_steps, 1):
-        print(f"\n📊 Progress: {i}/{len(import_steps)}")
-        
-        success = run_script(step['script'], step['description'])
-        
-        if success:
-            successful_imports.append(step)
-        else:
-            failed_imports.append(step)
-            if step['required']:
-                print(f"\n❌ Required step failed: {step['description']}")
-                print("🛑 Stopping setup process due to critical failure")
-                break
-        
-        # Add a small delay between imports
-        if i < len(import_steps):
-            print("⏳ Waiting 3 seconds before next import...")
-            time.sleep(3)
+    run_id = setup_metrics.new_run_id()
+    started_at = datetime.now(timezone.utc).isoformat()
+    start_time = time.perf_counter()
+    results = run_steps(import_steps, args.workers, args.isolate)
+    total_time = time.perf_counter() - start_time
+    
+    successful_imports = [step for step in import_steps if results[step['script']]['status'] == 'success']
+    failed_imports = [step for step in import_steps if results[step['script']]['status'] == 'failed']
+    skipped_imports = [step for step in import_steps if results[step['script']]['status'] == 'skipped']
     
     # Print final summary
     print(f"\n{'='*60}")
@@ -203,11 +566,31 @@ def main():
         for step in failed_imports:
             print(f"   • {step['description']}")
     
-    if not failed_imports:
+    if skipped_imports:
+        print(f"\n⏭️  Skipped imports: {len(skipped_imports)}")
+        for step in skipped_imports:
+            print(f"   • {step['description']}")
+    
+    # The longest chain of dependent steps is what the run time is made of
+    path = critical_path(import_steps, results)
+    report_path = setup_metrics.save_run_report(
+        build_run_report(run_id, started_at, args, import_steps, results, total_time, path)
+    )
+    if path:
+        descriptions = {step['script']: step['description'] for step in import_steps}
+        busy_time = sum(r['duration'] for r in results.values())
+        print(f"\n⏱️  Total time: {total_time:.1f}s (steps took {busy_time:.1f}s combined)")
+        print("🧭 Critical path:")
+        for name in path:
+            print(f"   • {descriptions[name]}: {results[name]['duration']:.1f}s")
+    print(f"\n📄 Run report: {report_path}")
+    print("   Compare with the previous run: python3 scripts/setup/supa_setup.py compare")
+    
+    if not failed_imports and not skipped_imports:
         print(f"\n🎉 Database setup completed successfully!")
         print("🏀 Your HoopGeek database is ready to use!")
     else:
-        print(f"\n⚠️  Setup completed with {len(failed_imports)} failure(s)")
+        print(f"\n⚠️  Setup completed with {len(failed_imports)} failure(s) and {len(skipped_imports)} skipped step(s)")
         print("🔧 Please check the error messages above and retry failed imports")
         sys.exit(1)
 
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Bulk Supabase helpers shared by the import scripts
+Keyset-paginated reads, chunked bulk writes and staging-table reloads with an atomic swap.
+"""
+
+import uuid
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from supabase import Client
+
+# PostgREST handles a few hundred rows per request comfortably
+DEFAULT_CHUNK_SIZE = 500
+
+# Supabase caps every select at 1000 rows
+DEFAULT_PAGE_SIZE = 1000
+
+def chunked(rows: Sequence[Any], size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Sequence[Any]]:
+    """Yield successive slices of at most `size` rows"""
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+def batched(rows: Iterable[Any], size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Any]]:
+    """Like chunked, for streams that can't be sliced"""
+    iterator = iter(rows)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+def iter_pages(
+    supabase: Client,
+    table: str,
+    columns: str = '*',
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    key: str = 'id',
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Stream a table page by page, paginating on `key` (id > last id).
+
+    Unlike limit/offset, each page is an index range scan so late pages cost
+    the same as the first, and rows are never skipped past the 1000-row cap.
+    Pages are requested back to back; there is no delay between them.
+
+    Args:
+        supabase: Supabase client
+        table: Table to read
+        columns: Select list, must include `key`
+        filters: Extra filters as (method, column, value), e.g. [('eq', 'source', 'espn')]
+        key: Unique, sortable column to paginate on
+        page_size: Rows per request
+    """
+    last_key = None
+    while True:
+        query = supabase.table(table).select(columns).order(key).limit(page_size)
+        for method, column, value in filters or []:
+            query = getattr(query, method)(column, value)
+        if last_key is not None:
+            query = query.gt(key, last_key)
+
+        rows = query.execute().data or []
+        if rows:
+            yield rows
+
+        if len(rows) < page_size:
+            break
+        last_key = rows[-1][key]
+
+def iter_rows(
+    supabase: Client,
+    table: str,
+    columns: str = '*',
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+    key: str = 'id',
+    page_size: int = DEFAULT_PAGE_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Stream a table row by row (see iter_pages)"""
+    for page in iter_pages(supabase, table, columns, filters, key, page_size):
+        yield from page
+
+def reload_via_staging(
+    supabase: Client,
+    staging_table: str,
+    swap_function: str,
+    rows: List[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Replace a table's contents without a visible gap for readers.
+
+    Rows are bulk inserted into `staging_table` under a fresh load id, then
+    `swap_function` replaces the live rows with that load in one transaction.
+    The live table is left untouched if anything fails before the swap.
+
+    Args:
+        supabase: Supabase client (service role)
+        staging_table: Staging table with the live columns plus `load_id`
+        swap_function: RPC that swaps a load into the live table
+        rows: Live-table rows; every row must have the same keys
+        chunk_size: Rows per insert request
+
+    Returns:
+        The swap function's result, e.g. {'success': True, 'inserted_count': 600, ...}
+    """
+    if not rows:
+        raise ValueError(f"Refusing to reload from {staging_table} with no rows")
+
+    load_id = str(uuid.uuid4())
+
+    for chunk in chunked(rows, chunk_size):
+        supabase.table(staging_table).insert(
+            [{**row, 'load_id': load_id} for row in chunk]
+        ).execute()
+
+    result = supabase.rpc(swap_function, {'p_load_id': load_id}).execute()
+    outcome = result.data or {}
+
+    if not outcome.get('success'):
+        raise Exception(f"{swap_function} failed: {outcome.get('error', 'unknown error')}")
+
+    return outcome
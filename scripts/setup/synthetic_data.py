@@ -0,0 +1,640 @@
+#!/usr/bin/env python3
+"""
+Synthetic Data Generator
+Seeded, realistic NBA and fantasy data at any scale for load testing scoring,
+drafts and the service without touching real data.
+
+Datasets (the same seed always produces the same rows):
+- players:     nba_players rows, 30 teams x --players-per-team
+- schedule:    nba_season_weeks + nba_games (same shape as import_2025_26_season.py)
+- game_logs:   nba_boxscores rows for every game in the first --played-weeks weeks
+               (those games get final scores)
+- projections: ESPN projections in the scraper's JSON format (import_espn_projections.py)
+- salaries:    HoopsHype salaries in the scraper's JSON format (import_hoopshype_salaries.py)
+- leagues:     fantasy_leagues, fantasy_league_seasons, fantasy_teams and drafted
+               fantasy_team_players rosters
+
+Each player gets a hidden talent/role profile, so box scores, projections,
+salaries and draft position agree with each other.
+
+Rows are streamed: to JSONL files (one per table) or, with --db, to Supabase in
+batches. Projections and salaries are always written as source files so the
+real importers can load them.
+
+Usage:
+    python3 scripts/setup/synthetic_data.py --output synthetic/ --leagues 10000 --seed 42
+    python3 scripts/setup/synthetic_data.py --db --commissioner-id <auth user uuid> --leagues 100
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from supabase_bulk import batched
+
+NBA_TEAMS = [
+    ('ATL', 'Atlanta Hawks'), ('BOS', 'Boston Celtics'), ('BKN', 'Brooklyn Nets'),
+    ('CHA', 'Charlotte Hornets'), ('CHI', 'Chicago Bulls'), ('CLE', 'Cleveland Cavaliers'),
+    ('DAL', 'Dallas Mavericks'), ('DEN', 'Denver Nuggets'), ('DET', 'Detroit Pistons'),
+    ('GSW', 'Golden State Warriors'), ('HOU', 'Houston Rockets'), ('IND', 'Indiana Pacers'),
+    ('LAC', 'LA Clippers'), ('LAL', 'Los Angeles Lakers'), ('MEM', 'Memphis Grizzlies'),
+    ('MIA', 'Miami Heat'), ('MIL', 'Milwaukee Bucks'), ('MIN', 'Minnesota Timberwolves'),
+    ('NOP', 'New Orleans Pelicans'), ('NYK', 'New York Knicks'), ('OKC', 'Oklahoma City Thunder'),
+    ('ORL', 'Orlando Magic'), ('PHI', 'Philadelphia 76ers'), ('PHX', 'Phoenix Suns'),
+    ('POR', 'Portland Trail Blazers'), ('SAC', 'Sacramento Kings'), ('SAS', 'San Antonio Spurs'),
+    ('TOR', 'Toronto Raptors'), ('UTA', 'Utah Jazz'), ('WAS', 'Washington Wizards')
+]
+
+# Game start times by slot (hour, minute)
+GAME_TIMES = [(19, 0), (19, 30), (20, 0), (22, 0)]
+
+# The All-Star break is around week 15-16
+ALL_STAR_WEEK = 15
+SEASON_WEEKS = 26
+
+# Synthetic nba_player_ids start here so they never collide with real ones
+SYNTHETIC_PLAYER_ID_BASE = 9000000
+
+FIRST_NAMES = [
+    'Aaron', 'Andre', 'Bennett', 'Brandon', 'Caleb', 'Cameron', 'Damian', 'Darius', 'Devin', 'Elijah',
+    'Evan', 'Franz', 'Gabe', 'Isaiah', 'Jalen', 'Jamal', 'Jaylen', 'Jordan', 'Josh', 'Julius',
+    'Keegan', 'Kevin', 'Kyle', 'Luka', 'Malik', 'Marcus', 'Mikal', 'Miles', 'Nikola', 'Olu',
+    'Paolo', 'Quentin', 'Reggie', 'Scottie', 'Shai', 'Tyrese', 'Victor', 'Walker', 'Zach', 'Zion'
+]
+LAST_NAMES = [
+    'Adams', 'Allen', 'Anderson', 'Banks', 'Bridges', 'Brooks', 'Brown', 'Carter', 'Collins', 'Davis',
+    'Edwards', 'Fox', 'Green', 'Harris', 'Hayes', 'Holiday', 'Jackson', 'Johnson', 'Jones', 'King',
+    'Lewis', 'Martin', 'Mitchell', 'Morris', 'Murray', 'Nance', 'Parker', 'Porter', 'Reed', 'Robinson',
+    'Sabonis', 'Smith', 'Thomas', 'Thompson', 'Turner', 'Walker', 'Wallace', 'White', 'Williams', 'Young'
+]
+
+POSITIONS = ['PG', 'SG', 'SF', 'PF', 'C']
+
+# Per-36 rate multipliers by position: (reb, ast, blk, fg3 share of shots)
+POSITION_PROFILES = {
+    'PG': (0.6, 1.8, 0.4, 0.45),
+    'SG': (0.7, 1.1, 0.5, 0.45),
+    'SF': (1.0, 0.9, 0.8, 0.38),
+    'PF': (1.4, 0.7, 1.3, 0.28),
+    'C':  (1.9, 0.6, 2.0, 0.12),
+}
+
+# Insert order that satisfies foreign keys, with the upsert key for each table
+TABLES = {
+    'nba_players': 'nba_player_id',
+    'nba_season_weeks': 'league_id,season_year,week_number',
+    'nba_games': 'game_id',
+    'nba_boxscores': 'nba_player_id,game_id',
+    'fantasy_leagues': None,
+    'fantasy_league_seasons': None,
+    'fantasy_teams': None,
+    'fantasy_team_players': None,
+}
+
+def make_uuid(rng: random.Random) -> str:
+    """Seeded UUID (uuid4 would differ on every run)"""
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+def season_label(season_year: int) -> str:
+    """2026 -> '2025-26'"""
+    return f"{season_year - 1}-{str(season_year)[2:]}"
+
+def generate_schedule(rng: random.Random, season_start: datetime, season_year: int,
+                      now: Optional[str] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Season weeks and games: 26 weeks, All-Star break skipped, 3-4 games a day
+    on 5-7 days a week. No team plays twice on the same day.
+
+    Returns:
+        (games, season_weeks)
+    """
+    now = now or datetime.now().isoformat()
+    games = []
+    season_weeks = []
+    current_date = season_start
+    team_indexes = range(len(NBA_TEAMS))
+
+    for week in range(1, SEASON_WEEKS + 1):
+        week_end = current_date + timedelta(days=6)
+        season_weeks.append({
+            'league_id': 0,
+            'season_year': season_year,
+            'week_number': week,
+            'week_name': f'Week {week}',
+            'start_date': current_date.strftime('%Y-%m-%d'),
+            'end_date': week_end.strftime('%Y-%m-%d'),
+            'created_at': now,
+            'updated_at': now
+        })
+
+        # Skip the All-Star break (3 weeks of calendar)
+        if week == ALL_STAR_WEEK:
+            current_date += timedelta(days=14)
+            continue
+        elif week == ALL_STAR_WEEK + 1:
+            current_date += timedelta(days=7)
+            continue
+
+        days_in_week = 6 if week <= 22 else 7
+        games_per_day = 4 if week <= 22 else 3
+
+        for day in range(days_in_week):
+            # Some Mondays and Sundays are off
+            if day == 0 and week % 3 == 0:
+                continue
+            if day == 6 and week % 4 == 0:
+                continue
+
+            game_date = current_date + timedelta(days=day)
+            # One draw per day: distinct teams, paired off home/away
+            day_teams = rng.sample(team_indexes, 2 * games_per_day)
+
+            for game_num in range(games_per_day):
+                hour, minute = GAME_TIMES[game_num]
+                game_time = game_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+                home_index, away_index = day_teams[2 * game_num], day_teams[2 * game_num + 1]
+                home_team, away_team = NBA_TEAMS[home_index], NBA_TEAMS[away_index]
+                game_id = f"NBA{season_year}{week:02d}{day:01d}{game_num:01d}"
+
+                games.append({
+                    'league_id': 0,
+                    'season_year': season_year,
+                    'game_date': game_time.isoformat(),
+                    'game_id': game_id,
+                    'game_code': game_id,
+                    'game_status': 1,  # 1 = Scheduled
+                    'game_status_text': 'Scheduled',
+                    'game_sequence': game_num + 1,
+                    'home_team_id': home_index + 1,
+                    'home_team_name': home_team[1],
+                    'home_team_city': home_team[1].split(' ')[0],
+                    'home_team_tricode': home_team[0],
+                    'home_team_score': 0,
+                    'away_team_id': away_index + 1,
+                    'away_team_name': away_team[1],
+                    'away_team_city': away_team[1].split(' ')[0],
+                    'away_team_tricode': away_team[0],
+                    'away_team_score': 0,
+                    'week_number': week,
+                    'week_name': f'Week {week}',
+                    'arena_name': f'{home_team[1]} Arena',
+                    'arena_city': home_team[1].split(' ')[0],
+                    'arena_state': 'CA' if home_team[0] in ['LAL', 'LAC', 'GSW', 'SAC'] else 'NY',
+                    'created_at': now,
+                    'updated_at': now
+                })
+
+        current_date += timedelta(days=7)
+
+    return games, season_weeks
+
+def generate_players(rng: random.Random, players_per_team: int = 15,
+                     now: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    nba_players rows plus a hidden profile per player (talent, minutes, per-36 rates).
+
+    Returns:
+        (players, profiles by player id)
+    """
+    now = now or datetime.now().isoformat()
+    players = []
+    profiles = {}
+    used_names = set()
+
+    for team_index, (tricode, team_name) in enumerate(NBA_TEAMS):
+        for slot in range(players_per_team):
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            while name in used_names:
+                name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            used_names.add(name)
+
+            position = POSITIONS[slot % len(POSITIONS)]
+            # Skewed: a few stars, many role players
+            talent = rng.betavariate(2, 5)
+            reb, ast, blk, fg3_share = POSITION_PROFILES[position]
+            player_id = make_uuid(rng)
+            first_name, last_name = name.split(' ', 1)
+
+            players.append({
+                'id': player_id,
+                'nba_player_id': SYNTHETIC_PLAYER_ID_BASE + len(players) + 1,
+                'name': name,
+                'first_name': first_name,
+                'last_name': last_name,
+                'position': position,
+                'team_id': team_index + 1,
+                'team_name': team_name,
+                'team_abbreviation': tricode,
+                'team_city': team_name.split(' ')[0],
+                'jersey_number': str(rng.randint(0, 99)),
+                'age': rng.randint(19, 37),
+                'is_active': True,
+                'created_at': now,
+                'updated_at': now
+            })
+            profiles[player_id] = {
+                'talent': talent,
+                'minutes': min(38.0, 8 + 30 * talent + rng.gauss(0, 3)),
+                'pts36': 10 + 20 * talent,
+                'reb36': (4 + 6 * talent) * reb,
+                'ast36': (2 + 5 * talent) * ast,
+                'stl36': 0.7 + 0.9 * talent,
+                'blk36': (0.3 + 0.9 * talent) * blk,
+                'tov36': 1.0 + 2.0 * talent,
+                'fg3_share': fg3_share,
+                'fg_pct': 0.42 + 0.08 * talent,
+                'ft_pct': min(0.92, 0.68 + 0.2 * rng.random()),
+            }
+
+    return players, profiles
+
+def _stat_line(rng: random.Random, profile: Dict[str, Any], minutes: float) -> Dict[str, Any]:
+    """One box score line scaled from per-36 rates"""
+    scale = minutes / 36.0
+
+    def count(rate: float) -> int:
+        return max(0, int(round(rng.gauss(rate * scale, 0.35 * rate * scale + 0.5))))
+
+    points_target = rng.gauss(profile['pts36'] * scale, 3 * scale + 1)
+    fta = count(profile['pts36'] * 0.25)
+    ftm = sum(1 for _ in range(fta) if rng.random() < profile['ft_pct'])
+    # Field goal attempts needed for the remaining points at ~2.2 points a make
+    fga = max(0, int(round(max(0.0, points_target - ftm) / (2.2 * profile['fg_pct']))))
+    fg3a = sum(1 for _ in range(fga) if rng.random() < profile['fg3_share'])
+    fg3m = sum(1 for _ in range(fg3a) if rng.random() < profile['fg_pct'] - 0.09)
+    fg2m = sum(1 for _ in range(fga - fg3a) if rng.random() < profile['fg_pct'] + 0.05)
+    fgm = fg2m + fg3m
+    reb = count(profile['reb36'])
+    oreb = sum(1 for _ in range(reb) if rng.random() < 0.22)
+
+    return {
+        'min': round(minutes, 2),
+        'fgm': fgm,
+        'fga': fga,
+        'fg_pct': round(fgm / fga, 3) if fga else None,
+        'fg3m': fg3m,
+        'fg3a': fg3a,
+        'fg3_pct': round(fg3m / fg3a, 3) if fg3a else None,
+        'ftm': ftm,
+        'fta': fta,
+        'ft_pct': round(ftm / fta, 3) if fta else None,
+        'oreb': oreb,
+        'dreb': reb - oreb,
+        'reb': reb,
+        'ast': count(profile['ast36']),
+        'stl': count(profile['stl36']),
+        'blk': count(profile['blk36']),
+        'tov': count(profile['tov36']),
+        'fouls_personal': min(6, count(3.0)),
+        'pts': 2 * fgm + fg3m + ftm,
+    }
+
+def generate_boxscores(rng: random.Random, games: List[Dict[str, Any]], players: List[Dict[str, Any]],
+                       profiles: Dict[str, Dict[str, Any]], played_weeks: int = SEASON_WEEKS,
+                       now: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    nba_boxscores rows for every game in the first `played_weeks` weeks.
+
+    Those games are marked final with the summed points as their score.
+    Ten players per team play; the top five by talent start.
+    """
+    now = now or datetime.now().isoformat()
+    rosters: Dict[int, List[Dict[str, Any]]] = {}
+    for player in players:
+        rosters.setdefault(player['team_id'], []).append(player)
+    for roster in rosters.values():
+        roster.sort(key=lambda p: profiles[p['id']]['talent'], reverse=True)
+
+    for game in games:
+        if game['week_number'] > played_weeks:
+            continue
+
+        game_date = game['game_date'][:10]
+        season = season_label(game['season_year'])
+        scores = {}
+        lines = []
+        for side, opponent in (('home', 'away'), ('away', 'home')):
+            team_id = game[f'{side}_team_id']
+            tricode = game[f'{side}_team_tricode']
+            matchup = (f"{tricode} vs. {game[f'{opponent}_team_tricode']}" if side == 'home'
+                       else f"{tricode} @ {game[f'{opponent}_team_tricode']}")
+            # Occasional DNPs shuffle the back of the rotation
+            rotation = [p for p in rosters.get(team_id, []) if rng.random() > 0.06][:10]
+            # Minutes are scaled so the team plays 240 of them
+            minutes = [max(4.0, rng.gauss(profiles[p['id']]['minutes'], 4)) for p in rotation]
+            factor = 240.0 / sum(minutes) if minutes else 0.0
+            team_points = 0
+            for order, player in enumerate(rotation):
+                profile = profiles[player['id']]
+                line = _stat_line(rng, profile, min(46.0, minutes[order] * factor))
+                team_points += line['pts']
+                lines.append({
+                    'player_id': player['id'],
+                    'nba_player_id': player['nba_player_id'],
+                    'player_name': player['name'],
+                    'game_id': game['game_id'],
+                    'game_date': game_date,
+                    'season_year': season,
+                    'matchup': matchup,
+                    'jersey_num': int(player['jersey_number']),
+                    'position': player['position'],
+                    'team_id': team_id,
+                    'team_abbreviation': tricode,
+                    'team_name': game[f'{side}_team_name'],
+                    'team_city': game[f'{side}_team_city'],
+                    'team_tricode': tricode,
+                    **line,
+                    'is_starter': order < 5,
+                    'is_home_game': side == 'home',
+                    'game_type': 'Regular Season',
+                    'created_at': now,
+                    'updated_at': now
+                })
+            scores[side] = team_points
+
+        # Overtime instead of a tie
+        if scores['home'] == scores['away']:
+            scores['home'] += rng.choice([2, 3])
+
+        for line in lines:
+            own, other = ('home', 'away') if line['is_home_game'] else ('away', 'home')
+            line['plus_minus_points'] = scores[own] - scores[other]
+            yield line
+
+        game.update({
+            'game_status': 3,
+            'game_status_text': 'Final',
+            'home_team_score': scores['home'],
+            'away_team_score': scores['away'],
+        })
+
+def _fmt_stat(value: float, pct: bool = False) -> str:
+    """ESPN formatting: '.476' for percentages, '24.3' otherwise"""
+    return f"{value:.3f}"[1:] if pct else f"{value:.1f}"
+
+def generate_projections(rng: random.Random, players: List[Dict[str, Any]],
+                         profiles: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """ESPN projections (scraper JSON format) for every rotation player"""
+    projections = []
+    for player in sorted(players, key=lambda p: profiles[p['id']]['talent'], reverse=True):
+        profile = profiles[player['id']]
+        if profile['minutes'] < 12:
+            continue
+
+        def season_stats(games_played: int, drift: float) -> Dict[str, str]:
+            scale = profile['minutes'] / 36.0 * drift
+            reb, ast, tov = profile['reb36'] * scale, profile['ast36'] * scale, profile['tov36'] * scale
+            return {
+                'GP': str(games_played),
+                'MIN': _fmt_stat(profile['minutes'] * drift),
+                'FG%': _fmt_stat(profile['fg_pct'] + rng.gauss(0, 0.01), pct=True),
+                'FT%': _fmt_stat(profile['ft_pct'] + rng.gauss(0, 0.01), pct=True),
+                '3PM': _fmt_stat(profile['pts36'] * scale * profile['fg3_share'] * 0.3),
+                'REB': _fmt_stat(reb),
+                'AST': _fmt_stat(ast),
+                'A/TO': f"{ast / tov:.2f}" if tov else '--',
+                'STL': _fmt_stat(profile['stl36'] * scale),
+                'BLK': _fmt_stat(profile['blk36'] * scale),
+                'TO': _fmt_stat(tov),
+                'PTS': _fmt_stat(profile['pts36'] * scale),
+            }
+
+        projections.append({
+            'Name': player['name'],
+            'Team': player['team_name'].split(' ')[-1],
+            'Position': player['position'],
+            '2025 Statistics': season_stats(rng.randint(40, 82), 1.0),
+            '2026 Projections': season_stats(rng.randint(55, 80), rng.gauss(1.02, 0.04)),
+            '2026 Outlook': f"{player['name']} projects as a {'starter' if profile['minutes'] >= 28 else 'rotation player'} "
+                            f"for the {player['team_name']}.",
+        })
+    return projections
+
+def generate_salaries(rng: random.Random, players: List[Dict[str, Any]],
+                      profiles: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """HoopsHype salaries (scraper JSON format), paid by talent"""
+    salaries = []
+    for player in players:
+        talent = profiles[player['id']]['talent']
+        base = 1_200_000 + 55_000_000 * talent ** 2 * rng.uniform(0.8, 1.2)
+        years = rng.randint(1, 4)
+        row = {'Name': player['name'], 'Team': player['team_name']}
+        for offset, season in enumerate(['2025-26', '2026-27', '2027-28', '2028-29']):
+            row[season] = f"${int(base * 1.05 ** offset):,}" if offset < years else None
+        salaries.append(row)
+    salaries.sort(key=lambda r: int(r['2025-26'][1:].replace(',', '')), reverse=True)
+    return salaries
+
+def generate_leagues(rng: random.Random, players: List[Dict[str, Any]], profiles: Dict[str, Dict[str, Any]],
+                     league_count: int, season_year: int, commissioner_id: str,
+                     teams_per_league: int = 12, roster_size: int = 13,
+                     now: Optional[str] = None) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Fantasy leagues with drafted rosters, as (table, row) in foreign key order.
+
+    Each league runs a snake draft where a team takes one of the best few
+    players left (by talent), so rosters differ between leagues.
+    """
+    now = now or datetime.now().isoformat()
+    ranked = [p['id'] for p in sorted(players, key=lambda p: profiles[p['id']]['talent'], reverse=True)]
+    roster_size = min(roster_size, len(ranked) // teams_per_league)
+
+    for league_number in range(1, league_count + 1):
+        league_id = make_uuid(rng)
+        season_id = make_uuid(rng)
+        yield 'fantasy_leagues', {
+            'id': league_id,
+            'name': f"Synthetic League {league_number}",
+            'commissioner_id': commissioner_id,
+            'max_teams': teams_per_league,
+            'draft_rounds': roster_size,
+            'fantasy_scoring_format': rng.choice(['FanDuel', 'DraftKings']),
+            'invite_code': f"SYN{rng.getrandbits(40):010X}",
+            'created_at': now,
+            'updated_at': now
+        }
+        yield 'fantasy_league_seasons', {
+            'id': season_id,
+            'league_id': league_id,
+            'season_year': season_year,
+            'season_status': 'active',
+            'current_teams': teams_per_league,
+            'draft_status': 'completed',
+            'created_at': now,
+            'updated_at': now
+        }
+
+        team_ids = []
+        for position in range(1, teams_per_league + 1):
+            team_id = make_uuid(rng)
+            team_ids.append(team_id)
+            yield 'fantasy_teams', {
+                'id': team_id,
+                'league_id': league_id,
+                'season_id': season_id,
+                'team_name': f"Team {position}",
+                'is_commissioner': position == 1,
+                'draft_position': position,
+                'created_at': now,
+                'updated_at': now
+            }
+
+        available = list(ranked)
+        for draft_round in range(roster_size):
+            order = team_ids if draft_round % 2 == 0 else reversed(team_ids)
+            for team_id in order:
+                pick = available.pop(min(len(available) - 1, int(rng.expovariate(0.5))))
+                yield 'fantasy_team_players', {
+                    'id': make_uuid(rng),
+                    'league_id': league_id,
+                    'fantasy_team_id': team_id,
+                    'player_id': pick,
+                    'is_starter': draft_round < 5,
+                    'is_bench': draft_round >= 10,
+                    'acquired_via': 'draft',
+                    'created_at': now,
+                    'updated_at': now
+                }
+
+class FileSink:
+    """Streams rows to <directory>/<table>.jsonl"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.files: Dict[str, Any] = {}
+        self.counts: Dict[str, int] = {}
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, rows: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        for table, row in rows:
+            f = self.files.get(table)
+            if f is None:
+                f = self.files[table] = open(os.path.join(self.directory, f"{table}.jsonl"), 'w', encoding='utf-8')
+            f.write(json.dumps(row, separators=(',', ':')))
+            f.write('\n')
+            self.counts[table] = self.counts.get(table, 0) + 1
+
+    def write_document(self, filename: str, data: Any) -> str:
+        path = os.path.join(self.directory, filename)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return path
+
+    def close(self) -> None:
+        for f in self.files.values():
+            f.close()
+
+class DatabaseSink:
+    """Streams rows to Supabase in batches, flushing tables in foreign key order"""
+
+    def __init__(self, supabase, directory: str, chunk_size: int = 500):
+        self.supabase = supabase
+        self.chunk_size = chunk_size
+        self.buffers: Dict[str, List[Dict[str, Any]]] = {table: [] for table in TABLES}
+        self.counts: Dict[str, int] = {}
+        # Source-format documents (projections, salaries) still go to files
+        self.documents = FileSink(directory)
+
+    def _flush(self) -> None:
+        for table, on_conflict in TABLES.items():
+            rows = self.buffers[table]
+            if not rows:
+                continue
+            for batch in batched(rows, self.chunk_size):
+                if on_conflict:
+                    self.supabase.table(table).upsert(batch, on_conflict=on_conflict).execute()
+                else:
+                    self.supabase.table(table).insert(batch).execute()
+            self.counts[table] = self.counts.get(table, 0) + len(rows)
+            self.buffers[table] = []
+
+    def write(self, rows: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        for table, row in rows:
+            buffer = self.buffers[table]
+            buffer.append(row)
+            # A child row may reference a parent still buffered, so flush everything together
+            if len(buffer) >= self.chunk_size:
+                self._flush()
+        self._flush()
+
+    def write_document(self, filename: str, data: Any) -> str:
+        return self.documents.write_document(filename, data)
+
+    def close(self) -> None:
+        self._flush()
+
+def tagged(table: str, rows: Iterable[Dict[str, Any]]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    for row in rows:
+        yield table, row
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Generate seeded synthetic NBA and fantasy data")
+    parser.add_argument('--seed', type=int, default=2026)
+    parser.add_argument('--season-year', type=int, default=2026)
+    parser.add_argument('--start-date', help="First day of the season (YYYY-MM-DD), default 21 days from now")
+    parser.add_argument('--players-per-team', type=int, default=15)
+    parser.add_argument('--played-weeks', type=int, default=SEASON_WEEKS, help="Weeks with final scores and box scores")
+    parser.add_argument('--leagues', type=int, default=100)
+    parser.add_argument('--teams-per-league', type=int, default=12)
+    parser.add_argument('--roster-size', type=int, default=13)
+    parser.add_argument('--output', default='synthetic', help="Directory for JSONL/JSON output")
+    parser.add_argument('--db', action='store_true', help="Write rows to Supabase instead of JSONL files")
+    parser.add_argument('--commissioner-id', help="auth.users id that owns the leagues (required with --db)")
+    args = parser.parse_args()
+
+    if args.db and args.leagues and not args.commissioner_id:
+        print("❌ --commissioner-id is required to write leagues to the database")
+        sys.exit(1)
+
+    rng = random.Random(args.seed)
+    now = datetime.now().isoformat()
+    season_start = (datetime.strptime(args.start_date, '%Y-%m-%d') if args.start_date
+                    else datetime.now() + timedelta(days=21))
+
+    if args.db:
+        from shared_client import get_client
+        url = os.getenv('VITE_SUPABASE_URL') or os.getenv('SUPABASE_URL')
+        key = os.getenv('SUPABASE_SERVICE_ROLE_KEY') or os.getenv('SUPABASE_KEY')
+        if not url or not key:
+            print("❌ Missing Supabase credentials: VITE_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY")
+            sys.exit(1)
+        sink = DatabaseSink(get_client(url, key), args.output)
+    else:
+        sink = FileSink(args.output)
+
+    print(f"🧪 Generating synthetic data (seed {args.seed}) -> {'Supabase' if args.db else args.output}")
+    start = time.perf_counter()
+
+    players, profiles = generate_players(rng, args.players_per_team, now)
+    games, season_weeks = generate_schedule(rng, season_start, args.season_year, now)
+    # Box scores first: they fill in the final scores of the games they cover
+    boxscores = list(generate_boxscores(rng, games, players, profiles, args.played_weeks, now))
+
+    sink.write(tagged('nba_players', players))
+    sink.write(tagged('nba_season_weeks', season_weeks))
+    sink.write(tagged('nba_games', games))
+    sink.write(tagged('nba_boxscores', boxscores))
+    projections_path = sink.write_document('espn_projections.json', generate_projections(rng, players, profiles))
+    salaries_path = sink.write_document('hoopshype_salaries.json', generate_salaries(rng, players, profiles))
+    sink.write(generate_leagues(rng, players, profiles, args.leagues, args.season_year,
+                                args.commissioner_id or make_uuid(rng),
+                                args.teams_per_league, args.roster_size, now))
+    sink.close()
+
+    elapsed = time.perf_counter() - start
+    total = sum(sink.counts.values())
+    print(f"✅ {total:,} rows in {elapsed:.1f}s ({total / elapsed:,.0f} rows/sec)")
+    for table, count in sink.counts.items():
+        print(f"   {table:<25} {count:>10,}")
+    print(f"   📄 {projections_path}")
+    print(f"   📄 {salaries_path}")
+
+if __name__ == "__main__":
+    main()
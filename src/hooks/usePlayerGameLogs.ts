@@ -160,3 +160,52 @@ export function usePlayerStatsForPlayer(playerId: number, gameIds: string[]) {
     staleTime: 5 * 60 * 1000, // 5 minutes
   });
 }
+
+interface UsePlayerFantasyPointsParams {
+  playerIds: number[];
+  gameIds: string[];
+  scoringFormat: string;
+}
+
+// Points scored from one nba_boxscores stat line, and when they were scored
+export interface PrecomputedFantasyPoints {
+  fantasyPts: number;
+  scoredAt: string;
+}
+
+// Key for fantasy point lookups
+export const fantasyPointsKey = (nbaPlayerId: number, gameId: string) => `${nbaPlayerId}:${gameId}`;
+
+// Hook to get precomputed fantasy points (player_fantasy_points, written by
+// scripts/setup/fantasy_scoring.py) keyed by fantasyPointsKey. Only the
+// nba_boxscores rows, so they describe the same stat lines usePlayerGameLogs shows
+export function usePlayerFantasyPoints({ playerIds, gameIds, scoringFormat }: UsePlayerFantasyPointsParams) {
+  return useQuery({
+    queryKey: ['playerFantasyPoints', playerIds, gameIds, scoringFormat],
+    queryFn: async (): Promise<Record<string, PrecomputedFantasyPoints>> => {
+      const { data, error } = await supabase
+        .from('player_fantasy_points')
+        .select('nba_player_id, game_id, fantasy_pts, updated_at')
+        .eq('source', 'nba_boxscores')
+        .eq('scoring_format', scoringFormat)
+        .in('nba_player_id', playerIds)
+        .in('game_id', gameIds);
+
+      if (error) {
+        console.error('Error fetching player fantasy points:', error);
+        throw error;
+      }
+
+      const points: Record<string, PrecomputedFantasyPoints> = {};
+      (data || []).forEach(row => {
+        points[fantasyPointsKey(row.nba_player_id, row.game_id)] = {
+          fantasyPts: Number(row.fantasy_pts),
+          scoredAt: row.updated_at,
+        };
+      });
+      return points;
+    },
+    enabled: playerIds.length > 0 && gameIds.length > 0,
+    staleTime: 5 * 60 * 1000, // 5 minutes
+  });
+}
@@ -6,27 +6,39 @@ export interface WeeklyTeamScore {
   starters_score: number;
   rotation_score: number;
   bench_score: number;
-  player_count: number;
+  games_played: number;
 }
 
+// Reads the running score kept in fantasy_team_week_scores by
+// scripts/setup/matchup_scoring.py (tier scores already include multipliers)
 export function useWeeklyTeamScore(leagueId: string, teamId: string, weekNumber: number) {
   return useQuery<WeeklyTeamScore | null, Error>({
     queryKey: ['weekly-team-score', leagueId, teamId, weekNumber],
     queryFn: async () => {
       if (!leagueId || !teamId || weekNumber < 0) return null;
       
-      const { data, error } = await supabase.rpc('calculate_weekly_team_score', {
-        p_league_id: leagueId,
-        p_fantasy_team_id: teamId,
-        p_week_number: weekNumber
-      });
+      const { data, error } = await supabase
+        .from('fantasy_team_week_scores')
+        .select('total_score, starters_score, rotation_score, bench_score, games_played')
+        .eq('league_id', leagueId)
+        .eq('fantasy_team_id', teamId)
+        .eq('week_number', weekNumber)
+        .maybeSingle();
       
       if (error) {
-        console.error('Error calculating weekly team score:', error);
+        console.error('Error fetching weekly team score:', error);
         throw error;
       }
       
-      return data?.[0] || null;
+      if (!data) return null;
+
+      return {
+        total_score: Number(data.total_score),
+        starters_score: Number(data.starters_score),
+        rotation_score: Number(data.rotation_score),
+        bench_score: Number(data.bench_score),
+        games_played: data.games_played,
+      };
     },
     enabled: !!leagueId && !!teamId && weekNumber >= 0,
     staleTime: 1000 * 60 * 2, // 2 minutes
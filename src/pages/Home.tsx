@@ -1,12 +1,13 @@
 import { Box, Typography, Stack, Card, Chip, IconButton, AspectRatio, Grid, Link as JoyLink, CircularProgress, CardContent, CardOverflow, Divider, CardCover } from '@mui/joy'
 import { useNavigate } from 'react-router-dom'
 import { useAuth } from '../hooks/useAuth'
-import { useState, useEffect, useMemo, useRef, useCallback } from 'react'
+import { useState, useEffect, useRef, useCallback } from 'react'
 import Favorite from '@mui/icons-material/Favorite'
 import Visibility from '@mui/icons-material/Visibility'
 import PlayCircleOutline from '@mui/icons-material/PlayCircleOutline'
 import KeyboardArrowUpIcon from '@mui/icons-material/KeyboardArrowUp'
-import { getAllGames, GameData } from '../utils/gameLoader'
+import { useFavoriteTeams, useFeedPreferences } from '../hooks/useUserSettings'
+import { getAllGames, getFeedManifest, getFeedPage, getTeamCandidates, mergeCandidates, expandFeedEntry, CandidateList, FeedEntry, GameData } from '../utils/gameLoader'
 
 // Detect if mobile device
 const isMobile = () => {
@@ -275,67 +276,129 @@ function GameCard({ game, onClick }: GameCardProps) {
   )
 }
 
+const expandEntries = (entries: FeedEntry[]) => entries.map(expandFeedEntry)
+
+// Take up to `count` games from the front of a queue, skipping (and recording) shown ones
+const takeUnshown = (queue: GameData[], count: number, shown: Set<string>): GameData[] => {
+  const taken: GameData[] = []
+  while (queue.length > 0 && taken.length < count) {
+    const game = queue.shift()!
+    if (!shown.has(game.gameId)) {
+      shown.add(game.gameId)
+      taken.push(game)
+    }
+  }
+  return taken
+}
+
 // Batch sizes based on viewport
 const MOBILE_BATCH_SIZE = 3  // Load 3 at a time on mobile (smoother than 1)
 const DESKTOP_BATCH_SIZE = 12 // Load 12 at a time on desktop (4 rows of 3)
+const FAVORITES_SHARE = 0.5    // Up to half of each batch comes from favorite-team candidates
 
 export default function Home() {
   const navigate = useNavigate()
   const { user } = useAuth()
-  const [allGames, setAllGames] = useState<GameData[]>([])
+  const { data: favoriteTeams } = useFavoriteTeams(user?.id)
+  const { data: feedPrefs } = useFeedPreferences(user?.id)
   const [displayedGames, setDisplayedGames] = useState<GameData[]>([])
-  const [page, setPage] = useState(0)
+  const [totalGames, setTotalGames] = useState(0)
   const [loading, setLoading] = useState(false)
   const [hasMore, setHasMore] = useState(true)
   const [showScrollTop, setShowScrollTop] = useState(false)
   const observerTarget = useRef<HTMLDivElement>(null)
 
-  // Sort games using the feed algorithm
-  const sortedGames = useMemo(() => {
-    return [...allGames].sort((a, b) => calculateFeedScore(b) - calculateFeedScore(a))
-  }, [allGames])
+  // Fetched but not yet shown games (ranked), the next feed page cursor and
+  // ids already queued, so games from the top list aren't repeated
+  const bufferRef = useRef<GameData[]>([])
+  const nextCursorRef = useRef<string | null>(null)
+  const seenRef = useRef<Set<string>>(new Set())
+  // Precomputed candidates for the user's favorite teams (merged, best first)
+  // and ids already shown, since a candidate can also be in the buffer
+  const priorityRef = useRef<GameData[]>([])
+  const shownRef = useRef<Set<string>>(new Set())
+
+  // Queue new games and re-rank everything not shown yet with the feed algorithm
+  const enqueueGames = useCallback((games: GameData[]) => {
+    const fresh = games.filter(game => !seenRef.current.has(game.gameId))
+    fresh.forEach(game => seenRef.current.add(game.gameId))
+    bufferRef.current = [...bufferRef.current, ...fresh]
+      .sort((a, b) => calculateFeedScore(b) - calculateFeedScore(a))
+  }, [])
+
+  // Take the next batch (favorite-team candidates first), fetching older feed
+  // pages until the batch is full
+  const showNextBatch = useCallback(async () => {
+    const batchSize = isMobile() ? MOBILE_BATCH_SIZE : DESKTOP_BATCH_SIZE
+    const favorites = takeUnshown(priorityRef.current, Math.ceil(batchSize * FAVORITES_SHARE), shownRef.current)
+    while (bufferRef.current.length < batchSize - favorites.length && nextCursorRef.current) {
+      const feedPage = await getFeedPage(nextCursorRef.current)
+      nextCursorRef.current = feedPage?.next ?? null
+      if (feedPage) enqueueGames(expandEntries(feedPage.games))
+    }
 
-  // Load initial games
+    const nextBatch = [...favorites, ...takeUnshown(bufferRef.current, batchSize - favorites.length, shownRef.current)]
+    setDisplayedGames(prev => [...prev, ...nextBatch])
+    setHasMore(bufferRef.current.length > 0 || priorityRef.current.length > 0 || nextCursorRef.current !== null)
+  }, [enqueueGames])
+
+  // Favorite teams: merge their precomputed candidate lists (feed/rank/<TEAM>.json)
+  useEffect(() => {
+    const teams = feedPrefs?.prioritize_favorite_teams === false ? [] : (favoriteTeams || [])
+    if (teams.length === 0) {
+      priorityRef.current = []
+      return
+    }
+    let cancelled = false
+    Promise.all(teams.map(team => getTeamCandidates(team.team_abbreviation))).then(lists => {
+      if (cancelled) return
+      const candidates = mergeCandidates(lists.filter((list): list is CandidateList => list !== null))
+      priorityRef.current = expandEntries(candidates).filter(game => !shownRef.current.has(game.gameId))
+      if (priorityRef.current.length > 0) setHasMore(true)
+    })
+    return () => { cancelled = true }
+  }, [favoriteTeams, feedPrefs])
+
+  // Load initial games: the feed manifest (top games + cursors) and the newest
+  // page, a few KB; falls back to the full index if the feed pages haven't been built
   useEffect(() => {
     const loadGames = async () => {
       try {
         setLoading(true)
-        const games = await getAllGames()
-        setAllGames(games)
-        
-        // Load first batch
-        const batchSize = isMobile() ? MOBILE_BATCH_SIZE : DESKTOP_BATCH_SIZE
-        const sortedData = [...games].sort((a, b) => calculateFeedScore(b) - calculateFeedScore(a))
-        setDisplayedGames(sortedData.slice(0, batchSize))
-        setPage(1)
-        setHasMore(sortedData.length > batchSize)
+        const manifest = await getFeedManifest()
+        if (manifest) {
+          setTotalGames(manifest.total)
+          enqueueGames(expandEntries(manifest.top))
+          const newest = manifest.first ? await getFeedPage(manifest.first) : null
+          if (newest) enqueueGames(expandEntries(newest.games))
+          nextCursorRef.current = (newest ? newest.next : manifest.first) ?? null
+        } else {
+          const games = await getAllGames()
+          setTotalGames(games.length)
+          enqueueGames(games)
+        }
+        await showNextBatch()
       } catch (error) {
         console.error('Error loading games:', error)
-        setAllGames([])
+        setHasMore(false)
       } finally {
         setLoading(false)
       }
     }
     loadGames()
-  }, [])
+  }, [enqueueGames, showNextBatch])
 
   // Load more games when scrolling
-  const loadMoreGames = useCallback(() => {
+  const loadMoreGames = useCallback(async () => {
     if (loading || !hasMore) return
 
-    const batchSize = isMobile() ? MOBILE_BATCH_SIZE : DESKTOP_BATCH_SIZE
-    const startIndex = page * batchSize
-    const endIndex = startIndex + batchSize
-    const nextBatch = sortedGames.slice(startIndex, endIndex)
-
-    if (nextBatch.length > 0) {
-      setDisplayedGames(prev => [...prev, ...nextBatch])
-      setPage(prev => prev + 1)
-      setHasMore(endIndex < sortedGames.length)
-    } else {
-      setHasMore(false)
+    setLoading(true)
+    try {
+      await showNextBatch()
+    } finally {
+      setLoading(false)
     }
-  }, [page, sortedGames, loading, hasMore])
+  }, [loading, hasMore, showNextBatch])
 
   // Intersection Observer for infinite scroll
   useEffect(() => {
@@ -518,7 +581,7 @@ export default function Home() {
                   🎉
                 </Typography>
                 <Typography level="title-lg" sx={{ textAlign: 'center' }}>
-                  You've watched all {allGames.length} games!
+                  You've watched all {totalGames} games!
                 </Typography>
                 <Typography level="body-sm" sx={{ color: 'text.secondary', textAlign: 'center' }}>
                   Check back later for more epic highlights
@@ -19,8 +19,9 @@ import { useUserTeamRoster } from '../hooks/useUserTeamRoster';
 import { useTeams } from '../hooks/useTeams';
 import { useMatchups } from '../hooks/useMatchups';
 import { useWeekSchedule, getGameTime } from '../hooks/useNBASchedule';
-import { usePlayerGameLogs } from '../hooks/usePlayerGameLogs';
+import { usePlayerGameLogs, usePlayerFantasyPoints, fantasyPointsKey } from '../hooks/usePlayerGameLogs';
 import { useLineupSettings } from '../hooks/useLineupSettings';
+import { useWeeklyTeamScore } from '../hooks/useWeeklyTeamScore';
 import BasketballCourt from '../components/BasketballCourt';
 import { getScoringFormat, calculateFantasyPoints } from '../utils/fantasyScoring';
 
@@ -87,6 +88,10 @@ export default function Lineups({ leagueId }: LineupsProps) {
   const opponentTeam = currentMatchup ? (
     currentMatchup.fantasy_team1_id === userTeam?.id ? currentMatchup.team2 : currentMatchup.team1
   ) : null;
+
+  // Running week scores kept by the scoring job (fantasy_team_week_scores)
+  const { data: weeklyScore } = useWeeklyTeamScore(leagueId, userTeam?.id || '', currentWeek);
+  const { data: opponentWeeklyScore } = useWeeklyTeamScore(leagueId, opponentTeam?.id || '', currentWeek);
   
   // Helper function to map full position names to simplified positions
   const mapPositionToSimplified = (position: string): string => {
@@ -223,6 +228,22 @@ export default function Lineups({ leagueId }: LineupsProps) {
     seasonYear: '2025-26'
   });
 
+  // Precomputed points for the league's format. They are only used when they were
+  // scored after the stat line shown next to them was last updated; live or
+  // corrected box scores newer than the last scoring run are scored here
+  const { data: precomputedPoints } = usePlayerFantasyPoints({
+    playerIds: allPlayerIds,
+    gameIds: allGameIds,
+    scoringFormat: leagueScoringFormat
+  });
+  const fantasyPointsFor = (stat: any): number => {
+    const precomputed = precomputedPoints?.[fantasyPointsKey(stat.nba_player_id, stat.game_id)];
+    if (precomputed && (!stat.updated_at || new Date(precomputed.scoredAt) >= new Date(stat.updated_at))) {
+      return precomputed.fantasyPts;
+    }
+    return calculateFantasyPoints(stat, selectedScoringFormat);
+  };
+
   // Debug logging
   console.log('🔍 Lineups Debug Info:');
   console.log('  Current week:', currentWeek);
@@ -325,15 +346,22 @@ export default function Lineups({ leagueId }: LineupsProps) {
         {currentMatchup && opponentTeam && (
           <Box sx={{ display: 'flex', alignItems: 'center', gap: 1 }}>
             <Typography level="body-xs" sx={{ fontWeight: 'bold' }}>
-              {userTeam.team_name.split(' ').pop()}
+              {userTeam.team_name.split(' ').pop()} {(weeklyScore?.total_score ?? 0).toFixed(1)}
             </Typography>
             <Typography level="body-xs" color="neutral">vs</Typography>
             <Typography level="body-xs" sx={{ fontWeight: 'bold' }}>
-              {opponentTeam.team_name.split(' ').pop()}
+              {(opponentWeeklyScore?.total_score ?? 0).toFixed(1)} {opponentTeam.team_name.split(' ').pop()}
             </Typography>
           </Box>
         )}
 
+        {/* Week score by lineup tier */}
+        {weeklyScore && (
+          <Typography level="body-xs" color="neutral">
+            Starters {weeklyScore.starters_score.toFixed(1)} • Rotation {weeklyScore.rotation_score.toFixed(1)} • Bench {weeklyScore.bench_score.toFixed(1)}
+          </Typography>
+        )}
+
         {/* Right: Scoring Format */}
         <Chip variant="soft" color="primary" size="sm" sx={{ fontSize: '0.7rem' }}>
           {selectedScoringFormat.name}
@@ -482,7 +510,7 @@ export default function Lineups({ leagueId }: LineupsProps) {
                     : 7;
                   
                   // Calculate weekly average for this player
-                  const weeklyFantasyPoints = playerStats.map(stat => calculateFantasyPoints(stat, selectedScoringFormat));
+                  const weeklyFantasyPoints = playerStats.map(stat => fantasyPointsFor(stat));
                   const weeklyAverage = weeklyFantasyPoints.length > 0 
                     ? Math.round((weeklyFantasyPoints.reduce((sum, points) => sum + points, 0) / weeklyFantasyPoints.length) * 100) / 100
                     : 0;
@@ -630,7 +658,7 @@ export default function Lineups({ leagueId }: LineupsProps) {
                                         textAlign: 'center'
                                       }}
                                     >
-                                      {calculateFantasyPoints(playerGameStats, selectedScoringFormat)}
+                                      {fantasyPointsFor(playerGameStats)}
                                     </Typography>
                                   </Box>
                                 )}
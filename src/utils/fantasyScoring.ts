@@ -1,4 +1,6 @@
 // Fantasy scoring utilities for translating raw NBA stats to fantasy points
+// The formats are mirrored in scripts/setup/fantasy_scoring.py, which precomputes
+// points into player_fantasy_points; keep the weights in sync
 
 export interface PlayerGameLog {
   id: string;
@@ -101,6 +101,173 @@ export interface FullGameData extends GameData {
   }
 }
 
+/**
+ * Compact feed entry (public/games/feed/*.json, written by supabase/json/build_game_index.py)
+ * Only what a feed card shows; w/l are [tricode, city, points]. The builder
+ * drops null values, so missing keys mean "not known"
+ */
+export interface FeedEntry {
+  id: string
+  date?: string
+  fun: number
+  w: [string, string, number]
+  l: [string, string, number]
+  lc: [number, number, number, number] // total, last 5 minutes, last minute, buzzer beaters
+  dunks: number
+  deep: [number, number] // deep threes, four pointers
+  video?: string
+  thumb?: string
+  views?: number
+  likes?: number
+}
+
+export interface FeedPageSummary {
+  cursor: string
+  start?: string
+  end?: string
+  count: number
+  top_fun: number
+}
+
+/** Root of the paginated feed: page cursors (newest first) and the top games by fun score */
+export interface FeedManifest {
+  version: number
+  total: number
+  first?: string
+  pages: FeedPageSummary[]
+  top: FeedEntry[]
+  ranking?: { as_of: string; teams: string[] } // Teams that have a candidate list
+}
+
+/** One week of games; `next` is the cursor of the previous week (missing on the last page) */
+export interface FeedPage {
+  cursor: string
+  start?: string
+  end?: string
+  next?: string
+  games: FeedEntry[]
+}
+
+/** Feed entry with its precomputed ranking score (supabase/json/feed_ranking.py) */
+export type RankedFeedEntry = FeedEntry & { score: number }
+
+/** Top-K candidates for one team (or `all`), best first */
+export interface CandidateList {
+  team: string
+  as_of: string
+  games: RankedFeedEntry[]
+}
+
+/**
+ * Expand a compact feed entry into the GameData shape the feed cards use
+ */
+export function expandFeedEntry(entry: FeedEntry): GameData {
+  const team = ([tricode, city, points]: [string, string, number]) => ({
+    name: '',
+    city,
+    tricode,
+    teamId: 0,
+    points
+  })
+  return {
+    gameId: entry.id,
+    date: entry.date || '',
+    fun_score: entry.fun,
+    story: {
+      matchup: `${entry.w[1]} vs ${entry.l[1]}`,
+      final_score: `${entry.w[1]} ${entry.w[2]} - ${entry.l[1]} ${entry.l[2]}`,
+      teams: { winner: team(entry.w), loser: team(entry.l) },
+      advantages: []
+    },
+    lead_changes: {
+      total: entry.lc[0],
+      last_5_minutes: entry.lc[1],
+      last_minute: entry.lc[2],
+      buzzer_beater: entry.lc[3]
+    },
+    dunk_stats: { 'Total Dunks': entry.dunks, 'Alley Oop': 0, 'Putback': 0 },
+    deep_shots: { deep_threes: entry.deep[0], four_pointers: entry.deep[1] },
+    video_url: entry.video,
+    thumbnail_url: entry.thumb,
+    views: entry.views || 0,
+    likes: entry.likes || 0
+  }
+}
+
+/**
+ * Get the feed manifest (a few KB), or null if the feed pages haven't been built
+ */
+export async function getFeedManifest(): Promise<FeedManifest | null> {
+  try {
+    const response = await fetch('/games/feed/manifest.json');
+    if (!response.ok) {
+      return null;
+    }
+    return (await response.json()) as FeedManifest;
+  } catch (error) {
+    console.error('Error loading feed manifest:', error);
+    return null;
+  }
+}
+
+/**
+ * Get one page of the feed by cursor (from the manifest or a previous page's `next`)
+ */
+export async function getFeedPage(cursor: string): Promise<FeedPage | null> {
+  try {
+    const response = await fetch(`/games/feed/${cursor}.json`);
+    if (!response.ok) {
+      throw new Error(`Failed to load feed page ${cursor}: ${response.statusText}`);
+    }
+    return (await response.json()) as FeedPage;
+  } catch (error) {
+    console.error(`Error loading feed page ${cursor}:`, error);
+    return null;
+  }
+}
+
+/**
+ * Get the precomputed candidate list for a team tricode (or 'all'), null if there is none
+ */
+export async function getTeamCandidates(team: string): Promise<CandidateList | null> {
+  try {
+    const response = await fetch(`/games/feed/rank/${team}.json`);
+    if (!response.ok) {
+      return null;
+    }
+    return (await response.json()) as CandidateList;
+  } catch (error) {
+    console.error(`Error loading feed candidates for ${team}:`, error);
+    return null;
+  }
+}
+
+/**
+ * Merge candidate lists (each sorted best first) into one list by score,
+ * keeping the best-scored copy of games that appear in several lists
+ */
+export function mergeCandidates(lists: CandidateList[]): RankedFeedEntry[] {
+  const heads = lists.map(() => 0);
+  const seen = new Set<string>();
+  const merged: RankedFeedEntry[] = [];
+  for (;;) {
+    let best = -1;
+    lists.forEach((list, i) => {
+      if (heads[i] < list.games.length && (best < 0 || list.games[heads[i]].score > lists[best].games[heads[best]].score)) {
+        best = i;
+      }
+    });
+    if (best < 0) {
+      return merged;
+    }
+    const entry = lists[best].games[heads[best]++];
+    if (!seen.has(entry.id)) {
+      seen.add(entry.id);
+      merged.push(entry);
+    }
+  }
+}
+
 /**
  * Get all games for the feed (from lightweight index)
  * This is fast because it only loads the index file, not all 500 game files
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Static JSON Artifacts
+How the game builders serialize what they publish under public/games/:
+minified, keys sorted (the same content always gives the same bytes), null
+values dropped from objects, integral floats written as ints, and written
+atomically next to precompressed .gz and .br variants for hosts/CDNs that
+serve precompressed files (nginx gzip_static/brotli_static, S3 + CloudFront,
+...).
+
+Brotli needs the optional `brotli` package; without it only .gz is written.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+REPORT_LINES = 25
+
+def js_numbers(value: Any) -> Any:
+    """Integral floats as ints, the way JSON.stringify prints them (3.0 -> 3)"""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, dict):
+        return {key: js_numbers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [js_numbers(item) for item in value]
+    return value
+
+def strip_nulls(value: Any) -> Any:
+    """Drop None values from objects (list items are kept, positions matter)"""
+    if isinstance(value, dict):
+        return {key: strip_nulls(item) for key, item in value.items() if item is not None}
+    if isinstance(value, list):
+        return [strip_nulls(item) for item in value]
+    return value
+
+def dumps(data: Any) -> str:
+    """Minified, key-stable JSON text without nulls"""
+    return json.dumps(js_numbers(strip_nulls(data)), separators=(',', ':'), sort_keys=True, ensure_ascii=False)
+
+def pretty_size(data: Any) -> int:
+    """Bytes the same data took as indented JSON (the baseline in reports)"""
+    return len(json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
+
+def write_bytes_atomic(path: str, content: bytes) -> None:
+    """Write to a temp file in the same directory, then rename over `path`"""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, 0o644)  # mkstemp creates 0600; these files are served
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def write_text_atomic(path: str, text: str) -> None:
+    write_bytes_atomic(path, text.encode('utf-8'))
+
+def write_json_atomic(path: str, data: Any, indent: Optional[int] = None) -> None:
+    """Plain JSON (manifests and caches, not published artifacts)"""
+    write_text_atomic(path, json.dumps(data, indent=indent))
+
+def has_variants(path: str) -> bool:
+    """Whether the compressed variants write_artifact would produce exist"""
+    return os.path.exists(f"{path}.gz") and (brotli is None or os.path.exists(f"{path}.br"))
+
+def write_artifact(path: str, text: str, baseline: Optional[int] = None) -> Dict[str, Any]:
+    """Write `text` plus .gz/.br variants; returns {path, baseline, raw, gz, br} byte sizes"""
+    raw = text.encode('utf-8')
+    write_bytes_atomic(path, raw)
+    # mtime=0 so an unchanged artifact compresses to the same bytes
+    gz = gzip.compress(raw, compresslevel=9, mtime=0)
+    write_bytes_atomic(f"{path}.gz", gz)
+    sizes = {'path': path, 'baseline': baseline, 'raw': len(raw), 'gz': len(gz), 'br': None}
+    if brotli is not None:
+        br = brotli.compress(raw, mode=brotli.MODE_TEXT, quality=11)
+        write_bytes_atomic(f"{path}.br", br)
+        sizes['br'] = len(br)
+    elif os.path.exists(f"{path}.br"):
+        os.remove(f"{path}.br")  # Would be stale
+    return sizes
+
+def remove_artifact(path: str) -> None:
+    """Remove an artifact and its compressed variants"""
+    for candidate in [path] + [path + suffix for suffix in COMPRESSED_SUFFIXES]:
+        if os.path.exists(candidate):
+            os.remove(candidate)
+
+def saving(baseline: int, size: int) -> str:
+    return f"{size:,} B (-{(1 - size / baseline) * 100:.0f}%)" if baseline else f"{size:,} B"
+
+def report(artifacts: List[Dict[str, Any]], label: str) -> None:
+    """Print per artifact (and total) sizes: indented -> minified -> gzip / brotli"""
+    if not artifacts:
+        return
+    print(f"📦 {label}: {len(artifacts)} artifacts written")
+
+    def line(name: str, baseline: int, raw: int, gz: int, br: Optional[int]) -> str:
+        text = f"   {name:<22} {baseline:>11,} B → min {saving(baseline, raw):<22} gz {saving(baseline, gz):<20}"
+        return text + (f" br {saving(baseline, br)}" if br is not None else " br n/a")
+
+    for sizes in artifacts[:REPORT_LINES]:
+        print(line(os.path.basename(sizes['path']), sizes['baseline'] or sizes['raw'], sizes['raw'], sizes['gz'], sizes['br']))
+    if len(artifacts) > REPORT_LINES:
+        print(f"   ... and {len(artifacts) - REPORT_LINES} more")
+    if len(artifacts) > 1:
+        has_br = all(sizes['br'] is not None for sizes in artifacts)
+        print(line('total', sum(sizes['baseline'] or sizes['raw'] for sizes in artifacts),
+                   sum(sizes['raw'] for sizes in artifacts), sum(sizes['gz'] for sizes in artifacts),
+                   sum(sizes['br'] for sizes in artifacts) if has_br else None))
+    if brotli is None:
+        print("   💡 pip install brotli to also write .br variants")
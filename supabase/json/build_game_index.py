@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+Incremental Games Index Builder
+Python version of scripts/generate_game_index.js that only parses game files
+that are new or changed since the last run.
+
+A manifest keeps (size, mtime, sha256, gameId) per game file. Files whose size
+and mtime are unchanged are not opened; files whose stat changed are hashed
+and only re-parsed if the hash differs. Their entries are merged into the
+existing games-index.json (entries of deleted files are dropped), and the
+index is rewritten only when its content actually changes.
+
+The entries and ordering match generate_game_index.js (--full rebuilds
+everything, like the JS script); the file itself is written minified with
+sorted keys, nulls dropped and .gz/.br variants (artifacts.py).
+
+Alongside the full index it writes the paginated feed Home.tsx reads, in
+public/games/feed/:
+
+    manifest.json     total, page cursors (newest first) and the top games
+                      by fun_score; a few KB, enough for first paint
+    <YYYY-Www>.json   one page per ISO week: {cursor, start, end, next, games}
+    rank/<name>.json  precomputed top-K candidates, `all` and per team, for
+                      personalized feeds (feed_ranking.py)
+
+Feed entries use a compact shape (see compact_entry and gameLoader.ts) with
+only what a feed card shows. Feed files are also rewritten only when their
+content changes, and pages of weeks that no longer have games are removed.
+Every written artifact is reported with its indented/minified/gzip/brotli size.
+
+Usage:
+    python3 supabase/json/build_game_index.py [--games-dir public/games] [--full] [--as-of 2025-04-25]
+    python3 supabase/json/build_game_index.py --from-index   # republish an existing games-index.json + feed
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from artifacts import dumps, has_variants, pretty_size, remove_artifact, report, write_artifact, write_json_atomic
+from build_games import CACHE_DIR, DEFAULT_OUTPUT_DIR
+from feed_ranking import ALL_TEAMS, candidate_lists, parse_as_of
+
+INDEX_NAME = 'games-index.json'
+FEED_DIR = 'feed'
+RANK_DIR = 'rank'
+FEED_MANIFEST = 'manifest.json'
+FEED_VERSION = 1
+TOP_GAMES = 12
+UNDATED_CURSOR = 'undated'
+DEFAULT_MANIFEST = os.path.join(CACHE_DIR, 'game_index_manifest.json')
+MANIFEST_VERSION = 1
+
+def first(*values: Any) -> Any:
+    """First truthy value (JavaScript `a || b || c`), the last one otherwise"""
+    for value in values[:-1]:
+        if value:
+            return value
+    return values[-1]
+
+def index_entry(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Feed entry for one game file, same fields and fallbacks as generate_game_index.js"""
+    game_id = data.get('gameId')
+    score = data.get('score') or {}
+    score_data = first(score.get(game_id) if isinstance(score, dict) else None, score, {})
+    story = data.get('story') or {}
+    metadata = data.get('gameMetadata') or {}
+
+    def metadata_team(side: str) -> Dict[str, Any]:
+        team = metadata.get(side) or {}
+        return {
+            'name': team.get('name') or '',
+            'city': team.get('city') or '',
+            'tricode': team.get('abbreviation') or '',
+            'teamId': team.get('team_id') or 0,
+            'points': team.get('points') or 0,
+        }
+
+    video_script = (data.get('script') or {}).get('video_script') or [{}]
+    return {
+        'gameId': game_id,
+        'date': first(metadata.get('date'), data.get('date')),
+        'fun_score': first(score_data.get('fun_score'), data.get('fun_score'), 0),
+        'story': {
+            'matchup': story.get('matchup') or '',
+            'final_score': story.get('final_score') or '',
+            'teams': story.get('teams') or {'winner': metadata_team('homeTeam'), 'loser': metadata_team('awayTeam')},
+            'advantages': (story.get('advantages') or [])[:3],  # Top 3 only for feed
+        },
+        'lead_changes': first(score_data.get('lead_changes'), data.get('lead_changes'),
+                              {'total': 0, 'last_5_minutes': 0, 'last_minute': 0, 'buzzer_beater': 0}),
+        'dunk_stats': first(score_data.get('dunk_stats'), data.get('dunk_stats'),
+                            {'Total Dunks': 0, 'Alley Oop': 0, 'Putback': 0}),
+        'deep_shots': first(score_data.get('deep_shots'), data.get('deep_shots'), {'deep_threes': 0, 'four_pointers': 0}),
+        'thumbnail_url': data.get('thumbnail_url') or None,
+        'video_url': first(data.get('video_url'), (video_script[0] or {}).get('mp4'), None),
+        'views': data.get('views') or 0,
+        'likes': data.get('likes') or 0,
+    }
+
+def date_key(entry: Dict[str, Any]) -> float:
+    """Sort key for 'most recent first'; undated entries go last"""
+    try:
+        return -datetime.fromisoformat(str(entry.get('date')).replace('Z', '+00:00')).replace(tzinfo=None).timestamp()
+    except ValueError:
+        return float('inf')
+
+def write_if_changed(path: str, data: Any) -> Optional[Dict[str, Any]]:
+    """Write `data` as an artifact unless the file already holds the same text; sizes if written"""
+    text = dumps(data)
+    if os.path.exists(path) and has_variants(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return None
+    return write_artifact(path, text, pretty_size(data))
+
+def week_cursor(value: Any) -> str:
+    """Feed page cursor for a game date: ISO week '2025-W17'"""
+    try:
+        year, week, _ = datetime.fromisoformat(str(value).replace('Z', '+00:00')).isocalendar()
+    except ValueError:
+        return UNDATED_CURSOR
+    return f"{year}-W{week:02d}"
+
+def compact_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Feed card fields only (gameLoader.ts FeedEntry); empty media/engagement keys are left out"""
+    teams = entry['story']['teams']
+    lead_changes = entry['lead_changes']
+    deep_shots = entry['deep_shots']
+
+    def team(side: str) -> List[Any]:
+        info = teams.get(side) or {}
+        return [info.get('tricode') or '', info.get('city') or '', info.get('points') or 0]
+
+    compact = {
+        'id': entry['gameId'],
+        'date': str(entry['date'])[:10] if entry.get('date') else None,
+        'fun': entry['fun_score'],
+        'w': team('winner'),
+        'l': team('loser'),
+        'lc': [lead_changes.get(key) or 0 for key in ('total', 'last_5_minutes', 'last_minute', 'buzzer_beater')],
+        'dunks': entry['dunk_stats'].get('Total Dunks') or 0,
+        'deep': [deep_shots.get('deep_threes') or 0, deep_shots.get('four_pointers') or 0],
+    }
+    for key, source in (('video', 'video_url'), ('thumb', 'thumbnail_url'), ('views', 'views'), ('likes', 'likes')):
+        if entry.get(source):
+            compact[key] = entry[source]
+    return compact
+
+def rank_files(ordered: List[Dict[str, Any]], as_of: date) -> Dict[str, Any]:
+    """'rank/<name>.json' -> ranked candidate list for `all` and every team"""
+    files = {}
+    for name, ranked in candidate_lists(ordered, as_of).items():
+        games = [dict(compact_entry(ordered[i]), score=round(score, 4)) for i, score in ranked]
+        files[f"{RANK_DIR}/{name}.json"] = {'team': name, 'as_of': as_of.isoformat(), 'games': games}
+    return files
+
+def feed_files(ordered: List[Dict[str, Any]], as_of: date) -> Dict[str, Any]:
+    """File name (relative to the feed dir) -> data for the manifest, weekly pages and rank lists"""
+    pages: List[Dict[str, Any]] = []
+    for entry in ordered:
+        cursor = week_cursor(entry.get('date'))
+        if not pages or pages[-1]['cursor'] != cursor:
+            pages.append({'cursor': cursor, 'games': []})
+        pages[-1]['games'].append(compact_entry(entry))
+
+    files, summaries = {}, []
+    for i, page in enumerate(pages):
+        dates = [game['date'] for game in page['games'] if game['date']]
+        page['start'], page['end'] = (min(dates), max(dates)) if dates else (None, None)
+        page['next'] = pages[i + 1]['cursor'] if i + 1 < len(pages) else None
+        files[f"{page['cursor']}.json"] = {key: page[key] for key in ('cursor', 'start', 'end', 'next', 'games')}
+        summaries.append({'cursor': page['cursor'], 'start': page['start'], 'end': page['end'],
+                          'count': len(page['games']), 'top_fun': max(game['fun'] for game in page['games'])})
+
+    top = sorted(ordered, key=lambda entry: -(entry.get('fun_score') or 0))[:TOP_GAMES]
+    files[FEED_MANIFEST] = {
+        'version': FEED_VERSION,
+        'total': len(ordered),
+        'first': pages[0]['cursor'] if pages else None,
+        'pages': summaries,
+        'top': [compact_entry(entry) for entry in top],
+    }
+    ranks = rank_files(ordered, as_of)
+    teams = sorted(data['team'] for data in ranks.values() if data['team'] != ALL_TEAMS)
+    files[FEED_MANIFEST]['ranking'] = {'as_of': as_of.isoformat(), 'teams': teams}
+    files.update(ranks)
+    return files
+
+def write_feed(games_dir: str, ordered: List[Dict[str, Any]], as_of: Optional[date] = None) -> Dict[str, Any]:
+    """Write changed feed files, remove pages and rank lists that no longer exist"""
+    feed_dir = os.path.join(games_dir, FEED_DIR)
+    files = feed_files(ordered, as_of or date.today())
+    existing = set()
+    for subdir in ('', RANK_DIR):
+        directory = os.path.join(feed_dir, subdir)
+        if os.path.isdir(directory):
+            existing.update(os.path.join(subdir, name) if subdir else name
+                            for name in os.listdir(directory) if name.endswith('.json'))
+
+    artifacts = []
+    for name, data in files.items():
+        sizes = write_if_changed(os.path.join(feed_dir, name), data)
+        if sizes:
+            artifacts.append(sizes)
+    stale = existing - set(files)
+    for name in stale:
+        remove_artifact(os.path.join(feed_dir, name))
+    pages = sum(1 for name in files if name != FEED_MANIFEST and not name.startswith(f"{RANK_DIR}/"))
+    return {'feed_pages': pages, 'feed_written': len(artifacts), 'feed_removed': len(stale), 'feed_artifacts': artifacts}
+
+def file_hash(path: str) -> Tuple[str, bytes]:
+    with open(path, 'rb') as f:
+        content = f.read()
+    return hashlib.sha256(content).hexdigest(), content
+
+def load_manifest(path: str) -> Dict[str, Dict[str, Any]]:
+    """file name -> {size, mtime_ns, sha256, gameId}"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('files', {}) if manifest.get('manifest_version') == MANIFEST_VERSION else {}
+
+def load_index(path: str) -> Tuple[Optional[str], Dict[str, Dict[str, Any]]]:
+    """(index text, gameId -> entry), (None, {}) if there is no readable index"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        return text, {entry['gameId']: entry for entry in json.loads(text)}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None, {}
+
+def update_index(games_dir: str, manifest_path: str, full: bool = False, as_of: Optional[date] = None) -> Dict[str, Any]:
+    """Bring games-index.json up to date; returns counts of what was done"""
+    index_path = os.path.join(games_dir, INDEX_NAME)
+    old_text, entries = load_index(index_path)
+    manifest = {} if full or old_text is None else load_manifest(manifest_path)
+    if not manifest:
+        entries = {}
+
+    stats = {'files': 0, 'unchanged': 0, 'touched': 0, 'parsed': 0, 'removed': 0, 'errors': 0}
+    files = sorted(name for name in os.listdir(games_dir)
+                   if name.endswith('.json') and name != INDEX_NAME and not name.startswith('.'))
+    new_manifest = {}
+    for name in files:
+        stats['files'] += 1
+        path = os.path.join(games_dir, name)
+        stat = os.stat(path)
+        known = manifest.get(name)
+        if known and known['size'] == stat.st_size and known['mtime_ns'] == stat.st_mtime_ns and known.get('gameId') in entries:
+            new_manifest[name] = known
+            stats['unchanged'] += 1
+            continue
+
+        digest, content = file_hash(path)
+        record = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest}
+        if known and known['sha256'] == digest and known.get('gameId') in entries:
+            new_manifest[name] = dict(known, **record)
+            stats['touched'] += 1
+            continue
+
+        try:
+            entry = index_entry(json.loads(content))
+        except (ValueError, AttributeError, TypeError) as e:
+            print(f"❌ Error processing {name}: {e}")
+            stats['errors'] += 1
+            continue
+        if known and known.get('gameId') != entry['gameId']:
+            entries.pop(known.get('gameId'), None)
+        entries[entry['gameId']] = entry
+        new_manifest[name] = dict(record, gameId=entry['gameId'])
+        stats['parsed'] += 1
+
+    # Entries of game files that were deleted (or now fail to parse)
+    live_ids = {record['gameId'] for record in new_manifest.values()}
+    for game_id in [game_id for game_id in entries if game_id not in live_ids]:
+        del entries[game_id]
+        stats['removed'] += 1
+
+    # File order first, so games on the same date keep the JS script's order
+    ordered = sorted([entries[record['gameId']] for record in new_manifest.values() if record['gameId'] in entries], key=date_key)
+    index_sizes = write_if_changed(index_path, ordered)
+    stats['written'] = index_sizes is not None
+    stats['index_artifacts'] = [index_sizes] if index_sizes else []
+    stats.update(write_feed(games_dir, ordered, as_of))
+    if new_manifest != manifest:
+        write_json_atomic(manifest_path, {'manifest_version': MANIFEST_VERSION, 'files': new_manifest})
+    stats['games'] = len(entries)
+    stats['index_path'] = index_path
+    return stats
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Incrementally rebuild public/games/games-index.json and the feed pages")
+    parser.add_argument('--games-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST)
+    parser.add_argument('--full', action='store_true', help="Ignore the manifest and re-parse every file")
+    parser.add_argument('--from-index', action='store_true', help="Republish games-index.json and its feed pages without game files")
+    parser.add_argument('--as-of', help="Date the feed ranking's recency decay is measured from (default today)")
+    args = parser.parse_args()
+    as_of = parse_as_of(args.as_of)
+
+    if args.from_index:
+        index_path = os.path.join(args.games_dir, INDEX_NAME)
+        _, entries = load_index(index_path)
+        ordered = sorted(entries.values(), key=date_key)
+        index_sizes = write_if_changed(index_path, ordered)
+        report([index_sizes] if index_sizes else [], "Index")
+        stats = write_feed(args.games_dir, ordered, as_of)
+        print(f"📄 Feed: {stats['feed_pages']} weekly pages from {len(entries)} games, "
+              f"{stats['feed_written']} files written, {stats['feed_removed']} removed")
+        report(stats['feed_artifacts'], "Feed")
+        return
+
+    print("🏀 Updating game index...")
+    start = time.perf_counter()
+    stats = update_index(args.games_dir, args.manifest, args.full, as_of)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"📊 {stats['files']} game files: {stats['parsed']} parsed, {stats['unchanged']} unchanged, "
+          f"{stats['touched']} touched (same content), {stats['removed']} removed, {stats['errors']} errors")
+    if stats['written']:
+        size = os.path.getsize(stats['index_path']) / 1024
+        print(f"✅ Wrote {stats['games']} games to {stats['index_path']} ({size:.0f} KB) in {elapsed:.0f} ms")
+    else:
+        print(f"✅ Index already up to date ({stats['games']} games, {elapsed:.0f} ms)")
+    print(f"📄 Feed: {stats['feed_pages']} weekly pages, {stats['feed_written']} files written, {stats['feed_removed']} removed")
+    report(stats['index_artifacts'], "Index")
+    report(stats['feed_artifacts'], "Feed")
+
+if __name__ == "__main__":
+    main()
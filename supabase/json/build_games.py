@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Game Feed Batch Builder
+Builds the per-game feed documents in public/games/<gameId>.json (the format
+in GAME_FEED_README.md) from play-by-play files, fanning the score/story/fun
+computation out over a process pool (one worker per core by default).
+
+- Games come from --games ids or from a --start/--end date range over a
+  schedule file (e.g. preseason_games_2025.json)
+- Play-by-play is read from --pbp-dir/<gameId>.json; --fetch downloads missing
+  games with nba_api's live PlayByPlay endpoint first
+- Each worker scores a chunk of games at once (the engine is vectorized) and
+  writes every game file atomically (temp file + rename), keeping keys other
+  pipelines add to the file (video_url, views, arena/teams in gameMetadata,
+  ...); files are minified with .gz/.br variants (see artifacts.py)
+- A bad play-by-play file fails only its own game, not the rest of its chunk
+- A manifest records each game's input hash (play-by-play bytes, schedule
+  date and the engine source), so unchanged games are skipped on the next run
+
+Usage:
+    python3 supabase/json/build_games.py --games 0022400599 0022400600
+    python3 supabase/json/build_games.py --schedule preseason_games_2025.json --start 2025-10-02 --end 2025-10-17
+    python3 supabase/json/build_games.py --schedule schedule.json --force --workers 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+JSON_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(JSON_DIR))
+sys.path.insert(0, JSON_DIR)
+
+from artifacts import dumps, pretty_size, report, write_artifact, write_json_atomic
+
+DEFAULT_PBP_DIR = os.path.join(REPO_ROOT, 'playbyplay')
+DEFAULT_OUTPUT_DIR = os.path.join(REPO_ROOT, 'public', 'games')
+CACHE_DIR = os.environ.get('HOOPGEEK_CACHE_DIR') or os.path.join(REPO_ROOT, 'scripts', '.cache')
+DEFAULT_MANIFEST = os.path.join(CACHE_DIR, 'game_feed_manifest.json')
+
+# Source files whose changes invalidate every built game
+ENGINE_FILES = ['pbp.py', 'score.py', 'story.py', 'fun.py', 'build_games.py', 'artifacts.py']
+MANIFEST_VERSION = 1
+GAMES_PER_TASK = 20
+
+# Keys the builder owns in a game document; anything else in an existing file is kept.
+# date and gameMetadata are merged instead (see merge_document)
+COMPUTED_KEYS = ['gameId', 'fun_score', 'story', 'team_stats', 'lead_changes',
+                 'dunk_stats', 'deep_shots', 'scoring_milestones']
+
+DATE_FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%Y-%m-%dT%H:%M:%S', '%Y-%m-%dT%H:%M:%SZ']
+
+def parse_date(value: str) -> Optional[date]:
+    """Schedule/CLI date in any of DATE_FORMATS, None if unparseable"""
+    value = (value or '').strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+def season_for(game_id: str) -> str:
+    """'0022400599' -> '2024-25'"""
+    year = int(game_id[3:5])
+    return f"20{year:02d}-{(year + 1) % 100:02d}"
+
+def engine_hash() -> str:
+    """Hash of the engine source, so a scoring change rebuilds every game"""
+    digest = hashlib.sha256()
+    for name in ENGINE_FILES:
+        with open(os.path.join(JSON_DIR, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def input_hash(pbp_path: str, game_date: Optional[str], engine: str) -> str:
+    digest = hashlib.sha256(engine.encode())
+    digest.update((game_date or '').encode())
+    with open(pbp_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_manifest(path: str) -> Dict[str, Any]:
+    """gameId -> {input_hash, built_at}; empty if missing or from another version"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('manifest_version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('games', {})
+
+def save_manifest(path: str, games: Dict[str, Any]) -> None:
+    write_json_atomic(path, {'manifest_version': MANIFEST_VERSION, 'games': games})
+
+def schedule_games(schedule_path: str, start: Optional[date], end: Optional[date]) -> Dict[str, Optional[str]]:
+    """gameId -> ISO date for schedule entries within [start, end]"""
+    with open(schedule_path, 'r', encoding='utf-8') as f:
+        schedule = json.load(f)
+    games = {}
+    for entry in schedule:
+        game_id = str(entry.get('game_id') or entry.get('gameId') or '')
+        game_date = parse_date(entry.get('date') or entry.get('gameDate') or '')
+        if not game_id or (start and (not game_date or game_date < start)) or (end and (not game_date or game_date > end)):
+            continue
+        games[game_id] = game_date.isoformat() if game_date else None
+    return games
+
+def fetch_play_by_play(game_ids: List[str], pbp_dir: str) -> None:
+    """Download missing play-by-play with nba_api's live endpoint"""
+    from nba_api.live.nba.endpoints import playbyplay
+
+    for game_id in game_ids:
+        path = os.path.join(pbp_dir, f"{game_id}.json")
+        if os.path.exists(path):
+            continue
+        try:
+            write_json_atomic(path, playbyplay.PlayByPlay(game_id).get_dict())
+            print(f"📥 Fetched play-by-play for {game_id}")
+        except Exception as e:
+            print(f"❌ Could not fetch play-by-play for {game_id}: {e}")
+        time.sleep(0.6)  # Rate limiting
+
+def game_document(game_id: str, score: Dict[str, Any], story: Dict[str, Any]) -> Dict[str, Any]:
+    """Computed sections of the feed document for one game (GAME_FEED_README.md)"""
+    return {
+        'gameId': game_id,
+        'fun_score': score['fun_score'],
+        'story': story,
+        'team_stats': score['team_stats'],
+        'lead_changes': score['lead_changes'],
+        'dunk_stats': score['dunk_stats'],
+        'deep_shots': score['deep_shots'],
+        'scoring_milestones': score['scoring_milestones'],
+    }
+
+def merge_document(existing: Dict[str, Any], game_id: str, game_date: Optional[str],
+                   score: Dict[str, Any], story: Dict[str, Any]) -> Dict[str, Any]:
+    """Existing file updated with the computed sections; gameMetadata (arena,
+    teams, status) is merged and a game without a known date keeps its old one"""
+    document = {key: value for key, value in existing.items() if key not in COMPUTED_KEYS}
+    document.update(game_document(game_id, score, story))
+    metadata = dict(document.get('gameMetadata') or {})
+    game_date = game_date or metadata.get('date') or (document.get('date') or '')[:10] or None
+    metadata['season'] = season_for(game_id)
+    if game_date:
+        metadata['date'] = game_date
+        document['date'] = f"{game_date}T00:00:00"
+    document['gameMetadata'] = metadata
+    return document
+
+def first_action_date(data: Dict[str, Any]) -> Optional[str]:
+    """Game date from the first timestamped action, for games not in a schedule"""
+    for action in (data.get('game', data).get('actions') or []):
+        stamp = action.get('timeActual')
+        if stamp:
+            return stamp[:10]
+    return None
+
+def read_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """Parsed and checked play-by-play of one task; raises ValueError on a bad file"""
+    from pbp import read_game
+
+    with open(task['pbp_path'], 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise ValueError("play-by-play is not a JSON object")
+    game = read_game(data)
+    if not isinstance(game, dict) or not isinstance(game.get('actions'), list) or not game['actions']:
+        raise ValueError("play-by-play has no actions")
+    if str(game.get('gameId', '')) != task['game_id']:
+        raise ValueError(f"play-by-play is for game {game.get('gameId')!r}")
+    task['date'] = task['date'] or first_action_date(data)
+    return game
+
+def score_games(games: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """gameId -> score and gameId -> story for the given games, scored together"""
+    from pbp import load_play_by_play
+    from score import compute_scores
+    from story import compute_stories
+
+    pbp = load_play_by_play(games)
+    return compute_scores(pbp), compute_stories(pbp)
+
+def build_chunk(tasks: List[Dict[str, Any]], output_dir: str) -> List[Dict[str, Any]]:
+    """Worker: score a chunk of games and write their files; one result per game,
+    with an 'error' instead of 'sizes' for games that failed"""
+    results, valid, games = [], [], []
+    for task in tasks:
+        try:
+            games.append(read_task(task))
+            valid.append(task)
+        except Exception as e:
+            results.append({'game_id': task['game_id'], 'error': str(e)})
+
+    scores: Dict[str, Any] = {}
+    stories: Dict[str, Any] = {}
+    try:
+        scores, stories = score_games(games)
+    except Exception:
+        # Score one game at a time so only the game that breaks the engine fails
+        for task, game in zip(valid, games):
+            try:
+                game_scores, game_stories = score_games([game])
+            except Exception as e:
+                results.append({'game_id': task['game_id'], 'error': str(e)})
+                continue
+            scores.update(game_scores)
+            stories.update(game_stories)
+
+    for task in valid:
+        game_id = task['game_id']
+        if game_id not in scores:
+            continue
+        path = os.path.join(output_dir, f"{game_id}.json")
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                existing = json.load(f)
+        except (OSError, ValueError):
+            existing = {}
+        try:
+            document = merge_document(existing if isinstance(existing, dict) else {}, game_id,
+                                      task['date'], scores[game_id], stories[game_id])
+            sizes = write_artifact(path, dumps(document), pretty_size(document))
+        except Exception as e:
+            results.append({'game_id': game_id, 'error': str(e)})
+            continue
+        results.append({'game_id': game_id, 'input_hash': task['input_hash'], 'sizes': sizes})
+    return results
+
+def chunked(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Build per-game feed JSON files in parallel")
+    parser.add_argument('--games', nargs='*', default=[], help="Game ids to build")
+    parser.add_argument('--schedule', help="Schedule JSON (game_id + date entries) for date ranges")
+    parser.add_argument('--start', help="First game date (YYYY-MM-DD), needs --schedule")
+    parser.add_argument('--end', help="Last game date (YYYY-MM-DD), needs --schedule")
+    parser.add_argument('--pbp-dir', default=DEFAULT_PBP_DIR, help="Directory of <gameId>.json play-by-play files")
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--manifest', default=DEFAULT_MANIFEST)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--fetch', action='store_true', help="Download missing play-by-play first")
+    parser.add_argument('--force', action='store_true', help="Rebuild even if the inputs are unchanged")
+    args = parser.parse_args()
+
+    start, end = parse_date(args.start or ''), parse_date(args.end or '')
+    if (args.start and not start) or (args.end and not end):
+        parser.error("--start/--end must be dates like 2025-01-15")
+    if (start or end) and not args.schedule:
+        parser.error("--start/--end need --schedule")
+
+    dates: Dict[str, Optional[str]] = {}
+    if args.schedule:
+        dates.update(schedule_games(args.schedule, start, end))
+    for game_id in args.games:
+        dates.setdefault(game_id, None)
+    if not dates:
+        parser.error("no games selected (use --games or --schedule)")
+
+    print(f"🏀 Building {len(dates)} games with {args.workers} workers")
+    if args.fetch:
+        fetch_play_by_play(list(dates), args.pbp_dir)
+
+    engine = engine_hash()
+    manifest = load_manifest(args.manifest)
+    pending, skipped, missing = [], 0, 0
+    for game_id, game_date in dates.items():
+        pbp_path = os.path.join(args.pbp_dir, f"{game_id}.json")
+        if not os.path.exists(pbp_path):
+            print(f"⚠️  No play-by-play for {game_id} ({pbp_path})")
+            missing += 1
+            continue
+        digest = input_hash(pbp_path, game_date, engine)
+        built = manifest.get(game_id)
+        output_path = os.path.join(args.output_dir, f"{game_id}.json")
+        if not args.force and built and built.get('input_hash') == digest and os.path.exists(output_path):
+            skipped += 1
+            continue
+        pending.append({'game_id': game_id, 'date': game_date, 'pbp_path': pbp_path, 'input_hash': digest})
+
+    print(f"📋 {len(pending)} to build, {skipped} unchanged, {missing} missing play-by-play")
+
+    started = time.perf_counter()
+    built_count, failed = 0, 0
+    artifacts = []
+    if pending:
+        with ProcessPoolExecutor(max_workers=max(args.workers, 1)) as executor:
+            futures = {executor.submit(build_chunk, chunk, args.output_dir): chunk for chunk in chunked(pending, GAMES_PER_TASK)}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    failed += len(chunk)
+                    print(f"❌ Failed {', '.join(task['game_id'] for task in chunk)}: {e}")
+                    continue
+                for result in results:
+                    if 'error' in result:
+                        failed += 1
+                        print(f"❌ Failed {result['game_id']}: {result['error']}")
+                        continue
+                    artifacts.append(result['sizes'])
+                    manifest[result['game_id']] = {'input_hash': result['input_hash'], 'built_at': time.time()}
+                    built_count += 1
+                # Saved per chunk so an interrupted run keeps its progress
+                save_manifest(args.manifest, manifest)
+                print(f"✅ Built {built_count}/{len(pending)} games")
+
+    elapsed = time.perf_counter() - started
+    report(artifacts, "Game files")
+    print(f"\n🎉 Done in {elapsed:.1f}s: {built_count} built, {skipped} unchanged, {failed} failed, {missing} missing")
+    if built_count:
+        print("💡 Run python3 supabase/json/build_game_index.py to refresh the feed index")
+
+if __name__ == "__main__":
+    main()
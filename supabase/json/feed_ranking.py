@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Feed Ranking Candidates
+Precomputes a feed score for every game and materializes top-K candidate
+lists, so a personalized feed is a merge of a few small lists instead of a
+sort over every game on the client.
+
+    score = 0.7 * fun_score / 100
+          + 0.3 * exp(-0.05 * days_ago)          (same decay as Home.tsx)
+          + 0.05 * min(lead_changes / 15, 1)     (back-and-forth games)
+          + 0.05 if there was a buzzer beater
+
+Each game also gets a team-affinity vector over all teams (winner 1.0, loser
+0.8, everyone else 0). The list for team T ranks the games with affinity > 0
+by score * affinity; the `all` list ranks every game by score. The client
+merges the lists of a user's favorite teams (they are already sorted) and
+falls back to the regular feed after them.
+
+build_game_index.py writes the lists to public/games/feed/rank/<name>.json:
+    {"team": "BOS", "as_of": "2025-04-25", "games": [compact entry + "score", ...]}
+
+Usage:
+    python3 supabase/json/feed_ranking.py [--as-of 2025-04-25] [--top 10]   # print the `all` list
+"""
+
+import argparse
+import os
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+FUN_WEIGHT = 0.7
+RECENCY_WEIGHT = 0.3
+DECAY_PER_DAY = 0.05
+LEAD_CHANGE_BOOST = 0.05
+LEAD_CHANGE_SATURATION = 15
+BUZZER_BEATER_BOOST = 0.05
+
+WINNER_AFFINITY = 1.0
+LOSER_AFFINITY = 0.8
+
+TOP_K = 60
+ALL_TEAMS = 'all'
+
+def game_dates(entries: List[Dict[str, Any]]) -> np.ndarray:
+    """Game dates as datetime64[D] (NaT when missing)"""
+    return np.array([str(entry.get('date') or '')[:10] or 'NaT' for entry in entries], dtype='datetime64[D]')
+
+def feed_scores(entries: List[Dict[str, Any]], as_of: date) -> np.ndarray:
+    """Score per index entry (see module docstring); undated games get no recency"""
+    fun = np.array([entry.get('fun_score') or 0 for entry in entries], dtype=np.float64)
+    lead_changes = np.array([(entry.get('lead_changes') or {}).get('total') or 0 for entry in entries], dtype=np.float64)
+    buzzer = np.array([(entry.get('lead_changes') or {}).get('buzzer_beater') or 0 for entry in entries]) > 0
+
+    dates = game_dates(entries)
+    # NaT casts to a huge negative number rather than NaN, so mask it before the cast
+    days_ago = (np.datetime64(as_of, 'D') - dates).astype(np.float64)
+    recency = np.where(np.isnat(dates), 0.0, np.exp(-DECAY_PER_DAY * np.clip(days_ago, 0, None)))
+
+    return (FUN_WEIGHT * fun / 100
+            + RECENCY_WEIGHT * recency
+            + LEAD_CHANGE_BOOST * np.minimum(lead_changes / LEAD_CHANGE_SATURATION, 1)
+            + BUZZER_BEATER_BOOST * buzzer)
+
+def team_affinity(entries: List[Dict[str, Any]]) -> Tuple[List[str], np.ndarray]:
+    """(team tricodes, (n_games, n_teams) affinity matrix)"""
+    sides = [((entry.get('story') or {}).get('teams') or {}) for entry in entries]
+    winners = [(teams.get('winner') or {}).get('tricode') or '' for teams in sides]
+    losers = [(teams.get('loser') or {}).get('tricode') or '' for teams in sides]
+    tricodes = sorted(set(winners + losers) - {''})
+    column = {tricode: i for i, tricode in enumerate(tricodes)}
+
+    affinity = np.zeros((len(entries), len(tricodes)))
+    rows = np.arange(len(entries))
+    for names, weight in ((losers, LOSER_AFFINITY), (winners, WINNER_AFFINITY)):
+        known = np.array([name in column for name in names], dtype=bool)
+        affinity[rows[known], [column[name] for name, ok in zip(names, known) if ok]] = weight
+    return tricodes, affinity
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k best scores, best first (ties keep index order)"""
+    candidates = np.flatnonzero(scores > 0)
+    if len(candidates) > k:
+        candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+def candidate_lists(entries: List[Dict[str, Any]], as_of: date, k: int = TOP_K) -> Dict[str, List[Tuple[int, float]]]:
+    """'all' and every team tricode -> [(entry index, score), ...] best first"""
+    scores = feed_scores(entries, as_of)
+    tricodes, affinity = team_affinity(entries)
+    lists = {ALL_TEAMS: [(int(i), float(scores[i])) for i in top_k(scores, k)]}
+    team_scores = scores[:, None] * affinity
+    for column, tricode in enumerate(tricodes):
+        lists[tricode] = [(int(i), float(team_scores[i, column])) for i in top_k(team_scores[:, column], k)]
+    return lists
+
+def parse_as_of(value: Optional[str]) -> date:
+    return datetime.strptime(value, '%Y-%m-%d').date() if value else date.today()
+
+def main():
+    """Main function"""
+    from build_game_index import INDEX_NAME, load_index
+    from build_games import DEFAULT_OUTPUT_DIR
+
+    parser = argparse.ArgumentParser(description="Show the precomputed feed ranking")
+    parser.add_argument('--games-dir', default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument('--as-of', help="Date the recency decay is measured from (default today)")
+    parser.add_argument('--team', default=ALL_TEAMS, help="Team tricode, or 'all'")
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    _, index = load_index(os.path.join(args.games_dir, INDEX_NAME))
+    entries = list(index.values())
+    lists = candidate_lists(entries, parse_as_of(args.as_of), args.top)
+    print(f"🏀 Top {args.top} for {args.team} ({len(entries)} games, {len(lists) - 1} teams)")
+    for rank, (i, score) in enumerate(lists.get(args.team, []), 1):
+        entry = entries[i]
+        print(f"   {rank}. {entry.get('date', '')[:10]} {entry['story']['matchup']} (fun {entry['fun_score']}) → {score:.3f}")
+
+if __name__ == "__main__":
+    main()
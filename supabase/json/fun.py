@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Game Fun Score
+Rates how entertaining a game was on a 50-100 scale from the per-game
+features score.py computes (all arrays, one entry per game):
+
+    margin              final margin of victory
+    lead_changes        all lead changes
+    late_lead_changes   lead changes in the last 5 minutes of the 4th/OT
+    last_minute_changes lead changes in the last minute of the 4th/OT
+    buzzer_beaters      made field goals in the last second of a period
+    overtimes           overtime periods played
+    dunks, deep_threes, four_pointers
+    milestones          40+ point games and triple doubles
+    total_points        combined final score
+
+Each feature becomes a 0-1 component with a saturating curve; the weighted sum
+is mapped onto 50-100, so a blowout with nothing going on still rates 50.
+
+Usage:
+    python3 supabase/json/fun.py playbyplay/ [--top 10]
+"""
+
+import argparse
+from typing import Dict
+
+import numpy as np
+
+WEIGHTS = {
+    'closeness': 0.25,
+    'lead_changes': 0.15,
+    'late_drama': 0.15,
+    'overtime': 0.10,
+    'buzzer_beater': 0.05,
+    'highlights': 0.12,
+    'milestones': 0.08,
+    'scoring': 0.10,
+}
+
+def saturate(values: np.ndarray, scale: float) -> np.ndarray:
+    """0 at 0, approaching 1 as values grow past `scale`"""
+    return 1.0 - np.exp(-np.asarray(values, dtype=np.float64) / scale)
+
+def fun_components(features: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Component name -> 0..1 array"""
+    late = features['late_lead_changes'] + 2 * features['last_minute_changes']
+    highlights = features['dunks'] / 10 + features['deep_threes'] / 4 + features['four_pointers']
+    return {
+        'closeness': np.exp(-np.asarray(features['margin'], dtype=np.float64) / 10),
+        'lead_changes': saturate(features['lead_changes'], 10),
+        'late_drama': saturate(late, 3),
+        'overtime': saturate(features['overtimes'], 1),
+        'buzzer_beater': np.minimum(features['buzzer_beaters'], 1).astype(np.float64),
+        'highlights': saturate(highlights, 3),
+        'milestones': saturate(features['milestones'], 1),
+        'scoring': np.clip((np.asarray(features['total_points'], dtype=np.float64) - 180) / 80, 0, 1),
+    }
+
+def fun_scores(features: Dict[str, np.ndarray]) -> np.ndarray:
+    """Fun score per game, 50-100 rounded to one decimal"""
+    components = fun_components(features)
+    total = sum(WEIGHTS[name] * values for name, values in components.items())
+    return np.round(50 + 50 * total, 1)
+
+def main():
+    """Main function"""
+    from pbp import expand_paths, load_play_by_play
+    from score import game_features
+
+    parser = argparse.ArgumentParser(description="Rank games by fun score")
+    parser.add_argument('paths', nargs='+', help="Play-by-play JSON files or directories")
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    pbp = load_play_by_play(expand_paths(args.paths))
+    scores = fun_scores(game_features(pbp))
+    print(f"🔥 Fun scores for {pbp.n_games} games (average {scores.mean():.1f})")
+    for rank, game in enumerate(np.argsort(-scores, kind='stable')[:args.top], 1):
+        print(f"   {rank}. {pbp.game_ids[game]} {pbp.away_team['tricode'][game]} @ {pbp.home_team['tricode'][game]}: {scores[game]}")
+
+if __name__ == "__main__":
+    main()
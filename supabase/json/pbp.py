@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Play-by-Play Arrays
+Loads NBA live play-by-play (cdn.nba.com liveData / nba_api.live PlayByPlay)
+for any number of games into flat NumPy column arrays, one entry per action,
+with a `game` index array. score.py, story.py and fun.py compute everything
+from masks and per-game reductions over these arrays instead of looping over
+events, so a full season (~1,300 games, ~650k actions) takes seconds.
+
+Accepted game inputs (dicts or paths to .json files):
+    {"meta": ..., "game": {"gameId": "...", "actions": [...]}}   (live endpoint)
+    {"gameId": "...", "actions": [...]}
+
+Requires numpy.
+"""
+
+import glob
+import json
+import os
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+# Action qualifiers kept as boolean columns
+QUALIFIERS = {
+    'fast_break': 'fastbreak',
+    'in_paint': 'pointsinthepaint',
+    'second_chance': '2ndchance',
+    'from_turnover': 'fromturnover',
+}
+
+# Regulation is four 12 minute periods, overtimes are 5 minutes
+REGULATION_PERIODS = 4
+PERIOD_SECONDS = 720.0
+OVERTIME_SECONDS = 300.0
+
+GameInput = Union[str, Dict[str, Any]]
+
+def parse_clock(clock: str) -> float:
+    """'PT05M12.30S' -> 312.3 seconds left in the period"""
+    if not clock:
+        return 0.0
+    minutes, _, seconds = clock[2:].partition('M')
+    return int(minutes) * 60 + float(seconds.rstrip('S') or 0)
+
+def read_game(game: GameInput) -> Dict[str, Any]:
+    """The game dict (gameId + actions) of a live play-by-play payload or file"""
+    if isinstance(game, str):
+        with open(game, 'r', encoding='utf-8') as f:
+            game = json.load(f)
+    return game.get('game', game)
+
+def expand_paths(paths: Iterable[str]) -> List[str]:
+    """Files as given, directories expanded to their *.json files"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(sorted(glob.glob(os.path.join(path, '*.json'))))
+        else:
+            files.append(path)
+    return files
+
+class PlayByPlay:
+    """Actions of many games as column arrays (see load_play_by_play)"""
+
+    def __init__(self, game_ids: List[str], actions: List[Dict[str, Any]], counts: List[int]):
+        n = len(actions)
+        self.game_ids = np.array(game_ids, dtype=object)
+        self.n_games = len(game_ids)
+        self.offsets = np.zeros(self.n_games + 1, dtype=np.int64)
+        np.cumsum(counts, out=self.offsets[1:])
+        self.game = np.repeat(np.arange(self.n_games, dtype=np.int32), counts)
+
+        def column(key: str, default: Any, dtype) -> np.ndarray:
+            return np.fromiter((a.get(key) or default for a in actions), dtype=dtype, count=n)
+
+        def text(key: str, lower: bool = False) -> np.ndarray:
+            if not n:
+                return np.zeros(0, dtype='<U1')
+            values = [a.get(key) or '' for a in actions]
+            return np.array([v.lower() for v in values] if lower else values, dtype=str)
+
+        self.period = column('period', 0, np.int16)
+        self.clock = np.fromiter((parse_clock(a.get('clock')) for a in actions), dtype=np.float32, count=n)
+        self.action_type = text('actionType')
+        # Feeds differ in case ('DUNK' / 'Dunk'), so these are lower-cased
+        self.sub_type = text('subType', lower=True)
+        self.descriptor = text('descriptor', lower=True)
+        self.team_id = column('teamId', 0, np.int64)
+        self.team_tricode = text('teamTricode')
+        self.person_id = column('personId', 0, np.int64)
+        self.player_name = text('playerNameI')
+        self.assist_person_id = column('assistPersonId', 0, np.int64)
+        location = text('location')
+        self.is_home = location == 'h'
+        self.has_side = (location == 'h') | (location == 'v')
+        self.made = text('shotResult') == 'Made'
+        self.is_field_goal = column('isFieldGoal', 0, np.int8).astype(bool)
+        self.shot_distance = np.fromiter(
+            (a['shotDistance'] if a.get('shotDistance') is not None else np.nan for a in actions),
+            dtype=np.float32, count=n
+        )
+        self.score_home = column('scoreHome', 0, np.int32)
+        self.score_away = column('scoreAway', 0, np.int32)
+        for name, qualifier in QUALIFIERS.items():
+            setattr(self, name, np.fromiter((qualifier in (a.get('qualifiers') or ()) for a in actions), dtype=bool, count=n))
+
+        # Seconds since tip-off (overtimes are 5 minutes)
+        regulation = np.minimum(self.period - 1, REGULATION_PERIODS) * PERIOD_SECONDS
+        overtime = np.maximum(self.period - 1 - REGULATION_PERIODS, 0) * OVERTIME_SECONDS
+        length = np.where(self.period > REGULATION_PERIODS, OVERTIME_SECONDS, PERIOD_SECONDS)
+        self.elapsed = (regulation + overtime + length - self.clock).astype(np.float32)
+
+        # Points scored on each action, from the running score (restarts every game)
+        total = self.score_home + self.score_away
+        previous = np.empty_like(total)
+        if n:
+            previous[1:] = total[:-1]
+            previous[self.offsets[:-1][np.asarray(counts) > 0]] = 0
+        self.points = total - previous
+
+        self.home_team, self.away_team = self._teams()
+
+    def _teams(self) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+        """Home/away team id and tricode per game, from the first action of each side"""
+        sides = []
+        for home in (True, False):
+            index = np.flatnonzero(self.has_side & (self.is_home == home) & (self.team_id != 0))
+            games, first = np.unique(self.game[index], return_index=True)
+            team_id = np.zeros(self.n_games, dtype=np.int64)
+            tricode = np.full(self.n_games, '', dtype=object)
+            team_id[games] = self.team_id[index[first]]
+            tricode[games] = self.team_tricode[index[first]]
+            sides.append({'team_id': team_id, 'tricode': tricode})
+        return sides[0], sides[1]
+
+    def __len__(self) -> int:
+        return len(self.game)
+
+    def per_game(self, mask: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+        """Count (or sum of `weights`) of the masked actions for every game"""
+        return np.bincount(self.game[mask], weights=None if weights is None else weights[mask], minlength=self.n_games)
+
+    def per_team(self, mask: np.ndarray, weights: np.ndarray = None) -> np.ndarray:
+        """Like per_game but split by side: shape (n_games, 2), column 0 home, 1 away"""
+        mask = mask & self.has_side
+        slot = self.game.astype(np.int64) * 2 + (~self.is_home)
+        totals = np.bincount(slot[mask], weights=None if weights is None else weights[mask], minlength=self.n_games * 2)
+        return totals.reshape(self.n_games, 2)
+
+    def last(self, values: np.ndarray) -> np.ndarray:
+        """Value of the last action of every game (e.g. the final score)"""
+        result = np.zeros(self.n_games, dtype=values.dtype)
+        has_actions = self.offsets[1:] > self.offsets[:-1]
+        result[has_actions] = values[self.offsets[1:][has_actions] - 1]
+        return result
+
+def load_play_by_play(games: Iterable[GameInput]) -> PlayByPlay:
+    """Column arrays for all games (dicts or .json paths), in input order"""
+    game_ids, actions, counts = [], [], []
+    for game in games:
+        data = read_game(game)
+        game_actions = data.get('actions') or []
+        game_ids.append(str(data.get('gameId', '')))
+        actions.extend(game_actions)
+        counts.append(len(game_actions))
+    return PlayByPlay(game_ids, actions, counts)
+
+def team_box(pbp: PlayByPlay) -> Dict[str, np.ndarray]:
+    """Team box score per game from the actions: stat -> (n_games, 2) array, home first"""
+    field_goal = pbp.is_field_goal
+    three = pbp.action_type == '3pt'
+    free_throw = pbp.action_type == 'freethrow'
+    rebound = pbp.action_type == 'rebound'
+    scoring = pbp.points > 0
+    points = pbp.points.astype(np.float64)
+
+    box = {
+        'pts': np.stack([pbp.last(pbp.score_home), pbp.last(pbp.score_away)], axis=1),
+        'fgm': pbp.per_team(field_goal & pbp.made),
+        'fga': pbp.per_team(field_goal),
+        'fg3m': pbp.per_team(three & pbp.made),
+        'fg3a': pbp.per_team(three),
+        'ftm': pbp.per_team(free_throw & pbp.made),
+        'fta': pbp.per_team(free_throw),
+        'oreb': pbp.per_team(rebound & (pbp.sub_type == 'offensive')),
+        'dreb': pbp.per_team(rebound & (pbp.sub_type == 'defensive')),
+        'ast': pbp.per_team(field_goal & pbp.made & (pbp.assist_person_id != 0)),
+        'tov': pbp.per_team(pbp.action_type == 'turnover'),
+        'stl': pbp.per_team(pbp.action_type == 'steal'),
+        'blk': pbp.per_team(pbp.action_type == 'block'),
+        'paint_pts': pbp.per_team(scoring & pbp.in_paint, points),
+        'fast_break_pts': pbp.per_team(scoring & pbp.fast_break, points),
+        'second_chance_pts': pbp.per_team(scoring & pbp.second_chance, points),
+        'pts_off_tov': pbp.per_team(scoring & pbp.from_turnover, points),
+    }
+    # Estimated possessions and minutes played (for pace)
+    box['poss'] = box['fga'] - box['oreb'] + box['tov'] + 0.44 * box['fta']
+    overtimes = np.maximum(pbp.last(pbp.period) - REGULATION_PERIODS, 0)
+    box['minutes'] = (48.0 + 5.0 * overtimes)[:, None].repeat(2, axis=1)
+    return box
+
+def ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """numerator / denominator, 0 where the denominator is 0"""
+    numerator = np.asarray(numerator, dtype=np.float64)
+    denominator = np.asarray(denominator, dtype=np.float64)
+    return np.divide(numerator, denominator, out=np.zeros(np.broadcast(numerator, denominator).shape), where=denominator != 0)
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Game Score Stats
+Per-game excitement stats for the game feed (see GAME_FEED_README.md):
+fun_score, lead_changes, dunk_stats, deep_shots, scoring_milestones and
+team_stats, computed with masks and per-game reductions over pbp.py arrays.
+
+    lead changes    sign flips of the home-away margin (ties don't count),
+                    late windows from clock masks in the 4th quarter and OT
+    buzzer beaters  made field goals with <= 1 second left in a period
+    dunks           made dunks, split by descriptor
+    deep threes     made threes from 30+ feet
+    four pointers   made three + and-one free throw by the same player
+    milestones      40/50/60/70 point games and triple doubles
+
+Output is keyed by gameId, which is how generate_game_index.js reads the
+`score` section of a game file.
+
+Usage:
+    python3 supabase/json/score.py playbyplay/ [--output scores.json]
+"""
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from fun import fun_scores
+from pbp import PlayByPlay, REGULATION_PERIODS, expand_paths, load_play_by_play, ratio, team_box
+
+LATE_SECONDS = 300.0
+LAST_MINUTE_SECONDS = 60.0
+BUZZER_SECONDS = 1.0
+DEEP_THREE_FEET = 30.0
+
+DUNK_DESCRIPTORS = {
+    'Alley Oop': 'alley-oop',
+    'Putback': 'putback',
+    'Running': 'running',
+    'Driving': 'driving',
+    'Tip': 'tip',
+    'Cutting': 'cutting',
+}
+
+# Highest first; a player lands in one bucket only
+POINT_MILESTONES = [('70 Ball', 70), ('60 Ball', 60), ('50 Ball', 50), ('40 Ball', 40)]
+PLAYER_STATS = ['pts', 'reb', 'ast', 'stl', 'blk']
+
+def lead_changes(pbp: PlayByPlay) -> Dict[str, np.ndarray]:
+    """Lead changes per game: total, last 5 minutes and last minute of the 4th/OT"""
+    sign = np.sign(pbp.score_home - pbp.score_away)
+    leading = np.flatnonzero(sign != 0)
+    # A lead change is a leading action whose leader differs from the previous
+    # leading action of the same game
+    flips = leading[1:][(sign[leading[1:]] != sign[leading[:-1]]) & (pbp.game[leading[1:]] == pbp.game[leading[:-1]])]
+    change = np.zeros(len(pbp), dtype=bool)
+    change[flips] = True
+
+    late_period = pbp.period >= REGULATION_PERIODS
+    return {
+        'total': pbp.per_game(change),
+        'last_5_minutes': pbp.per_game(change & late_period & (pbp.clock <= LATE_SECONDS)),
+        'last_minute': pbp.per_game(change & late_period & (pbp.clock <= LAST_MINUTE_SECONDS)),
+    }
+
+def buzzer_beaters(pbp: PlayByPlay) -> np.ndarray:
+    """Made field goals in the last second of any period"""
+    return pbp.per_game(pbp.is_field_goal & pbp.made & (pbp.clock <= BUZZER_SECONDS))
+
+def dunk_stats(pbp: PlayByPlay) -> Dict[str, np.ndarray]:
+    """'Total Dunks' and per-descriptor made dunk counts per game"""
+    dunk = pbp.is_field_goal & pbp.made & (pbp.sub_type == 'dunk')
+    stats = {'Total Dunks': pbp.per_game(dunk)}
+    for name, descriptor in DUNK_DESCRIPTORS.items():
+        stats[name] = pbp.per_game(dunk & (pbp.descriptor == descriptor))
+    return stats
+
+def shot_keys(pbp: PlayByPlay, index: np.ndarray) -> np.ndarray:
+    """int64 key of (game, period, clock, player) for matching and-ones to their shot"""
+    clock = np.round(pbp.clock[index] * 100).astype(np.int64)
+    moment = (pbp.game[index].astype(np.int64) * 16 + pbp.period[index]) * (1 << 17) + clock
+    return moment * (1 << 22) + pbp.person_id[index]
+
+def deep_shots(pbp: PlayByPlay) -> Dict[str, np.ndarray]:
+    """Made 30+ ft threes and four-point plays per game"""
+    made_three = (pbp.action_type == '3pt') & pbp.made
+    deep = made_three & (pbp.shot_distance >= DEEP_THREE_FEET)
+
+    and_one = np.flatnonzero((pbp.action_type == 'freethrow') & pbp.made & np.char.endswith(pbp.sub_type, '1 of 1'))
+    threes = np.flatnonzero(made_three)
+    four_point = np.zeros(len(pbp), dtype=bool)
+    four_point[and_one[np.isin(shot_keys(pbp, and_one), shot_keys(pbp, threes))]] = True
+
+    return {'deep_threes': pbp.per_game(deep), 'four_pointers': pbp.per_game(four_point)}
+
+def player_lines(pbp: PlayByPlay) -> Dict[str, np.ndarray]:
+    """pts/reb/ast/stl/blk per (game, player), plus game, person_id and name arrays"""
+    has_player = pbp.person_id != 0
+    events = {
+        'pts': (np.flatnonzero(has_player & (pbp.points > 0)), pbp.person_id, pbp.points),
+        'reb': (np.flatnonzero(has_player & (pbp.action_type == 'rebound')), pbp.person_id, None),
+        'ast': (np.flatnonzero(pbp.is_field_goal & pbp.made & (pbp.assist_person_id != 0)), pbp.assist_person_id, None),
+        'stl': (np.flatnonzero(has_player & (pbp.action_type == 'steal')), pbp.person_id, None),
+        'blk': (np.flatnonzero(has_player & (pbp.action_type == 'block')), pbp.person_id, None),
+    }
+
+    def keys(index: np.ndarray, person: np.ndarray) -> np.ndarray:
+        return (pbp.game[index].astype(np.int64) << 32) | person[index]
+
+    named = np.flatnonzero(has_player)
+    all_keys = np.concatenate([keys(named, pbp.person_id)] + [keys(index, person) for index, person, _ in events.values()])
+    unique, first = np.unique(all_keys, return_index=True)
+
+    lines = {'game': (unique >> 32).astype(np.int32), 'person_id': unique & 0xFFFFFFFF}
+    # Names come from the player's own actions (an assist-only player has none)
+    names = np.full(len(unique), '', dtype=object)
+    own = first < len(named)
+    names[own] = pbp.player_name[named[first[own]]]
+    lines['name'] = names
+
+    for stat, (index, person, weights) in events.items():
+        slot = np.searchsorted(unique, keys(index, person))
+        lines[stat] = np.bincount(slot, weights=None if weights is None else weights[index], minlength=len(unique)).astype(np.int64)
+    return lines
+
+def triple_doubles(lines: Dict[str, np.ndarray]) -> np.ndarray:
+    """Mask of player lines with 10+ in at least three stats"""
+    return sum((lines[stat] >= 10).astype(np.int64) for stat in PLAYER_STATS) >= 3
+
+def scoring_milestones(pbp: PlayByPlay, lines: Optional[Dict[str, np.ndarray]] = None) -> List[Dict[str, List]]:
+    """Per game: {'70 Ball': [[name, pts]], ..., 'Triple Double': [[name, 'PTS: .., REB: ..']]}"""
+    lines = player_lines(pbp) if lines is None else lines
+    milestones = [dict({name: [] for name, _ in POINT_MILESTONES}, **{'Triple Double': []}) for _ in range(pbp.n_games)]
+
+    ceiling = np.inf
+    for name, floor in POINT_MILESTONES:
+        for i in np.flatnonzero((lines['pts'] >= floor) & (lines['pts'] < ceiling)):
+            milestones[lines['game'][i]][name].append([lines['name'][i], int(lines['pts'][i])])
+        ceiling = floor
+    for i in np.flatnonzero(triple_doubles(lines)):
+        line = ', '.join(f"{stat.upper()}: {lines[stat][i]}" for stat in ['pts', 'reb', 'ast', 'blk', 'stl'])
+        milestones[lines['game'][i]]['Triple Double'].append([lines['name'][i], line])
+
+    for game in milestones:
+        for name, _ in POINT_MILESTONES:
+            game[name].sort(key=lambda entry: -entry[1])
+    return milestones
+
+def milestone_counts(pbp: PlayByPlay, lines: Dict[str, np.ndarray]) -> np.ndarray:
+    """40+ point games plus triple doubles per game"""
+    notable = (lines['pts'] >= POINT_MILESTONES[-1][1]) | triple_doubles(lines)
+    return np.bincount(lines['game'][notable], minlength=pbp.n_games)
+
+def game_features(pbp: PlayByPlay, box: Optional[Dict[str, np.ndarray]] = None,
+                  lines: Optional[Dict[str, np.ndarray]] = None, changes: Optional[Dict[str, np.ndarray]] = None,
+                  dunks: Optional[Dict[str, np.ndarray]] = None, deep: Optional[Dict[str, np.ndarray]] = None) -> Dict[str, np.ndarray]:
+    """Per-game arrays fun.fun_scores() rates (pass already computed sections to reuse them)"""
+    box = team_box(pbp) if box is None else box
+    lines = player_lines(pbp) if lines is None else lines
+    changes = lead_changes(pbp) if changes is None else changes
+    dunks = dunk_stats(pbp) if dunks is None else dunks
+    deep = deep_shots(pbp) if deep is None else deep
+    return {
+        'margin': np.abs(box['pts'][:, 0] - box['pts'][:, 1]),
+        'lead_changes': changes['total'],
+        'late_lead_changes': changes['last_5_minutes'],
+        'last_minute_changes': changes['last_minute'],
+        'buzzer_beaters': buzzer_beaters(pbp),
+        'overtimes': np.maximum(pbp.last(pbp.period) - REGULATION_PERIODS, 0),
+        'dunks': dunks['Total Dunks'],
+        'deep_threes': deep['deep_threes'],
+        'four_pointers': deep['four_pointers'],
+        'milestones': milestone_counts(pbp, lines),
+        'total_points': box['pts'].sum(axis=1),
+    }
+
+def team_stats(pbp: PlayByPlay, box: Optional[Dict[str, np.ndarray]] = None) -> List[Dict[str, Any]]:
+    """Per game team_stats section (contested shots aren't in play-by-play and are left out)"""
+    box = team_box(pbp) if box is None else box
+    three_pct = np.round(ratio(box['fg3m'], box['fg3a']) * 100, 1)
+    combined_three_pct = np.round(ratio(box['fg3m'].sum(axis=1), box['fg3a'].sum(axis=1)) * 100, 1)
+    pace = np.round(ratio(48 * box['poss'], box['minutes']), 1)
+    margin = np.abs(box['pts'][:, 0] - box['pts'][:, 1])
+
+    stats = []
+    for game in range(pbp.n_games):
+        tricodes = (pbp.home_team['tricode'][game], pbp.away_team['tricode'][game])
+
+        def per_team(values: np.ndarray) -> Dict[str, Any]:
+            return {tricode: values[game, side].item() for side, tricode in enumerate(tricodes)}
+
+        stats.append({
+            'Margin of Victory': int(margin[game]),
+            'Combined Threes': int(box['fg3m'][game].sum()),
+            'Team Threes': per_team(box['fg3m']),
+            'Combined Three %': float(combined_three_pct[game]),
+            'Team Three %': per_team(three_pct),
+            'Pace': float(np.round(pace[game].mean(), 1)),
+            'Team Pace': per_team(pace),
+            'Combined Fast Break Points': int(box['fast_break_pts'][game].sum()),
+            'Team Fast Break Points': per_team(box['fast_break_pts'].astype(np.int64)),
+        })
+    return stats
+
+def compute_scores(pbp: PlayByPlay) -> Dict[str, Dict[str, Any]]:
+    """gameId -> fun_score, lead_changes, dunk_stats, deep_shots, scoring_milestones, team_stats"""
+    box = team_box(pbp)
+    lines = player_lines(pbp)
+    changes = lead_changes(pbp)
+    dunks = dunk_stats(pbp)
+    deep = deep_shots(pbp)
+    features = game_features(pbp, box, lines, changes, dunks, deep)
+    fun = fun_scores(features)
+    milestones = scoring_milestones(pbp, lines)
+    teams = team_stats(pbp, box)
+
+    scores = {}
+    for game, game_id in enumerate(pbp.game_ids):
+        scores[game_id] = {
+            'fun_score': float(fun[game]),
+            'lead_changes': {
+                'total': int(changes['total'][game]),
+                'last_5_minutes': int(changes['last_5_minutes'][game]),
+                'last_minute': int(changes['last_minute'][game]),
+                'buzzer_beater': int(features['buzzer_beaters'][game]),
+            },
+            'dunk_stats': {name: int(counts[game]) for name, counts in dunks.items()},
+            'deep_shots': {name: int(counts[game]) for name, counts in deep.items()},
+            'scoring_milestones': milestones[game],
+            'team_stats': teams[game],
+        }
+    return scores
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Score stats for play-by-play files")
+    parser.add_argument('paths', nargs='+', help="Play-by-play JSON files or directories")
+    parser.add_argument('--output', help="Write the scores JSON here (default: stdout)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    pbp = load_play_by_play(expand_paths(args.paths))
+    loaded = time.perf_counter()
+    scores = compute_scores(pbp)
+    done = time.perf_counter()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(scores, f, indent=2)
+        print(f"✅ Scored {pbp.n_games} games ({len(pbp):,} actions): "
+              f"load {loaded - start:.2f}s, compute {done - loaded:.2f}s → {args.output}")
+    else:
+        print(json.dumps(scores, indent=2))
+
+if __name__ == "__main__":
+    main()
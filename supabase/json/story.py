@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Game Story
+"How [Team] Won" for the game feed (see GAME_FEED_README.md): matchup, final
+score, winner/loser and the statistical advantages the winner had, from the
+team box scores pbp.team_box() builds out of the play-by-play.
+
+Every advantage stat is computed for all games at once as (n_games, 2)
+arrays; a game's advantages are the stats where the winner was better, ranked
+by the relative size of the gap, top 5.
+
+Usage:
+    python3 supabase/json/story.py playbyplay/ [--output stories.json]
+"""
+
+import argparse
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from pbp import PlayByPlay, expand_paths, load_play_by_play, ratio, team_box
+
+TOP_ADVANTAGES = 5
+
+TEAMS = {
+    'ATL': ('Atlanta', 'Hawks'),
+    'BOS': ('Boston', 'Celtics'),
+    'BKN': ('Brooklyn', 'Nets'),
+    'CHA': ('Charlotte', 'Hornets'),
+    'CHI': ('Chicago', 'Bulls'),
+    'CLE': ('Cleveland', 'Cavaliers'),
+    'DAL': ('Dallas', 'Mavericks'),
+    'DEN': ('Denver', 'Nuggets'),
+    'DET': ('Detroit', 'Pistons'),
+    'GSW': ('Golden State', 'Warriors'),
+    'HOU': ('Houston', 'Rockets'),
+    'IND': ('Indiana', 'Pacers'),
+    'LAC': ('LA', 'Clippers'),
+    'LAL': ('Los Angeles', 'Lakers'),
+    'MEM': ('Memphis', 'Grizzlies'),
+    'MIA': ('Miami', 'Heat'),
+    'MIL': ('Milwaukee', 'Bucks'),
+    'MIN': ('Minnesota', 'Timberwolves'),
+    'NOP': ('New Orleans', 'Pelicans'),
+    'NYK': ('New York', 'Knicks'),
+    'OKC': ('Oklahoma City', 'Thunder'),
+    'ORL': ('Orlando', 'Magic'),
+    'PHI': ('Philadelphia', '76ers'),
+    'PHX': ('Phoenix', 'Suns'),
+    'POR': ('Portland', 'Trail Blazers'),
+    'SAC': ('Sacramento', 'Kings'),
+    'SAS': ('San Antonio', 'Spurs'),
+    'TOR': ('Toronto', 'Raptors'),
+    'UTA': ('Utah', 'Jazz'),
+    'WAS': ('Washington', 'Wizards'),
+}
+
+Box = Dict[str, np.ndarray]
+
+def opponent(values: np.ndarray) -> np.ndarray:
+    """The other team's column for every team"""
+    return values[:, ::-1]
+
+# stat_name -> (values from the box score, higher is better, decimals)
+ADVANTAGE_STATS: Dict[str, Tuple[Callable[[Box], np.ndarray], bool, int]] = {
+    'Points in Paint': (lambda box: box['paint_pts'], True, 0),
+    'Fast Break Points': (lambda box: box['fast_break_pts'], True, 0),
+    'Second Chance Points': (lambda box: box['second_chance_pts'], True, 0),
+    'Points Off Turnovers': (lambda box: box['pts_off_tov'], True, 0),
+    'Assists': (lambda box: box['ast'], True, 0),
+    'Assist-to-Turnover': (lambda box: ratio(box['ast'], box['tov']), True, 2),
+    'Turnovers': (lambda box: box['tov'], False, 0),
+    'Steals': (lambda box: box['stl'], True, 0),
+    'Blocks': (lambda box: box['blk'], True, 0),
+    'Three Pointers Made': (lambda box: box['fg3m'], True, 0),
+    'Field Goal %': (lambda box: ratio(box['fgm'], box['fga']) * 100, True, 1),
+    'Three Point %': (lambda box: ratio(box['fg3m'], box['fg3a']) * 100, True, 1),
+    'True Shooting %': (lambda box: ratio(box['pts'], 2 * (box['fga'] + 0.44 * box['fta'])) * 100, True, 1),
+    'Free Throw Rate': (lambda box: ratio(box['fta'], box['fga']), True, 3),
+    'Offensive Rebound %': (lambda box: ratio(box['oreb'], box['oreb'] + opponent(box['dreb'])) * 100, True, 1),
+    'Defensive Rebound %': (lambda box: ratio(box['dreb'], box['dreb'] + opponent(box['oreb'])) * 100, True, 1),
+}
+
+def team_info(tricode: str) -> Tuple[str, str]:
+    """(city, name) for a tricode, the tricode itself when unknown"""
+    return TEAMS.get(tricode, (tricode, tricode))
+
+def winner_side(box: Box) -> np.ndarray:
+    """Column of the winning team per game (0 home, 1 away; home on a tie)"""
+    return (box['pts'][:, 1] > box['pts'][:, 0]).astype(np.int64)
+
+def advantages(pbp: PlayByPlay, box: Optional[Box] = None) -> List[List[Dict[str, Any]]]:
+    """Per game: the winner's top advantages, biggest relative gap first"""
+    box = team_box(pbp) if box is None else box
+    games = np.arange(pbp.n_games)
+    winner = winner_side(box)
+
+    names = list(ADVANTAGE_STATS)
+    winner_values = np.empty((len(names), pbp.n_games))
+    loser_values = np.empty((len(names), pbp.n_games))
+    diffs = np.empty((len(names), pbp.n_games))
+    for row, name in enumerate(names):
+        compute, higher_is_better, decimals = ADVANTAGE_STATS[name]
+        values = np.round(np.asarray(compute(box), dtype=np.float64), decimals)
+        winner_values[row] = values[games, winner]
+        loser_values[row] = values[games, 1 - winner]
+        diffs[row] = winner_values[row] - loser_values[row] if higher_is_better else loser_values[row] - winner_values[row]
+
+    # Relative gap, so 0.3 in assist-to-turnover can outrank 4 paint points
+    scale = np.maximum((np.abs(winner_values) + np.abs(loser_values)) / 2, 1e-9)
+    strength = np.where(diffs > 0, diffs / scale, -np.inf)
+    order = np.argsort(-strength, axis=0, kind='stable')[:TOP_ADVANTAGES]
+
+    winner_tricodes = np.where(winner == 0, pbp.home_team['tricode'], pbp.away_team['tricode'])
+    winner_ids = np.where(winner == 0, pbp.home_team['team_id'], pbp.away_team['team_id'])
+    stories = []
+    for game in range(pbp.n_games):
+        tricode = winner_tricodes[game]
+        entries = []
+        for row in order[:, game]:
+            if strength[row, game] == -np.inf:
+                break
+            decimals = ADVANTAGE_STATS[names[row]][2]
+            cast = int if decimals == 0 else float
+            entries.append({
+                'stat_name': names[row],
+                'team': team_info(tricode)[0],
+                'teamId': int(winner_ids[game]),
+                'teamTricode': tricode,
+                'value1': cast(winner_values[row, game]),
+                'value2': cast(loser_values[row, game]),
+                'diff': cast(round(diffs[row, game], decimals)),
+            })
+        stories.append(entries)
+    return stories
+
+def compute_stories(pbp: PlayByPlay, box: Optional[Box] = None) -> Dict[str, Dict[str, Any]]:
+    """gameId -> story section (matchup, final_score, teams, advantages)"""
+    box = team_box(pbp) if box is None else box
+    winner = winner_side(box)
+    game_advantages = advantages(pbp, box)
+
+    stories = {}
+    for game, game_id in enumerate(pbp.game_ids):
+        teams = {}
+        for role, side in (('winner', winner[game]), ('loser', 1 - winner[game])):
+            team = pbp.home_team if side == 0 else pbp.away_team
+            tricode = team['tricode'][game]
+            city, name = team_info(tricode)
+            teams[role] = {
+                'name': name,
+                'city': city,
+                'tricode': tricode,
+                'teamId': int(team['team_id'][game]),
+                'points': int(box['pts'][game, side]),
+            }
+        winner_team, loser_team = teams['winner'], teams['loser']
+        stories[game_id] = {
+            'matchup': f"{winner_team['city']} {winner_team['name']} vs {loser_team['city']} {loser_team['name']}",
+            'final_score': f"{winner_team['name']} {winner_team['points']} - {loser_team['name']} {loser_team['points']}",
+            'teams': teams,
+            'advantages': game_advantages[game],
+        }
+    return stories
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Game stories for play-by-play files")
+    parser.add_argument('paths', nargs='+', help="Play-by-play JSON files or directories")
+    parser.add_argument('--output', help="Write the stories JSON here (default: stdout)")
+    args = parser.parse_args()
+
+    pbp = load_play_by_play(expand_paths(args.paths))
+    stories = compute_stories(pbp)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(stories, f, indent=2)
+        print(f"✅ Wrote stories for {pbp.n_games} games → {args.output}")
+    else:
+        print(json.dumps(stories, indent=2))
+
+if __name__ == "__main__":
+    main()
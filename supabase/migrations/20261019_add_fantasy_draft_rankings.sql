@@ -0,0 +1,282 @@
+-- =====================================================
+-- DRAFT RANKINGS INDEX
+-- =====================================================
+-- get_best_available_player used to re-score the whole player
+-- pool from nba_espn_projections on every auto-pick.
+--
+-- scripts/setup/draft_rankings.py now precomputes, per league,
+-- each player's projected points under the league's scoring,
+-- value over replacement (vorp) and vorp per $1M of salary.
+-- A trigger on fantasy_draft_picks records who drafted each
+-- player, so the rankings stay current pick by pick. The team's
+-- salary is still summed over all of its picks (indexed by
+-- league and team), since not every pick is in the ranked pool.
+--
+-- Leagues without rankings keep the previous behaviour through
+-- get_best_available_player_unranked.
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS fantasy_draft_rankings (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    league_id UUID NOT NULL REFERENCES fantasy_leagues(id) ON DELETE CASCADE,
+    player_id UUID NOT NULL REFERENCES nba_players(id) ON DELETE CASCADE,
+    positions TEXT[] DEFAULT '{}', -- Eligible G/F/C slots (empty = UTIL only)
+    salary BIGINT NOT NULL, -- nba_hoopshype_salaries.salary_2025_26
+
+    -- Projection (league scoring)
+    projected_games INTEGER DEFAULT 0,
+    projected_total NUMERIC(9,2) DEFAULT 0,
+
+    -- Value
+    vorp NUMERIC(9,2) DEFAULT 0, -- Points over the replacement player at the best slot
+    value_per_dollar NUMERIC(10,4) DEFAULT 0, -- vorp per $1M of salary
+    vorp_score NUMERIC(6,4) DEFAULT 0, -- vorp / league's best vorp (0-1)
+    value_score NUMERIC(6,4) DEFAULT 0, -- value_per_dollar / league's best (0-1)
+    vorp_rank INTEGER,
+    value_rank INTEGER,
+
+    -- Draft state (kept current by the fantasy_draft_picks trigger)
+    drafted_by_team_id UUID REFERENCES fantasy_teams(id) ON DELETE SET NULL,
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (league_id, player_id)
+);
+
+-- =====================================================
+-- INDEXES FOR PERFORMANCE
+-- =====================================================
+
+-- Best available: undrafted players of a league in rank order
+CREATE INDEX IF NOT EXISTS idx_fantasy_draft_rankings_available
+    ON fantasy_draft_rankings(league_id, vorp_rank)
+    WHERE drafted_by_team_id IS NULL;
+
+-- Team salary: every pick a team has made, ranked or not
+CREATE INDEX IF NOT EXISTS idx_fantasy_draft_picks_league_team
+    ON fantasy_draft_picks(league_id, fantasy_team_id);
+
+-- =====================================================
+-- DRAFT PICK TRIGGER
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION sync_fantasy_draft_rankings()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE fantasy_draft_rankings
+        SET drafted_by_team_id = NULL
+        WHERE league_id = OLD.league_id
+        AND player_id = OLD.player_id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE fantasy_draft_rankings
+        SET drafted_by_team_id = NEW.fantasy_team_id
+        WHERE league_id = NEW.league_id
+        AND player_id = NEW.player_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS sync_fantasy_draft_rankings_on_pick ON fantasy_draft_picks;
+CREATE TRIGGER sync_fantasy_draft_rankings_on_pick
+    AFTER INSERT OR UPDATE OF player_id, fantasy_team_id OR DELETE ON fantasy_draft_picks
+    FOR EACH ROW
+    EXECUTE FUNCTION sync_fantasy_draft_rankings();
+
+-- =====================================================
+-- BEST AVAILABLE PLAYER
+-- =====================================================
+
+-- Keep the pool-scoring version for leagues that have no rankings yet
+DO $$
+BEGIN
+    IF to_regprocedure('get_best_available_player_unranked(UUID, UUID, INTEGER, INTEGER, INTEGER)') IS NULL
+       AND to_regprocedure('get_best_available_player(UUID, UUID, INTEGER, INTEGER, INTEGER)') IS NOT NULL THEN
+        ALTER FUNCTION get_best_available_player(UUID, UUID, INTEGER, INTEGER, INTEGER)
+            RENAME TO get_best_available_player_unranked;
+    END IF;
+END $$;
+
+DROP FUNCTION IF EXISTS get_best_available_player(UUID, UUID, INTEGER, INTEGER, INTEGER);
+DROP FUNCTION IF EXISTS get_best_available_player(UUID, UUID, INTEGER, INTEGER, INTEGER, TEXT);
+
+CREATE OR REPLACE FUNCTION get_best_available_player(
+  league_id_param UUID,
+  team_id_param UUID,
+  current_round_param INTEGER DEFAULT 1,
+  picks_remaining_param INTEGER DEFAULT 15,
+  total_picks_param INTEGER DEFAULT 15,
+  position_param TEXT DEFAULT NULL -- 'G', 'F', 'C' or NULL/'UTIL' for any
+)
+RETURNS TABLE(
+  id UUID,
+  name TEXT,
+  "position" TEXT,
+  team_name TEXT,
+  team_abbreviation TEXT,
+  salary_2025_26 BIGINT,
+  projected_fantasy_points NUMERIC,
+  value_per_dollar NUMERIC,
+  remaining_cap_after BIGINT,
+  average_budget_per_pick BIGINT,
+  is_over_budget BOOLEAN
+) AS $$
+DECLARE
+  current_salary BIGINT;
+  salary_cap BIGINT;
+  remaining_cap BIGINT;
+  average_budget BIGINT;
+  max_salary_allowed BIGINT;
+  min_fantasy_points NUMERIC;
+  min_games_played NUMERIC;
+  fantasy_weight NUMERIC;
+  value_weight NUMERIC;
+BEGIN
+  IF NOT EXISTS (SELECT 1 FROM fantasy_draft_rankings r WHERE r.league_id = league_id_param) THEN
+    RETURN QUERY
+    SELECT * FROM get_best_available_player_unranked(
+      league_id_param, team_id_param, current_round_param, picks_remaining_param, total_picks_param
+    );
+    RETURN;
+  END IF;
+
+  -- Team's salary usage from all of its picks: players outside the ranked
+  -- pool (no projection, inactive, manual picks) still count against the cap
+  SELECT COALESCE(SUM(nhs.salary_2025_26), 0)
+  INTO current_salary
+  FROM fantasy_draft_picks fdp
+  INNER JOIN nba_hoopshype_salaries nhs ON nhs.player_id = fdp.player_id
+  WHERE fdp.league_id = league_id_param
+  AND fdp.fantasy_team_id = team_id_param;
+
+  -- Get league's salary cap (default to $200M if not set)
+  SELECT COALESCE(fls.salary_cap_amount, 200000000)
+  INTO salary_cap
+  FROM fantasy_league_seasons fls
+  WHERE fls.league_id = league_id_param
+  AND fls.is_active = true;
+
+  remaining_cap := COALESCE(salary_cap, 200000000) - current_salary;
+
+  IF picks_remaining_param > 0 THEN
+    average_budget := remaining_cap / picks_remaining_param;
+  ELSE
+    average_budget := remaining_cap;
+  END IF;
+
+  -- ===== SALARY CAP DISCIPLINE (same schedule as before) =====
+  IF current_round_param <= 3 THEN
+    max_salary_allowed := LEAST(average_budget * 2.5, remaining_cap);
+    fantasy_weight := 0.90;
+    value_weight := 0.10;
+    min_fantasy_points := 1800;
+    min_games_played := 55;
+  ELSIF current_round_param <= 6 THEN
+    max_salary_allowed := LEAST(average_budget * 2.0, remaining_cap);
+    fantasy_weight := 0.70;
+    value_weight := 0.30;
+    min_fantasy_points := 1500;
+    min_games_played := 50;
+  ELSIF current_round_param <= 9 THEN
+    max_salary_allowed := LEAST(average_budget * 1.5, remaining_cap);
+    fantasy_weight := 0.50;
+    value_weight := 0.50;
+    min_fantasy_points := 1200;
+    min_games_played := 45;
+  ELSIF current_round_param <= 12 THEN
+    max_salary_allowed := LEAST(average_budget, remaining_cap);
+    fantasy_weight := 0.30;
+    value_weight := 0.70;
+    min_fantasy_points := 900;
+    min_games_played := 40;
+  ELSE
+    max_salary_allowed := LEAST(average_budget * 0.8, remaining_cap);
+    fantasy_weight := 0.10;
+    value_weight := 0.90;
+    min_fantasy_points := 600;
+    min_games_played := 30;
+  END IF;
+
+  -- Safety check: If already over cap, only allow minimum salary players
+  IF remaining_cap < 0 THEN
+    max_salary_allowed := 1000000; -- $1M minimum
+  END IF;
+
+  -- Blend of the precomputed vorp and value scores, undrafted rows only
+  RETURN QUERY
+  SELECT
+    np.id,
+    np.name,
+    np.position,
+    np.team_abbreviation as team_name,
+    np.team_abbreviation,
+    r.salary,
+    r.projected_total::NUMERIC,
+    r.value_per_dollar::NUMERIC,
+    (remaining_cap - r.salary) as remaining_cap_after,
+    average_budget as average_budget_per_pick,
+    (r.salary > average_budget) as is_over_budget
+  FROM fantasy_draft_rankings r
+  INNER JOIN nba_players np ON np.id = r.player_id
+  WHERE r.league_id = league_id_param
+    AND r.drafted_by_team_id IS NULL
+    AND np.is_active = true
+    AND r.salary <= max_salary_allowed
+    AND r.salary > 0
+    AND r.projected_total >= min_fantasy_points
+    AND r.projected_games >= min_games_played
+    AND (position_param IS NULL OR position_param = 'UTIL' OR position_param = ANY(r.positions))
+  ORDER BY
+    (r.vorp_score * fantasy_weight + r.value_score * value_weight) DESC,
+    r.vorp_rank
+  LIMIT 1;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+GRANT EXECUTE ON FUNCTION get_best_available_player(UUID, UUID, INTEGER, INTEGER, INTEGER, TEXT) TO authenticated;
+GRANT EXECUTE ON FUNCTION get_best_available_player(UUID, UUID, INTEGER, INTEGER, INTEGER, TEXT) TO service_role;
+
+COMMENT ON FUNCTION get_best_available_player(UUID, UUID, INTEGER, INTEGER, INTEGER, TEXT) IS 'CAP-AWARE DRAFTING from fantasy_draft_rankings: same per-round salary discipline, ranked by precomputed value over replacement and value per dollar. Falls back to get_best_available_player_unranked for leagues without rankings.';
+
+-- =====================================================
+-- ROW LEVEL SECURITY (RLS) POLICIES
+-- =====================================================
+
+ALTER TABLE fantasy_draft_rankings ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow authenticated users to read fantasy_draft_rankings" ON fantasy_draft_rankings;
+CREATE POLICY "Allow authenticated users to read fantasy_draft_rankings" ON fantasy_draft_rankings
+    FOR SELECT TO authenticated
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow service role to manage fantasy_draft_rankings" ON fantasy_draft_rankings;
+CREATE POLICY "Allow service role to manage fantasy_draft_rankings" ON fantasy_draft_rankings
+    FOR ALL TO service_role
+    USING (true);
+
+-- =====================================================
+-- TRIGGERS FOR UPDATED_AT
+-- =====================================================
+
+DROP TRIGGER IF EXISTS update_fantasy_draft_rankings_updated_at ON fantasy_draft_rankings;
+CREATE TRIGGER update_fantasy_draft_rankings_updated_at
+    BEFORE UPDATE ON fantasy_draft_rankings
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ Table: fantasy_draft_rankings (kept current by sync_fantasy_draft_rankings_on_pick)';
+    RAISE NOTICE '✅ Function: get_best_available_player reads the rankings (get_best_available_player_unranked for leagues without)';
+    RAISE NOTICE '🎯 Run scripts/setup/draft_rankings.py before drafts start';
+END $$;
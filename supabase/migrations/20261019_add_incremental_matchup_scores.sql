@@ -0,0 +1,293 @@
+-- =====================================================
+-- INCREMENTAL MATCHUP SCORES
+-- =====================================================
+-- Weekly team scores used to be rebuilt on every read from
+-- lineups and game logs. scripts/setup/matchup_scoring.py now
+-- applies only newly ingested game logs:
+--
+--   fantasy_scoring_cursors     newest game log updated_at applied, per source
+--                               and season (each run reads one season)
+--   fantasy_scored_game_logs    stats already applied per game log (the ledger),
+--                               so a corrected box score only applies its difference
+--   fantasy_team_week_scores    running score per team and matchup
+--
+-- apply_fantasy_score_deltas adds a batch of deltas, refreshes
+-- the affected fantasy_matchups scores and records the ledger in
+-- one transaction. Scoreboard reads become single-row lookups.
+-- reset_fantasy_week_scores zeroes a week ahead of a rebuild
+-- (lineups edited after their games, scoring changes).
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS fantasy_scoring_cursors (
+    source TEXT NOT NULL, -- 'player_game_logs' or 'nba_boxscores'
+    season_year INTEGER NOT NULL, -- Fantasy season year (2026 for 2025-26)
+    last_updated_at TIMESTAMP WITH TIME ZONE,
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    PRIMARY KEY (source, season_year)
+);
+
+CREATE TABLE IF NOT EXISTS fantasy_scored_game_logs (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    source TEXT NOT NULL,
+    nba_player_id INTEGER NOT NULL,
+    game_id VARCHAR(50) NOT NULL,
+    game_date DATE,
+    stats JSONB NOT NULL, -- {"pts": 31, "reb": 9, ...} as last applied
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (source, nba_player_id, game_id)
+);
+
+CREATE TABLE IF NOT EXISTS fantasy_team_week_scores (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    league_id UUID NOT NULL REFERENCES fantasy_leagues(id) ON DELETE CASCADE,
+    fantasy_team_id UUID NOT NULL REFERENCES fantasy_teams(id) ON DELETE CASCADE,
+    matchup_id UUID NOT NULL REFERENCES fantasy_matchups(id) ON DELETE CASCADE,
+    season_year INTEGER NOT NULL,
+    week_number INTEGER NOT NULL,
+
+    -- Scores (tier points already scaled by the season's lineup multipliers)
+    starters_score DECIMAL(10,2) DEFAULT 0.0,
+    rotation_score DECIMAL(10,2) DEFAULT 0.0,
+    bench_score DECIMAL(10,2) DEFAULT 0.0,
+    total_score DECIMAL(10,2) DEFAULT 0.0,
+    games_played INTEGER DEFAULT 0, -- Lineup player games counted so far
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (fantasy_team_id, matchup_id)
+);
+
+-- =====================================================
+-- INDEXES FOR PERFORMANCE
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_fantasy_scored_game_logs_game_id ON fantasy_scored_game_logs(source, game_id);
+CREATE INDEX IF NOT EXISTS idx_fantasy_team_week_scores_team_week ON fantasy_team_week_scores(league_id, fantasy_team_id, week_number);
+CREATE INDEX IF NOT EXISTS idx_fantasy_team_week_scores_matchup_id ON fantasy_team_week_scores(matchup_id);
+
+-- Delta lookups: changed logs by updated_at, lineup slots by player and week
+CREATE INDEX IF NOT EXISTS idx_nba_boxscores_updated_at ON nba_boxscores(updated_at);
+CREATE INDEX IF NOT EXISTS idx_fantasy_lineups_player_week ON fantasy_lineups(player_id, season_year, week_number);
+CREATE INDEX IF NOT EXISTS idx_fantasy_scored_game_logs_game_date ON fantasy_scored_game_logs(game_date);
+
+-- =====================================================
+-- PLAYER GAME LOG CHANGES
+-- =====================================================
+-- import_2024_25_player_game_logs.py upserts without setting
+-- updated_at, so corrections would never pass the cursor.
+-- player_game_logs is created by the importer's own setup, so
+-- only touch it where it exists.
+-- =====================================================
+
+DO $$
+BEGIN
+    IF to_regclass('public.player_game_logs') IS NOT NULL THEN
+        ALTER TABLE player_game_logs ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW();
+        CREATE INDEX IF NOT EXISTS idx_player_game_logs_updated_at ON player_game_logs(updated_at);
+        DROP TRIGGER IF EXISTS update_player_game_logs_updated_at ON player_game_logs;
+        CREATE TRIGGER update_player_game_logs_updated_at
+            BEFORE UPDATE ON player_game_logs
+            FOR EACH ROW
+            EXECUTE FUNCTION update_updated_at_column();
+    END IF;
+END $$;
+
+-- =====================================================
+-- APPLY FUNCTION
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION apply_fantasy_score_deltas(p_source TEXT, p_deltas JSONB, p_logs JSONB)
+RETURNS JSONB AS $$
+DECLARE
+    team_week_count INTEGER;
+    matchup_count INTEGER;
+    log_count INTEGER;
+BEGIN
+    -- Add each team's delta to its running score for the matchup
+    INSERT INTO fantasy_team_week_scores (
+        league_id, fantasy_team_id, matchup_id, season_year, week_number,
+        starters_score, rotation_score, bench_score, total_score, games_played
+    )
+    SELECT
+        d.league_id, d.fantasy_team_id, d.matchup_id, d.season_year, d.week_number,
+        d.starters_score, d.rotation_score, d.bench_score, d.total_score, d.games_played
+    FROM jsonb_to_recordset(p_deltas) AS d(
+        league_id UUID, fantasy_team_id UUID, matchup_id UUID, season_year INTEGER, week_number INTEGER,
+        starters_score DECIMAL, rotation_score DECIMAL, bench_score DECIMAL, total_score DECIMAL, games_played INTEGER
+    )
+    ON CONFLICT (fantasy_team_id, matchup_id) DO UPDATE SET
+        starters_score = fantasy_team_week_scores.starters_score + EXCLUDED.starters_score,
+        rotation_score = fantasy_team_week_scores.rotation_score + EXCLUDED.rotation_score,
+        bench_score = fantasy_team_week_scores.bench_score + EXCLUDED.bench_score,
+        total_score = fantasy_team_week_scores.total_score + EXCLUDED.total_score,
+        games_played = fantasy_team_week_scores.games_played + EXCLUDED.games_played,
+        updated_at = NOW();
+    GET DIAGNOSTICS team_week_count = ROW_COUNT;
+
+    -- Copy the new totals onto the matchups they belong to
+    UPDATE fantasy_matchups fm SET
+        team1_score = COALESCE((
+            SELECT s.total_score FROM fantasy_team_week_scores s
+            WHERE s.matchup_id = fm.id AND s.fantasy_team_id = fm.fantasy_team1_id
+        ), 0),
+        team2_score = COALESCE((
+            SELECT s.total_score FROM fantasy_team_week_scores s
+            WHERE s.matchup_id = fm.id AND s.fantasy_team_id = fm.fantasy_team2_id
+        ), 0),
+        updated_at = NOW()
+    WHERE fm.id IN (
+        SELECT DISTINCT (d->>'matchup_id')::UUID FROM jsonb_array_elements(p_deltas) AS d
+    );
+    GET DIAGNOSTICS matchup_count = ROW_COUNT;
+
+    -- Record what has been applied, so the next run only adds differences
+    INSERT INTO fantasy_scored_game_logs (source, nba_player_id, game_id, game_date, stats)
+    SELECT p_source, l.nba_player_id, l.game_id, l.game_date, l.stats
+    FROM jsonb_to_recordset(p_logs) AS l(nba_player_id INTEGER, game_id VARCHAR(50), game_date DATE, stats JSONB)
+    ON CONFLICT (source, nba_player_id, game_id) DO UPDATE SET
+        game_date = EXCLUDED.game_date,
+        stats = EXCLUDED.stats,
+        updated_at = NOW();
+    GET DIAGNOSTICS log_count = ROW_COUNT;
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'team_weeks', team_week_count,
+        'matchups', matchup_count,
+        'logs', log_count
+    );
+
+EXCEPTION WHEN OTHERS THEN
+    RETURN jsonb_build_object(
+        'success', FALSE,
+        'error', SQLERRM,
+        'sqlstate', SQLSTATE
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION reset_fantasy_week_scores(
+    p_season_year INTEGER,
+    p_week_number INTEGER,
+    p_start_date DATE,
+    p_end_date DATE
+)
+RETURNS JSONB AS $$
+DECLARE
+    team_week_count INTEGER;
+    matchup_count INTEGER;
+    log_count INTEGER;
+BEGIN
+    UPDATE fantasy_team_week_scores SET
+        starters_score = 0, rotation_score = 0, bench_score = 0, total_score = 0, games_played = 0,
+        updated_at = NOW()
+    WHERE season_year = p_season_year AND week_number = p_week_number;
+    GET DIAGNOSTICS team_week_count = ROW_COUNT;
+
+    UPDATE fantasy_matchups SET
+        team1_score = 0,
+        team2_score = 0,
+        updated_at = NOW()
+    WHERE season_year = p_season_year AND week_number = p_week_number;
+    GET DIAGNOSTICS matchup_count = ROW_COUNT;
+
+    -- Every source: the zeroed scores no longer hold any of the week's logs
+    DELETE FROM fantasy_scored_game_logs
+    WHERE game_date BETWEEN p_start_date AND p_end_date;
+    GET DIAGNOSTICS log_count = ROW_COUNT;
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'team_weeks', team_week_count,
+        'matchups', matchup_count,
+        'logs', log_count
+    );
+
+EXCEPTION WHEN OTHERS THEN
+    RETURN jsonb_build_object(
+        'success', FALSE,
+        'error', SQLERRM,
+        'sqlstate', SQLSTATE
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- Writes scores for every league, so only the scoring job may call them
+REVOKE EXECUTE ON FUNCTION apply_fantasy_score_deltas(TEXT, JSONB, JSONB) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION apply_fantasy_score_deltas(TEXT, JSONB, JSONB) TO service_role;
+REVOKE EXECUTE ON FUNCTION reset_fantasy_week_scores(INTEGER, INTEGER, DATE, DATE) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION reset_fantasy_week_scores(INTEGER, INTEGER, DATE, DATE) TO service_role;
+
+-- =====================================================
+-- ROW LEVEL SECURITY (RLS) POLICIES
+-- =====================================================
+
+ALTER TABLE fantasy_scoring_cursors ENABLE ROW LEVEL SECURITY;
+ALTER TABLE fantasy_scored_game_logs ENABLE ROW LEVEL SECURITY;
+ALTER TABLE fantasy_team_week_scores ENABLE ROW LEVEL SECURITY;
+
+-- Allow all authenticated users to read team scores
+DROP POLICY IF EXISTS "Allow authenticated users to read fantasy_team_week_scores" ON fantasy_team_week_scores;
+CREATE POLICY "Allow authenticated users to read fantasy_team_week_scores" ON fantasy_team_week_scores
+    FOR SELECT TO authenticated
+    USING (true);
+
+-- Allow service role to insert/update/delete (for the scoring job)
+DROP POLICY IF EXISTS "Allow service role to manage fantasy_scoring_cursors" ON fantasy_scoring_cursors;
+CREATE POLICY "Allow service role to manage fantasy_scoring_cursors" ON fantasy_scoring_cursors
+    FOR ALL TO service_role
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow service role to manage fantasy_scored_game_logs" ON fantasy_scored_game_logs;
+CREATE POLICY "Allow service role to manage fantasy_scored_game_logs" ON fantasy_scored_game_logs
+    FOR ALL TO service_role
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow service role to manage fantasy_team_week_scores" ON fantasy_team_week_scores;
+CREATE POLICY "Allow service role to manage fantasy_team_week_scores" ON fantasy_team_week_scores
+    FOR ALL TO service_role
+    USING (true);
+
+-- =====================================================
+-- TRIGGERS FOR UPDATED_AT
+-- =====================================================
+
+DROP TRIGGER IF EXISTS update_fantasy_scoring_cursors_updated_at ON fantasy_scoring_cursors;
+CREATE TRIGGER update_fantasy_scoring_cursors_updated_at
+    BEFORE UPDATE ON fantasy_scoring_cursors
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_fantasy_scored_game_logs_updated_at ON fantasy_scored_game_logs;
+CREATE TRIGGER update_fantasy_scored_game_logs_updated_at
+    BEFORE UPDATE ON fantasy_scored_game_logs
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_fantasy_team_week_scores_updated_at ON fantasy_team_week_scores;
+CREATE TRIGGER update_fantasy_team_week_scores_updated_at
+    BEFORE UPDATE ON fantasy_team_week_scores
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ Tables: fantasy_scoring_cursors, fantasy_scored_game_logs, fantasy_team_week_scores';
+    RAISE NOTICE '✅ Functions: apply_fantasy_score_deltas, reset_fantasy_week_scores';
+    RAISE NOTICE '🎯 Run scripts/setup/matchup_scoring.py after each game log import';
+    RAISE NOTICE '🔁 After lineup or scoring changes: matchup_scoring.py --rebuild --week N';
+END $$;
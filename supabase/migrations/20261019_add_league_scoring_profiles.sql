@@ -0,0 +1,203 @@
+-- =====================================================
+-- LEAGUE SCORING PROFILES
+-- =====================================================
+-- Per-league fantasy points, materialized in bulk by
+-- scripts/setup/league_scoring.py.
+--
+-- Every league's scoring (a preset fantasy_scoring_format
+-- or custom_scoring_categories) is reduced to a scoring
+-- profile: the stat weights plus double/triple-double
+-- bonuses. Leagues with the same scoring share a profile, so
+-- points are stored once per profile and read per league
+-- through the fantasy_league_player_* views.
+-- =====================================================
+
+-- Custom scoring per season (read by useLineupSettings for 'Custom' leagues)
+ALTER TABLE fantasy_league_seasons ADD COLUMN IF NOT EXISTS custom_scoring_categories JSONB;
+
+CREATE TABLE IF NOT EXISTS fantasy_scoring_profiles (
+    profile_key TEXT PRIMARY KEY, -- Hash of the weights and bonuses
+    weights JSONB NOT NULL, -- {"pts": 1.0, "reb": 1.2, ...} (non-zero weights only)
+    double_double NUMERIC DEFAULT 0,
+    triple_double NUMERIC DEFAULT 0,
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS fantasy_league_scoring (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    league_id UUID NOT NULL UNIQUE REFERENCES fantasy_leagues(id) ON DELETE CASCADE,
+    season_year INTEGER NOT NULL,
+    scoring_format TEXT NOT NULL,
+    profile_key TEXT NOT NULL REFERENCES fantasy_scoring_profiles(profile_key),
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW()
+);
+
+CREATE TABLE IF NOT EXISTS fantasy_profile_projections (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    profile_key TEXT NOT NULL REFERENCES fantasy_scoring_profiles(profile_key) ON DELETE CASCADE,
+    player_id UUID NOT NULL REFERENCES nba_players(id) ON DELETE CASCADE,
+    season_year INTEGER NOT NULL,
+
+    -- Projection (from nba_espn_projections per-game stats)
+    projected_games INTEGER DEFAULT 0,
+    projected_fpg NUMERIC(7,2) NOT NULL, -- Fantasy points per game
+    projected_total NUMERIC(9,2) NOT NULL, -- projected_fpg * projected_games
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (profile_key, player_id, season_year)
+);
+
+CREATE TABLE IF NOT EXISTS fantasy_profile_weekly_points (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+    profile_key TEXT NOT NULL REFERENCES fantasy_scoring_profiles(profile_key) ON DELETE CASCADE,
+    season_year INTEGER NOT NULL,
+    week_number INTEGER NOT NULL, -- fantasy_season_weeks.week_number
+    nba_player_id INTEGER NOT NULL,
+    player_id UUID,
+
+    -- Totals
+    games INTEGER DEFAULT 0,
+    fantasy_pts NUMERIC(8,2) NOT NULL,
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (profile_key, season_year, week_number, nba_player_id)
+);
+
+-- =====================================================
+-- LEAGUE VIEWS
+-- =====================================================
+
+CREATE OR REPLACE VIEW fantasy_league_player_projections
+WITH (security_invoker = true) AS
+SELECT
+    s.league_id,
+    p.season_year,
+    p.player_id,
+    p.projected_games,
+    p.projected_fpg,
+    p.projected_total
+FROM fantasy_league_scoring s
+JOIN fantasy_profile_projections p ON p.profile_key = s.profile_key AND p.season_year = s.season_year;
+
+CREATE OR REPLACE VIEW fantasy_league_player_weekly_points
+WITH (security_invoker = true) AS
+SELECT
+    s.league_id,
+    w.season_year,
+    w.week_number,
+    w.nba_player_id,
+    w.player_id,
+    w.games,
+    w.fantasy_pts
+FROM fantasy_league_scoring s
+JOIN fantasy_profile_weekly_points w ON w.profile_key = s.profile_key AND w.season_year = s.season_year;
+
+-- =====================================================
+-- INDEXES FOR PERFORMANCE
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_fantasy_league_scoring_profile_key ON fantasy_league_scoring(profile_key);
+CREATE INDEX IF NOT EXISTS idx_fantasy_profile_projections_player_id ON fantasy_profile_projections(player_id);
+CREATE INDEX IF NOT EXISTS idx_fantasy_profile_weekly_points_week ON fantasy_profile_weekly_points(profile_key, season_year, week_number);
+
+-- =====================================================
+-- ROW LEVEL SECURITY (RLS) POLICIES
+-- =====================================================
+
+ALTER TABLE fantasy_scoring_profiles ENABLE ROW LEVEL SECURITY;
+ALTER TABLE fantasy_league_scoring ENABLE ROW LEVEL SECURITY;
+ALTER TABLE fantasy_profile_projections ENABLE ROW LEVEL SECURITY;
+ALTER TABLE fantasy_profile_weekly_points ENABLE ROW LEVEL SECURITY;
+
+-- Allow all authenticated users to read scoring and points
+DROP POLICY IF EXISTS "Allow authenticated users to read fantasy_scoring_profiles" ON fantasy_scoring_profiles;
+CREATE POLICY "Allow authenticated users to read fantasy_scoring_profiles" ON fantasy_scoring_profiles
+    FOR SELECT TO authenticated
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow authenticated users to read fantasy_league_scoring" ON fantasy_league_scoring;
+CREATE POLICY "Allow authenticated users to read fantasy_league_scoring" ON fantasy_league_scoring
+    FOR SELECT TO authenticated
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow authenticated users to read fantasy_profile_projections" ON fantasy_profile_projections;
+CREATE POLICY "Allow authenticated users to read fantasy_profile_projections" ON fantasy_profile_projections
+    FOR SELECT TO authenticated
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow authenticated users to read fantasy_profile_weekly_points" ON fantasy_profile_weekly_points;
+CREATE POLICY "Allow authenticated users to read fantasy_profile_weekly_points" ON fantasy_profile_weekly_points
+    FOR SELECT TO authenticated
+    USING (true);
+
+-- Allow service role to insert/update/delete (for the scoring job)
+DROP POLICY IF EXISTS "Allow service role to manage fantasy_scoring_profiles" ON fantasy_scoring_profiles;
+CREATE POLICY "Allow service role to manage fantasy_scoring_profiles" ON fantasy_scoring_profiles
+    FOR ALL TO service_role
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow service role to manage fantasy_league_scoring" ON fantasy_league_scoring;
+CREATE POLICY "Allow service role to manage fantasy_league_scoring" ON fantasy_league_scoring
+    FOR ALL TO service_role
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow service role to manage fantasy_profile_projections" ON fantasy_profile_projections;
+CREATE POLICY "Allow service role to manage fantasy_profile_projections" ON fantasy_profile_projections
+    FOR ALL TO service_role
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow service role to manage fantasy_profile_weekly_points" ON fantasy_profile_weekly_points;
+CREATE POLICY "Allow service role to manage fantasy_profile_weekly_points" ON fantasy_profile_weekly_points
+    FOR ALL TO service_role
+    USING (true);
+
+-- =====================================================
+-- TRIGGERS FOR UPDATED_AT
+-- =====================================================
+
+DROP TRIGGER IF EXISTS update_fantasy_scoring_profiles_updated_at ON fantasy_scoring_profiles;
+CREATE TRIGGER update_fantasy_scoring_profiles_updated_at
+    BEFORE UPDATE ON fantasy_scoring_profiles
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_fantasy_league_scoring_updated_at ON fantasy_league_scoring;
+CREATE TRIGGER update_fantasy_league_scoring_updated_at
+    BEFORE UPDATE ON fantasy_league_scoring
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_fantasy_profile_projections_updated_at ON fantasy_profile_projections;
+CREATE TRIGGER update_fantasy_profile_projections_updated_at
+    BEFORE UPDATE ON fantasy_profile_projections
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+DROP TRIGGER IF EXISTS update_fantasy_profile_weekly_points_updated_at ON fantasy_profile_weekly_points;
+CREATE TRIGGER update_fantasy_profile_weekly_points_updated_at
+    BEFORE UPDATE ON fantasy_profile_weekly_points
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ Tables: fantasy_scoring_profiles, fantasy_league_scoring, fantasy_profile_projections, fantasy_profile_weekly_points';
+    RAISE NOTICE '✅ Views: fantasy_league_player_projections, fantasy_league_player_weekly_points';
+    RAISE NOTICE '🎯 Run scripts/setup/league_scoring.py to score every league in one pass';
+END $$;
@@ -0,0 +1,79 @@
+-- =====================================================
+-- NBA PLAYER CROSSWALK
+-- =====================================================
+-- Persisted mapping from external players (name and team, ESPN
+-- projections, HoopsHype salaries) to nba_players.id.
+--
+-- Importers resolve known names with one lookup here and only
+-- run the name matcher for names they have never seen, which
+-- keeps matches stable between reloads. A wrong match can be
+-- fixed by updating player_id on its row (set match_method to
+-- 'manual'); importers never overwrite existing rows.
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS nba_player_crosswalk (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+
+    -- External identity
+    source TEXT NOT NULL, -- 'espn' or 'hoopshype'
+    external_key TEXT NOT NULL, -- 'normalized name|team' (player_crosswalk.crosswalk_key)
+    external_name TEXT NOT NULL, -- Name exactly as the source wrote it
+    external_team TEXT, -- Team as the source wrote it (HoopsHype logo id for unknown teams)
+
+    -- Player Reference (links to nba_players table)
+    player_id UUID NOT NULL REFERENCES nba_players(id) ON DELETE CASCADE,
+    match_confidence NUMERIC DEFAULT 0.0,
+    match_method TEXT, -- 'exact', 'fuzzy_team', 'fuzzy' or 'manual'
+    matched_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (source, external_key)
+);
+
+-- =====================================================
+-- INDEXES FOR PERFORMANCE
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_nba_player_crosswalk_player_id ON nba_player_crosswalk(player_id);
+CREATE INDEX IF NOT EXISTS idx_nba_player_crosswalk_source ON nba_player_crosswalk(source);
+
+-- =====================================================
+-- ROW LEVEL SECURITY (RLS) POLICIES
+-- =====================================================
+
+ALTER TABLE nba_player_crosswalk ENABLE ROW LEVEL SECURITY;
+
+-- Allow all authenticated users to read the crosswalk
+DROP POLICY IF EXISTS "Allow authenticated users to read nba_player_crosswalk" ON nba_player_crosswalk;
+CREATE POLICY "Allow authenticated users to read nba_player_crosswalk" ON nba_player_crosswalk
+    FOR SELECT TO authenticated
+    USING (true);
+
+-- Allow service role to insert/update/delete (for import scripts)
+DROP POLICY IF EXISTS "Allow service role to manage nba_player_crosswalk" ON nba_player_crosswalk;
+CREATE POLICY "Allow service role to manage nba_player_crosswalk" ON nba_player_crosswalk
+    FOR ALL TO service_role
+    USING (true);
+
+-- =====================================================
+-- TRIGGERS FOR UPDATED_AT
+-- =====================================================
+
+DROP TRIGGER IF EXISTS update_nba_player_crosswalk_updated_at ON nba_player_crosswalk;
+CREATE TRIGGER update_nba_player_crosswalk_updated_at
+    BEFORE UPDATE ON nba_player_crosswalk
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ Table: nba_player_crosswalk';
+    RAISE NOTICE '🎯 ESPN and HoopsHype names now resolve to nba_players.id without re-matching';
+END $$;
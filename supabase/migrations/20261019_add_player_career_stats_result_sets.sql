@@ -0,0 +1,214 @@
+-- =====================================================
+-- PLAYER CAREER STATS: ALL RESULT SETS
+-- =====================================================
+-- import_career_stats_nba_api.py persists every result set of
+-- the PlayerCareerStats response, not only the regular season
+-- ones, so post-season, All-Star, college and showcase stats
+-- need no second multi-hour run.
+--
+-- The regular season tables are defined here (no-ops where
+-- they already exist) and every other table copies the shape
+-- (columns, defaults, unique keys) of its regular season
+-- counterpart:
+--   player_career_totals_*   unique (player_id)
+--   player_season_totals_*   unique (player_id, season_id)
+--   player_season_rankings_* unique (player_id, season_id)
+-- College sets add organization_id/school_name, rankings add
+-- the efficiency rank (RANK_EFF). The importer only writes
+-- the columns listed in its RESULT_SET_TABLES.
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS player_career_totals_regular_season (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    player_id INTEGER NOT NULL, -- players.id
+    nba_player_id INTEGER NOT NULL,
+    league_id INTEGER,
+    team_id INTEGER,
+
+    -- Totals
+    gp INTEGER,
+    gs INTEGER,
+    min_total INTEGER,
+    fgm INTEGER,
+    fga INTEGER,
+    fg_pct DECIMAL(5,3),
+    fg3m INTEGER,
+    fg3a INTEGER,
+    fg3_pct DECIMAL(5,3),
+    ftm INTEGER,
+    fta INTEGER,
+    ft_pct DECIMAL(5,3),
+    oreb INTEGER,
+    dreb INTEGER,
+    reb INTEGER,
+    ast INTEGER,
+    stl INTEGER,
+    blk INTEGER,
+    tov INTEGER,
+    pf INTEGER,
+    pts INTEGER,
+    fantasy_pts DECIMAL(10,2),
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (player_id)
+);
+
+CREATE TABLE IF NOT EXISTS player_season_totals_regular_season (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    player_id INTEGER NOT NULL, -- players.id
+    nba_player_id INTEGER NOT NULL,
+    season_id VARCHAR(10) NOT NULL, -- e.g., '2024-25'
+    league_id INTEGER,
+    team_id INTEGER,
+    team_abbreviation VARCHAR(10),
+    player_age INTEGER,
+
+    -- Totals
+    gp INTEGER,
+    gs INTEGER,
+    min_total INTEGER,
+    fgm INTEGER,
+    fga INTEGER,
+    fg_pct DECIMAL(5,3),
+    fg3m INTEGER,
+    fg3a INTEGER,
+    fg3_pct DECIMAL(5,3),
+    ftm INTEGER,
+    fta INTEGER,
+    ft_pct DECIMAL(5,3),
+    oreb INTEGER,
+    dreb INTEGER,
+    reb INTEGER,
+    ast INTEGER,
+    stl INTEGER,
+    blk INTEGER,
+    tov INTEGER,
+    pf INTEGER,
+    pts INTEGER,
+    fantasy_pts DECIMAL(10,2),
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (player_id, season_id)
+);
+
+CREATE TABLE IF NOT EXISTS player_season_rankings_regular_season (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    player_id INTEGER NOT NULL, -- players.id
+    nba_player_id INTEGER NOT NULL,
+    season_id VARCHAR(10) NOT NULL,
+    league_id INTEGER,
+    team_id INTEGER,
+    team_abbreviation VARCHAR(10),
+    player_age INTEGER,
+    gp INTEGER,
+    gs INTEGER,
+
+    -- Ranks among the league's players (NULL when unranked)
+    min_total INTEGER,
+    fgm INTEGER,
+    fga INTEGER,
+    fg_pct INTEGER,
+    fg3m INTEGER,
+    fg3a INTEGER,
+    fg3_pct INTEGER,
+    ftm INTEGER,
+    fta INTEGER,
+    ft_pct INTEGER,
+    oreb INTEGER,
+    dreb INTEGER,
+    reb INTEGER,
+    ast INTEGER,
+    stl INTEGER,
+    blk INTEGER,
+    tov INTEGER,
+    pts INTEGER,
+    eff INTEGER,
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (player_id, season_id)
+);
+
+CREATE TABLE IF NOT EXISTS player_career_totals_post_season (LIKE player_career_totals_regular_season INCLUDING ALL);
+CREATE TABLE IF NOT EXISTS player_season_totals_post_season (LIKE player_season_totals_regular_season INCLUDING ALL);
+CREATE TABLE IF NOT EXISTS player_season_rankings_post_season (LIKE player_season_rankings_regular_season INCLUDING ALL);
+
+CREATE TABLE IF NOT EXISTS player_career_totals_all_star_season (LIKE player_career_totals_regular_season INCLUDING ALL);
+CREATE TABLE IF NOT EXISTS player_season_totals_all_star_season (LIKE player_season_totals_regular_season INCLUDING ALL);
+
+CREATE TABLE IF NOT EXISTS player_career_totals_college_season (LIKE player_career_totals_regular_season INCLUDING ALL);
+CREATE TABLE IF NOT EXISTS player_season_totals_college_season (LIKE player_season_totals_regular_season INCLUDING ALL);
+
+CREATE TABLE IF NOT EXISTS player_career_totals_showcase_season (LIKE player_career_totals_regular_season INCLUDING ALL);
+CREATE TABLE IF NOT EXISTS player_season_totals_showcase_season (LIKE player_season_totals_regular_season INCLUDING ALL);
+
+-- =====================================================
+-- RESULT SET SPECIFIC COLUMNS
+-- =====================================================
+
+ALTER TABLE player_career_totals_college_season
+    ADD COLUMN IF NOT EXISTS organization_id INTEGER,
+    ADD COLUMN IF NOT EXISTS school_name TEXT;
+
+ALTER TABLE player_season_totals_college_season
+    ADD COLUMN IF NOT EXISTS organization_id INTEGER,
+    ADD COLUMN IF NOT EXISTS school_name TEXT;
+
+-- Rankings tables created before RANK_EFF was imported
+ALTER TABLE player_season_rankings_regular_season ADD COLUMN IF NOT EXISTS eff INTEGER; -- RANK_EFF
+ALTER TABLE player_season_rankings_post_season ADD COLUMN IF NOT EXISTS eff INTEGER;
+
+-- =====================================================
+-- ROW LEVEL SECURITY (RLS) POLICIES AND UPDATED_AT TRIGGERS
+-- =====================================================
+
+DO $$
+DECLARE
+    stats_table TEXT;
+BEGIN
+    FOREACH stats_table IN ARRAY ARRAY[
+        'player_career_totals_regular_season',
+        'player_season_totals_regular_season',
+        'player_season_rankings_regular_season',
+        'player_career_totals_post_season',
+        'player_season_totals_post_season',
+        'player_season_rankings_post_season',
+        'player_career_totals_all_star_season',
+        'player_season_totals_all_star_season',
+        'player_career_totals_college_season',
+        'player_season_totals_college_season',
+        'player_career_totals_showcase_season',
+        'player_season_totals_showcase_season'
+    ] LOOP
+        EXECUTE format('ALTER TABLE %I ENABLE ROW LEVEL SECURITY', stats_table);
+
+        -- Allow all authenticated users to read career stats
+        EXECUTE format('DROP POLICY IF EXISTS "Allow authenticated users to read %s" ON %I', stats_table, stats_table);
+        EXECUTE format('CREATE POLICY "Allow authenticated users to read %s" ON %I FOR SELECT TO authenticated USING (true)', stats_table, stats_table);
+
+        -- Allow service role to insert/update/delete (for import scripts)
+        EXECUTE format('DROP POLICY IF EXISTS "Allow service role to manage %s" ON %I', stats_table, stats_table);
+        EXECUTE format('CREATE POLICY "Allow service role to manage %s" ON %I FOR ALL TO service_role USING (true)', stats_table, stats_table);
+
+        EXECUTE format('DROP TRIGGER IF EXISTS update_%s_updated_at ON %I', stats_table, stats_table);
+        EXECUTE format('CREATE TRIGGER update_%s_updated_at BEFORE UPDATE ON %I FOR EACH ROW EXECUTE FUNCTION update_updated_at_column()', stats_table, stats_table);
+    END LOOP;
+END $$;
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ Tables: player_{career,season}_totals_{regular,post,all_star,college,showcase}_season, player_season_rankings_{regular,post}_season';
+    RAISE NOTICE '🎯 One PlayerCareerStats fetch now fills every career stats table';
+END $$;
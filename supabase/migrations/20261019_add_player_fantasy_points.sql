@@ -0,0 +1,81 @@
+-- =====================================================
+-- PLAYER FANTASY POINTS
+-- =====================================================
+-- Fantasy points per player, game and scoring format,
+-- materialized by scripts/setup/fantasy_scoring.py from
+-- player_game_logs and nba_boxscores.
+--
+-- Clients read points from here instead of scoring every
+-- game log in the browser. Formats are named like
+-- fantasy_leagues.fantasy_scoring_format ('FanDuel',
+-- 'DraftKings', 'Yahoo', 'ESPN') plus 'NBA' (the formula
+-- behind nba_fantasy_pts).
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS player_fantasy_points (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+
+    -- Player and Game (nba_player_id + source identify the player in either source)
+    nba_player_id INTEGER NOT NULL,
+    game_id VARCHAR(50) NOT NULL,
+    game_date DATE,
+    season_year VARCHAR(10),
+    source TEXT NOT NULL, -- 'player_game_logs' or 'nba_boxscores'
+
+    -- Points
+    scoring_format TEXT NOT NULL,
+    fantasy_pts NUMERIC(7,2) NOT NULL,
+
+    -- System Fields
+    created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+
+    UNIQUE (source, nba_player_id, game_id, scoring_format)
+);
+
+-- =====================================================
+-- INDEXES FOR PERFORMANCE
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_player_fantasy_points_player_game ON player_fantasy_points(nba_player_id, game_id);
+CREATE INDEX IF NOT EXISTS idx_player_fantasy_points_format_date ON player_fantasy_points(scoring_format, game_date);
+CREATE INDEX IF NOT EXISTS idx_player_fantasy_points_game_id ON player_fantasy_points(game_id);
+CREATE INDEX IF NOT EXISTS idx_player_fantasy_points_season ON player_fantasy_points(season_year, scoring_format);
+
+-- =====================================================
+-- ROW LEVEL SECURITY (RLS) POLICIES
+-- =====================================================
+
+ALTER TABLE player_fantasy_points ENABLE ROW LEVEL SECURITY;
+
+-- Allow all authenticated users to read fantasy points
+DROP POLICY IF EXISTS "Allow authenticated users to read player_fantasy_points" ON player_fantasy_points;
+CREATE POLICY "Allow authenticated users to read player_fantasy_points" ON player_fantasy_points
+    FOR SELECT TO authenticated
+    USING (true);
+
+-- Allow service role to insert/update/delete (for the scoring job)
+DROP POLICY IF EXISTS "Allow service role to manage player_fantasy_points" ON player_fantasy_points;
+CREATE POLICY "Allow service role to manage player_fantasy_points" ON player_fantasy_points
+    FOR ALL TO service_role
+    USING (true);
+
+-- =====================================================
+-- TRIGGERS FOR UPDATED_AT
+-- =====================================================
+
+DROP TRIGGER IF EXISTS update_player_fantasy_points_updated_at ON player_fantasy_points;
+CREATE TRIGGER update_player_fantasy_points_updated_at
+    BEFORE UPDATE ON player_fantasy_points
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ Table: player_fantasy_points';
+    RAISE NOTICE '🎯 Run scripts/setup/fantasy_scoring.py to materialize points for every scoring format';
+END $$;
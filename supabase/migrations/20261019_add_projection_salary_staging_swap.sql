@@ -0,0 +1,189 @@
+-- =====================================================
+-- STAGING TABLES + ATOMIC SWAP FOR PROJECTION/SALARY RELOADS
+-- =====================================================
+-- The ESPN projections and HoopsHype salary importers used to
+-- wipe the live tables and then insert one row per request, so
+-- readers (and get_best_available_player) saw an empty or
+-- partial table for the whole import.
+--
+-- Reloads now bulk insert into a staging table tagged with a
+-- load_id and then call a swap function that replaces the live
+-- rows inside a single transaction. Readers keep seeing the old
+-- rows until the swap commits.
+-- =====================================================
+
+-- =====================================================
+-- STAGING TABLES
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS nba_espn_projections_staging (
+    LIKE nba_espn_projections INCLUDING DEFAULTS,
+    load_id UUID NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS nba_hoopshype_salaries_staging (
+    LIKE nba_hoopshype_salaries INCLUDING DEFAULTS,
+    load_id UUID NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_nba_espn_projections_staging_load_id ON nba_espn_projections_staging(load_id);
+CREATE INDEX IF NOT EXISTS idx_nba_hoopshype_salaries_staging_load_id ON nba_hoopshype_salaries_staging(load_id);
+
+-- Staging tables are only written by the import scripts
+ALTER TABLE nba_espn_projections_staging ENABLE ROW LEVEL SECURITY;
+ALTER TABLE nba_hoopshype_salaries_staging ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow service role to manage nba_espn_projections_staging" ON nba_espn_projections_staging;
+CREATE POLICY "Allow service role to manage nba_espn_projections_staging" ON nba_espn_projections_staging
+    FOR ALL TO service_role
+    USING (true);
+
+DROP POLICY IF EXISTS "Allow service role to manage nba_hoopshype_salaries_staging" ON nba_hoopshype_salaries_staging;
+CREATE POLICY "Allow service role to manage nba_hoopshype_salaries_staging" ON nba_hoopshype_salaries_staging
+    FOR ALL TO service_role
+    USING (true);
+
+-- =====================================================
+-- SWAP FUNCTION: ESPN PROJECTIONS
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION swap_nba_espn_projections_staging(p_load_id UUID)
+RETURNS JSONB AS $$
+DECLARE
+    staged_count INTEGER;
+    replaced_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO staged_count
+    FROM nba_espn_projections_staging
+    WHERE load_id = p_load_id;
+
+    -- Never swap an empty load in, that would wipe the live table
+    IF staged_count = 0 THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'No staged rows found for load ' || p_load_id
+        );
+    END IF;
+
+    -- Block concurrent reloads; plain SELECTs are not blocked by EXCLUSIVE
+    LOCK TABLE nba_espn_projections IN EXCLUSIVE MODE;
+
+    DELETE FROM nba_espn_projections;
+    GET DIAGNOSTICS replaced_count = ROW_COUNT;
+
+    INSERT INTO nba_espn_projections (
+        espn_name, espn_team, espn_position, player_id, matched_at, match_confidence,
+        stats_2025_gp, stats_2025_min, stats_2025_fg_pct, stats_2025_ft_pct, stats_2025_3pm,
+        stats_2025_reb, stats_2025_ast, stats_2025_ato, stats_2025_stl, stats_2025_blk,
+        stats_2025_to, stats_2025_pts,
+        proj_2026_gp, proj_2026_min, proj_2026_fg_pct, proj_2026_ft_pct, proj_2026_3pm,
+        proj_2026_reb, proj_2026_ast, proj_2026_ato, proj_2026_stl, proj_2026_blk,
+        proj_2026_to, proj_2026_pts, outlook_2026
+    )
+    SELECT
+        espn_name, espn_team, espn_position, player_id, matched_at, match_confidence,
+        stats_2025_gp, stats_2025_min, stats_2025_fg_pct, stats_2025_ft_pct, stats_2025_3pm,
+        stats_2025_reb, stats_2025_ast, stats_2025_ato, stats_2025_stl, stats_2025_blk,
+        stats_2025_to, stats_2025_pts,
+        proj_2026_gp, proj_2026_min, proj_2026_fg_pct, proj_2026_ft_pct, proj_2026_3pm,
+        proj_2026_reb, proj_2026_ast, proj_2026_ato, proj_2026_stl, proj_2026_blk,
+        proj_2026_to, proj_2026_pts, outlook_2026
+    FROM nba_espn_projections_staging
+    WHERE load_id = p_load_id;
+
+    -- Clean up this load plus anything left behind by crashed imports
+    DELETE FROM nba_espn_projections_staging
+    WHERE load_id = p_load_id
+    OR created_at < NOW() - INTERVAL '1 day';
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'replaced_count', replaced_count,
+        'inserted_count', staged_count
+    );
+
+EXCEPTION WHEN OTHERS THEN
+    RETURN jsonb_build_object(
+        'success', FALSE,
+        'error', SQLERRM,
+        'sqlstate', SQLSTATE
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =====================================================
+-- SWAP FUNCTION: HOOPSHYPE SALARIES
+-- =====================================================
+
+CREATE OR REPLACE FUNCTION swap_nba_hoopshype_salaries_staging(p_load_id UUID)
+RETURNS JSONB AS $$
+DECLARE
+    staged_count INTEGER;
+    replaced_count INTEGER;
+BEGIN
+    SELECT COUNT(*) INTO staged_count
+    FROM nba_hoopshype_salaries_staging
+    WHERE load_id = p_load_id;
+
+    -- Never swap an empty load in, that would wipe the live table
+    IF staged_count = 0 THEN
+        RETURN jsonb_build_object(
+            'success', FALSE,
+            'error', 'No staged rows found for load ' || p_load_id
+        );
+    END IF;
+
+    -- Block concurrent reloads; plain SELECTs are not blocked by EXCLUSIVE
+    LOCK TABLE nba_hoopshype_salaries IN EXCLUSIVE MODE;
+
+    DELETE FROM nba_hoopshype_salaries;
+    GET DIAGNOSTICS replaced_count = ROW_COUNT;
+
+    INSERT INTO nba_hoopshype_salaries (
+        player_name, team_name, player_id, matched_at, match_confidence,
+        salary_2025_26, salary_2026_27, salary_2027_28, salary_2028_29,
+        contract_years_remaining
+    )
+    SELECT
+        player_name, team_name, player_id, matched_at, match_confidence,
+        salary_2025_26, salary_2026_27, salary_2027_28, salary_2028_29,
+        contract_years_remaining
+    FROM nba_hoopshype_salaries_staging
+    WHERE load_id = p_load_id;
+
+    -- Clean up this load plus anything left behind by crashed imports
+    DELETE FROM nba_hoopshype_salaries_staging
+    WHERE load_id = p_load_id
+    OR created_at < NOW() - INTERVAL '1 day';
+
+    RETURN jsonb_build_object(
+        'success', TRUE,
+        'replaced_count', replaced_count,
+        'inserted_count', staged_count
+    );
+
+EXCEPTION WHEN OTHERS THEN
+    RETURN jsonb_build_object(
+        'success', FALSE,
+        'error', SQLERRM,
+        'sqlstate', SQLSTATE
+    );
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- These replace whole tables, so only the import scripts may call them
+REVOKE EXECUTE ON FUNCTION swap_nba_espn_projections_staging(UUID) FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION swap_nba_hoopshype_salaries_staging(UUID) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION swap_nba_espn_projections_staging(UUID) TO service_role;
+GRANT EXECUTE ON FUNCTION swap_nba_hoopshype_salaries_staging(UUID) TO service_role;
+
+-- =====================================================
+-- VERIFICATION
+-- =====================================================
+
+DO $$
+BEGIN
+    RAISE NOTICE '✅ Staging tables: nba_espn_projections_staging, nba_hoopshype_salaries_staging';
+    RAISE NOTICE '✅ Functions: swap_nba_espn_projections_staging, swap_nba_hoopshype_salaries_staging';
+    RAISE NOTICE '🎯 Projection and salary reloads no longer empty the live tables';
+END $$;